@@ -0,0 +1,149 @@
+"""CPU benchmark of the ONNX Runtime backend of TransformersNlpEngine.
+
+Compares latency and outputs of the PyTorch backend with the ONNX Runtime
+backend (fp32 and int8 quantized) on the same texts.
+The output spans and scores of each ONNX backend are checked against
+the PyTorch backend, using the tolerances documented in
+docs/analyzer/nlp_engines/transformers.md.
+
+Requires `pip install "presidio-analyzer[transformers,onnx]"`.
+
+Usage:
+    python transformers_onnx_benchmark.py \
+        --model StanfordAIMI/stanford-deidentifier-base --repeat 20
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from presidio_analyzer.nlp_engine import NerModelConfiguration, TransformersNlpEngine
+
+TEXTS = [
+    "My name is John Smith and I live in Seattle, Washington.",
+    "Patient Jane Doe, 43 years old, was admitted to St. Mary's Hospital "
+    "on 03/14/2023 and discharged on 03/18/2023.",
+    "Please call Dr. Alan Turing at (555) 123-4567 or email alan@example.com.",
+    "Our offices in London and Tel Aviv will be closed on Monday.",
+    "The contract between Contoso Ltd. and Fabrikam was signed by Maria Garcia.",
+]
+
+# Maximum allowed disagreement with the PyTorch backend
+TOLERANCES = {
+    "onnx": {"min_span_agreement": 1.0, "max_score_diff": 1e-3},
+    "onnx-int8": {"min_span_agreement": 0.95, "max_score_diff": 0.05},
+}
+
+Span = Tuple[str, int, int]
+
+
+def create_engine(
+    model: str, spacy_model: str, backend: str, quantize: bool
+) -> TransformersNlpEngine:
+    """Create and load a TransformersNlpEngine using the given backend."""
+    engine = TransformersNlpEngine(
+        models=[
+            {
+                "lang_code": "en",
+                "model_name": {"spacy": spacy_model, "transformers": model},
+            }
+        ],
+        ner_model_configuration=NerModelConfiguration(
+            backend=backend, onnx_quantize=quantize
+        ),
+    )
+    engine.load()
+    return engine
+
+
+def run(
+    engine: TransformersNlpEngine, texts: List[str], repeat: int
+) -> Tuple[List[float], List[Dict[Span, float]]]:
+    """Return per-text latencies (ms) and the spans with scores of each text."""
+    outputs = []
+    for text in texts:
+        artifacts = engine.process_text(text, "en")
+        outputs.append(
+            {
+                (ent.label_, ent.start_char, ent.end_char): score
+                for ent, score in zip(artifacts.entities, artifacts.scores)
+            }
+        )
+
+    latencies = []
+    for _ in range(repeat):
+        for text in texts:
+            start = time.perf_counter()
+            engine.process_text(text, "en")
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies, outputs
+
+
+def compare(
+    expected: List[Dict[Span, float]], actual: List[Dict[Span, float]]
+) -> Tuple[float, float]:
+    """Return the span agreement ratio and the max score difference."""
+    matched = total = 0
+    max_score_diff = 0.0
+    for expected_spans, actual_spans in zip(expected, actual):
+        all_spans = set(expected_spans) | set(actual_spans)
+        total += len(all_spans)
+        for span in set(expected_spans) & set(actual_spans):
+            matched += 1
+            max_score_diff = max(
+                max_score_diff, abs(expected_spans[span] - actual_spans[span])
+            )
+    return (matched / total if total else 1.0), max_score_diff
+
+
+def main() -> int:
+    """Run the benchmark and return a non-zero exit code on tolerance failures."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--model", default="StanfordAIMI/stanford-deidentifier-base")
+    parser.add_argument("--spacy-model", default="en_core_web_sm")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    backends = {
+        "pytorch": ("pytorch", False),
+        "onnx": ("onnx", False),
+        "onnx-int8": ("onnx", True),
+    }
+
+    results = {}
+    for name, (backend, quantize) in backends.items():
+        engine = create_engine(args.model, args.spacy_model, backend, quantize)
+        results[name] = run(engine, TEXTS, args.repeat)
+
+    baseline_latencies, baseline_outputs = results["pytorch"]
+    baseline_p50 = statistics.median(baseline_latencies)
+
+    failed = False
+    print(
+        f"{'backend':<10} {'p50 ms':>8} {'p95 ms':>8} {'speedup':>8} "
+        f"{'spans':>7} {'max dscore':>11}"
+    )
+    for name, (latencies, outputs) in results.items():
+        p50 = statistics.median(latencies)
+        p95 = statistics.quantiles(latencies, n=20)[-1]
+        agreement, max_score_diff = compare(baseline_outputs, outputs)
+        print(
+            f"{name:<10} {p50:>8.2f} {p95:>8.2f} {baseline_p50 / p50:>7.2f}x "
+            f"{agreement:>7.1%} {max_score_diff:>11.4f}"
+        )
+
+        tolerance = TOLERANCES.get(name)
+        if tolerance and (
+            agreement < tolerance["min_span_agreement"]
+            or max_score_diff > tolerance["max_score_diff"]
+        ):
+            print(f"{name} is outside of the documented tolerance: {tolerance}")
+            failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,6 +26,16 @@ def anonymize(data):
     return response.status_code, response.content
 
 
+def anonymize_batch(data, headers=None, params=None):
+    response = requests.post(
+        f"{ANONYMIZER_BASE_URL}/anonymize/batch",
+        data=data,
+        headers=headers if headers else DEFAULT_HEADERS,
+        params=params,
+    )
+    return response.status_code, response.content
+
+
 def anonymizers():
     response = requests.get(
         f"{ANONYMIZER_BASE_URL}/anonymizers", headers=DEFAULT_HEADERS
@@ -40,6 +50,16 @@ def analyze(data):
     return response.status_code, response.content
 
 
+def analyze_batch(data, headers=None, params=None):
+    response = requests.post(
+        f"{ANALYZER_BASE_URL}/analyze/batch",
+        data=data,
+        headers=headers if headers else DEFAULT_HEADERS,
+        params=params,
+    )
+    return response.status_code, response.content
+
+
 def analyzer_supported_entities(data):
     response = requests.get(
         f"{ANALYZER_BASE_URL}/supportedentities?{data}", headers=DEFAULT_HEADERS
@@ -67,6 +87,13 @@ def deanonymize(data):
     return response.status_code, response.content
 
 
+def deanonymize_batch(data):
+    response = requests.post(
+        f"{ANONYMIZER_BASE_URL}/deanonymize/batch", data=data, headers=DEFAULT_HEADERS
+    )
+    return response.status_code, response.content
+
+
 def __get_redact_payload(color_fill):
     payload = {}
     if color_fill:
@@ -1,6 +1,6 @@
 import pytest
 from common.assertions import equal_json_strings
-from common.methods import analyze, analyzer_supported_entities
+from common.methods import analyze, analyze_batch, analyzer_supported_entities
 
 
 @pytest.mark.api
@@ -572,3 +572,89 @@ def test_given_regex_flags_and_normal_entities_are_returned():
     assert equal_json_strings(
         expected_response, response_content
     )
+
+
+@pytest.mark.api
+def test_given_a_batch_of_texts_then_return_results_aligned_to_inputs():
+    request_body = """
+    {
+        "texts": ["John Smith drivers license is AC432223", "hello world"],
+        "language": "en",
+        "score_threshold": 0.7,
+        "batch_size": 2
+    }
+    """
+
+    response_status, response_content = analyze_batch(request_body)
+
+    expected_response = """
+    [
+        [{"entity_type": "PERSON", "start": 0, "end": 10, "score": 0.85, "analysis_explanation": null}],
+        []
+    ]
+    """
+    assert response_status == 200
+    assert equal_json_strings(expected_response, response_content)
+
+
+@pytest.mark.api
+def test_given_a_batch_of_records_then_return_results_with_record_ids():
+    request_body = """
+    {
+        "records": [{"id": "rec-1", "text": "John Smith drivers license is AC432223"}],
+        "language": "en",
+        "score_threshold": 0.7
+    }
+    """
+
+    response_status, response_content = analyze_batch(request_body)
+
+    expected_response = """
+    [
+        {"id": "rec-1", "recognizer_results": [
+            {"entity_type": "PERSON", "start": 0, "end": 10, "score": 0.85, "analysis_explanation": null}
+        ]}
+    ]
+    """
+    assert response_status == 200
+    assert equal_json_strings(expected_response, response_content)
+
+
+@pytest.mark.api
+def test_given_an_ndjson_batch_then_stream_ndjson_results():
+    request_body = (
+        '{"id": "rec-1", "text": "John Smith drivers license is AC432223"}\n'
+        '"hello world"\n'
+    )
+
+    response_status, response_content = analyze_batch(
+        request_body,
+        headers={"Content-Type": "application/x-ndjson"},
+        params={"language": "en", "score_threshold": 0.7, "batch_size": 1},
+    )
+
+    lines = response_content.decode().splitlines()
+    assert response_status == 200
+    assert len(lines) == 2
+    assert equal_json_strings(
+        """{"id": "rec-1", "recognizer_results": [
+            {"entity_type": "PERSON", "start": 0, "end": 10, "score": 0.85, "analysis_explanation": null}
+        ]}""",
+        lines[0],
+    )
+    assert equal_json_strings('{"id": 1, "recognizer_results": []}', lines[1])
+
+
+@pytest.mark.api
+def test_given_no_batch_texts_then_return_error():
+    request_body = """
+    {"language": "en"}
+    """
+
+    response_status, response_content = analyze_batch(request_body)
+
+    expected_response = """
+        {"error": "No texts or records provided"}
+    """
+    assert response_status == 500
+    assert equal_json_strings(expected_response, response_content)
@@ -3,7 +3,13 @@ import json
 import pytest
 
 from common.assertions import equal_json_strings
-from common.methods import anonymize, anonymizers, deanonymize
+from common.methods import (
+    anonymize,
+    anonymize_batch,
+    anonymizers,
+    deanonymize,
+    deanonymize_batch,
+)
 
 
 @pytest.mark.api
@@ -401,3 +407,104 @@ def test_overlapping_keep_both():
 
     assert response_status == 200
     assert equal_json_strings(expected_response, response_content)
+
+
+@pytest.mark.api
+def test_given_anonymize_batch_then_results_aligned_to_items():
+    request_body = """
+    {
+        "anonymizers": { "DEFAULT": { "type": "replace", "new_value": "ANONYMIZED" } },
+        "items": [
+            { "id": "msg-1", "text": "My name is Jane Doe",
+              "analyzer_results": [ { "start": 11, "end": 19, "score": 0.8, "entity_type": "PERSON" } ] },
+            { "text": "hello world", "analyzer_results": [] },
+            { "id": "msg-3", "text": "Call 034453334",
+              "analyzer_results": [ { "start": 5, "end": 14, "score": 0.95, "entity_type": "PHONE_NUMBER" } ],
+              "anonymizers": { "PHONE_NUMBER": { "type": "mask", "masking_char": "*", "chars_to_mask": 4, "from_end": true } } }
+        ]
+    }
+    """
+
+    response_status, response_content = anonymize_batch(request_body)
+
+    expected_response = """
+    [
+        { "id": "msg-1", "text": "My name is ANONYMIZED",
+          "items": [ { "operator": "replace", "entity_type": "PERSON", "start": 11, "end": 21, "text": "ANONYMIZED" } ] },
+        { "text": "hello world", "items": [] },
+        { "id": "msg-3", "text": "Call 03445****",
+          "items": [ { "operator": "mask", "entity_type": "PHONE_NUMBER", "start": 5, "end": 14, "text": "03445****" } ] }
+    ]
+    """
+    assert response_status == 200
+    assert equal_json_strings(expected_response, response_content)
+
+
+@pytest.mark.api
+def test_given_ndjson_anonymize_batch_then_stream_ndjson_results():
+    request_body = (
+        '{"id": "msg-1", "text": "My name is Jane Doe", "analyzer_results": '
+        '[{"start": 11, "end": 19, "score": 0.8, "entity_type": "PERSON"}]}\n'
+        '{"text": "hello world", "analyzer_results": []}\n'
+    )
+
+    response_status, response_content = anonymize_batch(
+        request_body,
+        headers={"Content-Type": "application/x-ndjson"},
+        params={
+            "batch_size": 1,
+            "anonymizers": json.dumps({"DEFAULT": {"type": "redact"}}),
+        },
+    )
+
+    lines = response_content.decode().splitlines()
+    assert response_status == 200
+    assert len(lines) == 2
+    assert equal_json_strings(
+        """{"id": "msg-1", "text": "My name is ",
+            "items": [{"operator": "redact", "entity_type": "PERSON", "start": 11, "end": 11, "text": ""}]}""",
+        lines[0],
+    )
+    assert equal_json_strings('{"id": 1, "text": "hello world", "items": []}', lines[1])
+
+
+@pytest.mark.api
+def test_given_anonymize_batch_without_items_then_bad_request():
+    response_status, _ = anonymize_batch('{"anonymizers": {}}')
+
+    assert response_status == 400
+
+
+@pytest.mark.api
+def test_given_anonymized_batch_then_deanonymize_batch_restores_texts():
+    key = "3t6w9z$C&F)J@NcR"
+    request_body = {
+        "anonymizers": {"DEFAULT": {"type": "encrypt", "key": key}},
+        "items": [
+            {
+                "text": text,
+                "analyzer_results": [
+                    {"start": 11, "end": 19, "score": 0.8, "entity_type": "PERSON"}
+                ],
+            }
+            for text in ("My name is Jane Doe", "My name is John Doe")
+        ],
+    }
+    _, anonymized_content = anonymize_batch(json.dumps(request_body))
+
+    deanonymize_request = {
+        "deanonymizers": {"DEFAULT": {"type": "decrypt", "key": key}},
+        "items": [
+            {"text": item["text"], "anonymizer_results": item["items"]}
+            for item in json.loads(anonymized_content)
+        ],
+    }
+    response_status, response_content = deanonymize_batch(
+        json.dumps(deanonymize_request)
+    )
+
+    assert response_status == 200
+    assert [item["text"] for item in json.loads(response_content)] == [
+        "My name is Jane Doe",
+        "My name is John Doe",
+    ]
@@ -3,16 +3,30 @@
 import json
 import logging
 import os
+from itertools import islice
 from logging.config import fileConfig
 from pathlib import Path
-from typing import Tuple
+from typing import Any, Dict, Iterator, Tuple
 
-from flask import Flask, Response, jsonify, request
-from presidio_analyzer import AnalyzerEngine, AnalyzerEngineProvider, AnalyzerRequest
+from flask import Flask, Response, jsonify, request, stream_with_context
+from presidio_analyzer import (
+    AnalyzerEngine,
+    AnalyzerEngineProvider,
+    AnalyzerRequest,
+    AnalyzerRequestBatcher,
+    BatchAnalyzerEngine,
+)
+from presidio_service_utils import RequestLimiter, warm_up
 from werkzeug.exceptions import HTTPException
 
 DEFAULT_PORT = "3000"
 
+DEFAULT_BATCH_SIZE = 32
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
+WARMUP_TEXT = "My name is John Smith and my phone number is 212-555-5555"
+
 LOGGING_CONF_FILE = "logging.ini"
 
 WELCOME_MESSAGE = r"""
@@ -46,8 +60,32 @@ class Server:
             nlp_engine_conf_file=nlp_engine_conf_file,
             recognizer_registry_conf_file=recognizer_registry_conf_file,
         ).create_engine()
+
+        # Optional micro-batching of concurrent /analyze requests
+        self.batcher = None
+        if os.environ.get("MICRO_BATCHING_ENABLED", "false").lower() == "true":
+            self.batcher = AnalyzerRequestBatcher(
+                analyzer_engine=self.engine,
+                max_batch_size=int(
+                    os.environ.get("MICRO_BATCHING_MAX_BATCH_SIZE", "32")
+                ),
+                max_wait_ms=float(os.environ.get("MICRO_BATCHING_MAX_WAIT_MS", "5")),
+            )
+            self.logger.info("Micro-batching of analyze requests is enabled")
+        self.batch_engine = BatchAnalyzerEngine(analyzer_engine=self.engine)
+
+        self.request_limiter = RequestLimiter.from_env()
+        self.request_limiter.init_app(self.app)
+        self.ready = warm_up(self._warmup, self.logger)
         self.logger.info(WELCOME_MESSAGE)
 
+        @self.app.route("/ready")
+        def ready() -> Tuple[str, int]:
+            """Return readiness probe result, not ready if the warmup failed."""
+            if not self.ready:
+                return jsonify(error="Presidio Analyzer service is not ready"), 503
+            return "Presidio Analyzer service is ready", 200
+
         @self.app.route("/health")
         def health() -> str:
             """Return basic health probe result."""
@@ -65,18 +103,13 @@ class Server:
                 if not req_data.language:
                     raise Exception("No language provided")
 
-                recognizer_result_list = self.engine.analyze(
+                analyze_func = (
+                    self.batcher.analyze if self.batcher else self.engine.analyze
+                )
+                recognizer_result_list = analyze_func(
                     text=req_data.text,
                     language=req_data.language,
-                    correlation_id=req_data.correlation_id,
-                    score_threshold=req_data.score_threshold,
-                    entities=req_data.entities,
-                    return_decision_process=req_data.return_decision_process,
-                    ad_hoc_recognizers=req_data.ad_hoc_recognizers,
-                    context=req_data.context,
-                    allow_list=req_data.allow_list,
-                    allow_list_match=req_data.allow_list_match,
-                    regex_flags=req_data.regex_flags,
+                    **_get_analyze_kwargs(req_data),
                 )
                 _exclude_attributes_from_dto(recognizer_result_list)
 
@@ -103,6 +136,77 @@ class Server:
                 )
                 return jsonify(error=e.args[0]), 500
 
+        @self.app.route("/analyze/batch", methods=["POST"])
+        def analyze_batch() -> Tuple[str, int]:
+            """Execute the analyzer function on a batch of texts.
+
+            Accepts either a JSON body with `texts` (a list of strings)
+            or `records` (a list of {"id", "text"} objects), together with
+            options shared by all texts, or a streaming NDJSON body with
+            one record per line, and options passed as query parameters.
+            """
+            try:
+                if request.mimetype == NDJSON_MIMETYPE:
+                    return self._analyze_batch_stream()
+
+                req_json = request.get_json()
+                req_data = AnalyzerRequest(req_json)
+                if not req_data.language:
+                    raise Exception("No language provided")
+
+                texts = req_json.get("texts")
+                records = req_json.get("records")
+                if texts is None and records is None:
+                    raise Exception("No texts or records provided")
+
+                if records is not None:
+                    texts = [record.get("text") for record in records]
+
+                batch_results = self.batch_engine.analyze_iterator(
+                    texts=texts,
+                    language=req_data.language,
+                    batch_size=_get_batch_size(req_json),
+                    **_get_analyze_kwargs(req_data),
+                )
+                for results in batch_results:
+                    _exclude_attributes_from_dto(results)
+
+                if records is not None:
+                    batch_results = [
+                        {"id": record.get("id"), "recognizer_results": results}
+                        for record, results in zip(records, batch_results)
+                    ]
+
+                return Response(
+                    json.dumps(
+                        batch_results,
+                        default=lambda o: o.to_dict(),
+                        sort_keys=True,
+                    ),
+                    content_type="application/json",
+                )
+            except TypeError as te:
+                error_msg = (
+                    f"Failed to parse /analyze/batch request "
+                    f"for BatchAnalyzerEngine.analyze_iterator(). {te.args[0]}"
+                )
+                self.logger.error(error_msg)
+                return jsonify(error=error_msg), 400
+
+            except Exception as e:
+                self.logger.error(
+                    f"A fatal error occurred during execution of "
+                    f"BatchAnalyzerEngine.analyze_iterator(). {e}"
+                )
+                return jsonify(error=e.args[0]), 500
+
+        @self.app.route("/batching/stats", methods=["GET"])
+        def batching_stats() -> Tuple[str, int]:
+            """Return micro-batching batch size and queue wait histograms."""
+            if not self.batcher:
+                return jsonify(error="Micro-batching is not enabled"), 404
+            return jsonify(self.batcher.get_stats()), 200
+
         @self.app.route("/recognizers", methods=["GET"])
         def recognizers() -> Tuple[str, int]:
             """Return a list of supported recognizers."""
@@ -136,6 +240,109 @@ class Server:
         def http_exception(e):
             return jsonify(error=e.description), e.code
 
+    def _warmup(self) -> None:
+        """Run the engine once per language, so the first request is not slowed down.
+
+        When workers are forked after loading, objects created during warmup
+        are shared with the workers as well.
+        """
+        for language in self.engine.supported_languages:
+            self.engine.analyze(text=WARMUP_TEXT, language=language)
+
+    def _analyze_batch_stream(self) -> Response:
+        """Analyze NDJSON records, streaming NDJSON results back.
+
+        Records are read and analyzed in chunks of `batch_size`,
+        so neither the request nor the response are buffered in memory.
+        """
+        req_params = request.args.to_dict()
+        for list_param in ("entities", "context", "allow_list"):
+            if list_param in req_params:
+                req_params[list_param] = request.args.get(list_param).split(",")
+        if "score_threshold" in req_params:
+            req_params["score_threshold"] = float(req_params["score_threshold"])
+
+        req_data = AnalyzerRequest(req_params)
+        if not req_data.language:
+            raise Exception("No language provided")
+        batch_size = _get_batch_size(req_params)
+        analyze_kwargs = _get_analyze_kwargs(req_data)
+        records = _read_ndjson_records(request.stream)
+
+        def generate() -> Iterator[str]:
+            while True:
+                # Reading is part of the try, as a malformed record is only
+                # found after results of previous records were streamed
+                try:
+                    chunk = list(islice(records, batch_size))
+                    if not chunk:
+                        return
+                    batch_results = self.batch_engine.analyze_iterator(
+                        texts=[record["text"] for record in chunk],
+                        language=req_data.language,
+                        batch_size=batch_size,
+                        **analyze_kwargs,
+                    )
+                except Exception as e:
+                    self.logger.error(f"Failed to process a streaming batch: {e}")
+                    if isinstance(e, json.JSONDecodeError):
+                        error = f"Invalid NDJSON record: {e}"
+                    elif isinstance(e, KeyError):
+                        error = f"Missing record field: {e}"
+                    else:
+                        error = str(e)
+                    yield json.dumps({"error": error}) + "\n"
+                    return
+
+                for record, results in zip(chunk, batch_results):
+                    _exclude_attributes_from_dto(results)
+                    yield (
+                        json.dumps(
+                            {"id": record["id"], "recognizer_results": results},
+                            default=lambda o: o.to_dict(),
+                            sort_keys=True,
+                        )
+                        + "\n"
+                    )
+
+        return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+
+def _get_analyze_kwargs(req_data: AnalyzerRequest) -> Dict[str, Any]:
+    return {
+        "correlation_id": req_data.correlation_id,
+        "score_threshold": req_data.score_threshold,
+        "entities": req_data.entities,
+        "return_decision_process": req_data.return_decision_process,
+        "ad_hoc_recognizers": req_data.ad_hoc_recognizers,
+        "context": req_data.context,
+        "allow_list": req_data.allow_list,
+        "allow_list_match": req_data.allow_list_match,
+        "regex_flags": req_data.regex_flags,
+    }
+
+
+def _get_batch_size(req_data: Dict) -> int:
+    batch_size = int(req_data.get("batch_size", DEFAULT_BATCH_SIZE))
+    if batch_size < 1:
+        raise ValueError("batch_size must be a positive integer")
+    return batch_size
+
+
+def _read_ndjson_records(stream) -> Iterator[Dict]:
+    """Read records from an NDJSON stream, either {"id", "text"} or strings."""
+    index = 0
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if isinstance(record, str):
+            record = {"text": record}
+        record.setdefault("id", index)
+        index += 1
+        yield record
+
 
 def _exclude_attributes_from_dto(recognizer_result_list):
     excluded_attributes = [
@@ -13,9 +13,12 @@ from presidio_analyzer.pattern_recognizer import PatternRecognizer
 from presidio_analyzer.remote_recognizer import RemoteRecognizer
 from presidio_analyzer.lm_recognizer import LMRecognizer
 from presidio_analyzer.recognizer_registry import RecognizerRegistry
+from presidio_analyzer.document_analysis_cache import DocumentAnalysisCache
 from presidio_analyzer.analyzer_engine import AnalyzerEngine
+from presidio_analyzer.columnar_recognizer_results import ColumnarRecognizerResults
 from presidio_analyzer.batch_analyzer_engine import BatchAnalyzerEngine
 from presidio_analyzer.analyzer_request import AnalyzerRequest
+from presidio_analyzer.analyzer_request_batcher import AnalyzerRequestBatcher
 from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer
 from presidio_analyzer.context_aware_enhancers import LemmaContextAwareEnhancer
 from presidio_analyzer.analyzer_engine_provider import AnalyzerEngineProvider
@@ -46,9 +49,12 @@ __all__ = [
     "LMRecognizer",
     "RecognizerRegistry",
     "AnalyzerEngine",
+    "DocumentAnalysisCache",
     "AnalyzerRequest",
+    "AnalyzerRequestBatcher",
     "ContextAwareEnhancer",
     "LemmaContextAwareEnhancer",
     "BatchAnalyzerEngine",
+    "ColumnarRecognizerResults",
     "AnalyzerEngineProvider",
 ]
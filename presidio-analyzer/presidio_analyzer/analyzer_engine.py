@@ -1,7 +1,7 @@
 import json
 import logging
 from collections import Counter
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import regex as re
 
@@ -14,6 +14,11 @@ from presidio_analyzer.context_aware_enhancers import (
     ContextAwareEnhancer,
     LemmaContextAwareEnhancer,
 )
+from presidio_analyzer.document_analysis_cache import (
+    AnalyzedDocument,
+    DocumentAnalysisCache,
+    find_changed_region,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts, NlpEngine, NlpEngineProvider
 from presidio_analyzer.recognizer_registry import (
     RecognizerRegistry,
@@ -43,6 +48,9 @@ class AnalyzerEngine:
     :param context_aware_enhancer: instance of type ContextAwareEnhancer for enhancing
     confidence score based on context words, (LemmaContextAwareEnhancer will be created
     by default if None passed)
+    :param document_cache: instance of type DocumentAnalysisCache, holding the last
+    analyzed version of documents for analyze_incremental
+    (a cache of up to 1000 documents will be created by default if None passed)
     """
 
     def __init__(
@@ -54,6 +62,7 @@ class AnalyzerEngine:
         default_score_threshold: float = 0,
         supported_languages: List[str] = None,
         context_aware_enhancer: Optional[ContextAwareEnhancer] = None,
+        document_cache: Optional[DocumentAnalysisCache] = None,
     ):
         if not supported_languages:
             supported_languages = ["en"]
@@ -110,6 +119,10 @@ class AnalyzerEngine:
 
         self.context_aware_enhancer = context_aware_enhancer
 
+        if not document_cache:
+            document_cache = DocumentAnalysisCache()
+        self.document_cache = document_cache
+
     def get_recognizers(self, language: Optional[str] = None) -> List[EntityRecognizer]:
         """
         Return a list of PII recognizers currently loaded.
@@ -159,6 +172,7 @@ class AnalyzerEngine:
         allow_list_match: Optional[str] = "exact",
         regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
         nlp_artifacts: Optional[NlpArtifacts] = None,
+        precomputed_results: Optional[Dict[str, List[RecognizerResult]]] = None,
     ) -> List[RecognizerResult]:
         """
         Find PII entities in text using different PII recognizers for a given language.
@@ -183,6 +197,9 @@ class AnalyzerEngine:
         - if `exact`, results which exactly match any value in the allow_list would be allowed and not be returned as potential PII.
         :param regex_flags: regex flags to be used for when allow_list_match is "regex"
         :param nlp_artifacts: precomputed NlpArtifacts
+        :param precomputed_results: precomputed results of recognizers
+        (e.g. from a batched remote call), by recognizer id.
+        These recognizers are not called again for this text.
         :return: an array of the found entities in the text
 
         :Example:
@@ -233,9 +250,12 @@ class AnalyzerEngine:
                 recognizer.is_loaded = True
 
             # analyze using the current recognizer and append the results
-            current_results = recognizer.analyze(
-                text=text, entities=entities, nlp_artifacts=nlp_artifacts
-            )
+            if precomputed_results and recognizer.id in precomputed_results:
+                current_results = precomputed_results[recognizer.id]
+            else:
+                current_results = recognizer.analyze(
+                    text=text, entities=entities, nlp_artifacts=nlp_artifacts
+                )
             if current_results:
                 # add recognizer name to recognition metadata inside results
                 # if not exists
@@ -266,6 +286,178 @@ class AnalyzerEngine:
 
         return results
 
+    def analyze_incremental(
+        self,
+        doc_id: str,
+        text: str,
+        language: str,
+        entities: Optional[List[str]] = None,
+        correlation_id: Optional[str] = None,
+        score_threshold: Optional[float] = None,
+        return_decision_process: Optional[bool] = False,
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        context: Optional[List[str]] = None,
+        allow_list: Optional[List[str]] = None,
+        allow_list_match: Optional[str] = "exact",
+        regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
+        context_margin: int = 100,
+        max_changed_ratio: float = 0.5,
+    ) -> List[RecognizerResult]:
+        """
+        Analyze a new version of a document, re-analyzing only the edited region.
+
+        The text is compared with the last analyzed version of the document
+        (kept in `document_cache`). Only the changed region, extended by
+        `context_margin` characters on each side (and up to whitespace), is
+        analyzed again. Results outside of this region are reused,
+        with their offsets shifted by the change in length.
+        The first version of a document, or a version analyzed with different
+        parameters, is analyzed in full.
+
+        Results are identical to a full analysis, unless an entity or the context
+        affecting its score spans more than `context_margin` characters
+        beyond the edited region.
+
+        :param doc_id: Identifier of the document, e.g. a path or a database key
+        :param text: The full new text of the document
+        :param language: the language of the text
+        :param entities: List of PII entities that should be looked for in the text.
+        :param correlation_id: cross call ID for this request
+        :param score_threshold: A minimum value for which
+        to return an identified entity
+        :param return_decision_process: Whether the analysis decision process steps
+        returned in the response.
+        :param ad_hoc_recognizers: List of recognizers which will be used only
+        for this specific request.
+        :param context: List of context words to enhance confidence score if matched
+        with the recognized entity's recognizer context
+        :param allow_list: List of words that the user defines as being allowed to keep
+        in the text
+        :param allow_list_match: How the allow_list should be interpreted;
+        either as "exact" or as "regex".
+        :param regex_flags: regex flags to be used for when allow_list_match is "regex"
+        :param context_margin: Number of characters around the edited region
+        which are analyzed again
+        :param max_changed_ratio: If the region to analyze is longer than
+        this ratio of the text, the full text is analyzed instead
+        :return: The results of the full text
+        """
+        analyze_params = {
+            "language": language,
+            "entities": entities,
+            "correlation_id": correlation_id,
+            "score_threshold": score_threshold,
+            "return_decision_process": return_decision_process,
+            "ad_hoc_recognizers": ad_hoc_recognizers,
+            "context": context,
+            "allow_list": allow_list,
+            "allow_list_match": allow_list_match,
+            "regex_flags": regex_flags,
+        }
+        cache_params = {
+            **analyze_params,
+            "correlation_id": None,
+            "ad_hoc_recognizers": [
+                recognizer.id for recognizer in ad_hoc_recognizers or []
+            ],
+        }
+
+        previous = self.document_cache.get(doc_id)
+        if previous is None or previous.params != cache_params:
+            results = self.analyze(text=text, **analyze_params)
+        elif previous.text == text:
+            results = self._shift_results(previous.results, 0)
+        else:
+            start, end, old_start, old_end = self._get_reanalysis_window(
+                previous, text, context_margin
+            )
+            if end - start > max_changed_ratio * len(text):
+                results = self.analyze(text=text, **analyze_params)
+            else:
+                logger.debug(
+                    f"Re-analyzing characters {start}-{end} of document {doc_id}"
+                )
+                offset = len(text) - len(previous.text)
+                results = self._shift_results(
+                    [r for r in previous.results if r.end <= old_start], 0
+                )
+                results.extend(
+                    self._shift_results(
+                        self.analyze(text=text[start:end], **analyze_params), start
+                    )
+                )
+                results.extend(
+                    self._shift_results(
+                        [r for r in previous.results if r.start >= old_end], offset
+                    )
+                )
+
+        self.document_cache.put(
+            doc_id,
+            AnalyzedDocument(
+                text=text,
+                params=cache_params,
+                results=self._shift_results(results, 0),
+            ),
+        )
+        return results
+
+    @staticmethod
+    def _get_reanalysis_window(
+        previous: AnalyzedDocument, text: str, context_margin: int
+    ) -> Tuple[int, int, int, int]:
+        """
+        Return the region of a new text version to analyze again.
+
+        :return: The start and end of the region in the new text,
+        and its start and end in the previous text
+        """
+        changed_start, old_changed_end, new_changed_end = find_changed_region(
+            previous.text, text
+        )
+        offset = len(text) - len(previous.text)
+
+        start = max(0, changed_start - context_margin)
+        while start > 0 and not text[start - 1].isspace():
+            start -= 1
+        end = min(len(text), new_changed_end + context_margin)
+        while end < len(text) and not text[end].isspace():
+            end += 1
+
+        # Extend the region over previous results it overlaps,
+        # so that they are either fully reused or detected again
+        old_start, old_end = start, max(end - offset, old_changed_end)
+        extended = True
+        while extended:
+            extended = False
+            for result in previous.results:
+                if result.start < old_end and result.end > old_start:
+                    if result.start < old_start or result.end > old_end:
+                        old_start = min(old_start, result.start)
+                        old_end = max(old_end, result.end)
+                        extended = True
+
+        return old_start, old_end + offset, old_start, old_end
+
+    @staticmethod
+    def _shift_results(
+        results: List[RecognizerResult], offset: int
+    ) -> List[RecognizerResult]:
+        """Return copies of results with their offsets shifted."""
+        return [
+            RecognizerResult(
+                entity_type=result.entity_type,
+                start=result.start + offset,
+                end=result.end + offset,
+                score=result.score,
+                analysis_explanation=result.analysis_explanation,
+                recognition_metadata=dict(result.recognition_metadata)
+                if result.recognition_metadata
+                else None,
+            )
+            for result in results
+        ]
+
     def _enhance_using_context(
         self,
         text: str,
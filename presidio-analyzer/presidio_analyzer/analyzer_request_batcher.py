@@ -0,0 +1,210 @@
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+
+from presidio_analyzer import AnalyzerEngine, RecognizerResult
+from presidio_analyzer.batching_utils import Histogram, reset_in_forked_children
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class _PendingRequest:
+    def __init__(self, text: str, language: str, kwargs: Dict):
+        self.text = text
+        self.language = language
+        self.kwargs = kwargs
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class AnalyzerRequestBatcher:
+    """
+    Coalesce concurrent analyze requests into micro-batches.
+
+    Requests arriving within `max_wait_ms` of each other are collected
+    (up to `max_batch_size`), grouped by language, and their texts are sent
+    together to `NlpEngine.process_batch`. Each request is then analyzed
+    with its own parameters, and gets back its own results.
+    This allows concurrent small requests to benefit from
+    the NLP engine's batching, without any change on the caller side.
+
+    The background worker thread is started on the first request, and again
+    in each forked child process (e.g. gunicorn workers of a preloaded app).
+
+    :param analyzer_engine: The AnalyzerEngine used for analysis
+    :param max_batch_size: Maximum number of requests in a single batch
+    :param max_wait_ms: Maximum time (in milliseconds) the first request
+    in a batch waits for additional requests to arrive
+    """
+
+    BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+    QUEUE_WAIT_MS_BUCKETS = (0.5, 1, 2, 5, 10, 25, 50, 100, 250)
+
+    def __init__(
+        self,
+        analyzer_engine: AnalyzerEngine,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+
+        self.analyzer_engine = analyzer_engine
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+
+        self.batch_size_histogram = Histogram(self.BATCH_SIZE_BUCKETS)
+        self.queue_wait_ms_histogram = Histogram(self.QUEUE_WAIT_MS_BUCKETS)
+
+        self._closed = False
+        self._reset_after_fork()
+        reset_in_forked_children(self)
+
+    def analyze(self, text: str, language: str, **kwargs) -> List[RecognizerResult]:
+        """
+        Analyze a text, possibly together with other concurrent requests.
+
+        Blocks until the results for this text are available.
+
+        :param text: the text to analyze
+        :param language: the language of the text
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        """
+        if self._closed:
+            raise RuntimeError("AnalyzerRequestBatcher is closed")
+
+        nlp_artifacts = kwargs.pop("nlp_artifacts", None)
+        if nlp_artifacts:
+            # NLP already ran for this text, nothing to batch
+            return self.analyzer_engine.analyze(
+                text=text, language=language, nlp_artifacts=nlp_artifacts, **kwargs
+            )
+
+        request = _PendingRequest(text=text, language=language, kwargs=kwargs)
+        self._start_worker()
+        self._queue.put(request)
+        return request.future.result()
+
+    def get_stats(self) -> Dict:
+        """Return the batch size and queue wait histograms."""
+        return {
+            "batch_size": self.batch_size_histogram.to_dict(),
+            "queue_wait_ms": self.queue_wait_ms_histogram.to_dict(),
+        }
+
+    def close(self) -> None:
+        """Stop the background worker after handling already queued requests."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            worker = self._worker
+        if worker:
+            self._queue.put(None)
+            worker.join()
+
+    def _start_worker(self) -> None:
+        if self._worker:
+            return
+        with self._lock:
+            if not self._worker:
+                self._worker = threading.Thread(
+                    target=self._run, name="presidio-analyzer-batcher", daemon=True
+                )
+                self._worker.start()
+
+    def _reset_after_fork(self) -> None:
+        # The worker thread of the parent process does not exist in a child,
+        # and the queue and lock may have been in use while forking
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[_PendingRequest]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            stop = self._collect_batch(batch)
+            self._process_batch(batch)
+            if stop:
+                return
+
+    def _collect_batch(self, batch: List[_PendingRequest]) -> bool:
+        """Add queued requests to the batch, return True if closing."""
+        deadline = batch[0].enqueued_at + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    request = self._queue.get(timeout=timeout)
+                else:
+                    request = self._queue.get_nowait()
+            except queue.Empty:
+                return False
+
+            if request is None:
+                return True
+            batch.append(request)
+        return False
+
+    def _process_batch(self, batch: List[_PendingRequest]) -> None:
+        self.batch_size_histogram.observe(len(batch))
+        started_at = time.monotonic()
+        for request in batch:
+            self.queue_wait_ms_histogram.observe(
+                (started_at - request.enqueued_at) * 1000
+            )
+
+        requests_by_language = defaultdict(list)
+        for request in batch:
+            requests_by_language[request.language].append(request)
+
+        for language, requests in requests_by_language.items():
+            self._analyze_requests(language, requests)
+
+    def _analyze_requests(self, language: str, requests: List[_PendingRequest]) -> None:
+        try:
+            nlp_artifacts_batch = list(
+                self.analyzer_engine.nlp_engine.process_batch(
+                    texts=[request.text for request in requests],
+                    language=language,
+                    batch_size=len(requests),
+                )
+            )
+        except Exception as e:
+            logger.error(f"Failed to run NLP engine on batch: {e}")
+            for request in requests:
+                request.future.set_exception(e)
+            return
+
+        if len(nlp_artifacts_batch) != len(requests):
+            # Results cannot be matched to requests, fail all of them
+            error = RuntimeError(
+                f"NLP engine returned {len(nlp_artifacts_batch)} results "
+                f"for a batch of {len(requests)} texts"
+            )
+            logger.error(str(error))
+            for request in requests:
+                request.future.set_exception(error)
+            return
+
+        for request, (_, nlp_artifacts) in zip(requests, nlp_artifacts_batch):
+            try:
+                results = self.analyzer_engine.analyze(
+                    text=request.text,
+                    language=language,
+                    nlp_artifacts=nlp_artifacts,
+                    **request.kwargs,
+                )
+                request.future.set_result(results)
+            except Exception as e:
+                request.future.set_exception(e)
@@ -1,7 +1,14 @@
 import logging
+from itertools import islice
 from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
-from presidio_analyzer import AnalyzerEngine, DictAnalyzerResult, RecognizerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    ColumnarRecognizerResults,
+    DictAnalyzerResult,
+    RecognizerResult,
+    RemoteRecognizer,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -14,14 +21,28 @@ class BatchAnalyzerEngine:
     Wrapper class to run Presidio Analyzer Engine on multiple values,
     either lists/iterators of strings, or dictionaries.
 
+    Remote recognizers (see `RemoteRecognizer.analyze_batch`) are called
+    once per chunk of `remote_batch_size` texts, allowing them to send
+    multiple texts in each request to the remote service.
+
     :param analyzer_engine: AnalyzerEngine instance to use
     for handling the values in those collections.
+    :param remote_batch_size: Number of texts sent together
+    to the `analyze_batch` method of remote recognizers.
     """
 
-    def __init__(self, analyzer_engine: Optional[AnalyzerEngine] = None):
+    def __init__(
+        self,
+        analyzer_engine: Optional[AnalyzerEngine] = None,
+        remote_batch_size: int = 100,
+    ):
+        if remote_batch_size < 1:
+            raise ValueError("remote_batch_size must be a positive integer")
+
         self.analyzer_engine = analyzer_engine
         if not analyzer_engine:
             self.analyzer_engine = AnalyzerEngine()
+        self.remote_batch_size = remote_batch_size
 
     def analyze_iterator(
         self,
@@ -55,15 +76,51 @@ class BatchAnalyzerEngine:
             )
         )
 
-        list_results = []
-        for text, nlp_artifacts in nlp_artifacts_batch:
-            results = self.analyzer_engine.analyze(
-                text=str(text), nlp_artifacts=nlp_artifacts, language=language, **kwargs
+        return list(
+            self._analyze_nlp_artifacts(nlp_artifacts_batch, language, **kwargs)
+        )
+
+    def analyze_iterator_columnar(
+        self,
+        texts: Iterable[Union[str, bool, float, int]],
+        language: str,
+        batch_size: int = 1,
+        n_process: int = 1,
+        **kwargs,
+    ) -> ColumnarRecognizerResults:
+        """
+        Analyze an iterable of strings, returning results in a columnar container.
+
+        Same as `analyze_iterator`, but the results of each text are packed
+        into flat arrays as soon as they are produced, instead of being
+        kept as RecognizerResult objects. Prefer this method when analyzing
+        large collections, or when results are consumed as a table.
+
+        :param texts: An list containing strings to be analyzed.
+        :param language: Input language
+        :param batch_size: Batch size to process in a single iteration
+        :param n_process: Number of processors to use. Defaults to `1`
+        :param kwargs: Additional parameters for the `AnalyzerEngine.analyze` method.
+        """
+
+        texts = self._validate_types(texts)
+
+        nlp_artifacts_batch: Iterator[Tuple[str, NlpArtifacts]] = (
+            self.analyzer_engine.nlp_engine.process_batch(
+                texts=texts,
+                language=language,
+                batch_size=batch_size,
+                n_process=n_process,
             )
+        )
 
-            list_results.append(results)
+        columnar_results = ColumnarRecognizerResults()
+        for results in self._analyze_nlp_artifacts(
+            nlp_artifacts_batch, language, **kwargs
+        ):
+            columnar_results.append_row(results)
 
-        return list_results
+        return columnar_results
 
     def analyze_dict(
         self,
@@ -138,6 +195,69 @@ class BatchAnalyzerEngine:
 
             yield DictAnalyzerResult(key=key, value=value, recognizer_results=results)
 
+    def _analyze_nlp_artifacts(
+        self,
+        nlp_artifacts_batch: Iterator[Tuple[str, NlpArtifacts]],
+        language: str,
+        **kwargs,
+    ) -> Iterator[List[RecognizerResult]]:
+        """Analyze texts with their NLP artifacts, batching remote recognizer calls."""
+        entities = kwargs.get("entities")
+        remote_recognizers = [
+            recognizer
+            for recognizer in self.analyzer_engine.registry.get_recognizers(
+                language=language,
+                entities=entities,
+                all_fields=not entities,
+                ad_hoc_recognizers=kwargs.get("ad_hoc_recognizers"),
+            )
+            if isinstance(recognizer, RemoteRecognizer)
+        ]
+
+        if not remote_recognizers:
+            for text, nlp_artifacts in nlp_artifacts_batch:
+                yield self.analyzer_engine.analyze(
+                    text=str(text),
+                    nlp_artifacts=nlp_artifacts,
+                    language=language,
+                    **kwargs,
+                )
+            return
+
+        if not entities:
+            entities = self.analyzer_engine.get_supported_entities(language=language)
+
+        nlp_artifacts_batch = iter(nlp_artifacts_batch)
+        while True:
+            chunk = list(islice(nlp_artifacts_batch, self.remote_batch_size))
+            if not chunk:
+                return
+
+            texts = [str(text) for text, _ in chunk]
+            nlp_artifacts_list = [nlp_artifacts for _, nlp_artifacts in chunk]
+            remote_results = {}
+            for recognizer in remote_recognizers:
+                if not recognizer.is_loaded:
+                    recognizer.load()
+                    recognizer.is_loaded = True
+                remote_results[recognizer.id] = recognizer.analyze_batch(
+                    texts=texts,
+                    entities=entities,
+                    nlp_artifacts_list=nlp_artifacts_list,
+                )
+
+            for i, (text, nlp_artifacts) in enumerate(zip(texts, nlp_artifacts_list)):
+                yield self.analyzer_engine.analyze(
+                    text=text,
+                    nlp_artifacts=nlp_artifacts,
+                    language=language,
+                    precomputed_results={
+                        recognizer_id: results[i]
+                        for recognizer_id, results in remote_results.items()
+                    },
+                    **kwargs,
+                )
+
     @staticmethod
     def _validate_types(value_iterator: Iterable[Any]) -> Iterator[Any]:
         for val in value_iterator:
@@ -0,0 +1,64 @@
+"""Utilities shared by the components batching requests in a background thread."""
+
+import os
+import threading
+import weakref
+from bisect import bisect_left
+from typing import Dict, Sequence
+
+
+def reset_in_forked_children(instance: object) -> None:
+    """
+    Call `instance._reset_after_fork()` in child processes forked from now on.
+
+    Threads do not survive `fork()`, so a component created before forking
+    (e.g. in a gunicorn master process with `preload_app`) must drop its
+    background thread, queue and locks in each worker, and start them again
+    when first used there. Only a weak reference to the instance is kept.
+
+    :param instance: An object with a `_reset_after_fork` method
+    """
+    if not hasattr(os, "register_at_fork"):
+        return
+
+    instance_ref = weakref.ref(instance)
+
+    def reset() -> None:
+        instance = instance_ref()
+        if instance is not None:
+            instance._reset_after_fork()
+
+    os.register_at_fork(after_in_child=reset)
+
+
+class Histogram:
+    """
+    Simple cumulative histogram, used for reporting batching statistics.
+
+    :param buckets: Sorted upper bounds of the histogram buckets.
+    Values above the last bound are counted in an additional overflow bucket.
+    """
+
+    def __init__(self, buckets: Sequence[float]):
+        self.buckets = list(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        """Record a single value."""
+        with self._lock:
+            self.counts[bisect_left(self.buckets, value)] += 1
+            self.count += 1
+            self.sum += value
+
+    def to_dict(self) -> Dict:
+        """Return the histogram as a dictionary of cumulative bucket counts."""
+        with self._lock:
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(self.buckets + ["+Inf"], self.counts):
+                cumulative += count
+                buckets[str(bound)] = cumulative
+            return {"buckets": buckets, "count": self.count, "sum": self.sum}
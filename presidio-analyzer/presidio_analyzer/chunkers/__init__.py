@@ -1,6 +1,11 @@
 """Text chunking strategies for handling long texts."""
 
-from presidio_analyzer.chunkers.base_chunker import BaseTextChunker, TextChunk
+from presidio_analyzer.chunkers.base_chunker import (
+    BaseTextChunker,
+    ChunkError,
+    ChunkPredictionError,
+    TextChunk,
+)
 from presidio_analyzer.chunkers.character_based_text_chunker import (
     CharacterBasedTextChunker,
 )
@@ -9,6 +14,8 @@ from presidio_analyzer.chunkers.text_chunker_provider import TextChunkerProvider
 __all__ = [
     "BaseTextChunker",
     "TextChunk",
+    "ChunkError",
+    "ChunkPredictionError",
     "CharacterBasedTextChunker",
     "TextChunkerProvider",
 ]
@@ -1,11 +1,15 @@
 """Abstract base class for text chunking strategies."""
+import logging
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, Callable, List
+from typing import TYPE_CHECKING, Callable, List, Tuple
 
 if TYPE_CHECKING:
     from presidio_analyzer import RecognizerResult
 
+logger = logging.getLogger("presidio-analyzer")
+
 
 @dataclass
 class TextChunk:
@@ -21,6 +25,38 @@ class TextChunk:
     end: int
 
 
+@dataclass
+class ChunkError:
+    """A chunk for which prediction failed.
+
+    :param chunk: The chunk
+    :param error: The raised exception
+    """
+
+    chunk: TextChunk
+    error: Exception
+
+
+class ChunkPredictionError(Exception):
+    """Raised when prediction failed for some of the chunks of a text.
+
+    :param chunk_errors: The failed chunks and their errors
+    :param results: Deduplicated predictions of the successful chunks
+    """
+
+    def __init__(
+        self, chunk_errors: List[ChunkError], results: List["RecognizerResult"]
+    ):
+        self.chunk_errors = chunk_errors
+        self.results = results
+        failed = ", ".join(
+            f"[{e.chunk.start}:{e.chunk.end}] {e.error!r}" for e in chunk_errors
+        )
+        super().__init__(
+            f"Prediction failed for {len(chunk_errors)} chunk(s): {failed}"
+        )
+
+
 class BaseTextChunker(ABC):
     """Abstract base class for text chunking strategies.
 
@@ -44,15 +80,27 @@ class BaseTextChunker(ABC):
         self,
         text: str,
         predict_func: Callable[[str], List["RecognizerResult"]],
+        max_concurrency: int = 1,
+        allow_partial_results: bool = False,
     ) -> List["RecognizerResult"]:
         """Process text with automatic chunking for long texts.
 
         For short text, calls predict_func directly.
         For long text, chunks it and merges predictions with deduplication.
 
+        By default, chunks are processed one at a time and the exception
+        of the first failing chunk is raised as is. When chunks are processed
+        in parallel, or partial results are allowed, the other chunks are
+        still processed if prediction fails for some chunks,
+        and each failed chunk is logged.
+
         :param text: Input text to process
         :param predict_func: Function that takes text and returns
             RecognizerResult objects
+        :param max_concurrency: Maximum number of chunks processed in parallel
+        :param allow_partial_results: Return the predictions of the successful
+            chunks if some chunks failed. Otherwise, ChunkPredictionError is
+            raised when max_concurrency is greater than 1
         :return: List of RecognizerResult with correct offsets
         """
         chunks = self.chunk(text)
@@ -61,27 +109,69 @@ class BaseTextChunker(ABC):
         if len(chunks) == 1:
             return predict_func(text)
 
-        predictions = self._process_chunks(chunks, predict_func)
-        return self.deduplicate_overlapping_entities(predictions)
+        fail_fast = max_concurrency <= 1 and not allow_partial_results
+        predictions, chunk_errors = self._process_chunks(
+            chunks, predict_func, max_concurrency, fail_fast=fail_fast
+        )
+        predictions = self.deduplicate_overlapping_entities(predictions)
+
+        if chunk_errors:
+            for chunk_error in chunk_errors:
+                logger.warning(
+                    "Prediction failed for chunk [%d:%d]: %r",
+                    chunk_error.chunk.start,
+                    chunk_error.chunk.end,
+                    chunk_error.error,
+                )
+            if not allow_partial_results:
+                raise ChunkPredictionError(
+                    chunk_errors, predictions
+                ) from chunk_errors[0].error
+        return predictions
 
     def _process_chunks(
         self,
         chunks: List[TextChunk],
         process_func: Callable[[str], List["RecognizerResult"]],
-    ) -> List["RecognizerResult"]:
+        max_concurrency: int = 1,
+        fail_fast: bool = False,
+    ) -> Tuple[List["RecognizerResult"], List[ChunkError]]:
         """Process text chunks and adjust entity offsets.
 
         :param chunks: List of TextChunk objects with text and position information
         :param process_func: Function that takes chunk text and returns
             RecognizerResult objects
-        :return: List of RecognizerResult with adjusted offsets
+        :param max_concurrency: Maximum number of chunks processed in parallel
+        :param fail_fast: Raise the exception of the first failing chunk,
+            without processing the following chunks
+        :return: List of RecognizerResult with adjusted offsets,
+            and the chunks for which process_func raised an exception
         """
         from presidio_analyzer import RecognizerResult
 
+        def process_chunk(chunk: TextChunk):
+            if fail_fast:
+                return process_func(chunk.text), None
+            try:
+                return process_func(chunk.text), None
+            except Exception as e:
+                return None, ChunkError(chunk=chunk, error=e)
+
+        if max_concurrency > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(max_concurrency, len(chunks))
+            ) as executor:
+                outputs = list(executor.map(process_chunk, chunks))
+        else:
+            outputs = [process_chunk(chunk) for chunk in chunks]
+
         all_predictions = []
+        chunk_errors = []
 
-        for chunk in chunks:
-            chunk_predictions = process_func(chunk.text)
+        for chunk, (chunk_predictions, chunk_error) in zip(chunks, outputs):
+            if chunk_error:
+                chunk_errors.append(chunk_error)
+                continue
 
             # Create new RecognizerResult objects with adjusted offsets
             # to avoid mutating the original predictions
@@ -96,7 +186,7 @@ class BaseTextChunker(ABC):
                 )
                 all_predictions.append(adjusted_pred)
 
-        return all_predictions
+        return all_predictions, chunk_errors
 
     def deduplicate_overlapping_entities(
         self,
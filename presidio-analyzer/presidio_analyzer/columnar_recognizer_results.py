@@ -0,0 +1,250 @@
+from array import array
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional
+
+from presidio_analyzer import RecognizerResult
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+class ColumnarRecognizerResults:
+    """
+    Columnar container for the results of analyzing many texts.
+
+    Instead of holding one RecognizerResult object per detected entity,
+    results are stored as flat typed arrays (row id, start, end, score,
+    entity type id and recognizer id), with entity types and recognizer
+    names kept once in lookup tables. This keeps memory and GC overhead
+    low for bulk analysis, and allows zero-copy conversion
+    to numpy, pandas and Arrow.
+
+    RecognizerResult objects are only created when a row is accessed,
+    e.g. `results[3]` or `for row_results in results`.
+    Materialized results contain the entity type, offsets, score and
+    recognizer name, but not the analysis explanation.
+    """
+
+    def __init__(self):
+        self.row_ids = array("q")
+        self.starts = array("q")
+        self.ends = array("q")
+        self.scores = array("d")
+        self.entity_type_ids = array("i")
+        self.recognizer_ids = array("i")
+
+        self.entity_types: List[str] = []
+        self.recognizer_names: List[str] = []
+
+        # row_offsets[i]:row_offsets[i+1] is the range of results of row i
+        self._row_offsets = array("q", [0])
+        self._entity_type_index: Dict[str, int] = {}
+        self._recognizer_index: Dict[str, int] = {}
+
+    @classmethod
+    def from_lists(
+        cls, list_results: Iterable[List[RecognizerResult]]
+    ) -> "ColumnarRecognizerResults":
+        """
+        Create a columnar container from lists of results, one list per text.
+
+        :param list_results: An iterable of lists of RecognizerResult
+        """
+        columnar_results = cls()
+        for results in list_results:
+            columnar_results.append_row(results)
+        return columnar_results
+
+    def append_row(self, results: List[RecognizerResult]) -> None:
+        """
+        Add the results of one text as a new row.
+
+        :param results: The results of analyzing a single text
+        """
+        row_id = len(self)
+        for result in results:
+            self.row_ids.append(row_id)
+            self.starts.append(result.start)
+            self.ends.append(result.end)
+            self.scores.append(result.score)
+            self.entity_type_ids.append(self.__get_entity_type_id(result.entity_type))
+            self.recognizer_ids.append(
+                self.__get_recognizer_id(self.__get_recognizer_name(result))
+            )
+        self._row_offsets.append(len(self.starts))
+
+    @property
+    def num_results(self) -> int:
+        """Return the total number of results across all rows."""
+        return len(self.starts)
+
+    def get_row(self, row_id: int) -> List[RecognizerResult]:
+        """
+        Materialize the results of one row as RecognizerResult objects.
+
+        :param row_id: Index of the analyzed text
+        """
+        if row_id < 0:
+            row_id += len(self)
+        if not 0 <= row_id < len(self):
+            raise IndexError("row index out of range")
+
+        return [
+            self.__materialize(i)
+            for i in range(self._row_offsets[row_id], self._row_offsets[row_id + 1])
+        ]
+
+    def to_numpy(self) -> Dict[str, "np.ndarray"]:
+        """
+        Return the columns as numpy arrays sharing memory with this container.
+
+        Entity types and recognizers are returned as integer ids,
+        see `entity_types` and `recognizer_names` for the lookup tables.
+        A recognizer id of -1 means the result had no recognizer name.
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "numpy is required for to_numpy. "
+                "Install it with `pip install numpy`."
+            )
+
+        return {
+            "row_id": np.frombuffer(self.row_ids, dtype=np.int64),
+            "start": np.frombuffer(self.starts, dtype=np.int64),
+            "end": np.frombuffer(self.ends, dtype=np.int64),
+            "score": np.frombuffer(self.scores, dtype=np.float64),
+            "entity_type_id": np.frombuffer(self.entity_type_ids, dtype=np.int32),
+            "recognizer_id": np.frombuffer(self.recognizer_ids, dtype=np.int32),
+        }
+
+    def to_pandas(self) -> "pd.DataFrame":  # noqa: F821
+        """
+        Return the results as a pandas DataFrame, one line per result.
+
+        Entity types and recognizer names are returned as categorical columns
+        built on top of the id arrays.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError(
+                "pandas is required for to_pandas. "
+                "Install it with `pip install pandas`."
+            )
+
+        columns = self.to_numpy()
+        return pd.DataFrame(
+            {
+                "row_id": columns["row_id"],
+                "start": columns["start"],
+                "end": columns["end"],
+                "score": columns["score"],
+                "entity_type": pd.Categorical.from_codes(
+                    columns["entity_type_id"], categories=self.entity_types
+                ),
+                "recognizer_name": pd.Categorical.from_codes(
+                    columns["recognizer_id"], categories=self.recognizer_names
+                ),
+            },
+            copy=False,
+        )
+
+    def to_arrow(self) -> "pa.Table":  # noqa: F821
+        """
+        Return the results as a pyarrow Table, one line per result.
+
+        Entity types and recognizer names are returned as dictionary-encoded
+        columns built on top of the id arrays.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError:
+            raise ImportError(
+                "pyarrow is required for to_arrow. "
+                "Install it with `pip install pyarrow`."
+            )
+
+        columns = self.to_numpy()
+        return pa.table(
+            {
+                "row_id": pa.array(columns["row_id"]),
+                "start": pa.array(columns["start"]),
+                "end": pa.array(columns["end"]),
+                "score": pa.array(columns["score"]),
+                "entity_type": pa.DictionaryArray.from_arrays(
+                    pa.array(columns["entity_type_id"]),
+                    pa.array(self.entity_types, type=pa.string()),
+                ),
+                "recognizer_name": pa.DictionaryArray.from_arrays(
+                    pa.array(
+                        columns["recognizer_id"], mask=columns["recognizer_id"] < 0
+                    ),
+                    pa.array(self.recognizer_names, type=pa.string()),
+                ),
+            }
+        )
+
+    def to_lists(self) -> List[List[RecognizerResult]]:
+        """Materialize all rows as lists of RecognizerResult."""
+        return list(self)
+
+    def __len__(self) -> int:
+        """Return the number of rows (analyzed texts)."""
+        return len(self._row_offsets) - 1
+
+    def __getitem__(self, row_id: int) -> List[RecognizerResult]:
+        """Materialize the results of one row, see `get_row`."""
+        return self.get_row(row_id)
+
+    def __iter__(self) -> Iterator[List[RecognizerResult]]:
+        """Iterate over rows, materializing each one when reached."""
+        for row_id in range(len(self)):
+            yield self.get_row(row_id)
+
+    def __repr__(self) -> str:
+        """Return a string representation of the instance."""
+        return (
+            f"ColumnarRecognizerResults(rows={len(self)}, results={self.num_results})"
+        )
+
+    def __materialize(self, i: int) -> RecognizerResult:
+        recognizer_id = self.recognizer_ids[i]
+        recognition_metadata = None
+        if recognizer_id >= 0:
+            recognition_metadata = {
+                RecognizerResult.RECOGNIZER_NAME_KEY: self.recognizer_names[
+                    recognizer_id
+                ]
+            }
+        return RecognizerResult(
+            entity_type=self.entity_types[self.entity_type_ids[i]],
+            start=self.starts[i],
+            end=self.ends[i],
+            score=self.scores[i],
+            recognition_metadata=recognition_metadata,
+        )
+
+    def __get_entity_type_id(self, entity_type: str) -> int:
+        entity_type_id = self._entity_type_index.get(entity_type)
+        if entity_type_id is None:
+            entity_type_id = len(self.entity_types)
+            self._entity_type_index[entity_type] = entity_type_id
+            self.entity_types.append(entity_type)
+        return entity_type_id
+
+    def __get_recognizer_id(self, recognizer_name: Optional[str]) -> int:
+        if recognizer_name is None:
+            return -1
+        recognizer_id = self._recognizer_index.get(recognizer_name)
+        if recognizer_id is None:
+            recognizer_id = len(self.recognizer_names)
+            self._recognizer_index[recognizer_name] = recognizer_id
+            self.recognizer_names.append(recognizer_name)
+        return recognizer_id
+
+    @staticmethod
+    def __get_recognizer_name(result: RecognizerResult) -> Optional[str]:
+        if not result.recognition_metadata:
+            return None
+        return result.recognition_metadata.get(RecognizerResult.RECOGNIZER_NAME_KEY)
@@ -1,6 +1,7 @@
 """Context awareness modules."""
 
 from .context_aware_enhancer import ContextAwareEnhancer
+from .context_matcher import ContextMatcher
 from .lemma_context_aware_enhancer import LemmaContextAwareEnhancer
 
-__all__ = ["ContextAwareEnhancer", "LemmaContextAwareEnhancer"]
+__all__ = ["ContextAwareEnhancer", "ContextMatcher", "LemmaContextAwareEnhancer"]
@@ -0,0 +1,134 @@
+import logging
+from bisect import bisect_left, bisect_right
+from typing import Dict, Iterable, List, Set, Tuple
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class ContextMatcher:
+    """
+    Matcher of recognizer context words and phrases over the lemmas of a document.
+
+    Compiled once from the context entries of the recognizers:
+    multi-word phrases (e.g. "social security") are stored in a trie over words,
+    and single words are matched as substrings of lemmas
+    (e.g. "phone" matches "telephone"), memoized per lemma.
+
+    `index_document` scans the tokens of a document once, and returns
+    a `DocumentContextIndex` for looking up the entries found
+    in a window of tokens.
+
+    :param context_entries: Context words and phrases to match
+    """
+
+    MAX_MEMOIZED_LEMMAS = 100000
+
+    def __init__(self, context_entries: Iterable[str]):
+        self.entries: Set[str] = set()
+        self.words: List[str] = []
+        self._trie: Dict = {}
+        self.max_phrase_length = 1
+        self._lemma_matches: Dict[str, Tuple[str, ...]] = {}
+
+        for entry in context_entries:
+            if entry in self.entries:
+                continue
+            self.entries.add(entry)
+
+            phrase_words = entry.lower().split()
+            if len(phrase_words) > 1:
+                node = self._trie
+                for word in phrase_words:
+                    node = node.setdefault(word, {})
+                node.setdefault(None, []).append(entry)
+                self.max_phrase_length = max(self.max_phrase_length, len(phrase_words))
+            else:
+                self.words.append(entry)
+
+    def contains(self, context_entries: Iterable[str]) -> bool:
+        """
+        Return whether all the given entries were compiled into this matcher.
+
+        :param context_entries: Context words and phrases
+        """
+        return all(entry in self.entries for entry in context_entries)
+
+    def index_document(
+        self,
+        lemmas: List[str],
+        tokens: List[str],
+        keywords: Set[str],
+    ) -> "DocumentContextIndex":
+        """
+        Find all context words and phrases in a document.
+
+        Single words are matched against keyword lemmas only
+        (e.g. not stopwords or punctuation), phrases are matched against
+        consecutive tokens, by their lemma or their text.
+
+        :param lemmas: The lemmas of the document tokens
+        :param tokens: The texts of the document tokens
+        :param keywords: The lowercase lemmas considered as keywords
+        """
+        lower_lemmas = [lemma.lower() for lemma in lemmas]
+        lower_tokens = [token.lower() for token in tokens]
+
+        occurrences = []
+        for i, lemma in enumerate(lower_lemmas):
+            if lemma in keywords:
+                for entry in self._match_lemma(lemma):
+                    occurrences.append((i, i + 1, entry))
+
+            node = self._trie
+            j = i
+            while node and j < len(lower_lemmas):
+                node = node.get(lower_lemmas[j]) or node.get(lower_tokens[j])
+                if not node:
+                    break
+                j += 1
+                for entry in node.get(None, []):
+                    occurrences.append((i, j, entry))
+
+        return DocumentContextIndex(occurrences, self.max_phrase_length)
+
+    def _match_lemma(self, lemma: str) -> Tuple[str, ...]:
+        matches = self._lemma_matches.get(lemma)
+        if matches is None:
+            matches = tuple(word for word in self.words if word in lemma)
+            if len(self._lemma_matches) >= self.MAX_MEMOIZED_LEMMAS:
+                self._lemma_matches.clear()
+            self._lemma_matches[lemma] = matches
+        return matches
+
+
+class DocumentContextIndex:
+    """
+    Context words and phrases found in a document, sorted by token position.
+
+    :param occurrences: Tuples of start token index, end token index
+    (exclusive) and matched context entry
+    :param max_phrase_length: Maximum number of words in a context phrase
+    """
+
+    def __init__(
+        self, occurrences: List[Tuple[int, int, str]], max_phrase_length: int
+    ):
+        occurrences.sort(key=lambda occurrence: occurrence[0])
+        self.occurrences = occurrences
+        self.starts = [occurrence[0] for occurrence in occurrences]
+        self.max_phrase_length = max_phrase_length
+
+    def find(self, first_token: int, last_token: int) -> Set[str]:
+        """
+        Return the context entries overlapping a window of tokens.
+
+        :param first_token: Index of the first token of the window
+        :param last_token: Index of the last token of the window (inclusive)
+        """
+        low = bisect_left(self.starts, first_token - self.max_phrase_length + 1)
+        high = bisect_right(self.starts, last_token)
+        return {
+            entry
+            for _, end, entry in self.occurrences[low:high]
+            if end > first_token
+        }
@@ -1,9 +1,16 @@
 import copy
 import logging
-from typing import List, Optional
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import FrozenSet, List, Optional, Set, Tuple
 
 from presidio_analyzer import EntityRecognizer, RecognizerResult
 from presidio_analyzer.context_aware_enhancers import ContextAwareEnhancer
+from presidio_analyzer.context_aware_enhancers.context_matcher import (
+    ContextMatcher,
+    DocumentContextIndex,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -19,12 +26,20 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
     context and the recognizer context words,
     if matched it enhance the recognized entity confidence score by a given factor.
 
+    Recognizer context entries may also be multi-word phrases
+    (e.g. "social security"), matched against consecutive words.
+    The context entries of the recognizers are compiled once into a
+    ContextMatcher, which indexes the lemmas of each document in a single pass.
+    The matchers of the most recently used sets of context entries are kept.
+
     :param context_similarity_factor: How much to enhance confidence of match entity
     :param min_score_with_context_similarity: Minimum confidence score
     :param context_prefix_count: how many words before the entity to match context
     :param context_suffix_count: how many words after the entity to match context
     """
 
+    MAX_CONTEXT_MATCHERS = 16
+
     def __init__(
         self,
         context_similarity_factor: float = 0.35,
@@ -38,6 +53,10 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
             context_prefix_count=context_prefix_count,
             context_suffix_count=context_suffix_count,
         )
+        self._context_matchers: "OrderedDict[FrozenSet[str], ContextMatcher]" = (
+            OrderedDict()
+        )
+        self._context_matchers_lock = threading.Lock()
 
     def enhance_using_context(
         self,
@@ -83,6 +102,7 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
             logger.warning("NLP artifacts were not provided")
             return results
 
+        document_index = None
         for result in results:
             recognizer = None
             # get recognizer matching the result, if found.
@@ -120,18 +140,29 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
                 logger.debug("result score already boosted, skipping")
                 continue
 
-            # extract lemmatized context from the surrounding of the match
-            word = text[result.start : result.end]
+            # index the context words and phrases of the document once
+            if document_index is None:
+                keywords = set(nlp_artifacts.keywords)
+                token_ends = self._get_token_ends(nlp_artifacts)
+                document_index = self._index_document(
+                    nlp_artifacts, recognizers, keywords
+                )
 
-            surrounding_words = self._extract_surrounding_words(
-                nlp_artifacts=nlp_artifacts, word=word, start=result.start
+            # find context entries around the match
+            word = text[result.start : result.end]
+            surrounding_entries = self._find_surrounding_context(
+                nlp_artifacts=nlp_artifacts,
+                document_index=document_index,
+                token_ends=token_ends,
+                keywords=keywords,
+                word=word,
+                start=result.start,
             )
 
-            # combine other sources of context with surrounding words
-            surrounding_words.extend(context)
-
+            # the first recognizer context entry found around the match,
+            # or in the input context
             supportive_context_word = self._find_supportive_word_in_context(
-                surrounding_words, recognizer.context
+                list(surrounding_entries) + context, recognizer.context
             )
             if supportive_context_word != "":
                 result.score += self.context_similarity_factor
@@ -185,60 +216,131 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
 
         return word
 
-    def _extract_surrounding_words(
-        self, nlp_artifacts: NlpArtifacts, word: str, start: int
-    ) -> List[str]:
-        """Extract words surrounding another given word.
+    def _index_document(
+        self,
+        nlp_artifacts: NlpArtifacts,
+        recognizers: List[EntityRecognizer],
+        keywords: Set[str],
+    ) -> DocumentContextIndex:
+        """Find the context entries of the recognizers in the document tokens."""
+        matcher = self._get_context_matcher(
+            frozenset(
+                entry
+                for recognizer in recognizers
+                if recognizer.context
+                for entry in recognizer.context
+            )
+        )
+
+        if not nlp_artifacts.tokens:
+            return DocumentContextIndex([], matcher.max_phrase_length)
+
+        return matcher.index_document(
+            lemmas=nlp_artifacts.lemmas,
+            tokens=[str(token) for token in nlp_artifacts.tokens],
+            keywords=keywords,
+        )
+
+    def _get_context_matcher(self, context_entries: FrozenSet[str]) -> ContextMatcher:
+        """Return the compiled matcher of a set of context entries."""
+        with self._context_matchers_lock:
+            matcher = self._context_matchers.get(context_entries)
+            if matcher is not None:
+                self._context_matchers.move_to_end(context_entries)
+                return matcher
 
-        The text from which the context is extracted is given in the nlp
-        doc.
+            matcher = ContextMatcher(sorted(context_entries))
+            self._context_matchers[context_entries] = matcher
+            if len(self._context_matchers) > self.MAX_CONTEXT_MATCHERS:
+                self._context_matchers.popitem(last=False)
+            return matcher
 
-        :param nlp_artifacts: An abstraction layer which holds different
-                              items which are the result of a NLP pipeline
-                              execution on a given text
-        :param word: The word to look for context around
-        :param start: The start index of the word in the original text
+    @staticmethod
+    def _get_token_ends(nlp_artifacts: NlpArtifacts) -> Optional[List[int]]:
+        """Return the end offsets of the tokens, or None if they are not sorted."""
+        if not nlp_artifacts.tokens:
+            return None
+        token_ends = [
+            token_start + len(token)
+            for token_start, token in zip(
+                nlp_artifacts.tokens_indices, nlp_artifacts.tokens
+            )
+        ]
+        if any(a > b for a, b in zip(token_ends, token_ends[1:])):
+            return None
+        return token_ends
+
+    def _find_surrounding_context(
+        self,
+        nlp_artifacts: NlpArtifacts,
+        document_index: DocumentContextIndex,
+        token_ends: Optional[List[int]],
+        keywords: Set[str],
+        word: str,
+        start: int,
+    ) -> Set[str]:
+        """Return the context entries found in the window around a match.
+
+        The window spans `context_prefix_count` keywords before the match
+        and `context_suffix_count` keywords after it.
+
+        :param nlp_artifacts: The nlp artifacts of the document
+        :param document_index: The context entries found in the document
+        :param token_ends: The end offsets of the tokens, if sorted
+        :param keywords: The keyword lemmas of the document
+        :param word: The matched text
+        :param start: The start index of the match in the text
         """
         if not nlp_artifacts.tokens:
             logger.info("Skipping context extraction due to lack of NLP artifacts")
-            # if there are no nlp artifacts, this is ok, we can
-            # extract context and we return a valid, yet empty
-            # context
-            return [""]
-
-        # Get the already prepared words in the given text, in their
-        # LEMMATIZED version
-        lemmatized_keywords = nlp_artifacts.keywords
-
-        # since the list of tokens is not necessarily aligned
-        # with the actual index of the match, we look for the
-        # token index which corresponds to the match
-        token_index = self._find_index_of_match_token(
-            word, start, nlp_artifacts.tokens, nlp_artifacts.tokens_indices
-        )
+            return set()
 
-        # index i belongs to the PII entity, take the preceding n words
-        # and the successing m words into a context list
+        if token_ends is None:
+            token_index = self._find_index_of_match_token(
+                word, start, nlp_artifacts.tokens, nlp_artifacts.tokens_indices
+            )
+        else:
+            # the first token ending after the start of the match,
+            # same as _find_index_of_match_token
+            token_index = bisect_right(token_ends, start)
+            if token_index == len(token_ends):
+                raise ValueError(
+                    "Did not find word '" + word + "' "
+                    "in the list of tokens although it "
+                    "is expected to be found"
+                )
 
-        backward_context = self._add_n_words_backward(
-            token_index,
-            self.context_prefix_count,
-            nlp_artifacts.lemmas,
-            lemmatized_keywords,
-        )
-        forward_context = self._add_n_words_forward(
-            token_index,
-            self.context_suffix_count,
-            nlp_artifacts.lemmas,
-            lemmatized_keywords,
+        first_token, last_token = self._get_context_window(
+            token_index, nlp_artifacts.lemmas, keywords
         )
+        return document_index.find(first_token, last_token)
+
+    def _get_context_window(
+        self, index: int, lemmas: List[str], keywords: Set[str]
+    ) -> Tuple[int, int]:
+        """
+        Return the first and last token index of the context window of a match.
+
+        The window spans `context_prefix_count` keyword lemmas before the match
+        token and `context_suffix_count` after it. The match token is counted
+        as well, if it is a keyword, as it may be attached with no spaces
+        to a context word.
+        """
 
-        context_list = []
-        context_list.extend(backward_context)
-        context_list.extend(forward_context)
-        context_list = list(set(context_list))
-        logger.debug("Context list is: %s", " ".join(context_list))
-        return context_list
+        def window_edge(n_words: int, step: int) -> int:
+            i = edge = index
+            remaining = n_words + 1
+            while 0 <= i < len(lemmas) and remaining > 0:
+                if lemmas[i].lower() in keywords:
+                    edge = i
+                    remaining -= 1
+                i += step
+            return edge
+
+        return (
+            window_edge(self.context_prefix_count, -1),
+            window_edge(self.context_suffix_count, 1),
+        )
 
     @staticmethod
     def _find_index_of_match_token(
@@ -273,64 +375,3 @@ class LemmaContextAwareEnhancer(ContextAwareEnhancer):
                 "is expected to be found"
             )
         return i
-
-    @staticmethod
-    def _add_n_words(
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-        is_backward: bool,
-    ) -> List[str]:
-        """
-        Prepare a string of context words.
-
-        Return a list of words which surrounds a lemma at a given index.
-        The words will be collected only if exist in the filtered array
-
-        :param index: index of the lemma that its surrounding words we want
-        :param n_words: number of words to take
-        :param lemmas: array of lemmas
-        :param lemmatized_filtered_keywords: the array of filtered
-               lemmas from the original sentence,
-        :param is_backward: if true take the preceeding words, if false,
-                            take the successing words
-        """
-        i = index
-        context_words = []
-        # The entity itself is no interest to us...however we want to
-        # consider it anyway for cases were it is attached with no spaces
-        # to an interesting context word, so we allow it and add 1 to
-        # the number of collected words
-
-        # collect at most n words (in lower case)
-        remaining = n_words + 1
-        while 0 <= i < len(lemmas) and remaining > 0:
-            lower_lemma = lemmas[i].lower()
-            if lower_lemma in lemmatized_filtered_keywords:
-                context_words.append(lower_lemma)
-                remaining -= 1
-            i = i - 1 if is_backward else i + 1
-        return context_words
-
-    def _add_n_words_forward(
-        self,
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-    ) -> List[str]:
-        return self._add_n_words(
-            index, n_words, lemmas, lemmatized_filtered_keywords, False
-        )
-
-    def _add_n_words_backward(
-        self,
-        index: int,
-        n_words: int,
-        lemmas: List[str],
-        lemmatized_filtered_keywords: List[str],
-    ) -> List[str]:
-        return self._add_n_words(
-            index, n_words, lemmas, lemmatized_filtered_keywords, True
-        )
@@ -0,0 +1,124 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+from presidio_analyzer import RecognizerResult
+
+
+@dataclass
+class AnalyzedDocument:
+    """
+    A previously analyzed version of a document.
+
+    :param text: The analyzed text
+    :param params: The analysis parameters (language, entities, thresholds etc.)
+    :param results: The results of the analysis
+    """
+
+    text: str
+    params: Dict[str, Any]
+    results: List[RecognizerResult]
+
+
+class DocumentAnalysisCache:
+    """
+    Bounded cache of the last analyzed version of each document.
+
+    Used by `AnalyzerEngine.analyze_incremental` to re-analyze only
+    the edited parts of a document. When more than `max_documents`
+    documents are cached, the least recently analyzed one is evicted.
+
+    :param max_documents: Maximum number of cached documents
+    """
+
+    def __init__(self, max_documents: int = 1000):
+        if max_documents < 1:
+            raise ValueError("max_documents must be a positive integer")
+
+        self.max_documents = max_documents
+        self._documents: "OrderedDict[str, AnalyzedDocument]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, doc_id: str) -> Optional[AnalyzedDocument]:
+        """
+        Return the last analyzed version of a document, or None if not cached.
+
+        :param doc_id: The document id
+        """
+        with self._lock:
+            document = self._documents.get(doc_id)
+            if document is not None:
+                self._documents.move_to_end(doc_id)
+            return document
+
+    def put(self, doc_id: str, document: AnalyzedDocument) -> None:
+        """
+        Store the last analyzed version of a document.
+
+        :param doc_id: The document id
+        :param document: The analyzed version
+        """
+        with self._lock:
+            self._documents[doc_id] = document
+            self._documents.move_to_end(doc_id)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+
+    def remove(self, doc_id: str) -> None:
+        """
+        Remove a document, e.g. when it is closed.
+
+        :param doc_id: The document id
+        """
+        with self._lock:
+            self._documents.pop(doc_id, None)
+
+    def clear(self) -> None:
+        """Remove all documents."""
+        with self._lock:
+            self._documents.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached documents."""
+        return len(self._documents)
+
+    def __contains__(self, doc_id: str) -> bool:
+        """Return whether a document is cached."""
+        return doc_id in self._documents
+
+
+def find_changed_region(old_text: str, new_text: str) -> Tuple[int, int, int]:
+    """
+    Find the region of a text which changed between two versions.
+
+    The region spans from the end of the common prefix to the start of
+    the common suffix, so multiple edits are covered by a single region.
+
+    :param old_text: The previous version of the text
+    :param new_text: The new version of the text
+    :return: The start of the region (same in both versions),
+    its end in the old text and its end in the new text
+    """
+    max_length = min(len(old_text), len(new_text))
+
+    # Binary search over slice comparisons, which run in C
+    low, high = 0, max_length
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old_text[:middle] == new_text[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    prefix = low
+
+    low, high = 0, max_length - prefix
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old_text[len(old_text) - middle :] == new_text[len(new_text) - middle :]:
+            low = middle
+        else:
+            high = middle - 1
+    suffix = low
+
+    return prefix, len(old_text) - suffix, len(new_text) - suffix
@@ -27,7 +27,14 @@ from .langextract_helper import (
     get_supported_entities,
     lx,
 )
+from .llm_response_cache import LLMResponseCache, create_llm_response_cache
 from .prompt_loader import load_file_from_conf, load_prompt_file, render_jinja_template
+from .remote_client_registry import (
+    CircuitOpenError,
+    RemoteClientRegistry,
+    get_remote_client_registry,
+    set_remote_client_registry,
+)
 
 __all__ = [
     "get_conf_path",
@@ -52,8 +59,14 @@ __all__ = [
     "extract_lm_config",
     "get_supported_entities",
     "lx",
+    "LLMResponseCache",
+    "create_llm_response_cache",
     "load_file_from_conf",
     "load_prompt_file",
     "render_jinja_template",
+    "CircuitOpenError",
+    "RemoteClientRegistry",
+    "get_remote_client_registry",
+    "set_remote_client_registry",
 ]
 
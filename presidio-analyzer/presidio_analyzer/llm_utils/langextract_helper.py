@@ -45,7 +45,7 @@ def extract_lm_config(config: Dict) -> Dict:
 
     :param config: Full configuration dictionary.
     :return: LM recognizer config with keys: supported_entities, min_score,
-             labels_to_ignore, enable_generic_consolidation.
+             labels_to_ignore, enable_generic_consolidation, cache, chunking.
     """
     lm_config_section = config.get("lm_recognizer", {})
 
@@ -56,6 +56,8 @@ def extract_lm_config(config: Dict) -> Dict:
         "enable_generic_consolidation": lm_config_section.get(
             "enable_generic_consolidation", True
         ),
+        "cache": lm_config_section.get("cache"),
+        "chunking": lm_config_section.get("chunking"),
     }
 
 
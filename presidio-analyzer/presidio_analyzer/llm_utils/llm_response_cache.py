@@ -0,0 +1,277 @@
+"""Persistent cache of LLM recognizer responses."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from presidio_analyzer import AnalysisExplanation, RecognizerResult
+from presidio_analyzer.batching_utils import reset_in_forked_children
+
+logger = logging.getLogger("presidio-analyzer")
+
+__all__ = [
+    "LLMResponseCache",
+    "create_llm_response_cache",
+]
+
+
+class LLMResponseCache:
+    """
+    Content addressed on-disk cache of LLM recognizer results, stored in SQLite.
+
+    Entries are keyed by a hash of everything affecting the LLM's response
+    (text, model, prompt, examples and call parameters), see `make_key`.
+    When the stored responses exceed `max_size_mb`, the least recently used
+    entries are evicted. The cache file can be shared between processes.
+
+    :param path: Path of the SQLite database file, created if missing.
+    :param max_size_mb: Maximum total size of the stored responses, in megabytes.
+    """
+
+    EVICTION_RATIO = 0.9
+
+    def __init__(self, path: Union[str, Path], max_size_mb: float = 512):
+        if max_size_mb <= 0:
+            raise ValueError("max_size_mb must be positive")
+
+        self.path = Path(path).expanduser()
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Create the schema now, so that configuration errors are raised early
+        self._connect().close()
+
+        # SQLite connections must not be used across fork(), e.g. when the
+        # recognizers are created in a gunicorn master with preload_app,
+        # so each process opens its own connection on first use
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        reset_in_forked_children(self)
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(
+            str(self.path), check_same_thread=False, isolation_level=None
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, "
+            "value TEXT NOT NULL, "
+            "size INTEGER NOT NULL, "
+            "last_access REAL NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_last_access "
+            "ON responses (last_access)"
+        )
+        # Running total of the sizes of the responses, kept in the database
+        # as the file can be shared between processes
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS total_size ("
+            "id INTEGER PRIMARY KEY CHECK (id = 0), "
+            "size INTEGER NOT NULL)"
+        )
+        connection.execute(
+            "INSERT OR IGNORE INTO total_size (id, size) "
+            "SELECT 0, COALESCE(SUM(size), 0) FROM responses"
+        )
+        return connection
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # Called with the lock held
+        if self._connection is None:
+            self._connection = self._connect()
+        return self._connection
+
+    def _reset_after_fork(self) -> None:
+        # The parent's connection is dropped without closing it,
+        # as closing it could affect the parent's open transactions
+        self._lock = threading.Lock()
+        self._connection = None
+
+    @staticmethod
+    def make_key(text: str, **params: Any) -> str:
+        """Return the cache key of a text and the parameters of the LLM call.
+
+        :param text: The analyzed text.
+        :param params: Everything else affecting the response, e.g. model id,
+        prompt and examples. Values must be JSON serializable
+        (other values are converted to strings).
+        """
+        payload = json.dumps(
+            {
+                "text": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+                "params": params,
+            },
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[List[RecognizerResult]]:
+        """Return the cached results of a key, or None if not cached.
+
+        :param key: The cache key, see `make_key`.
+        """
+        with self._lock:
+            connection = self._get_connection()
+            row = connection.execute(
+                "SELECT value FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                self._stats["misses"] += 1
+                return None
+
+            self._stats["hits"] += 1
+            connection.execute(
+                "UPDATE responses SET last_access = ? WHERE key = ?",
+                (time.time(), key),
+            )
+        return [self._deserialize_result(result) for result in json.loads(row[0])]
+
+    def put(self, key: str, results: List[RecognizerResult]) -> None:
+        """Store the results of a key, evicting old entries if needed.
+
+        :param key: The cache key, see `make_key`.
+        :param results: The results to store.
+        """
+        value = json.dumps([self._serialize_result(result) for result in results])
+        size = len(value.encode("utf-8"))
+        if size > self.max_size_bytes:
+            logger.debug("LLM response is larger than the cache, not caching it")
+            return
+
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                row = connection.execute(
+                    "SELECT size FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+                replaced_size = row[0] if row else 0
+                connection.execute(
+                    "INSERT OR REPLACE INTO responses "
+                    "(key, value, size, last_access) VALUES (?, ?, ?, ?)",
+                    (key, value, size, time.time()),
+                )
+                connection.execute(
+                    "UPDATE total_size SET size = size + ? WHERE id = 0",
+                    (size - replaced_size,),
+                )
+                evicted = self._evict(connection)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+            connection.execute("COMMIT")
+            self._stats["writes"] += 1
+            self._stats["evictions"] += evicted
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            connection = self._get_connection()
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("DELETE FROM responses")
+            connection.execute("UPDATE total_size SET size = 0 WHERE id = 0")
+            connection.execute("COMMIT")
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """Return hit and miss counters, the hit rate and the cache size."""
+        with self._lock:
+            connection = self._get_connection()
+            entries = connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            size = connection.execute(
+                "SELECT size FROM total_size WHERE id = 0"
+            ).fetchone()[0]
+            stats = dict(self._stats)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        stats["entries"] = entries
+        stats["size_bytes"] = size
+        return stats
+
+    def close(self) -> None:
+        """Close the database connection of this process."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        total_size = connection.execute(
+            "SELECT size FROM total_size WHERE id = 0"
+        ).fetchone()[0]
+        if total_size <= self.max_size_bytes:
+            return 0
+
+        # Evict below the limit, so that eviction does not run on every write
+        target_size = self.max_size_bytes * self.EVICTION_RATIO
+        evicted_keys = []
+        evicted_size = 0
+        for key, size in connection.execute(
+            "SELECT key, size FROM responses ORDER BY last_access"
+        ):
+            if total_size - evicted_size <= target_size:
+                break
+            evicted_keys.append((key,))
+            evicted_size += size
+
+        connection.executemany("DELETE FROM responses WHERE key = ?", evicted_keys)
+        connection.execute(
+            "UPDATE total_size SET size = size - ? WHERE id = 0", (evicted_size,)
+        )
+        logger.debug(f"Evicted {len(evicted_keys)} LLM responses from the cache")
+        return len(evicted_keys)
+
+    @staticmethod
+    def _serialize_result(result: RecognizerResult) -> Dict:
+        explanation = result.analysis_explanation
+        return {
+            "entity_type": result.entity_type,
+            "start": result.start,
+            "end": result.end,
+            "score": result.score,
+            "analysis_explanation": dict(explanation.to_dict())
+            if explanation
+            else None,
+            "recognition_metadata": result.recognition_metadata,
+        }
+
+    @staticmethod
+    def _deserialize_result(data: Dict) -> RecognizerResult:
+        explanation = None
+        if data.get("analysis_explanation"):
+            explanation = AnalysisExplanation.__new__(AnalysisExplanation)
+            explanation.__dict__.update(data["analysis_explanation"])
+        return RecognizerResult(
+            entity_type=data["entity_type"],
+            start=data["start"],
+            end=data["end"],
+            score=data["score"],
+            analysis_explanation=explanation,
+            recognition_metadata=data.get("recognition_metadata"),
+        )
+
+
+def create_llm_response_cache(
+    cache_config: Optional[Dict],
+) -> Optional[LLMResponseCache]:
+    """Create a response cache from the `cache` section of an LLM recognizer config.
+
+    :param cache_config: Dict with keys: enabled (default: True when the
+    section exists), path, max_size_mb.
+    :return: The cache, or None if caching is not configured.
+    """
+    if not cache_config or not cache_config.get("enabled", True):
+        return None
+
+    path = cache_config.get(
+        "path", str(Path.home() / ".cache" / "presidio" / "llm_responses.sqlite")
+    )
+    return LLMResponseCache(path=path, max_size_mb=cache_config.get("max_size_mb", 512))
@@ -0,0 +1,570 @@
+"""Shared clients, credentials and call policies for remote integrations.
+
+Remote recognizers and operators (Azure AI Language, AHDS, Azure OpenAI,
+Ollama) get their clients from a process wide `RemoteClientRegistry`,
+so that connections and tokens are reused across instances and calls.
+Each named endpoint is protected by a concurrency limit,
+retries with jittered exponential backoff, and a circuit breaker.
+
+The registry is configured in YAML, see conf/remote_clients.yaml.
+"""
+
+import logging
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, Optional, Union
+
+import yaml
+from pydantic import BaseModel, ConfigDict, Field
+
+if TYPE_CHECKING:
+    from azure.core.credentials import AccessToken, TokenCredential
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+except ImportError:  # pragma: no cover
+    requests = None
+    HTTPAdapter = None
+
+try:
+    from azure.core.pipeline.transport import RequestsTransport
+except ImportError:
+    RequestsTransport = None
+
+from presidio_analyzer.llm_utils.azure_auth_helper import get_azure_credential
+
+logger = logging.getLogger("presidio-analyzer")
+
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "conf" / "remote_clients.yaml"
+
+
+class RetryConfig(BaseModel):
+    """Retry configuration of a remote endpoint.
+
+    :param max_retries: Number of retries after the first failed attempt.
+    :param backoff_base: Base delay in seconds, doubled on every retry.
+    :param backoff_max: Maximum delay in seconds between attempts.
+    """
+
+    max_retries: int = Field(default=3, ge=0)
+    backoff_base: float = Field(default=0.5, ge=0.0)
+    backoff_max: float = Field(default=10.0, ge=0.0)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class CircuitBreakerConfig(BaseModel):
+    """Circuit breaker configuration of a remote endpoint.
+
+    :param failure_threshold: Consecutive failures after which the circuit opens.
+    :param reset_timeout: Seconds after which an open circuit allows a trial call.
+    """
+
+    failure_threshold: int = Field(default=5, ge=1)
+    reset_timeout: float = Field(default=30.0, ge=0.0)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class RemoteEndpointConfig(BaseModel):
+    """Configuration of a remote endpoint.
+
+    :param max_connections: Size of the HTTP connection pool.
+    :param max_concurrency: Maximum number of concurrent calls to the endpoint.
+    :param timeout: Connection and read timeout in seconds.
+    :param retry: Retry configuration.
+    :param circuit_breaker: Circuit breaker configuration.
+    """
+
+    max_connections: int = Field(default=20, ge=1)
+    max_concurrency: int = Field(default=16, ge=1)
+    timeout: float = Field(default=30.0, gt=0.0)
+    retry: RetryConfig = Field(default_factory=RetryConfig)
+    circuit_breaker: CircuitBreakerConfig = Field(default_factory=CircuitBreakerConfig)
+
+    model_config = ConfigDict(extra="forbid")
+
+
+class RemoteClientsConfig(BaseModel):
+    """Configuration of the remote client registry.
+
+    :param token_refresh_margin: Seconds before expiry at which
+    cached access tokens are refreshed.
+    :param defaults: Configuration used by all endpoints.
+    :param endpoints: Per endpoint overrides of the defaults, by endpoint name.
+    """
+
+    token_refresh_margin: float = Field(default=300.0, ge=0.0)
+    defaults: RemoteEndpointConfig = Field(default_factory=RemoteEndpointConfig)
+    endpoints: Dict[str, Dict[str, Any]] = Field(default_factory=dict)
+
+    model_config = ConfigDict(extra="forbid")
+
+    def get_endpoint_config(self, name: str) -> RemoteEndpointConfig:
+        """Return the configuration of an endpoint, merged with the defaults.
+
+        :param name: Name of the endpoint.
+        """
+        merged = self.defaults.model_dump()
+        for key, value in self.endpoints.get(name, {}).items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key] = {**merged[key], **value}
+            else:
+                merged[key] = value
+        return RemoteEndpointConfig(**merged)
+
+
+class CircuitOpenError(Exception):
+    """Raised when calling an endpoint whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """
+    Stop calling an endpoint after consecutive failures.
+
+    After `failure_threshold` consecutive failures the circuit opens and calls
+    fail fast. After `reset_timeout` seconds a single trial call is allowed
+    (half open): its success closes the circuit, its failure opens it again.
+
+    :param failure_threshold: Consecutive failures after which the circuit opens.
+    :param reset_timeout: Seconds after which an open circuit allows a trial call.
+    :param clock: Function returning the current time in seconds.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._trial_in_progress = False
+        self._lock = threading.Lock()
+
+    def allow_request(self) -> bool:
+        """Return True if a call may be made."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if (
+                self.state == self.OPEN
+                and self.clock() - self._opened_at >= self.reset_timeout
+            ):
+                self.state = self.HALF_OPEN
+                self._trial_in_progress = False
+            if self.state == self.HALF_OPEN and not self._trial_in_progress:
+                self._trial_in_progress = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        """Record a successful call, closing the circuit."""
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._trial_in_progress = False
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit if needed."""
+        with self._lock:
+            self.failures += 1
+            self._trial_in_progress = False
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    logger.warning(
+                        f"Circuit opened after {self.failures} consecutive failures"
+                    )
+                self.state = self.OPEN
+                self._opened_at = self.clock()
+
+
+class RetryPolicy:
+    """
+    Retry transient failures with exponential backoff and full jitter.
+
+    An error is retried if it carries a retryable HTTP status code
+    (on the error or its response, as exposed by requests, azure-core
+    and openai errors), or if it is a connection or timeout error.
+    Other errors (e.g. authentication or validation errors) are raised at once.
+
+    :param max_retries: Number of retries after the first failed attempt.
+    :param backoff_base: Base delay in seconds, doubled on every retry.
+    :param backoff_max: Maximum delay in seconds between attempts.
+    """
+
+    RETRYABLE_STATUS_CODES = frozenset({408, 429, 500, 502, 503, 504})
+    RETRYABLE_ERROR_NAMES = frozenset(
+        {
+            "ServiceRequestError",
+            "ServiceResponseError",
+            "APIConnectionError",
+            "APITimeoutError",
+        }
+    )
+
+    def __init__(
+        self, max_retries: int = 3, backoff_base: float = 0.5, backoff_max: float = 10.0
+    ):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    def get_backoff(self, attempt: int) -> float:
+        """Return the delay before the next attempt, in seconds.
+
+        :param attempt: Number of the failed attempt, starting from 0.
+        """
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    @classmethod
+    def is_retryable(cls, error: BaseException) -> bool:
+        """Return True if the error (or one of its causes) is transient.
+
+        :param error: The raised error.
+        """
+        seen = set()
+        while error is not None and id(error) not in seen:
+            seen.add(id(error))
+            status_code = cls.__get_status_code(error)
+            if status_code is not None:
+                return status_code in cls.RETRYABLE_STATUS_CODES
+            if isinstance(error, (ConnectionError, TimeoutError)) or any(
+                klass.__name__ in cls.RETRYABLE_ERROR_NAMES
+                for klass in type(error).__mro__
+            ):
+                return True
+            if requests and isinstance(
+                error, (requests.ConnectionError, requests.Timeout)
+            ):
+                return True
+            error = error.__cause__ or error.__context__
+        return False
+
+    @staticmethod
+    def __get_status_code(error: BaseException) -> Optional[int]:
+        status_code = getattr(error, "status_code", None)
+        if status_code is None:
+            status_code = getattr(getattr(error, "response", None), "status_code", None)
+        return status_code if isinstance(status_code, int) else None
+
+
+class RemoteEndpoint:
+    """
+    Call policies of a single remote endpoint.
+
+    Calls made through `call` are limited to `max_concurrency` at a time,
+    retried on transient failures, and fail fast with `CircuitOpenError`
+    while the endpoint's circuit breaker is open.
+
+    :param name: Name of the endpoint.
+    :param config: Configuration of the endpoint.
+    """
+
+    def __init__(self, name: str, config: RemoteEndpointConfig):
+        self.name = name
+        self.config = config
+        self.retry_policy = RetryPolicy(**config.retry.model_dump())
+        self.circuit_breaker = CircuitBreaker(**config.circuit_breaker.model_dump())
+        self._semaphore = threading.BoundedSemaphore(config.max_concurrency)
+        self._stats = {"calls": 0, "failures": 0, "retries": 0, "rejected": 0}
+        self._stats_lock = threading.Lock()
+        self._sleep = time.sleep
+
+    def call(self, func: Callable, *args, **kwargs) -> Any:
+        """Call a function accessing the endpoint, applying the call policies.
+
+        :param func: Function calling the remote endpoint.
+        :param args: Positional arguments for func.
+        :param kwargs: Keyword arguments for func.
+        """
+        attempt = 0
+        while True:
+            if not self.circuit_breaker.allow_request():
+                self.__count("rejected")
+                raise CircuitOpenError(
+                    f"Circuit breaker for remote endpoint '{self.name}' is open"
+                )
+
+            self.__count("calls")
+            try:
+                with self._semaphore:
+                    result = func(*args, **kwargs)
+            except Exception as e:
+                retryable = self.retry_policy.is_retryable(e)
+                if not retryable:
+                    # The endpoint answered, the request itself is invalid
+                    self.circuit_breaker.record_success()
+                    raise
+
+                self.__count("failures")
+                self.circuit_breaker.record_failure()
+                if attempt >= self.retry_policy.max_retries:
+                    raise
+
+                backoff = self.retry_policy.get_backoff(attempt)
+                logger.warning(
+                    f"Call to remote endpoint '{self.name}' failed ({e}), "
+                    f"retrying in {backoff:.2f}s"
+                )
+                self.__count("retries")
+                self._sleep(backoff)
+                attempt += 1
+            else:
+                self.circuit_breaker.record_success()
+                return result
+
+    def get_stats(self) -> Dict[str, Union[int, str]]:
+        """Return call counters and the circuit breaker state."""
+        with self._stats_lock:
+            return {**self._stats, "circuit_state": self.circuit_breaker.state}
+
+    def __count(self, key: str) -> None:
+        with self._stats_lock:
+            self._stats[key] += 1
+
+
+class CachedTokenCredential:
+    """
+    Azure token credential caching access tokens until shortly before expiry.
+
+    Tokens are refreshed once they are within `refresh_margin` seconds of
+    expiring. If the refresh fails while the cached token is still valid,
+    the cached token is returned and the refresh is retried on the next call.
+
+    :param credential: The Azure credential to get tokens from.
+    :param refresh_margin: Seconds before expiry at which tokens are refreshed.
+    :param clock: Function returning the current (epoch) time in seconds.
+    """
+
+    def __init__(
+        self,
+        credential: "TokenCredential",
+        refresh_margin: float = 300.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.credential = credential
+        self.refresh_margin = refresh_margin
+        self.clock = clock
+        self._tokens: Dict[Hashable, "AccessToken"] = {}
+        self._lock = threading.Lock()
+
+    def get_token(self, *scopes: str, **kwargs) -> "AccessToken":
+        """Return a cached or new access token for the given scopes.
+
+        :param scopes: The requested scopes.
+        :param kwargs: Additional arguments for the wrapped credential.
+        Requests with claims (e.g. from a claims challenge) are not cached.
+        """
+        if kwargs.get("claims"):
+            return self.credential.get_token(*scopes, **kwargs)
+
+        key = (scopes, kwargs.get("tenant_id"))
+        with self._lock:
+            token = self._tokens.get(key)
+            now = self.clock()
+            if token and token.expires_on - now > self.refresh_margin:
+                return token
+
+            try:
+                new_token = self.credential.get_token(*scopes, **kwargs)
+            except Exception as e:
+                if token and token.expires_on > now:
+                    logger.warning(f"Token refresh failed, using cached token: {e}")
+                    return token
+                raise
+
+            self._tokens[key] = new_token
+            return new_token
+
+    def close(self) -> None:
+        """Close the wrapped credential, if it can be closed."""
+        close = getattr(self.credential, "close", None)
+        if close:
+            close()
+
+
+class RemoteClientRegistry:
+    """
+    Process wide registry of clients for remote integrations.
+
+    Clients, HTTP sessions and the Azure credential are created once
+    and shared by all recognizers and operators of the process.
+
+    :param config: Registry configuration. Defaults are used if None.
+    """
+
+    def __init__(self, config: Optional[RemoteClientsConfig] = None):
+        self.config = config or RemoteClientsConfig()
+        self._clients: Dict[Hashable, Any] = {}
+        self._sessions: Dict[str, "requests.Session"] = {}
+        self._endpoints: Dict[str, RemoteEndpoint] = {}
+        self._credential: Optional[CachedTokenCredential] = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_dict(cls, config_dict: Dict) -> "RemoteClientRegistry":
+        """Create a registry from a configuration dictionary.
+
+        :param config_dict: See conf/remote_clients.yaml for an example.
+        """
+        return cls(RemoteClientsConfig(**(config_dict or {})))
+
+    @classmethod
+    def from_yaml(cls, config_path: Union[str, Path]) -> "RemoteClientRegistry":
+        """Create a registry from a YAML configuration file.
+
+        :param config_path: Path to the configuration file.
+        """
+        with open(config_path) as f:
+            return cls.from_dict(yaml.safe_load(f))
+
+    def get_endpoint(self, name: str) -> RemoteEndpoint:
+        """Return the call policies of an endpoint.
+
+        :param name: Name of the endpoint, e.g. "azure_ai_language".
+        """
+        with self._lock:
+            if name not in self._endpoints:
+                self._endpoints[name] = RemoteEndpoint(
+                    name, self.config.get_endpoint_config(name)
+                )
+            return self._endpoints[name]
+
+    def get_session(self, name: str) -> "requests.Session":
+        """Return a pooled keep-alive HTTP session for an endpoint.
+
+        :param name: Name of the endpoint.
+        """
+        if not requests:
+            raise ImportError("requests is required for pooled HTTP sessions.")
+
+        with self._lock:
+            if name not in self._sessions:
+                max_connections = self.config.get_endpoint_config(name).max_connections
+                adapter = HTTPAdapter(
+                    pool_connections=max_connections, pool_maxsize=max_connections
+                )
+                session = requests.Session()
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self._sessions[name] = session
+            return self._sessions[name]
+
+    def get_azure_client_kwargs(self, name: str) -> Dict[str, Any]:
+        """Return keyword arguments for creating Azure SDK clients of an endpoint.
+
+        The client uses the endpoint's pooled session and timeouts.
+        The SDK's own retries are disabled, as calls are retried by `RemoteEndpoint`.
+
+        :param name: Name of the endpoint.
+        """
+        if not RequestsTransport:
+            return {}
+
+        timeout = self.config.get_endpoint_config(name).timeout
+        return {
+            "transport": RequestsTransport(
+                session=self.get_session(name),
+                session_owner=False,
+                connection_timeout=timeout,
+                read_timeout=timeout,
+            ),
+            "retry_total": 0,
+        }
+
+    def get_credential(
+        self, credential_factory: Optional[Callable[[], "TokenCredential"]] = None
+    ) -> CachedTokenCredential:
+        """Return the shared Azure credential, caching its access tokens.
+
+        :param credential_factory: Function creating the credential on first use.
+        Defaults to `get_azure_credential`.
+        """
+        with self._lock:
+            if self._credential is None:
+                credential_factory = credential_factory or get_azure_credential
+                self._credential = CachedTokenCredential(
+                    credential_factory(),
+                    refresh_margin=self.config.token_refresh_margin,
+                )
+            return self._credential
+
+    def get_client(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the client stored under a key, creating it on first use.
+
+        :param key: Key identifying the client, e.g. (service, endpoint).
+        :param factory: Function creating the client.
+        """
+        with self._lock:
+            if key not in self._clients:
+                self._clients[key] = factory()
+            return self._clients[key]
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Return the call statistics of all endpoints."""
+        with self._lock:
+            endpoints = dict(self._endpoints)
+        return {name: endpoint.get_stats() for name, endpoint in endpoints.items()}
+
+    def close(self) -> None:
+        """Close all clients, sessions and the credential."""
+        with self._lock:
+            for client in self._clients.values():
+                close = getattr(client, "close", None)
+                if close:
+                    try:
+                        close()
+                    except Exception as e:
+                        logger.warning(f"Failed to close remote client: {e}")
+            for session in self._sessions.values():
+                session.close()
+            if self._credential:
+                self._credential.close()
+            self._clients = {}
+            self._sessions = {}
+            self._credential = None
+
+
+_registry: Optional[RemoteClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_remote_client_registry() -> RemoteClientRegistry:
+    """Return the process wide remote client registry.
+
+    On first use, it is configured from the YAML file set in the
+    PRESIDIO_REMOTE_CLIENTS_CONFIG environment variable,
+    or from conf/remote_clients.yaml.
+    """
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            config_path = os.environ.get(
+                "PRESIDIO_REMOTE_CLIENTS_CONFIG", str(DEFAULT_CONFIG_PATH)
+            )
+            _registry = RemoteClientRegistry.from_yaml(config_path)
+        return _registry
+
+
+def set_remote_client_registry(registry: Optional[RemoteClientRegistry]) -> None:
+    """Replace the process wide remote client registry.
+
+    :param registry: The new registry. If None, the registry is recreated
+    from the configuration file on next use.
+    """
+    global _registry
+    with _registry_lock:
+        _registry = registry
@@ -1,9 +1,11 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from presidio_analyzer import RecognizerResult, RemoteRecognizer
+from presidio_analyzer.chunkers import BaseTextChunker
 from presidio_analyzer.llm_utils import (
+    LLMResponseCache,
     consolidate_generic_entities,
     ensure_generic_entity_support,
     filter_results_by_entities,
@@ -25,6 +27,13 @@ class LMRecognizer(RemoteRecognizer, ABC):
 
     Provides common functionality for LLM-based entity detection.
     Subclasses implement _call_llm() for specific LLM providers.
+
+    If a response cache is set, LLM results are stored in it and reused
+    for identical texts and LLM settings (see `_get_cache_params`).
+
+    If a text chunker is set, long texts are split into chunks which are
+    sent to the LLM concurrently, and the results are merged back
+    with offsets relative to the full text.
     """
 
     def __init__(
@@ -38,6 +47,11 @@ class LMRecognizer(RemoteRecognizer, ABC):
         min_score: float = 0.5,
         labels_to_ignore: Optional[List[str]] = None,
         enable_generic_consolidation: bool = True,
+        response_cache: Optional[LLMResponseCache] = None,
+        bypass_cache: bool = False,
+        text_chunker: Optional[BaseTextChunker] = None,
+        max_concurrent_chunks: int = 4,
+        allow_partial_results: bool = False,
     ):
         """Initialize LM recognizer.
 
@@ -45,11 +59,23 @@ class LMRecognizer(RemoteRecognizer, ABC):
         :param labels_to_ignore: Entity labels to skip.
         :param enable_generic_consolidation: Consolidate unknown
             entities to GENERIC_PII_ENTITY.
+        :param response_cache: Cache of LLM results, not used if None.
+        :param bypass_cache: Always call the LLM instead of reading cached
+            results. New results are still written to the cache.
+        :param text_chunker: Chunker splitting long texts into chunks
+            sent to the LLM separately, texts are not chunked if None.
+        :param max_concurrent_chunks: Maximum number of chunks of a text
+            sent to the LLM in parallel.
+        :param allow_partial_results: Return the results of the successful
+            chunks if the LLM call failed for some chunks, instead of
+            raising an error.
         """
         if not supported_entities:
             raise ValueError(
                 "LMRecognizer requires at least one entity in 'supported_entities'"
             )
+        if max_concurrent_chunks < 1:
+            raise ValueError("max_concurrent_chunks must be a positive integer")
 
         super().__init__(
             supported_entities=supported_entities,
@@ -63,6 +89,11 @@ class LMRecognizer(RemoteRecognizer, ABC):
         self.min_score = min_score
         self.labels_to_ignore = [label.lower() for label in (labels_to_ignore or [])]
         self.enable_generic_consolidation = enable_generic_consolidation
+        self.response_cache = response_cache
+        self.bypass_cache = bypass_cache
+        self.text_chunker = text_chunker
+        self.max_concurrent_chunks = max_concurrent_chunks
+        self.allow_partial_results = allow_partial_results
 
         self._generic_entities_logged = set()
 
@@ -111,7 +142,15 @@ class LMRecognizer(RemoteRecognizer, ABC):
             )
             return []
 
-        results = self._call_llm(text, requested_entities)
+        if self.text_chunker:
+            results = self.text_chunker.predict_with_chunking(
+                text,
+                lambda chunk: self._call_llm_cached(chunk, requested_entities),
+                max_concurrency=self.max_concurrent_chunks,
+                allow_partial_results=self.allow_partial_results,
+            )
+        else:
+            results = self._call_llm_cached(text, requested_entities)
 
         filtered_results = self._filter_and_process_results(
             results, requested_entities
@@ -125,6 +164,36 @@ class LMRecognizer(RemoteRecognizer, ABC):
 
         return filtered_results
 
+    def _call_llm_cached(
+        self, text: str, entities: List[str]
+    ) -> List[RecognizerResult]:
+        """Call the LLM, reusing results from the response cache if set."""
+        if not self.response_cache:
+            return self._call_llm(text, entities)
+
+        key = self.response_cache.make_key(
+            text, entities=sorted(entities), **self._get_cache_params()
+        )
+        if not self.bypass_cache:
+            cached_results = self.response_cache.get(key)
+            if cached_results is not None:
+                return cached_results
+
+        results = self._call_llm(text, entities)
+        self.response_cache.put(key, results)
+        return results
+
+    def _get_cache_params(self) -> Dict[str, Any]:
+        """Return the settings affecting LLM results, used in response cache keys.
+
+        Subclasses add their prompt, examples and provider parameters.
+        """
+        return {
+            "recognizer": self.__class__.__name__,
+            "model_id": self.model_id,
+            "temperature": self.temperature,
+        }
+
     def _filter_and_process_results(
         self,
         results: List[RecognizerResult],
@@ -46,6 +46,18 @@ class NerModelConfiguration(BaseModel):
     Set of entity names that are likely to have low detection accuracy that should be adjusted.
     :param low_confidence_score_multiplier: A multiplier for the score given for low_score_entity_names.
     Multiplier to the score given for low_score_entity_names.
+    :param backend: Inference backend for transformers models,
+    "pytorch" (default) or "onnx" (ONNX Runtime on CPU).
+    :param onnx_quantize: Whether to use an int8 dynamically quantized model
+    when using the "onnx" backend.
+    :param onnx_intra_op_num_threads: Number of ONNX Runtime threads per process.
+    If not set, the CPU cores are split between the server workers.
+    :param onnx_cache_dir: Directory in which exported ONNX models are stored.
+    :param dynamic_batching: Whether to batch transformers inference across
+    concurrent requests, see `TransformersInferenceScheduler`.
+    :param dynamic_batching_max_batch_size: Maximum number of texts per batch.
+    :param dynamic_batching_max_wait_ms: Maximum time (in milliseconds) a text
+    waits for other texts to be batched with.
     """  # noqa: E501
 
     labels_to_ignore: Optional[Collection[str]] = Field(
@@ -75,6 +87,29 @@ class NerModelConfiguration(BaseModel):
         default=0.4, ge=0.0, description="Score multiplier for low confidence entities"
     )
 
+    backend: Optional[str] = Field(
+        default="pytorch", description="Inference backend for transformers models"
+    )
+    onnx_quantize: Optional[bool] = Field(
+        default=False, description="Use an int8 quantized model with ONNX Runtime"
+    )
+    onnx_intra_op_num_threads: Optional[int] = Field(
+        default=None, ge=1, description="Number of ONNX Runtime threads"
+    )
+    onnx_cache_dir: Optional[str] = Field(
+        default=None, description="Directory for exported ONNX models"
+    )
+
+    dynamic_batching: Optional[bool] = Field(
+        default=False, description="Batch inference across concurrent requests"
+    )
+    dynamic_batching_max_batch_size: Optional[int] = Field(
+        default=32, ge=1, description="Maximum number of texts per batch"
+    )
+    dynamic_batching_max_wait_ms: Optional[float] = Field(
+        default=5, ge=0.0, description="Maximum batching wait time in milliseconds"
+    )
+
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
     @field_validator("aggregation_strategy")
@@ -113,6 +148,20 @@ class NerModelConfiguration(BaseModel):
             )
         return alignment
 
+    @field_validator("backend")
+    @classmethod
+    def validate_backend(cls, backend: Optional[str]) -> str:
+        """Validate inference backend and handle None values."""
+        if backend is None:
+            return cls.model_fields["backend"].default
+        valid_backends = ["pytorch", "onnx"]
+        if backend not in valid_backends:
+            raise ValueError(
+                f"Backend '{backend}' is not supported. "
+                f"Valid options: {valid_backends}"
+            )
+        return backend
+
     @classmethod
     def from_dict(cls, ner_model_configuration_dict: Dict) -> "NerModelConfiguration":
         """
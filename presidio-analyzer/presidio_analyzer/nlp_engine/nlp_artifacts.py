@@ -1,7 +1,9 @@
 import json
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import srsly
 from spacy.tokens import Doc, Span
+from spacy.vocab import Vocab
 
 
 class NlpArtifacts:
@@ -18,6 +20,14 @@ class NlpArtifacts:
     :param nlp_engine: NlpEngine object
     :param language: Text language
     :param scores: Entity confidence scores
+    :param keywords: Precomputed keywords.
+    If not provided, keywords are extracted from the lemmas using the nlp_engine
+
+    NlpArtifacts can be converted to a compact, serializable form
+    (see `to_dict` and `to_bytes`), which holds plain lists instead
+    of the spaCy objects and the NLP engine. This allows running the NLP
+    pipeline and the recognizers in different processes, or caching
+    the NLP results per text.
     """
 
     def __init__(
@@ -29,13 +39,17 @@ class NlpArtifacts:
         nlp_engine: "NlpEngine",  # noqa: F821
         language: str,
         scores: Optional[List[float]] = None,
+        keywords: Optional[List[str]] = None,
     ):
         self.entities = entities
         self.tokens = tokens
         self.lemmas = lemmas
         self.tokens_indices = tokens_indices
-        self.keywords = self.set_keywords(nlp_engine, lemmas, language)
+        if keywords is None:
+            keywords = self.set_keywords(nlp_engine, lemmas, language)
+        self.keywords = keywords
         self.nlp_engine = nlp_engine
+        self.language = language
         self.scores = scores if scores else [0.85] * len(entities)
 
     @staticmethod
@@ -86,3 +100,85 @@ class NlpArtifacts:
             return_dict["scores"] = [float(score) for score in self.scores]
 
         return json.dumps(return_dict)
+
+    def to_dict(self) -> Dict:
+        """
+        Convert nlp artifacts to a compact serializable dictionary.
+
+        The NLP engine is not serialized. Tokens and entities are stored
+        as plain lists, and restored as spaCy objects by `from_dict`.
+        """
+        if isinstance(self.tokens, Doc):
+            words = [token.text for token in self.tokens]
+            spaces = [bool(token.whitespace_) for token in self.tokens]
+        else:
+            words = [getattr(token, "text", str(token)) for token in self.tokens]
+            spaces = [False] * len(words)
+
+        return {
+            "language": self.language,
+            "words": words,
+            "spaces": spaces,
+            "tokens_indices": list(self.tokens_indices),
+            "lemmas": list(self.lemmas),
+            "keywords": list(self.keywords),
+            "entities": [
+                [entity.start, entity.end, entity.label_] for entity in self.entities
+            ],
+            "scores": [float(score) for score in self.scores],
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: Dict,
+        nlp_engine: Optional["NlpEngine"] = None,  # noqa: F821
+    ) -> "NlpArtifacts":
+        """
+        Create NlpArtifacts from a dictionary created by `to_dict`.
+
+        :param data: Serialized nlp artifacts
+        :param nlp_engine: Optional NlpEngine to attach to the artifacts
+        """
+        tokens = Doc(Vocab(), words=data["words"], spaces=data["spaces"])
+        entities = [
+            Span(tokens, start, end, label=label)
+            for start, end, label in data["entities"]
+        ]
+
+        return cls(
+            entities=entities,
+            tokens=tokens,
+            tokens_indices=data["tokens_indices"],
+            lemmas=data["lemmas"],
+            nlp_engine=nlp_engine,
+            language=data["language"],
+            scores=data["scores"],
+            keywords=data["keywords"],
+        )
+
+    def to_bytes(self) -> bytes:
+        """Serialize nlp artifacts to bytes (msgpack over `to_dict`)."""
+        return srsly.msgpack_dumps(self.to_dict())
+
+    @classmethod
+    def from_bytes(
+        cls,
+        bytes_data: bytes,
+        nlp_engine: Optional["NlpEngine"] = None,  # noqa: F821
+    ) -> "NlpArtifacts":
+        """
+        Create NlpArtifacts from bytes created by `to_bytes`.
+
+        :param bytes_data: Serialized nlp artifacts
+        :param nlp_engine: Optional NlpEngine to attach to the artifacts
+        """
+        return cls.from_dict(srsly.msgpack_loads(bytes_data), nlp_engine=nlp_engine)
+
+    def __getstate__(self) -> Dict:
+        """Pickle nlp artifacts using their compact form."""
+        return self.to_dict()
+
+    def __setstate__(self, state: Dict) -> None:
+        """Restore nlp artifacts pickled by `__getstate__`."""
+        self.__dict__.update(self.from_dict(state).__dict__)
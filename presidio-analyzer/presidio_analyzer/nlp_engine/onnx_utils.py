@@ -0,0 +1,146 @@
+"""ONNX Runtime helpers for CPU inference of transformers based models.
+
+Used by `TransformersNlpEngine` (when `backend: onnx` is configured)
+and by `GLiNERRecognizer` (when `use_onnx=True`).
+"""
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Optional, Tuple
+
+try:
+    import onnxruntime
+except ImportError:
+    onnxruntime = None
+
+try:
+    from optimum.onnxruntime import (
+        AutoQuantizationConfig,
+        ORTModelForTokenClassification,
+        ORTQuantizer,
+    )
+    from transformers import AutoTokenizer
+except ImportError:
+    AutoQuantizationConfig = None
+    ORTModelForTokenClassification = None
+    ORTQuantizer = None
+    AutoTokenizer = None
+
+logger = logging.getLogger("presidio-analyzer")
+
+ONNX_MODEL_FILE = "model.onnx"
+QUANTIZED_ONNX_MODEL_FILE = "model_quantized.onnx"
+
+
+def get_default_num_threads() -> int:
+    """Return the number of ONNX Runtime threads to use per process.
+
+    The available CPU cores are split between the server worker processes
+    (the `WORKERS` environment variable, as used by the gunicorn configuration),
+    so that workers do not oversubscribe the CPU.
+    """
+    workers = max(1, int(os.environ.get("WORKERS", "1")))
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def create_session_options(
+    intra_op_num_threads: Optional[int] = None,
+) -> "onnxruntime.SessionOptions":
+    """Create ONNX Runtime session options for CPU inference.
+
+    :param intra_op_num_threads: Number of threads used within an operator.
+    If None, see `get_default_num_threads`.
+    """
+    if not onnxruntime:
+        raise ImportError(
+            "onnxruntime is not installed. "
+            "Install it with `pip install presidio-analyzer[onnx]`."
+        )
+
+    session_options = onnxruntime.SessionOptions()
+    session_options.intra_op_num_threads = (
+        intra_op_num_threads
+        if intra_op_num_threads is not None
+        else get_default_num_threads()
+    )
+    # A single request runs a single graph at a time
+    session_options.inter_op_num_threads = 1
+    session_options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+    session_options.graph_optimization_level = (
+        onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+    )
+    return session_options
+
+
+def get_onnx_model_dir(model_name: str, cache_dir: Optional[str] = None) -> Path:
+    """Return the directory holding the exported ONNX files of a model.
+
+    :param model_name: Name (or local path) of the Hugging Face model
+    :param cache_dir: Root directory for exported models.
+    Defaults to the `PRESIDIO_ONNX_CACHE_DIR` environment variable,
+    or `~/.cache/presidio/onnx`.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get(
+            "PRESIDIO_ONNX_CACHE_DIR",
+            str(Path.home() / ".cache" / "presidio" / "onnx"),
+        )
+    return Path(cache_dir, re.sub(r"[^\w.-]", "_", model_name))
+
+
+def load_onnx_token_classification_model(
+    model_name: str,
+    quantize: bool = False,
+    intra_op_num_threads: Optional[int] = None,
+    cache_dir: Optional[str] = None,
+) -> Tuple["ORTModelForTokenClassification", "AutoTokenizer"]:  # noqa: F821
+    """Load a token classification model for inference with ONNX Runtime.
+
+    The model is exported to ONNX (and optionally int8 dynamically quantized)
+    on first use, and the exported files are reused on subsequent loads.
+
+    :param model_name: Name (or local path) of the Hugging Face model
+    :param quantize: Whether to use an int8 dynamically quantized model
+    :param intra_op_num_threads: Number of ONNX Runtime threads.
+    If None, see `get_default_num_threads`.
+    :param cache_dir: Root directory for exported models, see `get_onnx_model_dir`
+    :return: The ONNX Runtime model and its tokenizer
+    """
+    if not ORTModelForTokenClassification:
+        raise ImportError(
+            "optimum and onnxruntime are required for the ONNX backend. "
+            "Install them with `pip install presidio-analyzer[onnx]`."
+        )
+
+    model_dir = get_onnx_model_dir(model_name, cache_dir)
+    if not (model_dir / ONNX_MODEL_FILE).exists():
+        logger.info(f"Exporting {model_name} to ONNX in {model_dir}")
+        model = ORTModelForTokenClassification.from_pretrained(model_name, export=True)
+        model.save_pretrained(model_dir)
+        AutoTokenizer.from_pretrained(model_name).save_pretrained(model_dir)
+
+    file_name = ONNX_MODEL_FILE
+    if quantize:
+        file_name = QUANTIZED_ONNX_MODEL_FILE
+        if not (model_dir / file_name).exists():
+            logger.info(f"Quantizing {model_name} to int8 in {model_dir}")
+            quantizer = ORTQuantizer.from_pretrained(
+                model_dir, file_name=ONNX_MODEL_FILE
+            )
+            quantizer.quantize(
+                quantization_config=AutoQuantizationConfig.avx2(
+                    is_static=False, per_channel=False
+                ),
+                save_dir=model_dir,
+            )
+
+    model = ORTModelForTokenClassification.from_pretrained(
+        model_dir,
+        file_name=file_name,
+        provider="CPUExecutionProvider",
+        session_options=create_session_options(intra_op_num_threads),
+    )
+    tokenizer = AutoTokenizer.from_pretrained(model_dir)
+    return model, tokenizer
@@ -1,6 +1,17 @@
 import logging
 import warnings
-from typing import Any, Dict, Generator, List, Optional, Tuple, Union
+from itertools import islice
+from typing import (
+    Any,
+    Dict,
+    Generator,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 try:
     import stanza
@@ -89,7 +100,8 @@ class StanzaNlpEngine(SpacyNlpEngine):
 
         This method overrides SpacyNlpEngine.process_batch to leverage Stanza's
         efficient bulk_process method, which processes multiple documents together
-        for better GPU utilization.
+        for better CPU and GPU utilization.
+        Texts are consumed lazily, `batch_size` texts at a time.
 
         Note: Stanza batches internally at the sentence/token level, not docs.
         For optimal GPU performance, use larger batch sizes (e.g., 16-32 docs).
@@ -112,34 +124,36 @@ class StanzaNlpEngine(SpacyNlpEngine):
         if not self.nlp:
             raise ValueError("NLP engine is not loaded. Consider calling .load()")
 
-        # Get the StanzaTokenizer (which wraps the Stanza pipeline)
+        nlp = self.nlp[language]
         # In spaCy, tokenizers are accessed via .tokenizer, not .get_pipe()
-        stanza_tokenizer = self.nlp[language].tokenizer
-        stanza_pipeline = stanza_tokenizer.snlp
-
-        text_list = list(texts) if not isinstance(texts, list) else texts
+        stanza_tokenizer = nlp.tokenizer
+        batch_size = max(1, batch_size)
 
-        for batch_start in range(0, len(text_list), batch_size):
-            batch_end = min(batch_start + batch_size, len(text_list))
-            batch = text_list[batch_start:batch_end]
+        # Consume the input lazily, one batch at a time
+        items = iter(texts)
+        while True:
+            batch = list(islice(items, batch_size))
+            if not batch:
+                return
 
             if as_tuples:
-                batch_texts = [str(text) for text, context in batch]
-                contexts = [context for text, context in batch]
+                if not all(isinstance(i, tuple) and len(i) == 2 for i in batch):
+                    raise ValueError(
+                        "When 'as_tuples' is True, "
+                        "'texts' must be a list of tuples (text, context)."
+                    )
+                batch_texts = [str(text) for text, _ in batch]
+                contexts = [context for _, context in batch]
             else:
                 batch_texts = [str(text) for text in batch]
-                contexts = None
 
-            # Create Stanza Document objects and process via bulk_process
-            # Stanza handles internal batching at sentence/token level
-            stanza_docs = [stanza.Document([], text=text) for text in batch_texts]
-            processed_stanza_docs = stanza_pipeline.bulk_process(stanza_docs)
-
-            # Convert processed Stanza docs to spaCy docs using spacy-stanza's logic
-            # We call _convert_doc() which reuses StanzaTokenizer's conversion path
-            for idx, processed_stanza_doc in enumerate(processed_stanza_docs):
-                spacy_doc = stanza_tokenizer._convert_doc(processed_stanza_doc)
-                nlp_artifacts = self._doc_to_nlp_artifact(spacy_doc, language)
+            # All texts of the batch go through a single Stanza bulk_process call
+            docs = stanza_tokenizer.pipe(batch_texts, batch_size=batch_size)
+            for idx, doc in enumerate(docs):
+                # Run any additional spaCy components, as nlp(text) would
+                for _, component in nlp.pipeline:
+                    doc = component(doc)
+                nlp_artifacts = self._doc_to_nlp_artifact(doc, language)
 
                 if as_tuples:
                     yield batch_texts[idx], nlp_artifacts, contexts[idx]
@@ -407,14 +421,38 @@ class StanzaTokenizer(object):
             doc.user_token_hooks["has_vector"] = self.token_has_vector
         return doc
 
-    def pipe(self, texts):
-        """Tokenize a stream of texts.
+    def pipe(self, texts: Iterable[str], batch_size: int = 32) -> Iterator[Doc]:
+        """Tokenize a stream of texts, running Stanza on batches of texts.
+
+        Each batch is processed by a single call to Stanza's bulk_process,
+        which batches the neural processors across documents.
 
         texts: A sequence of Unicode texts.
+        batch_size: The number of texts to process together.
         YIELDS (Doc): A sequence of Doc objects, in order.
         """
+        texts = iter(texts)
+        while True:
+            batch = list(islice(texts, max(1, batch_size)))
+            if not batch:
+                return
+            yield from self._process_batch(batch)
+
+    def _process_batch(self, texts: List[str]) -> Iterator[Doc]:
+        # Empty and whitespace-only texts are not sent to Stanza
+        to_process = [text for text in texts if text and not text.isspace()]
+        processed = iter(
+            self.snlp.bulk_process(
+                [stanza.Document([], text=text) for text in to_process]
+            )
+            if to_process
+            else []
+        )
         for text in texts:
-            yield self(text)
+            if text and not text.isspace():
+                yield self._convert_doc(next(processed))
+            else:
+                yield self(text)
 
     @staticmethod
     def __get_tokens_with_heads(snlp_doc):
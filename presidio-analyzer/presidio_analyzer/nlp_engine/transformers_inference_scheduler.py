@@ -0,0 +1,234 @@
+import asyncio
+import logging
+import queue
+import threading
+import time
+from bisect import bisect_left
+from collections import defaultdict
+from concurrent.futures import Future
+from typing import Callable, Dict, List, Optional, Union
+
+from presidio_analyzer.batching_utils import Histogram, reset_in_forked_children
+
+logger = logging.getLogger("presidio-analyzer")
+
+
+class _PendingText:
+    def __init__(self, text: str, length: int):
+        self.text = text
+        self.length = length
+        self.future = Future()
+        self.enqueued_at = time.monotonic()
+
+
+class TransformersInferenceScheduler:
+    """
+    Shared inference scheduler for a transformers token classification pipeline.
+
+    Wraps a Hugging Face pipeline so that texts sent by multiple threads
+    (or async tasks) are queued, and a background loop runs them together.
+    Texts arriving within `max_wait_ms` of each other are collected
+    (up to `max_batch_size`), bucketed by their length in tokens
+    so that each padded batch contains sequences of similar length,
+    and each bucket is sent to the pipeline as a single batch.
+    Each caller gets back the results of its own texts.
+
+    The scheduler is a drop-in replacement for the pipeline it wraps:
+    calling it with a string returns the entities of that string,
+    and calling it with a list of strings returns a list of results.
+
+    The background worker thread is started on the first submitted text,
+    and again in each forked child process (e.g. gunicorn workers
+    of a preloaded app).
+
+    :param pipeline: The token classification pipeline to run
+    :param max_batch_size: Maximum number of texts in a single forward pass
+    :param max_wait_ms: Maximum time (in milliseconds) the first queued text
+    waits for additional texts to arrive
+    :param length_function: Function returning the length of a text,
+    used for bucketing. Defaults to the number of tokens produced by
+    the pipeline's tokenizer, or the number of characters if it has none.
+    """
+
+    LENGTH_BUCKETS = (16, 32, 64, 128, 256, 512)
+    BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128)
+
+    def __init__(
+        self,
+        pipeline: Callable,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5,
+        length_function: Optional[Callable[[str], int]] = None,
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be a positive integer")
+        if max_wait_ms < 0:
+            raise ValueError("max_wait_ms must not be negative")
+
+        self.pipeline = pipeline
+        self.max_batch_size = max_batch_size
+        self.max_wait_ms = max_wait_ms
+        self.length_function = length_function or self._get_default_length_function(
+            pipeline
+        )
+
+        self.batch_size_histogram = Histogram(self.BATCH_SIZE_BUCKETS)
+        self.sequence_length_histogram = Histogram(self.LENGTH_BUCKETS)
+
+        self._closed = False
+        self._reset_after_fork()
+        reset_in_forked_children(self)
+
+    def __call__(
+        self, inputs: Union[str, List[str]], **kwargs
+    ) -> Union[List[Dict], List[List[Dict]]]:
+        """
+        Run the pipeline on one or more texts, batched with other callers.
+
+        Blocks until the results are available.
+        Calls with additional pipeline arguments are not batched.
+
+        :param inputs: A text or a list of texts
+        :param kwargs: Additional arguments passed to the pipeline
+        """
+        if kwargs:
+            return self.pipeline(inputs, **kwargs)
+
+        if isinstance(inputs, str):
+            return self.submit(inputs).result()
+
+        futures = [self.submit(text) for text in inputs]
+        return [future.result() for future in futures]
+
+    async def infer_async(self, texts: List[str]) -> List[List[Dict]]:
+        """
+        Run the pipeline on a list of texts without blocking the event loop.
+
+        :param texts: The texts to run the pipeline on
+        """
+        futures = [asyncio.wrap_future(self.submit(text)) for text in texts]
+        return list(await asyncio.gather(*futures))
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for inference.
+
+        :param text: The text to run the pipeline on
+        :return: A future holding the pipeline's output for this text
+        """
+        if self._closed:
+            raise RuntimeError("TransformersInferenceScheduler is closed")
+
+        pending = _PendingText(text=text, length=self.length_function(text))
+        self._start_worker()
+        self._queue.put(pending)
+        return pending.future
+
+    def get_stats(self) -> Dict:
+        """Return the batch size and sequence length histograms."""
+        return {
+            "batch_size": self.batch_size_histogram.to_dict(),
+            "sequence_length": self.sequence_length_histogram.to_dict(),
+        }
+
+    def close(self) -> None:
+        """Stop the background worker after handling already queued texts."""
+        if self._closed:
+            return
+        self._closed = True
+        with self._lock:
+            worker = self._worker
+        if worker:
+            self._queue.put(None)
+            worker.join()
+
+    def _start_worker(self) -> None:
+        if self._worker:
+            return
+        with self._lock:
+            if not self._worker:
+                self._worker = threading.Thread(
+                    target=self._run,
+                    name="presidio-transformers-scheduler",
+                    daemon=True,
+                )
+                self._worker.start()
+
+    def _reset_after_fork(self) -> None:
+        # The worker thread of the parent process does not exist in a child,
+        # and the queue and lock may have been in use while forking
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[_PendingText]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+
+    @staticmethod
+    def _get_default_length_function(pipeline: Callable) -> Callable[[str], int]:
+        tokenizer = getattr(pipeline, "tokenizer", None)
+        if tokenizer is None:
+            return len
+
+        def count_tokens(text: str) -> int:
+            return len(tokenizer(text, add_special_tokens=False)["input_ids"])
+
+        return count_tokens
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+
+            batch = [first]
+            stop = self._collect_batch(batch)
+            self._process_batch(batch)
+            if stop:
+                return
+
+    def _collect_batch(self, batch: List[_PendingText]) -> bool:
+        """Add queued texts to the batch, return True if closing."""
+        deadline = batch[0].enqueued_at + self.max_wait_ms / 1000
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            try:
+                if timeout > 0:
+                    pending = self._queue.get(timeout=timeout)
+                else:
+                    pending = self._queue.get_nowait()
+            except queue.Empty:
+                return False
+
+            if pending is None:
+                return True
+            batch.append(pending)
+        return False
+
+    def _process_batch(self, batch: List[_PendingText]) -> None:
+        buckets = defaultdict(list)
+        for pending in batch:
+            self.sequence_length_histogram.observe(pending.length)
+            buckets[bisect_left(self.LENGTH_BUCKETS, pending.length)].append(pending)
+
+        for bucket in buckets.values():
+            self.batch_size_histogram.observe(len(bucket))
+            self._run_bucket(bucket)
+
+    def _run_bucket(self, bucket: List[_PendingText]) -> None:
+        if len(bucket) > 1:
+            try:
+                outputs = self.pipeline(
+                    [pending.text for pending in bucket], batch_size=len(bucket)
+                )
+                for pending, output in zip(bucket, outputs):
+                    pending.future.set_result(output)
+                return
+            except Exception as e:
+                logger.warning(
+                    f"Failed to run batch of {len(bucket)} texts, "
+                    f"processing texts individually: {e}"
+                )
+
+        for pending in bucket:
+            try:
+                pending.future.set_result(self.pipeline(pending.text))
+            except Exception as e:
+                pending.future.set_exception(e)
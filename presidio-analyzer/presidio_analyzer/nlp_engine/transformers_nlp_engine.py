@@ -2,6 +2,7 @@ import logging
 from typing import Dict, List, Optional
 
 import spacy
+from spacy.language import Language
 from spacy.tokens import Doc, Span
 
 try:
@@ -15,10 +16,70 @@ from presidio_analyzer.nlp_engine import (
     NerModelConfiguration,
     SpacyNlpEngine,
 )
+from presidio_analyzer.nlp_engine.onnx_utils import (
+    load_onnx_token_classification_model,
+)
+from presidio_analyzer.nlp_engine.transformers_inference_scheduler import (
+    TransformersInferenceScheduler,
+)
 
 logger = logging.getLogger("presidio-analyzer")
 
 
+if spacy_huggingface_pipelines:
+
+    @Language.factory(
+        "presidio_onnx_token_pipe",
+        assigns=[],
+        default_config={
+            "model": "",
+            "stride": 16,
+            "aggregation_strategy": "average",
+            "annotate": "spans",
+            "annotate_spans_key": None,
+            "alignment_mode": "strict",
+            "quantize": False,
+            "intra_op_num_threads": None,
+            "cache_dir": None,
+        },
+        default_score_weights={},
+    )
+    def make_onnx_token_pipe(
+        nlp: Language,
+        name: str,
+        model: str,
+        stride: Optional[int],
+        aggregation_strategy: str,
+        annotate: str,
+        annotate_spans_key: Optional[str],
+        alignment_mode: str,
+        quantize: bool,
+        intra_op_num_threads: Optional[int],
+        cache_dir: Optional[str],
+    ) -> spacy_huggingface_pipelines.HFTokenPipe:
+        """Create an `hf_token_pipe` equivalent running on ONNX Runtime."""
+        ort_model, tokenizer = load_onnx_token_classification_model(
+            model_name=model,
+            quantize=quantize,
+            intra_op_num_threads=intra_op_num_threads,
+            cache_dir=cache_dir,
+        )
+        hf_pipeline = transformers.pipeline(
+            task="token-classification",
+            model=ort_model,
+            tokenizer=tokenizer,
+            aggregation_strategy=aggregation_strategy,
+            stride=stride,
+        )
+        return spacy_huggingface_pipelines.HFTokenPipe(
+            name=name,
+            hf_pipeline=hf_pipeline,
+            annotate=annotate,
+            annotate_spans_key=annotate_spans_key,
+            alignment_mode=alignment_mode,
+        )
+
+
 class TransformersNlpEngine(SpacyNlpEngine):
     """
 
@@ -37,7 +98,11 @@ class TransformersNlpEngine(SpacyNlpEngine):
             }
     }]
     :param ner_model_configuration: Parameters for the NER model.
-    See conf/transformers.yaml for an example
+    See conf/transformers.yaml for an example.
+    Setting `backend: onnx` runs the transformers model with ONNX Runtime
+    (optionally int8 quantized) instead of PyTorch.
+    Setting `dynamic_batching: true` batches the transformers inference
+    of concurrent requests, see `TransformersInferenceScheduler`.
 
 
     Note that since the spaCy model is not used for NER,
@@ -69,6 +134,7 @@ class TransformersNlpEngine(SpacyNlpEngine):
             ]
         super().__init__(models=models, ner_model_configuration=ner_model_configuration)
         self.entity_key = "bert-base-ner"
+        self.inference_schedulers: Dict[str, TransformersInferenceScheduler] = {}
 
     def load(self) -> None:
         """Load the spaCy and transformers models."""
@@ -77,6 +143,9 @@ class TransformersNlpEngine(SpacyNlpEngine):
 
         super()._enable_gpu()
 
+        for scheduler in self.inference_schedulers.values():
+            scheduler.close()
+        self.inference_schedulers = {}
         self.nlp = {}
 
         for model in self.models:
@@ -95,10 +164,41 @@ class TransformersNlpEngine(SpacyNlpEngine):
                 "aggregation_strategy": self.ner_model_configuration.aggregation_strategy,  # noqa: E501
                 "annotate_spans_key": self.entity_key,
             }
-
-            nlp.add_pipe("hf_token_pipe", config=pipe_config)
+            if self.ner_model_configuration.backend == "onnx":
+                pipe_config.update(
+                    {
+                        "quantize": self.ner_model_configuration.onnx_quantize,
+                        "intra_op_num_threads": (
+                            self.ner_model_configuration.onnx_intra_op_num_threads
+                        ),
+                        "cache_dir": self.ner_model_configuration.onnx_cache_dir,
+                    }
+                )
+
+            hf_token_pipe = nlp.add_pipe(self._get_pipe_name(), config=pipe_config)
+            ner_config = self.ner_model_configuration
+            if ner_config.dynamic_batching:
+                scheduler = TransformersInferenceScheduler(
+                    hf_token_pipe.hf_pipeline,
+                    max_batch_size=ner_config.dynamic_batching_max_batch_size,
+                    max_wait_ms=ner_config.dynamic_batching_max_wait_ms,
+                )
+                hf_token_pipe.hf_pipeline = scheduler
+                self.inference_schedulers[model["lang_code"]] = scheduler
             self.nlp[model["lang_code"]] = nlp
 
+    def get_inference_stats(self) -> Dict[str, Dict]:
+        """Return the dynamic batching statistics, per language."""
+        return {
+            lang_code: scheduler.get_stats()
+            for lang_code, scheduler in self.inference_schedulers.items()
+        }
+
+    def _get_pipe_name(self) -> str:
+        if self.ner_model_configuration.backend == "onnx":
+            return "presidio_onnx_token_pipe"
+        return "hf_token_pipe"
+
     @staticmethod
     def _validate_model_params(model: Dict) -> None:
         if "lang_code" not in model:
@@ -1,6 +1,7 @@
 import datetime
 import logging
-from typing import TYPE_CHECKING, Dict, List, Optional
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 import regex as re
 
@@ -30,8 +31,15 @@ class PatternRecognizer(LocalRecognizer):
     identified using a deny-list
     :param global_regex_flags: regex flags to be used in regex matching,
     including deny-lists.
+
+    The outcomes of `validate_result` and `invalidate_result` are cached
+    by matched text, up to `VALIDATION_CACHE_SIZE` texts per recognizer.
+    Recognizers whose validation depends on more than the matched text
+    (e.g. the current date) should set `VALIDATION_CACHE_SIZE` to 0.
     """
 
+    VALIDATION_CACHE_SIZE = 10000
+
     def __init__(
         self,
         supported_entity: str,
@@ -74,6 +82,14 @@ class PatternRecognizer(LocalRecognizer):
         else:
             self.deny_list = []
 
+        self._validation_cache: Dict[str, Tuple[Optional[bool], Optional[bool]]] = {}
+        self._validation_cache_stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._validation_cache_lock = threading.Lock()
+        self._has_validation = (
+            type(self).validate_result is not PatternRecognizer.validate_result
+            or type(self).invalidate_result is not PatternRecognizer.invalidate_result
+        )
+
     def load(self):  # noqa: D102
         pass
 
@@ -138,6 +154,70 @@ class PatternRecognizer(LocalRecognizer):
         """
         return None
 
+    def get_validation_cache_stats(self) -> Dict[str, int]:
+        """Return the hits, misses, evictions and size of the validation cache."""
+        with self._validation_cache_lock:
+            return {
+                **self._validation_cache_stats,
+                "size": len(self._validation_cache),
+            }
+
+    def clear_validation_cache(self) -> None:
+        """Remove all cached validation outcomes."""
+        with self._validation_cache_lock:
+            self._validation_cache.clear()
+
+    def _get_validation_results(
+        self, pattern_text: str
+    ) -> Tuple[Optional[bool], Optional[bool]]:
+        """
+        Return the validation and invalidation results of a matched text.
+
+        Results are cached, see `VALIDATION_CACHE_SIZE`.
+
+        :param pattern_text: the text detected by the regex engine
+        :return: The results of validate_result and invalidate_result
+        """
+        if not self._has_validation:
+            return None, None
+
+        with self._validation_cache_lock:
+            cached = self._validation_cache.get(pattern_text)
+            if cached is not None:
+                self._validation_cache_stats["hits"] += 1
+                return cached
+
+        # Validation runs outside the lock, so concurrent callers may both
+        # validate the same new text, storing the same results
+        results = (
+            self.validate_result(pattern_text),
+            self.invalidate_result(pattern_text),
+        )
+        if self.VALIDATION_CACHE_SIZE > 0:
+            with self._validation_cache_lock:
+                self._validation_cache_stats["misses"] += 1
+                if len(self._validation_cache) >= self.VALIDATION_CACHE_SIZE:
+                    # Evict the oldest entry (dicts keep insertion order)
+                    self._validation_cache.pop(
+                        next(iter(self._validation_cache)), None
+                    )
+                    self._validation_cache_stats["evictions"] += 1
+                self._validation_cache[pattern_text] = results
+        return results
+
+    def __getstate__(self) -> Dict:
+        """Pickle without the validation cache and its lock."""
+        state = self.__dict__.copy()
+        del state["_validation_cache_lock"]
+        state["_validation_cache"] = {}
+        state["_validation_cache_stats"] = {"hits": 0, "misses": 0, "evictions": 0}
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        """Unpickle with an empty validation cache."""
+        self.__dict__.update(state)
+        self._validation_cache_lock = threading.Lock()
+
     @staticmethod
     def build_regex_explanation(
         recognizer_name: str,
@@ -213,7 +293,9 @@ class PatternRecognizer(LocalRecognizer):
 
                 score = pattern.score
 
-                validation_result = self.validate_result(current_match)
+                validation_result, invalidation_result = (
+                    self._get_validation_results(current_match)
+                )
                 description = self.build_regex_explanation(
                     self.name,
                     pattern.name,
@@ -240,7 +322,6 @@ class PatternRecognizer(LocalRecognizer):
                     else:
                         pattern_result.score = EntityRecognizer.MIN_SCORE
 
-                invalidation_result = self.invalidate_result(current_match)
                 if invalidation_result is not None and invalidation_result:
                     pattern_result.score = EntityRecognizer.MIN_SCORE
 
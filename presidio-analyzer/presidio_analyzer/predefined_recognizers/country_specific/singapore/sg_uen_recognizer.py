@@ -28,6 +28,9 @@ class SgUenRecognizer(PatternRecognizer):
 
     CONTEXT = ["uen", "unique entity number", "business registration", "ACRA"]
 
+    # Validation depends on the current year, so its outcome is not cached
+    VALIDATION_CACHE_SIZE = 0
+
     UEN_FORMAT_A_WEIGHT = (10, 4, 9, 3, 8, 2, 7, 1)
     UEN_FORMAT_A_ALPHABET = "XMKECAWLJDB"
     UEN_FORMAT_B_WEIGHT = (10, 8, 6, 4, 9, 7, 5, 3, 1)
@@ -162,7 +162,9 @@ class IbanRecognizer(PatternRecognizer):
 
                     score = pattern.score
 
-                    validation_result = self.validate_result(current_match)
+                    validation_result, _ = self._get_validation_results(
+                        current_match
+                    )
                     description = PatternRecognizer.build_regex_explanation(
                         self.name,
                         pattern.name,
@@ -13,6 +13,7 @@ from presidio_analyzer.nlp_engine import (
     NlpArtifacts,
     device_detector,
 )
+from presidio_analyzer.nlp_engine.onnx_utils import create_session_options
 
 try:
     from gliner import GLiNER, GLiNERConfig
@@ -40,6 +41,9 @@ class GLiNERRecognizer(LocalRecognizer):
         threshold: float = 0.30,
         map_location: Optional[str] = None,
         text_chunker: Optional[BaseTextChunker] = None,
+        use_onnx: bool = False,
+        onnx_model_file: str = "model.onnx",
+        onnx_intra_op_num_threads: Optional[int] = None,
     ):
         """GLiNER model based entity recognizer.
 
@@ -63,8 +67,13 @@ class GLiNERRecognizer(LocalRecognizer):
         :param text_chunker: Custom text chunking strategy. If None, uses
             CharacterBasedTextChunker with default settings (chunk_size=250,
             chunk_overlap=50)
-
-
+        :param use_onnx: Whether to run the model with ONNX Runtime
+            instead of PyTorch. Requires the model repository (or local path)
+            to contain an ONNX export of the model.
+        :param onnx_model_file: Name of the ONNX file to load when use_onnx is True,
+            e.g. "model_quantized.onnx" for an int8 quantized model
+        :param onnx_intra_op_num_threads: Number of ONNX Runtime threads.
+            If None, the CPU cores are split between the server workers.
         """
 
         if entity_mapping:
@@ -101,6 +110,9 @@ class GLiNERRecognizer(LocalRecognizer):
         self.flat_ner = flat_ner
         self.multi_label = multi_label
         self.threshold = threshold
+        self.use_onnx = use_onnx
+        self.onnx_model_file = onnx_model_file
+        self.onnx_intra_op_num_threads = onnx_intra_op_num_threads
 
         # Use provided chunker or default to in-house character-based chunker
         if text_chunker is not None:
@@ -130,9 +142,19 @@ class GLiNERRecognizer(LocalRecognizer):
         if not GLiNER:
             raise ImportError("GLiNER is not installed. Please install it.")
 
-        self.gliner = GLiNER.from_pretrained(
-            self.model_name, map_location=self.map_location
-        )
+        if self.use_onnx:
+            self.gliner = GLiNER.from_pretrained(
+                self.model_name,
+                load_onnx_model=True,
+                onnx_model_file=self.onnx_model_file,
+                session_options=create_session_options(
+                    self.onnx_intra_op_num_threads
+                ),
+            )
+        else:
+            self.gliner = GLiNER.from_pretrained(
+                self.model_name, map_location=self.map_location
+            )
 
     def analyze(
         self,
@@ -1,4 +1,5 @@
 import os
+from bisect import bisect_right
 from typing import List, Optional
 
 try:
@@ -24,18 +25,27 @@ except ImportError:  # pragma: no cover
     AZURE_AUTH_AVAILABLE = False
 
 from presidio_analyzer import AnalysisExplanation, RecognizerResult, RemoteRecognizer
+from presidio_analyzer.llm_utils.remote_client_registry import (
+    get_remote_client_registry,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 
 class AzureHealthDeidRecognizer(RemoteRecognizer):
     """Wrapper for PHI detection using Azure Health Data Services de-identification."""
 
+    # Used by analyze_batch when join_batch_texts is set
+    BATCH_SEPARATOR = "\n\n"
+    MAX_BATCH_CHARACTERS = 40000
+    BATCH_CONCURRENCY = 4
+
     def __init__(
         self,
         supported_entities: Optional[List[str]] = None,
         supported_language: str = "en",
         client: Optional[DeidentificationClient] = None,
         name: Optional[str] = None,
+        join_batch_texts: bool = False,
     ):
         """
         Wrap PHI detection using Azure Health Data Services de-identification.
@@ -43,6 +53,10 @@ class AzureHealthDeidRecognizer(RemoteRecognizer):
         :param supported_entities: List of supported entities for this recognizer.
         :param supported_language: Language code (not used, only 'en' supported).
         :param client: Optional DeidentificationClient instance.
+        :param join_batch_texts: Whether `analyze_batch` joins consecutive texts
+        into a single request. This reduces the number of requests, but the
+        context of one text affects the detection in its neighbours,
+        and entities spanning two texts are dropped.
         """
         super().__init__(
             supported_entities=supported_entities,
@@ -53,6 +67,7 @@ class AzureHealthDeidRecognizer(RemoteRecognizer):
 
 
         endpoint = os.getenv("AHDS_ENDPOINT", None)
+        registry = get_remote_client_registry()
 
         if client is None:
             if endpoint is None:
@@ -69,11 +84,20 @@ class AzureHealthDeidRecognizer(RemoteRecognizer):
                 )
 
             # Use environment-aware credential (DefaultAzureCredential for dev,
-            # ChainedTokenCredential for production)
-            credential = get_azure_credential()
-            client = DeidentificationClient(endpoint, credential)
+            # ChainedTokenCredential for production), shared through the
+            # registry so access tokens are cached across clients
+            client = registry.get_client(
+                ("ahds", endpoint),
+                lambda: DeidentificationClient(
+                    endpoint,
+                    registry.get_credential(get_azure_credential),
+                    **registry.get_azure_client_kwargs("ahds"),
+                ),
+            )
 
         self.deid_client = client
+        self.join_batch_texts = join_batch_texts
+        self.remote_endpoint = registry.get_endpoint("ahds")
 
         if not supported_entities:
             self.supported_entities = self._get_supported_entities()
@@ -114,28 +138,98 @@ class AzureHealthDeidRecognizer(RemoteRecognizer):
             input_text=text,
             operation_type=DeidentificationOperationType.TAG
         )
-        result = self.deid_client.deidentify_text(body)
+        result = self.remote_endpoint.call(self.deid_client.deidentify_text, body)
 
         recognizer_results = []
         if result.tagger_result and result.tagger_result.entities:
             for entity in result.tagger_result.entities:
-                category = entity.category.upper()
-                if category not in [e.upper() for e in entities]:
+                recognizer_result = self._convert_entity(entity, entities)
+                if recognizer_result:
+                    recognizer_results.append(recognizer_result)
+        return recognizer_results
+
+    def analyze_batch(
+        self,
+        texts: List[str],
+        entities: List[str] = None,
+        nlp_artifacts_list: Optional[List[NlpArtifacts]] = None,
+    ) -> List[List[RecognizerResult]]:
+        """
+        Analyze multiple texts using Azure Health Data Services Deidentification.
+
+        The service accepts a single text per request, so each text is sent
+        in its own request, with up to `BATCH_CONCURRENCY` parallel requests.
+        With `join_batch_texts`, consecutive texts are instead joined with
+        `BATCH_SEPARATOR` into requests of up to `MAX_BATCH_CHARACTERS`
+        characters. Entity offsets are then mapped back to each text,
+        and entities spanning two texts are dropped.
+
+        :param texts: Texts to analyze
+        :param entities: List of entities to return (optional)
+        :param nlp_artifacts_list: Not used
+        :return: List of RecognizerResult per text
+        """
+        if not entities:
+            entities = self.supported_entities
+
+        batches = self._pack_texts(
+            texts,
+            max_texts=None if self.join_batch_texts else 1,
+            max_characters=self.MAX_BATCH_CHARACTERS,
+            separator_length=len(self.BATCH_SEPARATOR),
+        )
+
+        def tag(batch: List[int]):
+            body = DeidentificationContent(
+                input_text=self.BATCH_SEPARATOR.join(texts[i] for i in batch),
+                operation_type=DeidentificationOperationType.TAG,
+            )
+            return self.remote_endpoint.call(self.deid_client.deidentify_text, body)
+
+        responses = self._map_batches(tag, batches, self.BATCH_CONCURRENCY)
+
+        recognizer_results = [[] for _ in texts]
+        for batch, result in zip(batches, responses):
+            if not (result.tagger_result and result.tagger_result.entities):
+                continue
+
+            starts = []
+            position = 0
+            for i in batch:
+                starts.append(position)
+                position += len(texts[i]) + len(self.BATCH_SEPARATOR)
+
+            for entity in result.tagger_result.entities:
+                recognizer_result = self._convert_entity(entity, entities)
+                if not recognizer_result:
                     continue
-                analysis_explanation = AzureHealthDeidRecognizer._build_explanation(
-                    entity_type=category
-                )
-                recognizer_results.append(
-                    RecognizerResult(
-                        entity_type=category,
-                        start=entity.offset.code_point,
-                        end=entity.offset.code_point + entity.length.code_point,
-                        score=round(entity.confidence_score, 2),
-                        analysis_explanation=analysis_explanation,
-                    )
-                )
+                index = bisect_right(starts, recognizer_result.start) - 1
+                text_start = starts[index]
+                text_index = batch[index]
+                if recognizer_result.end > text_start + len(texts[text_index]):
+                    continue
+                recognizer_result.start -= text_start
+                recognizer_result.end -= text_start
+                recognizer_results[text_index].append(recognizer_result)
         return recognizer_results
 
+    def _convert_entity(
+        self, entity, entities: List[str]
+    ) -> Optional[RecognizerResult]:
+        category = entity.category.upper()
+        if category not in [e.upper() for e in entities]:
+            return None
+        analysis_explanation = AzureHealthDeidRecognizer._build_explanation(
+            entity_type=category
+        )
+        return RecognizerResult(
+            entity_type=category,
+            start=entity.offset.code_point,
+            end=entity.offset.code_point + entity.length.code_point,
+            score=round(entity.confidence_score, 2),
+            analysis_explanation=analysis_explanation,
+        )
+
     @staticmethod
     def _build_explanation(entity_type: str) -> AnalysisExplanation:
         explanation = AnalysisExplanation(
@@ -1,3 +1,4 @@
+import hashlib
 import logging
 import os
 from typing import List, Optional
@@ -10,6 +11,9 @@ except ImportError:
     TextAnalyticsClient = None
     AzureKeyCredential = None
 from presidio_analyzer import AnalysisExplanation, RecognizerResult, RemoteRecognizer
+from presidio_analyzer.llm_utils.remote_client_registry import (
+    get_remote_client_registry,
+)
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 logger = logging.getLogger("presidio-analyzer")
@@ -18,6 +22,11 @@ logger = logging.getLogger("presidio-analyzer")
 class AzureAILanguageRecognizer(RemoteRecognizer):
     """Wrapper for PII detection using Azure AI Language."""
 
+    # Synchronous PII request limits, used by analyze_batch
+    MAX_BATCH_DOCUMENTS = 5
+    MAX_BATCH_CHARACTERS = 125000
+    BATCH_CONCURRENCY = 4
+
     def __init__(
         self,
         supported_entities: Optional[List[str]] = None,
@@ -25,6 +34,7 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         ta_client: Optional["TextAnalyticsClient"] = None,
         azure_ai_key: Optional[str] = None,
         azure_ai_endpoint: Optional[str] = None,
+        use_azure_credential: bool = False,
     ):
         """
         Wrap the PII detection in Azure AI Language.
@@ -34,8 +44,16 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         :param supported_language: Language code to use for the recognizer.
         :param ta_client: object of type TextAnalyticsClient. If missing,
         the client will be created using the key and endpoint.
-        :param azure_ai_key: Azure AI for language key
+        :param azure_ai_key: Azure AI for language key. If missing,
+        the AZURE_AI_KEY environment variable is used.
         :param azure_ai_endpoint: Azure AI for language endpoint
+        :param use_azure_credential: Without a key, authenticate with the shared
+        Azure credential of the registry (Microsoft Entra ID) instead of
+        raising an error.
+
+        Clients created from a key and endpoint are shared between instances,
+        see `RemoteClientRegistry`. Calls use the "azure_ai_language"
+        endpoint configuration (concurrency limit, retries and circuit breaker).
 
         For more info, see https://learn.microsoft.com/en-us/azure/ai-services/language-service/personally-identifiable-information/overview
         """
@@ -60,8 +78,13 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
             self.supported_entities = self.__get_azure_ai_supported_entities()
 
         if not ta_client:
-            ta_client = self.__authenticate_client(azure_ai_key, azure_ai_endpoint)
+            ta_client = self.__authenticate_client(
+                azure_ai_key, azure_ai_endpoint, use_azure_credential
+            )
         self.ta_client = ta_client
+        self.remote_endpoint = get_remote_client_registry().get_endpoint(
+            "azure_ai_language"
+        )
 
     def get_supported_entities(self) -> List[str]:
         """
@@ -79,15 +102,19 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         return [r.value.upper() for r in PiiEntityCategory]
 
     @staticmethod
-    def __authenticate_client(key: str, endpoint: str) -> TextAnalyticsClient:
+    def __authenticate_client(
+        key: str, endpoint: str, use_azure_credential: bool
+    ) -> TextAnalyticsClient:
         """Authenticate the client using the key and endpoint.
 
         :param key: Azure AI Language key
         :param endpoint: Azure AI Language endpoint
+        :param use_azure_credential: Without a key, use the shared Azure
+        credential of the registry (Microsoft Entra ID authentication)
         """
         key = key if key else os.getenv("AZURE_AI_KEY", None)
         endpoint = endpoint if endpoint else os.getenv("AZURE_AI_ENDPOINT", None)
-        if key is None:
+        if key is None and not use_azure_credential:
             raise ValueError(
                 "Azure AI Language key is required. "
                 "Please provide a key or set the AZURE_AI_KEY environment variable."
@@ -99,11 +126,26 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
                 "or set the AZURE_AI_ENDPOINT environment variable."
             )
 
-        ta_credential = AzureKeyCredential(key)
-        text_analytics_client = TextAnalyticsClient(
-            endpoint=endpoint, credential=ta_credential
+        registry = get_remote_client_registry()
+        if key is None:
+            return registry.get_client(
+                ("azure_ai_language", endpoint),
+                lambda: TextAnalyticsClient(
+                    endpoint=endpoint,
+                    credential=registry.get_credential(),
+                    **registry.get_azure_client_kwargs("azure_ai_language"),
+                ),
+            )
+
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        return registry.get_client(
+            ("azure_ai_language", endpoint, key_hash),
+            lambda: TextAnalyticsClient(
+                endpoint=endpoint,
+                credential=AzureKeyCredential(key),
+                **registry.get_azure_client_kwargs("azure_ai_language"),
+            ),
         )
-        return text_analytics_client
 
     def analyze(
         self, text: str, entities: List[str] = None, nlp_artifacts: NlpArtifacts = None
@@ -118,34 +160,86 @@ class AzureAILanguageRecognizer(RemoteRecognizer):
         """
         if not entities:
             entities = self.supported_entities
-        response = self.ta_client.recognize_pii_entities(
-            [text], language=self.supported_language
+        response = self.remote_endpoint.call(
+            self.ta_client.recognize_pii_entities,
+            [text],
+            language=self.supported_language,
         )
         results = [doc for doc in response if not doc.is_error]
         recognizer_results = []
         for res in results:
-            for entity in res.entities:
-                entity.category = entity.category.upper()
-                if entity.category.lower() not in [
-                    ent.lower() for ent in self.supported_entities
-                ]:
-                    continue
-                if entity.category.lower() not in [ent.lower() for ent in entities]:
-                    continue
-                analysis_explanation = AzureAILanguageRecognizer._build_explanation(
-                    original_score=entity.confidence_score,
+            recognizer_results.extend(self._convert_document(res, entities))
+
+        return recognizer_results
+
+    def analyze_batch(
+        self,
+        texts: List[str],
+        entities: List[str] = None,
+        nlp_artifacts_list: Optional[List[NlpArtifacts]] = None,
+    ) -> List[List[RecognizerResult]]:
+        """
+        Analyze multiple texts using Azure AI Language.
+
+        Texts are sent as multiple documents per request, up to the service's
+        document count and size limits (`MAX_BATCH_DOCUMENTS`,
+        `MAX_BATCH_CHARACTERS`), with up to `BATCH_CONCURRENCY`
+        parallel requests.
+
+        :param texts: Texts to analyze
+        :param entities: List of entities to return
+        :param nlp_artifacts_list: Not used in this recognizer.
+        :return: A list of RecognizerResult per text.
+        """
+        if not entities:
+            entities = self.supported_entities
+
+        batches = self._pack_texts(
+            texts,
+            max_texts=self.MAX_BATCH_DOCUMENTS,
+            max_characters=self.MAX_BATCH_CHARACTERS,
+        )
+
+        def recognize(batch: List[int]):
+            return self.remote_endpoint.call(
+                self.ta_client.recognize_pii_entities,
+                [texts[i] for i in batch],
+                language=self.supported_language,
+            )
+
+        responses = self._map_batches(recognize, batches, self.BATCH_CONCURRENCY)
+
+        recognizer_results = [[] for _ in texts]
+        for batch, response in zip(batches, responses):
+            # Documents are returned in the order they were sent
+            for i, doc in zip(batch, response):
+                if not doc.is_error:
+                    recognizer_results[i] = self._convert_document(doc, entities)
+        return recognizer_results
+
+    def _convert_document(self, doc, entities: List[str]) -> List[RecognizerResult]:
+        recognizer_results = []
+        for entity in doc.entities:
+            entity.category = entity.category.upper()
+            if entity.category.lower() not in [
+                ent.lower() for ent in self.supported_entities
+            ]:
+                continue
+            if entity.category.lower() not in [ent.lower() for ent in entities]:
+                continue
+            analysis_explanation = AzureAILanguageRecognizer._build_explanation(
+                original_score=entity.confidence_score,
+                entity_type=entity.category,
+            )
+            recognizer_results.append(
+                RecognizerResult(
                     entity_type=entity.category,
+                    start=entity.offset,
+                    end=entity.offset + entity.length,
+                    score=entity.confidence_score,
+                    analysis_explanation=analysis_explanation,
                 )
-                recognizer_results.append(
-                    RecognizerResult(
-                        entity_type=entity.category,
-                        start=entity.offset,
-                        end=entity.offset + entity.length,
-                        score=entity.confidence_score,
-                        analysis_explanation=analysis_explanation,
-                    )
-                )
-
+            )
         return recognizer_results
 
     @staticmethod
@@ -45,6 +45,8 @@ class AzureOpenAILangExtractRecognizer(LangExtractRecognizer):
 
     DEFAULT_API_VERSION = "2024-02-15-preview"
 
+    REMOTE_ENDPOINT_NAME = "azure_openai"
+
     DEFAULT_CONFIG_PATH = (
         Path(__file__).parent.parent.parent
         / "conf"
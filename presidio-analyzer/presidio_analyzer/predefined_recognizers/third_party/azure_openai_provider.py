@@ -26,6 +26,10 @@ except ImportError:  # pragma: no cover
     get_azure_credential = None
     get_bearer_token_provider_for_scope = None
 
+from presidio_analyzer.llm_utils.remote_client_registry import (
+    get_remote_client_registry,
+)
+
 logger = logging.getLogger("presidio-analyzer")
 
 
@@ -137,7 +141,8 @@ if LANGEXTRACT_OPENAI_AVAILABLE:
                 client = openai.AzureOpenAI(
                     azure_ad_token_provider=token_provider,
                     azure_endpoint=self.azure_endpoint,
-                    api_version=self.api_version
+                    api_version=self.api_version,
+                    **self._get_http_client_kwargs(),
                 )
 
                 logger.debug(
@@ -148,7 +153,8 @@ if LANGEXTRACT_OPENAI_AVAILABLE:
                 client = openai.AzureOpenAI(
                     api_key=self.api_key,
                     azure_endpoint=self.azure_endpoint,
-                    api_version=self.api_version
+                    api_version=self.api_version,
+                    **self._get_http_client_kwargs(),
                 )
 
                 logger.debug(
@@ -156,6 +162,38 @@ if LANGEXTRACT_OPENAI_AVAILABLE:
                 )
                 return client
 
+        @staticmethod
+        def _get_http_client_kwargs() -> dict:
+            """
+            Return the shared HTTP client settings of the "azure_openai" endpoint.
+
+            All Azure OpenAI clients share one pooled keep-alive HTTP client.
+            Retries are disabled, as extraction calls are retried by the
+            recognizer's `RemoteEndpoint`.
+
+            :return: Keyword arguments for the AzureOpenAI client
+            """
+            registry = get_remote_client_registry()
+            config = registry.config.get_endpoint_config("azure_openai")
+
+            def create_http_client():
+                import httpx
+
+                return openai.DefaultHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=config.max_connections,
+                        max_keepalive_connections=config.max_connections,
+                    ),
+                    timeout=config.timeout,
+                )
+
+            return {
+                "http_client": registry.get_client(
+                    ("azure_openai", "http_client"), create_http_client
+                ),
+                "max_retries": 0,
+            }
+
         def _get_client_model_id(self) -> str:
             """
             Return the model/deployment identifier for API calls.
@@ -2,10 +2,12 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
+from presidio_analyzer.chunkers import BaseTextChunker, TextChunkerProvider
 from presidio_analyzer.llm_utils import (
     check_langextract_available,
     convert_langextract_to_presidio_results,
     convert_to_langextract_format,
+    create_llm_response_cache,
     extract_lm_config,
     get_model_config,
     get_supported_entities,
@@ -16,6 +18,9 @@ from presidio_analyzer.llm_utils import (
     render_jinja_template,
     validate_config_fields,
 )
+from presidio_analyzer.llm_utils.remote_client_registry import (
+    get_remote_client_registry,
+)
 from presidio_analyzer.lm_recognizer import LMRecognizer
 
 logger = logging.getLogger("presidio-analyzer")
@@ -26,8 +31,12 @@ class LangExtractRecognizer(LMRecognizer, ABC):
     Base class for LangExtract-based PII recognizers.
 
     Subclasses implement _call_langextract() for specific LLM providers.
+    Extraction calls use the call policies (concurrency limit, retries and
+    circuit breaker) of the remote endpoint named by `REMOTE_ENDPOINT_NAME`.
     """
 
+    REMOTE_ENDPOINT_NAME = "langextract"
+
     def __init__(
         self,
         config_path: str,
@@ -74,6 +83,7 @@ class LangExtractRecognizer(LMRecognizer, ABC):
         model_config = get_model_config(
             full_config, provider_key="langextract"
         )
+        chunking_config = dict(lm_config.get("chunking") or {})
 
         super().__init__(
             supported_entities=supported_entities,
@@ -87,11 +97,19 @@ class LangExtractRecognizer(LMRecognizer, ABC):
             enable_generic_consolidation=lm_config.get(
                 "enable_generic_consolidation"
             ),
+            response_cache=create_llm_response_cache(lm_config.get("cache")),
+            bypass_cache=(lm_config.get("cache") or {}).get("bypass", False),
+            max_concurrent_chunks=chunking_config.pop("max_concurrency", 4),
+            allow_partial_results=chunking_config.pop(
+                "allow_partial_results", False
+            ),
+            text_chunker=self._create_text_chunker(chunking_config),
         )
 
         examples_data = load_yaml_examples(
             langextract_config["examples_file"]
         )
+        self._examples_data = examples_data
         self.examples = convert_to_langextract_format(examples_data)
 
         prompt_template = load_prompt_file(
@@ -169,7 +187,9 @@ class LangExtractRecognizer(LMRecognizer, ABC):
                 extract_params["language_model_params"] = self._language_model_params
             extract_params.update(kwargs)
 
-            return lx.extract(**extract_params)
+            return get_remote_client_registry().get_endpoint(
+                self.REMOTE_ENDPOINT_NAME
+            ).call(lx.extract, **extract_params)
         except Exception:
             logger.exception(
                 "LangExtract extraction failed (model '%s')",
@@ -177,6 +197,39 @@ class LangExtractRecognizer(LMRecognizer, ABC):
             )
             raise
 
+    def _get_cache_params(self) -> Dict[str, Any]:
+        """Add the prompt, examples and extraction parameters to cache keys."""
+        provider_params = dict(self._get_provider_params())
+        language_model_params = {
+            name: value
+            for name, value in provider_params.pop("language_model_params", {}).items()
+            if name != "api_key"
+        }
+        return {
+            **super()._get_cache_params(),
+            "prompt": self.prompt_description,
+            "examples": self._examples_data,
+            "provider_params": provider_params,
+            "provider_language_model_params": language_model_params,
+            "extract_params": self._extract_params,
+            "language_model_params": self._language_model_params,
+        }
+
+    @staticmethod
+    def _create_text_chunker(
+        chunking_config: Dict[str, Any],
+    ) -> Optional[BaseTextChunker]:
+        """Create the text chunker of the `lm_recognizer.chunking` config section.
+
+        :param chunking_config: Chunker configuration (chunker_type, chunk_size,
+            chunk_overlap). Chunking is disabled if empty or if enabled is False.
+        """
+        if not chunking_config or not chunking_config.pop("enabled", True):
+            return None
+        return TextChunkerProvider(
+            chunker_configuration=chunking_config or None
+        ).create_chunker()
+
     @abstractmethod
     def _get_provider_params(self) -> Dict[str, Any]:
         """Return provider-specific params.
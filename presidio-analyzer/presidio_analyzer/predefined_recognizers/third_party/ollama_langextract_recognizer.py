@@ -11,6 +11,8 @@ logger = logging.getLogger("presidio-analyzer")
 class OllamaLangExtractRecognizer(LangExtractRecognizer):
     """LangExtract recognizer using Ollama backend."""
 
+    REMOTE_ENDPOINT_NAME = "ollama"
+
     DEFAULT_CONFIG_PATH = (
         Path(__file__).parent.parent.parent / "conf" / "langextract_config_ollama.yaml"
     )
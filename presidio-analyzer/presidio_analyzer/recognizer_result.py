@@ -21,6 +21,17 @@ class RecognizerResult:
     and recognizer name
     """
 
+    # Slotted to keep per-instance memory and GC overhead low,
+    # as bulk analysis may hold millions of results at once
+    __slots__ = (
+        "entity_type",
+        "start",
+        "end",
+        "score",
+        "analysis_explanation",
+        "recognition_metadata",
+    )
+
     # Keys for recognizer metadata
     RECOGNIZER_NAME_KEY = "recognizer_name"
     RECOGNIZER_IDENTIFIER_KEY = "recognizer_identifier"
@@ -65,7 +76,14 @@ class RecognizerResult:
 
         :return: a dictionary
         """
-        return self.__dict__
+        result_dict = {
+            attr: getattr(self, attr)
+            for attr in RecognizerResult.__slots__
+            if hasattr(self, attr)
+        }
+        # Subclasses without __slots__ may hold additional attributes
+        result_dict.update(getattr(self, "__dict__", {}))
+        return result_dict
 
     @classmethod
     def from_json(cls, data: Dict) -> "RecognizerResult":
@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, List, Optional, Sequence, TypeVar
 
 from presidio_analyzer import EntityRecognizer
 
 if TYPE_CHECKING:
+    from presidio_analyzer import RecognizerResult
     from presidio_analyzer.nlp_engine import NlpArtifacts
 
+T = TypeVar("T")
+
 
 class RemoteRecognizer(ABC, EntityRecognizer):
     """
@@ -51,6 +55,93 @@ class RemoteRecognizer(ABC, EntityRecognizer):
         # 2. Translate results into List[RecognizerResult]
         pass
 
+    def analyze_batch(
+        self,
+        texts: List[str],
+        entities: List[str],
+        nlp_artifacts_list: Optional[List["NlpArtifacts"]] = None,
+    ) -> List[List["RecognizerResult"]]:
+        """
+        Call an external service for PII detection on multiple texts.
+
+        Used by `BatchAnalyzerEngine`. The default implementation calls
+        `analyze` once per text. Override it to send multiple texts
+        in each request to the external service.
+
+        :param texts: texts to be analyzed
+        :param entities: Entities that should be looked for
+        :param nlp_artifacts_list: Additional metadata from the NLP engine,
+        one per text
+        :return: List of identified PII entities, one list per text
+        """
+        if nlp_artifacts_list is None:
+            nlp_artifacts_list = [None] * len(texts)
+        return [
+            self.analyze(text=text, entities=entities, nlp_artifacts=nlp_artifacts)
+            for text, nlp_artifacts in zip(texts, nlp_artifacts_list)
+        ]
+
     @abstractmethod
     def get_supported_entities(self) -> List[str]:  # noqa: D102
         pass
+
+    @staticmethod
+    def _pack_texts(
+        texts: Sequence[str],
+        max_texts: Optional[int],
+        max_characters: int,
+        separator_length: int = 0,
+    ) -> List[List[int]]:
+        """
+        Split texts into consecutive batches within a service's request limits.
+
+        Empty texts are not added to any batch.
+        A text longer than `max_characters` is put in a batch of its own.
+
+        :param texts: The texts to pack
+        :param max_texts: Maximum number of texts per batch (None for no limit)
+        :param max_characters: Maximum number of characters per batch
+        :param separator_length: Characters added between two texts of a batch
+        :return: The indices of the texts in each batch
+        """
+        batches = []
+        batch = []
+        batch_characters = 0
+        for i, text in enumerate(texts):
+            if not text or text.isspace():
+                continue
+            added_characters = len(text) + (separator_length if batch else 0)
+            if batch and (
+                batch_characters + added_characters > max_characters
+                or (max_texts is not None and len(batch) >= max_texts)
+            ):
+                batches.append(batch)
+                batch = []
+                batch_characters = 0
+                added_characters = len(text)
+            batch.append(i)
+            batch_characters += added_characters
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _map_batches(
+        func: Callable[[List[int]], T],
+        batches: List[List[int]],
+        max_concurrency: int,
+    ) -> List[T]:
+        """
+        Call a function on each batch, with up to `max_concurrency` parallel calls.
+
+        :param func: The function sending a batch to the external service
+        :param batches: The batches, as returned by `_pack_texts`
+        :param max_concurrency: Maximum number of parallel calls
+        :return: The function's results, in the order of the batches
+        """
+        if len(batches) <= 1 or max_concurrency <= 1:
+            return [func(batch) for batch in batches]
+        with ThreadPoolExecutor(
+            max_workers=min(max_concurrency, len(batches))
+        ) as executor:
+            return list(executor.map(func, batches))
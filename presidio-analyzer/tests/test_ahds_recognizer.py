@@ -108,3 +108,66 @@ def test_mocked_entities_match_recognizer_results():
         assert expected.start == actual.start
         assert expected.end == actual.end
         assert expected.score >= actual.score
+
+
+def _deidentify_text(body):
+    from types import SimpleNamespace
+
+    entities = []
+    text = body.input_text
+    for name in ("John Doe", "Jane"):
+        start = text.find(name)
+        while start >= 0:
+            entities.append(
+                SimpleNamespace(
+                    category="Patient",
+                    offset=SimpleNamespace(code_point=start),
+                    length=SimpleNamespace(code_point=len(name)),
+                    confidence_score=0.9,
+                )
+            )
+            start = text.find(name, start + 1)
+    return SimpleNamespace(tagger_result=SimpleNamespace(entities=entities))
+
+
+def test_analyze_batch_sends_one_text_per_request(import_modules):
+    client = MagicMock()
+    client.deidentify_text = MagicMock(side_effect=_deidentify_text)
+    recognizer = AzureHealthDeidRecognizer(
+        supported_entities=["PATIENT"], client=client
+    )
+
+    texts = ["Patient name is John Doe.", "", "Jane was discharged.", "Jane"]
+    results = recognizer.analyze_batch(texts=texts, entities=["PATIENT"])
+
+    sent_texts = sorted(
+        call.args[0].input_text for call in client.deidentify_text.call_args_list
+    )
+    assert sent_texts == sorted(text for text in texts if text)
+    assert results == [
+        recognizer.analyze(text=text, entities=["PATIENT"]) if text else []
+        for text in texts
+    ]
+
+
+def test_analyze_batch_maps_entities_back_to_joined_texts(import_modules):
+    client = MagicMock()
+    client.deidentify_text = MagicMock(side_effect=_deidentify_text)
+    recognizer = AzureHealthDeidRecognizer(
+        supported_entities=["PATIENT"], client=client, join_batch_texts=True
+    )
+    recognizer.MAX_BATCH_CHARACTERS = 60
+
+    texts = [
+        "Patient name is John Doe.",
+        "",
+        "Jane was discharged.",
+        "Seen by nurse on call, then by John Doe and Jane again.",
+    ]
+    results = recognizer.analyze_batch(texts=texts, entities=["PATIENT"])
+
+    assert client.deidentify_text.call_count == 2
+    assert [len(text_results) for text_results in results] == [1, 0, 1, 2]
+    for text, text_results in zip(texts, results):
+        for result in text_results:
+            assert text[result.start : result.end] in ("John Doe", "Jane")
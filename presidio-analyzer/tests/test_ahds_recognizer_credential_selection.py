@@ -4,9 +4,20 @@ import os
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
+from presidio_analyzer.llm_utils.remote_client_registry import (
+    set_remote_client_registry,
+)
 from presidio_analyzer.predefined_recognizers.third_party.ahds_recognizer import AzureHealthDeidRecognizer
 
 
+@pytest.fixture(autouse=True)
+def fresh_remote_client_registry():
+    """Start every test without cached clients and credentials."""
+    set_remote_client_registry(None)
+    yield
+    set_remote_client_registry(None)
+
+
 @pytest.fixture
 def mock_azure_modules():
     """Mock Azure modules to avoid import dependencies."""
@@ -51,7 +62,7 @@ class TestAHDSRecognizerCredentialSelection:
             # Verify DeidentificationClient was initialized with credential from get_azure_credential
             mock_azure_modules['DeidentificationClient'].assert_called_once()
             call_args = mock_azure_modules['DeidentificationClient'].call_args
-            assert call_args[0][1] == mock_credential
+            assert call_args[0][1].credential == mock_credential
 
     def test_uses_chained_credential_in_production_environment(self, mock_azure_modules):
         """Test that get_azure_credential is used when ENV=production."""
@@ -69,7 +80,7 @@ class TestAHDSRecognizerCredentialSelection:
             # Verify DeidentificationClient was initialized with credential from get_azure_credential
             mock_azure_modules['DeidentificationClient'].assert_called_once()
             call_args = mock_azure_modules['DeidentificationClient'].call_args
-            assert call_args[0][1] == mock_credential
+            assert call_args[0][1].credential == mock_credential
 
     def test_uses_chained_credential_when_env_var_not_set(self, mock_azure_modules):
         """Test that get_azure_credential is used when ENV is not set (default)."""
@@ -99,7 +110,8 @@ class TestAHDSRecognizerCredentialSelection:
                 mock_credential = MagicMock()
                 mock_azure_modules['get_azure_credential'].return_value = mock_credential
                 
-                # Reset mocks
+                # Reset mocks and cached clients
+                set_remote_client_registry(None)
                 mock_azure_modules['get_azure_credential'].reset_mock()
                 mock_azure_modules['DeidentificationClient'].reset_mock()
                 
@@ -108,6 +120,16 @@ class TestAHDSRecognizerCredentialSelection:
                 # Verify get_azure_credential was called for this environment
                 mock_azure_modules['get_azure_credential'].assert_called_once(), f"Failed for environment: {env_value}"
 
+    def test_client_and_credential_shared_between_instances(self, mock_azure_modules):
+        """Test that recognizers of the same endpoint share one client."""
+        with patch.dict(os.environ, {'AHDS_ENDPOINT': 'https://test.endpoint.com'}):
+            first = AzureHealthDeidRecognizer()
+            second = AzureHealthDeidRecognizer()
+
+        mock_azure_modules['get_azure_credential'].assert_called_once()
+        mock_azure_modules['DeidentificationClient'].assert_called_once()
+        assert first.deid_client is second.deid_client
+
     def test_respects_provided_client_parameter(self, mock_azure_modules):
         """Test that when a client is provided, no credential creation occurs."""
         mock_client_instance = MagicMock()
@@ -0,0 +1,176 @@
+from unittest.mock import patch
+
+import pytest
+
+from presidio_analyzer import (
+    AnalyzerEngine,
+    DocumentAnalysisCache,
+    RecognizerRegistry,
+)
+from presidio_analyzer.document_analysis_cache import (
+    AnalyzedDocument,
+    find_changed_region,
+)
+from tests.mocks import NlpEngineMock
+
+PARAGRAPHS = [
+    "Please contact John Smith at john.smith@example.com about the invoice.",
+    "The payment was made with card 4095-2609-9393-4932 on Monday.",
+    "Our office phone number is 212-555-1234, call between 9 and 5.",
+    "Send the signed contract to Maria Garcia before the end of the month.",
+    "The server at 192.168.0.1 was restarted after the outage.",
+]
+DOCUMENT = "\n\n".join(PARAGRAPHS * 4)
+
+
+@pytest.fixture(scope="module")
+def analyzer_engine():
+    return AnalyzerEngine(registry=RecognizerRegistry(), nlp_engine=NlpEngineMock())
+
+
+def as_tuples(results):
+    return sorted((r.entity_type, r.start, r.end, round(r.score, 6)) for r in results)
+
+
+def analyze_with_spy(analyzer_engine, **kwargs):
+    with patch.object(
+        analyzer_engine, "analyze", wraps=analyzer_engine.analyze
+    ) as analyze:
+        results = analyzer_engine.analyze_incremental(**kwargs)
+    return results, [len(call.kwargs["text"]) for call in analyze.call_args_list]
+
+
+@pytest.mark.parametrize(
+    "old_text, new_text, expected",
+    [
+        ("abcdef", "abcdef", (6, 6, 6)),
+        ("abcdef", "abXdef", (2, 3, 3)),
+        ("abcdef", "abdef", (2, 3, 2)),
+        ("abcdef", "abcXYdef", (3, 3, 5)),
+        ("abcdef", "Xbcdef", (0, 1, 1)),
+        ("abcdef", "abcdeX", (5, 6, 6)),
+        ("aaaa", "aaaaaa", (4, 4, 6)),
+        ("", "abc", (0, 0, 3)),
+        ("abXdeYg", "abZdeWg", (2, 6, 6)),
+    ],
+)
+def test_when_texts_differ_then_changed_region_found(old_text, new_text, expected):
+    assert find_changed_region(old_text, new_text) == expected
+
+
+def test_when_cache_full_then_least_recently_used_document_evicted():
+    cache = DocumentAnalysisCache(max_documents=2)
+    for doc_id in ("a", "b"):
+        cache.put(doc_id, AnalyzedDocument(text=doc_id, params={}, results=[]))
+
+    cache.get("a")
+    cache.put("c", AnalyzedDocument(text="c", params={}, results=[]))
+
+    assert "a" in cache and "c" in cache
+    assert "b" not in cache
+    assert len(cache) == 2
+
+
+def test_when_max_documents_invalid_then_raises():
+    with pytest.raises(ValueError):
+        DocumentAnalysisCache(max_documents=0)
+
+
+def test_when_first_version_then_full_analysis(analyzer_engine):
+    results, analyzed_lengths = analyze_with_spy(
+        analyzer_engine, doc_id="first", text=DOCUMENT, language="en"
+    )
+
+    assert analyzed_lengths == [len(DOCUMENT)]
+    assert as_tuples(results) == as_tuples(
+        analyzer_engine.analyze(DOCUMENT, language="en")
+    )
+
+
+@pytest.mark.parametrize(
+    "old, new",
+    [
+        # Insert a new entity
+        ("about the invoice.", "about the invoice, cc jane@example.org."),
+        # Change an existing entity
+        ("212-555-1234", "212-555-9876"),
+        # Remove an entity
+        ("server at 192.168.0.1 was", "server was"),
+        # Edit text next to an entity
+        ("was restarted", "was rebooted and restarted"),
+    ],
+)
+def test_when_document_edited_then_results_equal_full_analysis(
+    analyzer_engine, old, new
+):
+    doc_id = f"edited-{old}"
+    analyzer_engine.analyze_incremental(doc_id, DOCUMENT, language="en")
+
+    # Edit an occurrence in the middle of the document
+    position = DOCUMENT.index(old, len(DOCUMENT) // 2)
+    edited = DOCUMENT[:position] + new + DOCUMENT[position + len(old) :]
+
+    results, analyzed_lengths = analyze_with_spy(
+        analyzer_engine, doc_id=doc_id, text=edited, language="en"
+    )
+
+    assert as_tuples(results) == as_tuples(
+        analyzer_engine.analyze(edited, language="en")
+    )
+    assert len(analyzed_lengths) == 1
+    assert analyzed_lengths[0] < len(edited) / 4
+
+
+def test_when_successive_edits_then_results_equal_full_analysis(analyzer_engine):
+    text = DOCUMENT
+    analyzer_engine.analyze_incremental("successive", text, language="en")
+
+    for i in range(3):
+        text = text.replace("Monday", f"day {i}, from 10.0.0.{i}", 1)
+        results = analyzer_engine.analyze_incremental("successive", text, language="en")
+
+        assert as_tuples(results) == as_tuples(
+            analyzer_engine.analyze(text, language="en")
+        )
+
+
+def test_when_text_unchanged_then_no_analysis(analyzer_engine):
+    first = analyzer_engine.analyze_incremental("unchanged", DOCUMENT, language="en")
+
+    results, analyzed_lengths = analyze_with_spy(
+        analyzer_engine, doc_id="unchanged", text=DOCUMENT, language="en"
+    )
+
+    assert analyzed_lengths == []
+    assert as_tuples(results) == as_tuples(first)
+    assert results[0] is not first[0]
+
+
+def test_when_parameters_change_then_full_analysis(analyzer_engine):
+    analyzer_engine.analyze_incremental("params", DOCUMENT, language="en")
+    edited = DOCUMENT.replace("Monday", "Tuesday", 1)
+
+    results, analyzed_lengths = analyze_with_spy(
+        analyzer_engine,
+        doc_id="params",
+        text=edited,
+        language="en",
+        entities=["PHONE_NUMBER"],
+    )
+
+    assert analyzed_lengths == [len(edited)]
+    assert {r.entity_type for r in results} == {"PHONE_NUMBER"}
+
+
+def test_when_most_of_text_changed_then_full_analysis(analyzer_engine):
+    analyzer_engine.analyze_incremental("rewritten", DOCUMENT, language="en")
+    rewritten = DOCUMENT[:10] + "Call 212-555-1234 now." + DOCUMENT[-10:]
+
+    results, analyzed_lengths = analyze_with_spy(
+        analyzer_engine, doc_id="rewritten", text=rewritten, language="en"
+    )
+
+    assert analyzed_lengths == [len(rewritten)]
+    assert as_tuples(results) == as_tuples(
+        analyzer_engine.analyze(rewritten, language="en")
+    )
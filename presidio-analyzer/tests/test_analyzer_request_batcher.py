@@ -0,0 +1,165 @@
+import os
+import threading
+
+import pytest
+
+from presidio_analyzer import AnalyzerEngine, AnalyzerRequestBatcher
+from presidio_analyzer.batching_utils import Histogram
+from tests.mocks import NlpEngineMock, RecognizerRegistryMock
+
+
+class BatchRecordingNlpEngineMock(NlpEngineMock):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def process_batch(self, texts, language, **kwargs):
+        texts = list(texts)
+        self.batches.append((language, texts))
+        return super().process_batch(texts, language, **kwargs)
+
+
+@pytest.fixture
+def nlp_engine():
+    return BatchRecordingNlpEngineMock()
+
+
+@pytest.fixture
+def analyzer_engine(nlp_engine):
+    return AnalyzerEngine(registry=RecognizerRegistryMock(), nlp_engine=nlp_engine)
+
+
+def test_when_single_request_then_same_results_as_analyzer(analyzer_engine):
+    batcher = AnalyzerRequestBatcher(analyzer_engine, max_wait_ms=0)
+    text = "Call me at 2352351232"
+
+    results = batcher.analyze(text=text, language="en")
+    batcher.close()
+
+    assert results == analyzer_engine.analyze(text=text, language="en")
+    assert batcher.get_stats()["batch_size"]["count"] == 1
+
+
+def test_when_concurrent_requests_then_coalesced_into_batches(
+    analyzer_engine, nlp_engine
+):
+    batcher = AnalyzerRequestBatcher(
+        analyzer_engine, max_batch_size=8, max_wait_ms=200
+    )
+    texts = [f"Call me at 212555123{i}" for i in range(8)]
+    results = [None] * len(texts)
+
+    def analyze(i):
+        results[i] = batcher.analyze(text=texts[i], language="en")
+
+    threads = [threading.Thread(target=analyze, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    batcher.close()
+
+    assert len(nlp_engine.batches) < len(texts)
+    assert sum(len(batch) for _, batch in nlp_engine.batches) == len(texts)
+    for text, text_results in zip(texts, results):
+        assert text_results == analyzer_engine.analyze(text=text, language="en")
+
+
+def test_when_request_specific_params_then_applied_per_request(analyzer_engine):
+    batcher = AnalyzerRequestBatcher(analyzer_engine, max_wait_ms=0)
+
+    results = batcher.analyze(
+        text="Call me at 2352351232", language="en", score_threshold=0.99
+    )
+    batcher.close()
+
+    assert results == []
+
+
+def test_when_analyze_fails_then_exception_raised_to_caller(analyzer_engine):
+    batcher = AnalyzerRequestBatcher(analyzer_engine, max_wait_ms=0)
+
+    with pytest.raises(ValueError):
+        batcher.analyze(text="text", language="en", allow_list=["a"],
+                        allow_list_match="unknown")
+    batcher.close()
+
+
+def test_when_nlp_engine_drops_results_then_all_requests_fail(
+    analyzer_engine, nlp_engine
+):
+    process_batch = nlp_engine.process_batch
+    nlp_engine.process_batch = lambda texts, language, **kwargs: list(
+        process_batch(texts, language, **kwargs)
+    )[:-1]
+    batcher = AnalyzerRequestBatcher(analyzer_engine, max_wait_ms=0)
+
+    with pytest.raises(RuntimeError, match="returned 0 results"):
+        batcher.analyze(text="Call me at 2352351232", language="en")
+    batcher.close()
+
+
+def test_when_closed_then_analyze_raises(analyzer_engine):
+    batcher = AnalyzerRequestBatcher(analyzer_engine)
+    batcher.close()
+
+    with pytest.raises(RuntimeError):
+        batcher.analyze(text="text", language="en")
+
+
+@pytest.mark.parametrize(
+    "max_batch_size, max_wait_ms", [(0, 5), (1, -1)]
+)
+def test_when_invalid_params_then_value_error(
+    analyzer_engine, max_batch_size, max_wait_ms
+):
+    with pytest.raises(ValueError):
+        AnalyzerRequestBatcher(
+            analyzer_engine, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms
+        )
+
+
+def test_histogram_counts_are_cumulative():
+    histogram = Histogram([1, 5])
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+
+    assert histogram.to_dict() == {
+        "buckets": {"1": 2, "5": 3, "+Inf": 4},
+        "count": 4,
+        "sum": 14.5,
+    }
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_when_forked_after_first_request_then_child_requests_answered(
+    analyzer_engine,
+):
+    batcher = AnalyzerRequestBatcher(analyzer_engine, max_wait_ms=0)
+    text = "Call me at 2352351232"
+    expected = batcher.analyze(text=text, language="en")
+
+    pid = os.fork()
+    if pid == 0:
+        # Child process: analyze in a thread, so a hang is reported as a failure
+        results = []
+        thread = threading.Thread(
+            target=lambda: results.append(batcher.analyze(text=text, language="en")),
+            daemon=True,
+        )
+        thread.start()
+        thread.join(timeout=10)
+        os._exit(0 if results == [expected] else 1)
+
+    _, status = os.waitpid(pid, 0)
+    batcher.close()
+    assert os.WEXITSTATUS(status) == 0
+
+
+def test_when_created_then_worker_started_on_first_request(analyzer_engine):
+    batcher = AnalyzerRequestBatcher(analyzer_engine, max_wait_ms=0)
+
+    assert batcher._worker is None
+    batcher.analyze(text="Call me at 2352351232", language="en")
+    assert batcher._worker.is_alive()
+    batcher.close()
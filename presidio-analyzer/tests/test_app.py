@@ -0,0 +1,98 @@
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("flask")
+
+from app import Server  # noqa: E402
+
+
+def create_server(engine: MagicMock) -> Server:
+    with patch("app.AnalyzerEngineProvider") as provider:
+        provider.return_value.create_engine.return_value = engine
+        return Server()
+
+
+@pytest.fixture
+def engine():
+    engine = MagicMock()
+    engine.supported_languages = ["en"]
+    engine.analyze.return_value = []
+    engine.nlp_engine.process_batch.side_effect = lambda texts, **kwargs: [
+        (text, MagicMock()) for text in texts
+    ]
+    return engine
+
+
+@pytest.fixture
+def limited_server(monkeypatch, engine):
+    monkeypatch.setenv("MAX_CONCURRENT_REQUESTS", "1")
+    monkeypatch.setenv("MAX_QUEUED_REQUESTS", "0")
+    return create_server(engine)
+
+
+def test_given_busy_worker_then_requests_are_rejected_with_429(limited_server):
+    client = limited_server.app.test_client()
+    request = {"text": "John Smith", "language": "en"}
+    assert limited_server.request_limiter.acquire()
+    try:
+        response = client.post("/analyze", json=request)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+        # Probes are not limited
+        assert client.get("/health").status_code == 200
+        assert client.get("/ready").status_code == 200
+    finally:
+        limited_server.request_limiter.release()
+
+    # Slots of completed requests are released
+    assert client.post("/analyze", json=request).status_code == 200
+    assert client.post("/analyze", json=request).status_code == 200
+
+
+def test_given_successful_warmup_then_ready(engine):
+    server = create_server(engine)
+    engine.analyze.assert_called_once()
+    assert server.app.test_client().get("/ready").status_code == 200
+
+
+def test_given_failed_warmup_then_not_ready(engine):
+    engine.analyze.side_effect = RuntimeError("model failed")
+    server = create_server(engine)
+    client = server.app.test_client()
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json == {"error": "Presidio Analyzer service is not ready"}
+    assert client.get("/health").status_code == 200
+
+
+def test_given_malformed_ndjson_record_then_error_record_streamed(engine):
+    client = create_server(engine).app.test_client()
+    body = '{"id": "a", "text": "John Smith"}\n{"id": "b", "text": \n'
+
+    response = client.post(
+        "/analyze/batch?language=en&batch_size=1",
+        data=body,
+        content_type="application/x-ndjson",
+    )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert lines[0] == {"id": "a", "recognizer_results": []}
+    assert len(lines) == 2
+    assert lines[1]["error"].startswith("Invalid NDJSON record")
+
+
+def test_given_ndjson_record_without_text_then_error_record_streamed(engine):
+    client = create_server(engine).app.test_client()
+
+    response = client.post(
+        "/analyze/batch?language=en",
+        data='{"id": "a"}\n',
+        content_type="application/x-ndjson",
+    )
+
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert lines == [{"error": "Missing record field: 'text'"}]
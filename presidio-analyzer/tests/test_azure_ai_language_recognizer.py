@@ -1,10 +1,14 @@
 import os
 import importlib
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 import dotenv
 
+from presidio_analyzer.llm_utils.remote_client_registry import (
+    RemoteClientRegistry,
+    set_remote_client_registry,
+)
 from presidio_analyzer.predefined_recognizers import AzureAILanguageRecognizer
 
 dotenv.load_dotenv()
@@ -87,3 +91,99 @@ def test_mocked_entities_match_recognizer_results():
         assert expected.offset == actual.start
         assert expected.length == actual.end - actual.start
         assert expected.confidence_score == actual.score
+
+
+def test_analyze_batch_packs_documents_and_maps_results():
+    pytest.importorskip("azure.ai.textanalytics")
+    from azure.ai.textanalytics import PiiEntity, RecognizePiiEntitiesResult
+
+    def recognize_pii_entities(documents, language):
+        assert len(documents) <= AzureAILanguageRecognizer.MAX_BATCH_DOCUMENTS
+        response = []
+        for document in documents:
+            offset = document.find("Raj")
+            entities = []
+            if offset >= 0:
+                entities.append(
+                    PiiEntity(
+                        text="Raj",
+                        category="Person",
+                        length=3,
+                        offset=offset,
+                        confidence_score=0.8,
+                    )
+                )
+            response.append(RecognizePiiEntitiesResult(entities=entities))
+        return response
+
+    ta_client = MagicMock()
+    ta_client.recognize_pii_entities = MagicMock(side_effect=recognize_pii_entities)
+    azure_ai_recognizer = AzureAILanguageRecognizer(ta_client=ta_client)
+
+    texts = [f"Document {i}, written by Raj" if i % 3 == 0 else "" for i in range(12)]
+    results = azure_ai_recognizer.analyze_batch(texts=texts, entities=["PERSON"])
+
+    # Empty texts are not sent, the 4 other texts fit in a single request
+    assert ta_client.recognize_pii_entities.call_count == 1
+    assert len(results) == len(texts)
+    for text, text_results in zip(texts, results):
+        if not text:
+            assert text_results == []
+            continue
+        assert len(text_results) == 1
+        assert text[text_results[0].start : text_results[0].end] == "Raj"
+
+
+def test_analyze_batch_skips_error_documents():
+    pytest.importorskip("azure.ai.textanalytics")
+    from azure.ai.textanalytics import DocumentError, TextAnalyticsError
+
+    ta_client = MagicMock()
+    ta_client.recognize_pii_entities = MagicMock(
+        side_effect=lambda documents, language: [
+            DocumentError(
+                id=str(i),
+                error=TextAnalyticsError(code="InvalidDocument", message="invalid"),
+            )
+            for i, _ in enumerate(documents)
+        ]
+    )
+    azure_ai_recognizer = AzureAILanguageRecognizer(ta_client=ta_client)
+
+    texts = ["text"] * 7
+    results = azure_ai_recognizer.analyze_batch(texts=texts, entities=["PERSON"])
+
+    assert results == [[]] * 7
+    assert ta_client.recognize_pii_entities.call_count == 2
+
+
+def test_without_key_then_error_raised():
+    pytest.importorskip("azure.ai.textanalytics")
+    env = {"AZURE_AI_ENDPOINT": "https://test.cognitiveservices.azure.com/"}
+    with patch.dict(os.environ, env):
+        os.environ.pop("AZURE_AI_KEY", None)
+        with pytest.raises(ValueError, match="key is required"):
+            AzureAILanguageRecognizer()
+
+
+def test_without_key_when_azure_credential_enabled_then_shared_credential_used():
+    pytest.importorskip("azure.ai.textanalytics")
+    registry = RemoteClientRegistry.from_dict({})
+    token_credential = MagicMock()
+    credential = registry.get_credential(lambda: token_credential)
+    set_remote_client_registry(registry)
+    module = "presidio_analyzer.predefined_recognizers.third_party.azure_ai_language"
+    env = {"AZURE_AI_ENDPOINT": "https://test.cognitiveservices.azure.com/"}
+    try:
+        with patch.dict(os.environ, env), patch(
+            f"{module}.TextAnalyticsClient"
+        ) as client_class:
+            os.environ.pop("AZURE_AI_KEY", None)
+            first = AzureAILanguageRecognizer(use_azure_credential=True)
+            second = AzureAILanguageRecognizer(use_azure_credential=True)
+    finally:
+        set_remote_client_registry(None)
+
+    client_class.assert_called_once()
+    assert client_class.call_args.kwargs["credential"] is credential
+    assert first.ta_client is second.ta_client
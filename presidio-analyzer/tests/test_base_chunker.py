@@ -1,8 +1,14 @@
 """Tests for BaseTextChunker methods."""
+import threading
+import time
+
 import pytest
 
 from presidio_analyzer import RecognizerResult
-from presidio_analyzer.chunkers import CharacterBasedTextChunker
+from presidio_analyzer.chunkers import (
+    CharacterBasedTextChunker,
+    ChunkPredictionError,
+)
 
 
 class TestPredictWithChunking:
@@ -123,3 +129,104 @@ class TestPredictWithChunkingEdgeCases:
 
         assert result == []
         assert call_count == 0, "predict_func should not be called for empty text"
+
+
+class TestPredictWithChunkingConcurrency:
+    """Test concurrent chunk processing and per-chunk failures."""
+
+    TEXT = "John Smith lives in New York City with Jane Doe and Bob Ray"
+
+    @staticmethod
+    def predict_names(chunk):
+        return [
+            RecognizerResult(
+                entity_type="PERSON", start=chunk.index(name), end=chunk.index(name) + len(name), score=0.9
+            )
+            for name in ("John", "Jane", "Bob")
+            if name in chunk
+        ]
+
+    def test_concurrent_results_equal_sequential_results(self):
+        """Chunks processed in parallel give the same results as sequentially."""
+        chunker = CharacterBasedTextChunker(chunk_size=20, chunk_overlap=5)
+
+        sequential = chunker.predict_with_chunking(self.TEXT, self.predict_names)
+        concurrent = chunker.predict_with_chunking(
+            self.TEXT, self.predict_names, max_concurrency=4
+        )
+
+        assert [(r.start, r.end) for r in concurrent] == [
+            (r.start, r.end) for r in sequential
+        ]
+        assert [self.TEXT[r.start:r.end] for r in concurrent] == ["John", "Jane", "Bob"]
+
+    def test_max_concurrency_limits_in_flight_chunks(self):
+        """No more than max_concurrency chunks are processed at once."""
+        chunker = CharacterBasedTextChunker(chunk_size=10, chunk_overlap=0)
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def predict_func(chunk):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return []
+
+        chunker.predict_with_chunking(self.TEXT, predict_func, max_concurrency=2)
+
+        assert max_in_flight == 2
+
+    def test_failed_chunk_raises_with_partial_results(self):
+        """A failing chunk raises after the other chunks are processed."""
+        chunker = CharacterBasedTextChunker(chunk_size=20, chunk_overlap=5)
+
+        def predict_func(chunk):
+            if "Jane" in chunk:
+                raise TimeoutError("LLM timed out")
+            return self.predict_names(chunk)
+
+        with pytest.raises(ChunkPredictionError) as exc_info:
+            chunker.predict_with_chunking(self.TEXT, predict_func, max_concurrency=4)
+
+        chunk_errors = exc_info.value.chunk_errors
+        assert chunk_errors
+        assert all("Jane" in e.chunk.text for e in chunk_errors)
+        assert all(isinstance(e.error, TimeoutError) for e in chunk_errors)
+        assert [self.TEXT[r.start:r.end] for r in exc_info.value.results] == ["John", "Bob"]
+
+    def test_failed_chunk_raises_original_error_by_default(self):
+        """With the defaults, the first failing chunk stops processing."""
+        chunker = CharacterBasedTextChunker(chunk_size=20, chunk_overlap=5)
+        processed = []
+
+        def predict_func(chunk):
+            processed.append(chunk)
+            if "Jane" in chunk:
+                raise TimeoutError("LLM timed out")
+            return self.predict_names(chunk)
+
+        with pytest.raises(TimeoutError):
+            chunker.predict_with_chunking(self.TEXT, predict_func)
+
+        assert "Jane" in processed[-1]
+        assert len(processed) < len(chunker.chunk(self.TEXT))
+
+    def test_allow_partial_results_returns_successful_chunks(self):
+        """With allow_partial_results, failed chunks are skipped."""
+        chunker = CharacterBasedTextChunker(chunk_size=20, chunk_overlap=5)
+
+        def predict_func(chunk):
+            if "Jane" in chunk:
+                raise TimeoutError("LLM timed out")
+            return self.predict_names(chunk)
+
+        result = chunker.predict_with_chunking(
+            self.TEXT, predict_func, max_concurrency=4, allow_partial_results=True
+        )
+
+        assert [self.TEXT[r.start:r.end] for r in result] == ["John", "Bob"]
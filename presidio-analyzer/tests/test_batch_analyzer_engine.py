@@ -1,5 +1,12 @@
 import pytest
-from presidio_analyzer import RecognizerResult, BatchAnalyzerEngine, DictAnalyzerResult
+from presidio_analyzer import (
+    AnalyzerEngine,
+    RecognizerResult,
+    BatchAnalyzerEngine,
+    DictAnalyzerResult,
+    RemoteRecognizer,
+)
+from tests.mocks import RecognizerRegistryMock
 
 
 @pytest.fixture(scope="module")
@@ -288,3 +295,114 @@ def test_batch_analyze_iterator_returns_list_of_recognizer_results(
     assert len(results) == len(expected_output)
     for result, expected_result in zip(results, expected_output):
         assert result == expected_result
+
+
+def test_analyze_iterator_columnar_returns_same_results_as_analyze_iterator(
+    batch_analyzer_engine_simple,
+):
+    texts = ["My name is David", "Call me at 2352351232", "", "Call 2121551234"]
+
+    list_results = batch_analyzer_engine_simple.analyze_iterator(
+        texts=texts, language="en", batch_size=2
+    )
+    columnar_results = batch_analyzer_engine_simple.analyze_iterator_columnar(
+        texts=texts, language="en", batch_size=2
+    )
+
+    assert len(columnar_results) == len(texts)
+    assert columnar_results.to_lists() == list_results
+
+
+class KeywordRemoteRecognizer(RemoteRecognizer):
+    """Remote recognizer stand-in counting its calls."""
+
+    def __init__(self):
+        super().__init__(
+            supported_entities=["KEYWORD"],
+            name="KeywordRemoteRecognizer",
+            supported_language="en",
+            version="1.0",
+        )
+        self.analyze_calls = 0
+        self.batch_sizes = []
+
+    def get_supported_entities(self):
+        return self.supported_entities
+
+    def analyze(self, text, entities, nlp_artifacts=None):
+        self.analyze_calls += 1
+        start = text.find("secret")
+        if start < 0:
+            return []
+        return [RecognizerResult("KEYWORD", start, start + len("secret"), 0.9)]
+
+    def analyze_batch(self, texts, entities, nlp_artifacts_list=None):
+        self.batch_sizes.append(len(texts))
+        return [self.analyze(text, entities) for text in texts]
+
+
+@pytest.fixture
+def remote_analyzer_engine(mock_nlp_engine):
+    registry = RecognizerRegistryMock()
+    registry.load_predefined_recognizers()
+    registry.add_recognizer(KeywordRemoteRecognizer())
+    return AnalyzerEngine(registry=registry, nlp_engine=mock_nlp_engine)
+
+
+def test_analyze_iterator_batches_remote_recognizer_calls(remote_analyzer_engine):
+    remote_recognizer = [
+        recognizer
+        for recognizer in remote_analyzer_engine.registry.recognizers
+        if isinstance(recognizer, KeywordRemoteRecognizer)
+    ][0]
+    texts = [f"text {i} with a secret, call me at 2352351232" for i in range(5)]
+
+    batch_engine = BatchAnalyzerEngine(remote_analyzer_engine, remote_batch_size=2)
+    results = batch_engine.analyze_iterator(texts=texts, language="en")
+
+    assert remote_recognizer.batch_sizes == [2, 2, 1]
+    assert remote_recognizer.analyze_calls == len(texts)
+
+    expected = [remote_analyzer_engine.analyze(text, language="en") for text in texts]
+    assert results == expected
+    assert all(
+        {result.entity_type for result in text_results}
+        == {"KEYWORD", "PHONE_NUMBER"}
+        for text_results in results
+    )
+
+
+def test_analyze_iterator_columnar_uses_remote_batches(remote_analyzer_engine):
+    batch_engine = BatchAnalyzerEngine(remote_analyzer_engine, remote_batch_size=10)
+    texts = ["no entities", "a secret"]
+
+    results = batch_engine.analyze_iterator_columnar(texts=texts, language="en")
+
+    assert results.to_lists() == [
+        [],
+        [RecognizerResult("KEYWORD", 2, 8, 0.9)],
+    ]
+
+
+def test_when_remote_batch_size_invalid_then_error(analyzer_engine_simple):
+    with pytest.raises(ValueError):
+        BatchAnalyzerEngine(analyzer_engine_simple, remote_batch_size=0)
+
+
+@pytest.mark.parametrize(
+    "texts, max_texts, max_characters, separator_length, expected",
+    [
+        (["a", "b", "c"], 2, 100, 0, [[0, 1], [2]]),
+        (["aaa", "bbb", "ccc"], None, 7, 1, [[0, 1], [2]]),
+        (["aaa", "", " ", "bbb"], None, 100, 0, [[0, 3]]),
+        (["a" * 10, "b", "c"], None, 5, 0, [[0], [1, 2]]),
+        ([], 5, 100, 0, []),
+    ],
+)
+def test_pack_texts(texts, max_texts, max_characters, separator_length, expected):
+    assert (
+        RemoteRecognizer._pack_texts(
+            texts, max_texts, max_characters, separator_length
+        )
+        == expected
+    )
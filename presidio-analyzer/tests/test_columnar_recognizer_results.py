@@ -0,0 +1,104 @@
+import numpy as np
+import pytest
+
+from presidio_analyzer import ColumnarRecognizerResults, RecognizerResult
+
+
+def create_result(entity_type, start, end, score, recognizer_name="TestRecognizer"):
+    return RecognizerResult(
+        entity_type=entity_type,
+        start=start,
+        end=end,
+        score=score,
+        recognition_metadata={RecognizerResult.RECOGNIZER_NAME_KEY: recognizer_name},
+    )
+
+
+@pytest.fixture
+def list_results():
+    return [
+        [create_result("PERSON", 0, 4, 0.85), create_result("PHONE_NUMBER", 10, 20, 0.4)],
+        [],
+        [create_result("PERSON", 3, 9, 0.6, recognizer_name="OtherRecognizer")],
+    ]
+
+
+def test_when_from_lists_then_rows_and_results_counted(list_results):
+    columnar = ColumnarRecognizerResults.from_lists(list_results)
+
+    assert len(columnar) == 3
+    assert columnar.num_results == 3
+    assert columnar.entity_types == ["PERSON", "PHONE_NUMBER"]
+    assert columnar.recognizer_names == ["TestRecognizer", "OtherRecognizer"]
+
+
+def test_when_materialized_then_equal_to_original_results(list_results):
+    columnar = ColumnarRecognizerResults.from_lists(list_results)
+
+    assert columnar.to_lists() == list_results
+    assert columnar[-1] == list_results[-1]
+    assert (
+        columnar[2][0].recognition_metadata[RecognizerResult.RECOGNIZER_NAME_KEY]
+        == "OtherRecognizer"
+    )
+
+
+def test_when_row_out_of_range_then_index_error(list_results):
+    columnar = ColumnarRecognizerResults.from_lists(list_results)
+
+    with pytest.raises(IndexError):
+        columnar.get_row(3)
+
+
+def test_when_no_recognizer_name_then_materialized_without_metadata():
+    columnar = ColumnarRecognizerResults.from_lists(
+        [[RecognizerResult("PERSON", 0, 4, 0.5)]]
+    )
+
+    assert columnar.to_numpy()["recognizer_id"].tolist() == [-1]
+    assert columnar[0][0].recognition_metadata is None
+
+
+def test_when_to_numpy_then_memory_is_shared(list_results):
+    columnar = ColumnarRecognizerResults.from_lists(list_results)
+    columns = columnar.to_numpy()
+
+    assert columns["row_id"].tolist() == [0, 0, 2]
+    assert columns["start"].tolist() == [0, 10, 3]
+    assert columns["entity_type_id"].tolist() == [0, 1, 0]
+    assert np.shares_memory(columns["score"], np.frombuffer(columnar.scores))
+
+
+def test_when_to_pandas_then_dataframe_has_one_line_per_result(list_results):
+    pytest.importorskip("pandas")
+    df = ColumnarRecognizerResults.from_lists(list_results).to_pandas()
+
+    assert len(df) == 3
+    assert df["entity_type"].tolist() == ["PERSON", "PHONE_NUMBER", "PERSON"]
+    assert df["recognizer_name"].tolist() == [
+        "TestRecognizer",
+        "TestRecognizer",
+        "OtherRecognizer",
+    ]
+
+
+def test_when_to_arrow_then_table_has_one_line_per_result(list_results):
+    pytest.importorskip("pyarrow")
+    table = ColumnarRecognizerResults.from_lists(list_results).to_arrow()
+
+    assert table.num_rows == 3
+    assert table.column("end").to_pylist() == [4, 20, 9]
+    assert table.column("entity_type").to_pylist() == [
+        "PERSON",
+        "PHONE_NUMBER",
+        "PERSON",
+    ]
+
+
+def test_when_no_recognizer_name_then_arrow_column_is_null():
+    pytest.importorskip("pyarrow")
+    columnar = ColumnarRecognizerResults.from_lists(
+        [[RecognizerResult("PERSON", 0, 4, 0.5)]]
+    )
+
+    assert columnar.to_arrow().column("recognizer_name").to_pylist() == [None]
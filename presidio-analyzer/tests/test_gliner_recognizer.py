@@ -254,3 +254,24 @@ def test_gliner_deduplicates_entities_in_overlap_region(mock_gliner):
     # Verify: Kept the one with highest score (0.95 from first chunk)
     assert results[0].score == 0.95
     assert text[results[0].start:results[0].end] == "Dr. Smith"
+
+
+def test_load_with_onnx_passes_onnx_options():
+    gliner_module = "presidio_analyzer.predefined_recognizers.ner.gliner_recognizer"
+    session_options = MagicMock()
+    with patch(f"{gliner_module}.GLiNER") as mock_gliner_class, patch(
+        f"{gliner_module}.create_session_options", return_value=session_options
+    ) as mock_create_session_options:
+        gliner_recognizer = GLiNERRecognizer(
+            use_onnx=True,
+            onnx_model_file="model_quantized.onnx",
+            onnx_intra_op_num_threads=2,
+        )
+
+    mock_create_session_options.assert_called_once_with(2)
+    mock_gliner_class.from_pretrained.assert_called_once_with(
+        gliner_recognizer.model_name,
+        load_onnx_model=True,
+        onnx_model_file="model_quantized.onnx",
+        session_options=session_options,
+    )
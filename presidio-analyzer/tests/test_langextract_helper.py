@@ -42,6 +42,37 @@ class TestExtractLmConfig:
         assert result["labels_to_ignore"] == []
         assert result["enable_generic_consolidation"] is True
 
+    def test_when_chunking_section_exists_then_extracted(self):
+        """Test that the chunking section is passed through."""
+        chunking = {"chunk_size": 1000, "chunk_overlap": 100, "max_concurrency": 8}
+        config = {"lm_recognizer": {"chunking": chunking}}
+
+        result = extract_lm_config(config)
+
+        assert result["chunking"] == chunking
+        assert extract_lm_config({})["chunking"] is None
+
+    def test_when_chunking_configured_then_text_chunker_created(self):
+        """Test creating the LangExtract recognizer text chunker from config."""
+        from presidio_analyzer.chunkers import CharacterBasedTextChunker
+        from presidio_analyzer.predefined_recognizers.third_party.langextract_recognizer import (  # noqa: E501
+            LangExtractRecognizer,
+        )
+
+        chunker = LangExtractRecognizer._create_text_chunker(
+            {"chunker_type": "character", "chunk_size": 1000, "chunk_overlap": 100}
+        )
+
+        assert isinstance(chunker, CharacterBasedTextChunker)
+        assert chunker.chunk_size == 1000
+        assert LangExtractRecognizer._create_text_chunker({}) is None
+        assert (
+            LangExtractRecognizer._create_text_chunker(
+                {"enabled": False, "chunk_size": 1000}
+            )
+            is None
+        )
+
     def test_when_partial_config_then_uses_defaults_for_missing_fields(self):
         """Test that defaults are used for missing fields."""
         config = {
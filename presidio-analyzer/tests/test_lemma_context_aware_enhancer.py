@@ -1,4 +1,16 @@
-from presidio_analyzer import LemmaContextAwareEnhancer
+import pytest
+
+from presidio_analyzer import (
+    AnalysisExplanation,
+    LemmaContextAwareEnhancer,
+    Pattern,
+    PatternRecognizer,
+    RecognizerResult,
+)
+from presidio_analyzer.context_aware_enhancers import ContextMatcher
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+STOPWORDS = {"my", "is", "of", "the", "a", "and"}
 
 
 def test_when_index_finding_then_succeed():
@@ -13,3 +25,150 @@ def test_when_index_finding_then_succeed():
         match, start, tokens, tokens_indices
     )
     assert index == 3
+
+
+def create_nlp_artifacts(text):
+    tokens = text.split(" ")
+    tokens_indices = []
+    position = 0
+    for token in tokens:
+        tokens_indices.append(position)
+        position += len(token) + 1
+    # a naive lemmatizer, for plural nouns only
+    lemmas = [token[:-1] if token.endswith("numbers") else token for token in tokens]
+    keywords = [lemma.lower() for lemma in lemmas if lemma.lower() not in STOPWORDS]
+    return NlpArtifacts(
+        [], tokens, tokens_indices, lemmas, None, "en", keywords=keywords
+    )
+
+
+def enhance(text, match, context, enhancer=None, request_context=None):
+    recognizer = PatternRecognizer(
+        supported_entity="ID",
+        patterns=[Pattern("id", r"\d{3}-\d{2}-\d{4}", 0.3)],
+        context=context,
+    )
+    start = text.index(match)
+    result = RecognizerResult(
+        "ID",
+        start,
+        start + len(match),
+        0.3,
+        AnalysisExplanation("test", 0.3),
+        {
+            RecognizerResult.RECOGNIZER_IDENTIFIER_KEY: recognizer.id,
+            RecognizerResult.RECOGNIZER_NAME_KEY: recognizer.name,
+        },
+    )
+    enhancer = enhancer or LemmaContextAwareEnhancer()
+    return enhancer.enhance_using_context(
+        text, [result], create_nlp_artifacts(text), [recognizer], request_context
+    )[0]
+
+
+@pytest.mark.parametrize(
+    "text, context, expected_word",
+    [
+        # phrase before the match
+        ("my social security is 078-05-1120", ["social security"], "social security"),
+        # phrase with a stopword
+        ("date of birth and id 078-05-1120", ["date of birth"], "date of birth"),
+        # phrase matched by lemma
+        ("account numbers 078-05-1120", ["account number"], "account number"),
+        # phrase words not consecutive
+        ("social and security 078-05-1120", ["social security"], ""),
+        # single words still match as substrings of lemmas
+        ("my telephone is 078-05-1120", ["phone", "social security"], "phone"),
+        # first matching entry of the recognizer context is reported
+        (
+            "phone of social security 078-05-1120",
+            ["social security", "phone"],
+            "social security",
+        ),
+    ],
+)
+def test_when_context_phrase_in_window_then_score_enhanced(
+    text, context, expected_word
+):
+    result = enhance(text, "078-05-1120", context)
+
+    assert result.analysis_explanation.supportive_context_word == expected_word
+    assert (result.score > 0.3) == bool(expected_word)
+
+
+def test_when_context_phrase_outside_window_then_not_matched():
+    text = "social security one two three four five six 078-05-1120"
+
+    result = enhance(text, "078-05-1120", ["social security"])
+    assert result.score == 0.3
+
+    result = enhance(
+        text,
+        "078-05-1120",
+        ["social security"],
+        enhancer=LemmaContextAwareEnhancer(context_prefix_count=8),
+    )
+    assert result.analysis_explanation.supportive_context_word == "social security"
+
+
+def test_when_context_phrase_in_request_context_then_matched():
+    result = enhance(
+        "the value 078-05-1120",
+        "078-05-1120",
+        ["social security"],
+        request_context=["Social Security"],
+    )
+
+    assert result.analysis_explanation.supportive_context_word == "social security"
+
+
+def test_when_recognizers_unchanged_then_context_matcher_reused():
+    enhancer = LemmaContextAwareEnhancer()
+    enhance("my social security is 078-05-1120", "078-05-1120", ["ssn"], enhancer)
+    matcher = enhancer._context_matchers[frozenset(["ssn"])]
+
+    enhance("ssn 078-05-1120", "078-05-1120", ["ssn"], enhancer)
+    enhance("ssn 078-05-1120", "078-05-1120", ["social security"], enhancer)
+    enhance("ssn 078-05-1120", "078-05-1120", ["ssn"], enhancer)
+    assert enhancer._context_matchers[frozenset(["ssn"])] is matcher
+    assert len(enhancer._context_matchers) == 2
+
+
+def test_when_many_context_sets_then_matchers_bounded():
+    enhancer = LemmaContextAwareEnhancer()
+    enhancer.MAX_CONTEXT_MATCHERS = 2
+    for word in ["ssn", "social", "security", "ssn"]:
+        enhance("ssn 078-05-1120", "078-05-1120", [word], enhancer)
+
+    assert list(enhancer._context_matchers) == [
+        frozenset(["security"]),
+        frozenset(["ssn"]),
+    ]
+
+
+def test_when_supportive_word_lookup_overridden_then_override_used():
+    class OverriddenContextAwareEnhancer(LemmaContextAwareEnhancer):
+        @staticmethod
+        def _find_supportive_word_in_context(context_list, recognizer_context_list):
+            return "overridden"
+
+    result = enhance(
+        "ssn 078-05-1120",
+        "078-05-1120",
+        ["ssn"],
+        enhancer=OverriddenContextAwareEnhancer(),
+    )
+    assert result.analysis_explanation.supportive_context_word == "overridden"
+
+
+def test_when_document_indexed_then_windows_found_by_position():
+    matcher = ContextMatcher(["social security", "social security number", "card"])
+    lemmas = ["my", "social", "security", "number", "and", "credit", "card"]
+    index = matcher.index_document(
+        lemmas=lemmas, tokens=lemmas, keywords=set(lemmas) - STOPWORDS
+    )
+
+    assert index.find(0, 2) == {"social security", "social security number"}
+    assert index.find(3, 4) == {"social security number"}
+    assert index.find(4, 6) == {"card"}
+    assert index.find(0, 0) == set()
@@ -0,0 +1,175 @@
+"""Tests for the LLM response cache."""
+import os
+import sqlite3
+
+import pytest
+
+from presidio_analyzer import AnalysisExplanation, RecognizerResult
+from presidio_analyzer.llm_utils import LLMResponseCache, create_llm_response_cache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = LLMResponseCache(tmp_path / "cache.sqlite", max_size_mb=1)
+    yield cache
+    cache.close()
+
+
+def create_result(start=0, end=4):
+    return RecognizerResult(
+        entity_type="PERSON",
+        start=start,
+        end=end,
+        score=0.85,
+        analysis_explanation=AnalysisExplanation(
+            recognizer="TestRecognizer",
+            original_score=0.85,
+            textual_explanation="Identified by LLM",
+        ),
+        recognition_metadata={"recognizer_name": "TestRecognizer"},
+    )
+
+
+class TestLLMResponseCacheKeys:
+    def test_when_same_inputs_then_same_key(self):
+        key1 = LLMResponseCache.make_key("text", model_id="m", examples=[{"a": 1}])
+        key2 = LLMResponseCache.make_key("text", examples=[{"a": 1}], model_id="m")
+        assert key1 == key2
+
+    @pytest.mark.parametrize(
+        "text, params",
+        [
+            ("other text", {"model_id": "m", "prompt": "p"}),
+            ("text", {"model_id": "other", "prompt": "p"}),
+            ("text", {"model_id": "m", "prompt": "other"}),
+            ("text", {"model_id": "m", "prompt": "p", "examples": [{"a": 1}]}),
+        ],
+    )
+    def test_when_any_input_differs_then_key_differs(self, text, params):
+        key = LLMResponseCache.make_key("text", model_id="m", prompt="p")
+        assert LLMResponseCache.make_key(text, **params) != key
+
+
+class TestLLMResponseCacheStorage:
+    def test_when_key_missing_then_returns_none(self, cache):
+        assert cache.get("missing") is None
+        assert cache.get_stats()["misses"] == 1
+
+    def test_when_results_stored_then_returned_identically(self, cache):
+        result = create_result()
+        cache.put("key", [result])
+
+        cached = cache.get("key")
+
+        assert cached == [result]
+        assert cached[0].score == result.score
+        assert cached[0].recognition_metadata == result.recognition_metadata
+        assert (
+            cached[0].analysis_explanation.to_dict()
+            == result.analysis_explanation.to_dict()
+        )
+
+    def test_when_empty_results_stored_then_cached(self, cache):
+        cache.put("key", [])
+        assert cache.get("key") == []
+
+    def test_when_reopened_then_entries_persist(self, tmp_path):
+        path = tmp_path / "cache.sqlite"
+        cache = LLMResponseCache(path)
+        cache.put("key", [create_result()])
+        cache.close()
+
+        reopened = LLMResponseCache(path)
+        assert reopened.get("key") == [create_result()]
+        reopened.close()
+
+    def test_stats_count_hits_and_misses(self, cache):
+        cache.put("key", [create_result()])
+        cache.get("key")
+        cache.get("key")
+        cache.get("other")
+
+        stats = cache.get_stats()
+        assert stats["hits"] == 2
+        assert stats["misses"] == 1
+        assert stats["writes"] == 1
+        assert stats["entries"] == 1
+        assert stats["hit_rate"] == pytest.approx(2 / 3)
+
+    def test_when_size_exceeded_then_least_recently_used_evicted(self, tmp_path):
+        cache = LLMResponseCache(tmp_path / "cache.sqlite", max_size_mb=0.002)
+        results = [create_result(i, i + 4) for i in range(2)]
+
+        for i in range(10):
+            cache.put(f"key{i}", results)
+            # Keep the first entry recently used
+            cache.get("key0")
+
+        stats = cache.get_stats()
+        assert stats["evictions"] > 0
+        assert stats["size_bytes"] <= cache.max_size_bytes
+        assert cache.get("key0") is not None
+        assert cache.get("key1") is None
+        assert cache.get("key9") is not None
+        cache.close()
+
+    def test_clear_removes_entries(self, cache):
+        cache.put("key", [])
+        cache.clear()
+        assert cache.get("key") is None
+        assert cache.get_stats()["size_bytes"] == 0
+
+    def test_when_entries_replaced_and_evicted_then_size_matches_table(
+        self, tmp_path
+    ):
+        cache = LLMResponseCache(tmp_path / "cache.sqlite", max_size_mb=0.002)
+        for i in range(10):
+            cache.put(f"key{i % 3}", [create_result(j, j + 4) for j in range(i % 4)])
+            cache.put(f"new{i}", [create_result()])
+
+        with sqlite3.connect(str(cache.path)) as connection:
+            (size,) = connection.execute("SELECT SUM(size) FROM responses").fetchone()
+        assert cache.get_stats()["size_bytes"] == size
+        cache.close()
+
+    def test_connection_opened_on_first_use(self, cache):
+        assert cache._connection is None
+        cache.get("key")
+        assert cache._connection is not None
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_when_forked_then_child_uses_own_connection(self, cache):
+        cache.put("parent", [create_result()])
+        parent_connection = cache._connection
+
+        pid = os.fork()
+        if pid == 0:
+            # Child process, report the result through the exit code
+            ok = cache._connection is None
+            cache.put("child", [create_result()])
+            ok = ok and cache._connection is not parent_connection
+            ok = ok and cache.get("parent") == [create_result()]
+            os._exit(0 if ok else 1)
+
+        _, status = os.waitpid(pid, 0)
+        assert os.WEXITSTATUS(status) == 0
+        assert cache._connection is parent_connection
+        assert cache.get("child") == [create_result()]
+
+
+class TestCreateLLMResponseCache:
+    def test_when_no_config_then_no_cache(self):
+        assert create_llm_response_cache(None) is None
+        assert create_llm_response_cache({"enabled": False}) is None
+
+    def test_when_config_then_cache_created(self, tmp_path):
+        cache = create_llm_response_cache(
+            {"path": str(tmp_path / "llm.sqlite"), "max_size_mb": 2}
+        )
+        assert cache.max_size_bytes == 2 * 1024 * 1024
+        assert (tmp_path / "llm.sqlite").exists()
+        cache.close()
+
+    def test_when_max_size_invalid_then_error(self, tmp_path):
+        with pytest.raises(ValueError):
+            LLMResponseCache(tmp_path / "cache.sqlite", max_size_mb=0)
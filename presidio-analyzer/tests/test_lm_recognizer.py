@@ -1,5 +1,12 @@
 """Tests for LMRecognizer base class."""
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
+import requests
 from unittest.mock import Mock
 
 from presidio_analyzer.lm_recognizer import LMRecognizer
@@ -241,3 +248,233 @@ class TestLMRecognizerFiltering:
         assert "PERSON" in entities
         assert "EMAIL_ADDRESS" in entities
         assert "GENERIC_PII_ENTITY" not in entities
+
+
+class TestLMRecognizerResponseCache:
+    """Test LMRecognizer response caching."""
+
+    @pytest.fixture
+    def response_cache(self, tmp_path):
+        from presidio_analyzer.llm_utils import LLMResponseCache
+
+        cache = LLMResponseCache(tmp_path / "llm_cache.sqlite")
+        yield cache
+        cache.close()
+
+    @staticmethod
+    def create_recognizer(**kwargs):
+        recognizer = ConcreteLMRecognizer(model_id="test-model", **kwargs)
+        recognizer._call_llm = Mock(
+            side_effect=lambda text, entities: [
+                RecognizerResult(entity_type="PERSON", start=0, end=4, score=0.9)
+            ]
+        )
+        return recognizer
+
+    def test_when_same_text_analyzed_twice_then_llm_called_once(self, response_cache):
+        """Test that cached results are reused for identical texts."""
+        recognizer = self.create_recognizer(response_cache=response_cache)
+
+        first = recognizer.analyze("John lives here")
+        second = recognizer.analyze("John lives here")
+
+        assert recognizer._call_llm.call_count == 1
+        assert first == second
+        assert response_cache.get_stats()["hits"] == 1
+
+    def test_when_text_differs_then_llm_called(self, response_cache):
+        """Test that different texts are not served from the cache."""
+        recognizer = self.create_recognizer(response_cache=response_cache)
+
+        recognizer.analyze("John lives here")
+        recognizer.analyze("Jane lives here")
+
+        assert recognizer._call_llm.call_count == 2
+
+    def test_when_model_differs_then_cache_not_shared(self, response_cache):
+        """Test that the model id is part of the cache key."""
+        recognizer = self.create_recognizer(response_cache=response_cache)
+        other_model = self.create_recognizer(response_cache=response_cache)
+        other_model.model_id = "other-model"
+
+        recognizer.analyze("John lives here")
+        other_model.analyze("John lives here")
+
+        assert other_model._call_llm.call_count == 1
+
+    def test_when_bypass_cache_then_llm_called_and_cache_refreshed(
+        self, response_cache
+    ):
+        """Test that bypass_cache skips reads but still writes results."""
+        recognizer = self.create_recognizer(
+            response_cache=response_cache, bypass_cache=True
+        )
+
+        recognizer.analyze("John lives here")
+        recognizer.analyze("John lives here")
+
+        assert recognizer._call_llm.call_count == 2
+        assert response_cache.get_stats()["hits"] == 0
+        assert response_cache.get_stats()["entries"] == 1
+
+        recognizer.bypass_cache = False
+        recognizer.analyze("John lives here")
+        assert recognizer._call_llm.call_count == 2
+
+    def test_when_no_cache_then_llm_always_called(self):
+        """Test that results are not cached without a response cache."""
+        recognizer = self.create_recognizer()
+
+        recognizer.analyze("John lives here")
+        recognizer.analyze("John lives here")
+
+        assert recognizer._call_llm.call_count == 2
+
+
+@pytest.fixture
+def ollama_stub_server():
+    """Ollama-compatible /api/generate server returning capitalized names."""
+    stats = {"requests": 0, "in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_POST(self):  # noqa: N802
+            prompt = json.loads(self.rfile.read(int(self.headers["Content-Length"])))[
+                "prompt"
+            ]
+            with lock:
+                stats["requests"] += 1
+                stats["in_flight"] += 1
+                stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            time.sleep(0.05)
+            with lock:
+                stats["in_flight"] -= 1
+
+            if "FAIL" in prompt:
+                status, body = 500, {"error": "model crashed"}
+            else:
+                names = [
+                    {"text": m.group(), "start": m.start(), "end": m.end()}
+                    for m in re.finditer(r"\b[A-Z][a-z]+\b", prompt)
+                ]
+                status, body = 200, {"response": json.dumps(names), "done": True}
+
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", stats
+    server.shutdown()
+    server.server_close()
+
+
+class OllamaStubLMRecognizer(LMRecognizer):
+    """Recognizer calling an Ollama-compatible generate endpoint."""
+
+    def __init__(self, model_url, **kwargs):
+        super().__init__(
+            supported_entities=["PERSON"], name="Ollama Stub Recognizer", **kwargs
+        )
+        self.model_url = model_url
+
+    def _call_llm(self, text, entities, **kwargs):
+        response = requests.post(
+            f"{self.model_url}/api/generate",
+            json={"model": "stub", "prompt": text, "stream": False},
+            timeout=5,
+        )
+        response.raise_for_status()
+        return [
+            RecognizerResult(
+                entity_type="PERSON", start=entity["start"], end=entity["end"], score=0.9
+            )
+            for entity in json.loads(response.json()["response"])
+        ]
+
+
+class TestLMRecognizerChunking:
+    """Test chunked LLM extraction against a stub Ollama server."""
+
+    @staticmethod
+    def create_recognizer(model_url, chunk_size=80, chunk_overlap=20, **kwargs):
+        from presidio_analyzer.chunkers import CharacterBasedTextChunker
+
+        return OllamaStubLMRecognizer(
+            model_url,
+            text_chunker=CharacterBasedTextChunker(
+                chunk_size=chunk_size, chunk_overlap=chunk_overlap
+            ),
+            **kwargs,
+        )
+
+    def test_when_text_chunked_then_offsets_refer_to_full_text(
+        self, ollama_stub_server
+    ):
+        """Test that entities of all chunks are found once, at full text offsets."""
+        text = "Alice met Bob. " * 3 + "Later, Carol called Dave about the plan."
+        url, stats = ollama_stub_server
+        recognizer = self.create_recognizer(url, chunk_size=20, chunk_overlap=5)
+
+        results = recognizer.analyze(text)
+
+        assert stats["requests"] > 1
+        assert [text[r.start:r.end] for r in results] == [
+            "Alice", "Bob", "Alice", "Bob", "Alice", "Bob", "Later", "Carol", "Dave"
+        ]
+
+    def test_when_max_concurrent_chunks_set_then_in_flight_requests_limited(
+        self, ollama_stub_server
+    ):
+        """Test that chunks are sent in parallel up to max_concurrent_chunks."""
+        url, stats = ollama_stub_server
+        recognizer = self.create_recognizer(url, max_concurrent_chunks=3)
+
+        recognizer.analyze("Alice went home. " * 40)
+
+        assert stats["requests"] > 3
+        assert stats["max_in_flight"] == 3
+
+    def test_when_chunk_fails_then_error_reported_per_chunk(self, ollama_stub_server):
+        """Test that failed chunks are reported with their offsets."""
+        from presidio_analyzer.chunkers import ChunkPredictionError
+
+        text = "Alice went home. " * 10 + "FAIL " + "Bob went home. " * 10
+        url, _ = ollama_stub_server
+        recognizer = self.create_recognizer(url)
+
+        with pytest.raises(ChunkPredictionError) as exc_info:
+            recognizer.analyze(text)
+
+        chunk_errors = exc_info.value.chunk_errors
+        assert chunk_errors
+        for chunk_error in chunk_errors:
+            assert "FAIL" in text[chunk_error.chunk.start:chunk_error.chunk.end]
+            assert isinstance(chunk_error.error, requests.HTTPError)
+
+    def test_when_allow_partial_results_then_other_chunks_returned(
+        self, ollama_stub_server
+    ):
+        """Test that results of successful chunks are kept on partial failure."""
+        text = "Alice went home. " * 10 + "FAIL " + "Bob went home. " * 10
+        url, _ = ollama_stub_server
+        recognizer = self.create_recognizer(url, allow_partial_results=True)
+
+        results = recognizer.analyze(text)
+
+        found = {text[r.start:r.end] for r in results}
+        assert found == {"Alice", "Bob"}
+        assert all(text[r.start:r.end] in found for r in results)
+
+    def test_when_max_concurrent_chunks_invalid_then_raises(self):
+        """Test that max_concurrent_chunks must be positive."""
+        with pytest.raises(ValueError):
+            OllamaStubLMRecognizer("http://localhost", max_concurrent_chunks=0)
@@ -105,3 +105,27 @@ def test_backward_compatibility_ner_config_to_dict():
     assert "default_score" in config_dict
     assert config_dict["default_score"] == 0.8
     assert config_dict["stride"] == 20
+
+
+def test_backend_defaults_to_pytorch():
+    config = NerModelConfiguration.from_dict({"backend": None})
+    assert config.backend == "pytorch"
+    assert config.onnx_quantize is False
+
+
+def test_onnx_backend_configuration():
+    config = NerModelConfiguration.from_dict(
+        {"backend": "onnx", "onnx_quantize": True, "onnx_intra_op_num_threads": 4}
+    )
+    assert config.to_dict()["backend"] == "onnx"
+    assert config.onnx_quantize is True
+    assert config.onnx_intra_op_num_threads == 4
+
+
+@pytest.mark.parametrize(
+    "key, value",
+    [("backend", "tensorflow"), ("onnx_intra_op_num_threads", 0)],
+)
+def test_invalid_backend_configuration(key, value):
+    with pytest.raises(ValueError):
+        NerModelConfiguration.from_dict({key: value})
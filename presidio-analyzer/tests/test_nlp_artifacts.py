@@ -0,0 +1,112 @@
+import pickle
+
+import pytest
+from spacy.lang.en import English
+from spacy.tokens import Span
+
+from presidio_analyzer import AnalyzerEngine, Pattern, PatternRecognizer
+from presidio_analyzer.nlp_engine import NlpArtifacts
+from tests.mocks import NlpEngineMock, RecognizerRegistryMock
+
+
+TEXT = "My zip code is 12345 and my name is John"
+
+
+@pytest.fixture(scope="module")
+def nlp_artifacts():
+    doc = English()(TEXT)
+    lemmas = [token.text.lower() for token in doc]
+    entities = [Span(doc, 9, 10, label="PERSON")]
+    return NlpArtifacts(
+        entities=entities,
+        tokens=doc,
+        tokens_indices=[token.idx for token in doc],
+        lemmas=lemmas,
+        nlp_engine=NlpEngineMock(stopwords=["my", "is", "and"]),
+        language="en",
+        scores=[0.85],
+    )
+
+
+def assert_equal_artifacts(actual, expected):
+    assert actual.tokens.text == expected.tokens.text
+    assert [t.text for t in actual.tokens] == [t.text for t in expected.tokens]
+    assert actual.tokens_indices == expected.tokens_indices
+    assert actual.lemmas == expected.lemmas
+    assert actual.keywords == expected.keywords
+    assert actual.scores == expected.scores
+    assert actual.language == expected.language
+    assert [(e.label_, e.start_char, e.end_char) for e in actual.entities] == [
+        (e.label_, e.start_char, e.end_char) for e in expected.entities
+    ]
+
+
+def test_when_to_dict_then_nlp_engine_not_serialized(nlp_artifacts):
+    artifacts_dict = nlp_artifacts.to_dict()
+
+    assert "nlp_engine" not in artifacts_dict
+    assert artifacts_dict["entities"] == [[9, 10, "PERSON"]]
+    assert "my" not in artifacts_dict["keywords"]
+    assert "zip" in artifacts_dict["keywords"]
+
+
+def test_when_from_dict_then_artifacts_restored(nlp_artifacts):
+    restored = NlpArtifacts.from_dict(nlp_artifacts.to_dict())
+
+    assert_equal_artifacts(restored, nlp_artifacts)
+    assert restored.nlp_engine is None
+
+
+def test_when_from_bytes_then_artifacts_restored(nlp_artifacts):
+    bytes_data = nlp_artifacts.to_bytes()
+    nlp_engine = NlpEngineMock()
+    restored = NlpArtifacts.from_bytes(bytes_data, nlp_engine=nlp_engine)
+
+    assert isinstance(bytes_data, bytes)
+    assert_equal_artifacts(restored, nlp_artifacts)
+    assert restored.nlp_engine is nlp_engine
+
+
+def test_when_pickled_then_artifacts_restored(nlp_artifacts):
+    restored = pickle.loads(pickle.dumps(nlp_artifacts))
+
+    assert_equal_artifacts(restored, nlp_artifacts)
+
+
+def test_when_empty_artifacts_then_round_trip_is_empty():
+    restored = NlpArtifacts.from_bytes(
+        NlpArtifacts([], [], [], [], None, "en").to_bytes()
+    )
+
+    assert not restored.tokens
+    assert restored.entities == []
+    assert restored.keywords == []
+
+
+def test_when_analyze_with_restored_artifacts_then_same_results(nlp_artifacts):
+    zip_recognizer = PatternRecognizer(
+        supported_entity="ZIP",
+        patterns=[Pattern(name="zip", regex=r"\b\d{5}\b", score=0.3)],
+        context=["zip"],
+    )
+    analyzer = AnalyzerEngine(
+        registry=RecognizerRegistryMock(), nlp_engine=NlpEngineMock()
+    )
+    restored = NlpArtifacts.from_bytes(nlp_artifacts.to_bytes())
+
+    expected = analyzer.analyze(
+        TEXT,
+        language="en",
+        ad_hoc_recognizers=[zip_recognizer],
+        nlp_artifacts=nlp_artifacts,
+    )
+    actual = analyzer.analyze(
+        TEXT,
+        language="en",
+        ad_hoc_recognizers=[zip_recognizer],
+        nlp_artifacts=restored,
+    )
+
+    zip_results = [r for r in actual if r.entity_type == "ZIP"]
+    assert zip_results and zip_results[0].score > 0.3
+    assert actual == expected
@@ -0,0 +1,92 @@
+import pytest
+
+from presidio_analyzer.nlp_engine import onnx_utils
+
+
+@pytest.mark.parametrize(
+    "cpu_count, workers, expected",
+    [(8, None, 8), (8, "4", 2), (8, "16", 1), (None, "2", 1)],
+)
+def test_get_default_num_threads_splits_cores_between_workers(
+    monkeypatch, cpu_count, workers, expected
+):
+    monkeypatch.setattr(onnx_utils.os, "cpu_count", lambda: cpu_count)
+    if workers is None:
+        monkeypatch.delenv("WORKERS", raising=False)
+    else:
+        monkeypatch.setenv("WORKERS", workers)
+
+    assert onnx_utils.get_default_num_threads() == expected
+
+
+def test_get_onnx_model_dir_sanitizes_model_name(tmp_path):
+    model_dir = onnx_utils.get_onnx_model_dir(
+        "StanfordAIMI/stanford-deidentifier-base", cache_dir=str(tmp_path)
+    )
+    assert model_dir == tmp_path / "StanfordAIMI_stanford-deidentifier-base"
+
+
+def test_create_session_options_sets_threads(mocker):
+    mock_onnxruntime = mocker.MagicMock()
+    mocker.patch.object(onnx_utils, "onnxruntime", mock_onnxruntime)
+
+    session_options = onnx_utils.create_session_options(3)
+
+    assert session_options is mock_onnxruntime.SessionOptions.return_value
+    assert session_options.intra_op_num_threads == 3
+    assert session_options.inter_op_num_threads == 1
+
+
+def test_create_session_options_without_onnxruntime_raises(mocker):
+    mocker.patch.object(onnx_utils, "onnxruntime", None)
+    with pytest.raises(ImportError):
+        onnx_utils.create_session_options()
+
+
+def test_load_model_without_optimum_raises(mocker):
+    mocker.patch.object(onnx_utils, "ORTModelForTokenClassification", None)
+    with pytest.raises(ImportError):
+        onnx_utils.load_onnx_token_classification_model("dslim/bert-base-NER")
+
+
+@pytest.mark.parametrize(
+    "quantize, expected_file_name",
+    [
+        (False, onnx_utils.ONNX_MODEL_FILE),
+        (True, onnx_utils.QUANTIZED_ONNX_MODEL_FILE),
+    ],
+)
+def test_load_model_exports_and_quantizes_once(
+    mocker, tmp_path, quantize, expected_file_name
+):
+    mock_ort_model_class = mocker.patch.object(
+        onnx_utils, "ORTModelForTokenClassification"
+    )
+    mock_quantizer_class = mocker.patch.object(onnx_utils, "ORTQuantizer")
+    mocker.patch.object(onnx_utils, "AutoQuantizationConfig")
+    mocker.patch.object(onnx_utils, "AutoTokenizer")
+    mocker.patch.object(onnx_utils, "create_session_options")
+    model_dir = onnx_utils.get_onnx_model_dir("my/model", cache_dir=str(tmp_path))
+
+    onnx_utils.load_onnx_token_classification_model(
+        "my/model", quantize=quantize, cache_dir=str(tmp_path)
+    )
+
+    mock_ort_model_class.from_pretrained.assert_any_call("my/model", export=True)
+    assert mock_quantizer_class.from_pretrained.called == quantize
+    load_kwargs = mock_ort_model_class.from_pretrained.call_args.kwargs
+    assert mock_ort_model_class.from_pretrained.call_args.args == (model_dir,)
+    assert load_kwargs["file_name"] == expected_file_name
+
+    # Exported files are reused on the next load
+    model_dir.mkdir(parents=True)
+    (model_dir / onnx_utils.ONNX_MODEL_FILE).touch()
+    (model_dir / onnx_utils.QUANTIZED_ONNX_MODEL_FILE).touch()
+    mock_ort_model_class.reset_mock()
+    mock_quantizer_class.reset_mock()
+
+    onnx_utils.load_onnx_token_classification_model(
+        "my/model", quantize=quantize, cache_dir=str(tmp_path)
+    )
+    assert mock_ort_model_class.from_pretrained.call_count == 1
+    assert not mock_quantizer_class.from_pretrained.called
@@ -1,4 +1,7 @@
+import pickle
 import re
+import sys
+import threading
 from typing import List
 
 import pytest
@@ -498,3 +501,114 @@ def test_pattern_recognizer_recognizer_metadata():
     assert "recognizer_identifier" in metadata
 
 
+
+
+class CountingValidationRecognizer(PatternRecognizer):
+    def __init__(self):
+        super().__init__(
+            supported_entity="NUMBER",
+            patterns=[Pattern("number", r"\b\d{4}\b", 0.5)],
+        )
+        self.validated = []
+
+    def validate_result(self, pattern_text):
+        self.validated.append(pattern_text)
+        return pattern_text.startswith("1")
+
+    def invalidate_result(self, pattern_text):
+        return pattern_text == "1111"
+
+
+def test_when_same_text_matched_repeatedly_then_validated_once():
+    recognizer = CountingValidationRecognizer()
+    text = " ".join(["1234", "5678", "1111"] * 10)
+
+    results = recognizer.analyze(text, ["NUMBER"])
+
+    assert [text[r.start:r.end] for r in results] == ["1234"] * 10
+    assert all(r.score == 1.0 for r in results)
+    assert recognizer.validated == ["1234", "5678", "1111"]
+    assert recognizer.get_validation_cache_stats() == {
+        "hits": 27,
+        "misses": 3,
+        "evictions": 0,
+        "size": 3,
+    }
+
+
+def test_when_validation_cache_full_then_oldest_entries_evicted():
+    recognizer = CountingValidationRecognizer()
+    recognizer.VALIDATION_CACHE_SIZE = 2
+
+    recognizer.analyze("1234 5678 1111 1234", ["NUMBER"])
+
+    assert recognizer.validated == ["1234", "5678", "1111", "1234"]
+    assert recognizer.get_validation_cache_stats()["evictions"] == 2
+    assert recognizer.get_validation_cache_stats()["size"] == 2
+
+
+def test_when_validation_cache_disabled_then_validated_every_time():
+    recognizer = CountingValidationRecognizer()
+    recognizer.VALIDATION_CACHE_SIZE = 0
+
+    recognizer.analyze("1234 1234 1234", ["NUMBER"])
+
+    assert recognizer.validated == ["1234"] * 3
+    assert recognizer.get_validation_cache_stats()["size"] == 0
+
+
+def test_when_validation_cache_cleared_then_validated_again():
+    recognizer = CountingValidationRecognizer()
+    recognizer.analyze("1234", ["NUMBER"])
+
+    recognizer.clear_validation_cache()
+    recognizer.analyze("1234", ["NUMBER"])
+
+    assert recognizer.validated == ["1234", "1234"]
+
+
+def test_when_analyzed_concurrently_then_validation_cache_stays_consistent():
+    recognizer = CountingValidationRecognizer()
+    recognizer.VALIDATION_CACHE_SIZE = 16
+    text = " ".join(str(1000 + i) for i in range(200))
+    errors = []
+
+    def analyze():
+        try:
+            for _ in range(10):
+                recognizer.analyze(text, ["NUMBER"])
+        except Exception as e:
+            errors.append(e)
+
+    # Switch threads often, to interleave cache updates
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=analyze) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    stats = recognizer.get_validation_cache_stats()
+    assert errors == []
+    assert stats["hits"] + stats["misses"] == 8 * 10 * 200
+    assert stats["size"] <= 16
+
+
+def test_when_pickled_then_validation_cache_is_empty():
+    recognizer = CountingValidationRecognizer()
+    recognizer.analyze("1234", ["NUMBER"])
+
+    copied = pickle.loads(pickle.dumps(recognizer))
+    copied.analyze("1234 1234", ["NUMBER"])
+
+    assert copied.validated == ["1234", "1234"]
+    assert copied.get_validation_cache_stats() == {
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "size": 1,
+    }
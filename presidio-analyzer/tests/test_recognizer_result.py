@@ -205,3 +205,25 @@ def test_given_recognizer_result_then_one_is_not_greater_then_another(start, end
 def create_recognizer_result(entity_type: str, score: float, start: int, end: int):
     data = {"entity_type": entity_type, "score": score, "start": start, "end": end}
     return RecognizerResult.from_json(data)
+
+
+def test_when_to_dict_then_all_fields_serialized():
+    metadata = {RecognizerResult.RECOGNIZER_NAME_KEY: "TestRecognizer"}
+    result = RecognizerResult("PERSON", 1, 5, 0.5, recognition_metadata=metadata)
+
+    assert not hasattr(result, "__dict__")
+    assert result.to_dict() == {
+        "entity_type": "PERSON",
+        "start": 1,
+        "end": 5,
+        "score": 0.5,
+        "analysis_explanation": None,
+        "recognition_metadata": metadata,
+    }
+
+
+def test_when_attribute_deleted_then_to_dict_omits_it():
+    result = RecognizerResult("PERSON", 1, 5, 0.5, recognition_metadata={})
+    delattr(result, "recognition_metadata")
+
+    assert "recognition_metadata" not in result.to_dict()
@@ -0,0 +1,396 @@
+"""Tests for the shared remote client registry."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+from azure.core.credentials import AccessToken
+from pydantic import ValidationError
+
+from presidio_analyzer.llm_utils.remote_client_registry import (
+    CachedTokenCredential,
+    CircuitBreaker,
+    CircuitOpenError,
+    RemoteClientRegistry,
+    RemoteClientsConfig,
+    RemoteEndpoint,
+    RemoteEndpointConfig,
+    RetryPolicy,
+    get_remote_client_registry,
+    set_remote_client_registry,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class HttpStatusError(Exception):
+    def __init__(self, status_code: int):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+def create_endpoint(**config) -> RemoteEndpoint:
+    endpoint = RemoteEndpoint("test", RemoteEndpointConfig(**config))
+    endpoint._sleep = lambda seconds: None
+    return endpoint
+
+
+@pytest.fixture
+def flaky_server():
+    """Local HTTP stand-in answering 503 twice, then 200."""
+    requests_count = {"value": 0}
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):  # noqa: N802
+            requests_count["value"] += 1
+            status = 503 if requests_count["value"] <= 2 else 200
+            body = b'{"ok": true}' if status == 200 else b"unavailable"
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", requests_count
+    server.shutdown()
+    server.server_close()
+
+
+def test_when_failures_reach_threshold_then_circuit_opens():
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=FakeClock())
+
+    breaker.record_failure()
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+def test_when_reset_timeout_passes_then_single_trial_call_allowed():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    breaker.record_failure()
+
+    clock.now += 10
+    assert breaker.allow_request()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow_request()
+
+
+def test_when_trial_call_fails_then_circuit_reopens():
+    clock = FakeClock()
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    for _ in range(3):
+        breaker.record_failure()
+
+    clock.now += 10
+    assert breaker.allow_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert not breaker.allow_request()
+
+
+@pytest.mark.parametrize(
+    "error, expected",
+    [
+        (HttpStatusError(429), True),
+        (HttpStatusError(503), True),
+        (HttpStatusError(400), False),
+        (HttpStatusError(401), False),
+        (ConnectionResetError(), True),
+        (TimeoutError(), True),
+        (requests.ConnectionError(), True),
+        (ValueError("invalid"), False),
+    ],
+)
+def test_when_error_then_retryable_is_detected(error, expected):
+    assert RetryPolicy.is_retryable(error) == expected
+
+
+def test_when_error_caused_by_transient_error_then_retryable():
+    try:
+        try:
+            raise HttpStatusError(502)
+        except HttpStatusError as e:
+            raise RuntimeError("wrapped") from e
+    except RuntimeError as e:
+        assert RetryPolicy.is_retryable(e)
+
+
+def test_when_response_has_status_code_then_it_is_used():
+    error = Exception("failed")
+    error.response = MagicMock(status_code=504)
+    assert RetryPolicy.is_retryable(error)
+
+
+def test_backoff_is_bounded():
+    policy = RetryPolicy(backoff_base=1, backoff_max=5)
+    for attempt in range(10):
+        assert 0 <= policy.get_backoff(attempt) <= min(5, 2**attempt)
+
+
+def test_when_transient_failures_then_call_is_retried():
+    endpoint = create_endpoint(retry={"max_retries": 3})
+    func = MagicMock(side_effect=[HttpStatusError(503), HttpStatusError(429), "ok"])
+
+    assert endpoint.call(func, "text", language="en") == "ok"
+
+    assert func.call_count == 3
+    func.assert_called_with("text", language="en")
+    stats = endpoint.get_stats()
+    assert stats["calls"] == 3
+    assert stats["retries"] == 2
+    assert stats["circuit_state"] == CircuitBreaker.CLOSED
+
+
+def test_when_retries_exhausted_then_error_is_raised():
+    endpoint = create_endpoint(retry={"max_retries": 1})
+    func = MagicMock(side_effect=HttpStatusError(503))
+
+    with pytest.raises(HttpStatusError):
+        endpoint.call(func)
+    assert func.call_count == 2
+
+
+def test_when_error_not_retryable_then_raised_at_once():
+    endpoint = create_endpoint()
+    func = MagicMock(side_effect=HttpStatusError(400))
+
+    with pytest.raises(HttpStatusError):
+        endpoint.call(func)
+    assert func.call_count == 1
+    assert endpoint.circuit_breaker.failures == 0
+
+
+def test_when_circuit_open_then_calls_fail_fast():
+    endpoint = create_endpoint(
+        retry={"max_retries": 0}, circuit_breaker={"failure_threshold": 2}
+    )
+    func = MagicMock(side_effect=HttpStatusError(503))
+    for _ in range(2):
+        with pytest.raises(HttpStatusError):
+            endpoint.call(func)
+
+    with pytest.raises(CircuitOpenError):
+        endpoint.call(func)
+    assert func.call_count == 2
+    assert endpoint.get_stats()["rejected"] == 1
+
+
+def test_when_many_threads_then_concurrency_is_bounded():
+    endpoint = create_endpoint(max_concurrency=2)
+    lock = threading.Lock()
+    active = {"current": 0, "max": 0}
+    release = threading.Event()
+
+    def func():
+        with lock:
+            active["current"] += 1
+            active["max"] = max(active["max"], active["current"])
+        release.wait(1)
+        with lock:
+            active["current"] -= 1
+
+    threads = [threading.Thread(target=endpoint.call, args=(func,)) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert active["max"] <= 2
+
+
+def test_when_token_valid_then_cached():
+    clock = FakeClock()
+    credential = MagicMock()
+    credential.get_token.return_value = AccessToken("token", int(clock.now) + 3600)
+    cached = CachedTokenCredential(credential, refresh_margin=300, clock=clock)
+
+    assert cached.get_token("scope").token == "token"
+    assert cached.get_token("scope").token == "token"
+    credential.get_token.assert_called_once_with("scope")
+
+
+def test_when_token_near_expiry_then_refreshed():
+    clock = FakeClock()
+    credential = MagicMock()
+    credential.get_token.side_effect = [
+        AccessToken("first", int(clock.now) + 600),
+        AccessToken("second", int(clock.now) + 3600),
+    ]
+    cached = CachedTokenCredential(credential, refresh_margin=300, clock=clock)
+
+    assert cached.get_token("scope").token == "first"
+    clock.now += 400
+    assert cached.get_token("scope").token == "second"
+
+
+def test_when_refresh_fails_then_valid_cached_token_is_used():
+    clock = FakeClock()
+    credential = MagicMock()
+    credential.get_token.side_effect = [
+        AccessToken("first", int(clock.now) + 600),
+        Exception("identity endpoint unavailable"),
+    ]
+    cached = CachedTokenCredential(credential, refresh_margin=300, clock=clock)
+    cached.get_token("scope")
+
+    clock.now += 400
+    assert cached.get_token("scope").token == "first"
+
+
+def test_when_token_expired_and_refresh_fails_then_error_is_raised():
+    clock = FakeClock()
+    credential = MagicMock()
+    credential.get_token.side_effect = [
+        AccessToken("first", int(clock.now) + 600),
+        Exception("identity endpoint unavailable"),
+    ]
+    cached = CachedTokenCredential(credential, refresh_margin=300, clock=clock)
+    cached.get_token("scope")
+
+    clock.now += 700
+    with pytest.raises(Exception, match="identity endpoint unavailable"):
+        cached.get_token("scope")
+
+
+def test_when_claims_given_then_token_not_cached():
+    credential = MagicMock()
+    credential.get_token.return_value = AccessToken("token", 10**10)
+    cached = CachedTokenCredential(credential)
+
+    cached.get_token("scope", claims="challenge")
+    cached.get_token("scope", claims="challenge")
+    assert credential.get_token.call_count == 2
+
+
+def test_endpoint_config_is_merged_with_defaults():
+    config = RemoteClientsConfig(
+        defaults={"timeout": 10, "retry": {"max_retries": 5, "backoff_max": 3}},
+        endpoints={"ollama": {"max_concurrency": 2, "retry": {"max_retries": 1}}},
+    )
+
+    ollama = config.get_endpoint_config("ollama")
+    assert ollama.max_concurrency == 2
+    assert ollama.timeout == 10
+    assert ollama.retry.max_retries == 1
+    assert ollama.retry.backoff_max == 3
+    assert config.get_endpoint_config("other").retry.max_retries == 5
+
+
+def test_when_config_has_unknown_key_then_error_is_raised():
+    with pytest.raises(ValidationError):
+        RemoteClientsConfig(defaults={"max_conections": 2})
+
+
+def test_registry_from_yaml(tmp_path):
+    config_file = tmp_path / "remote_clients.yaml"
+    config_file.write_text(
+        "token_refresh_margin: 60\n"
+        "endpoints:\n"
+        "  ahds:\n"
+        "    max_concurrency: 3\n"
+    )
+
+    registry = RemoteClientRegistry.from_yaml(config_file)
+
+    assert registry.config.token_refresh_margin == 60
+    assert registry.get_endpoint("ahds").config.max_concurrency == 3
+
+
+def test_default_config_file_is_valid():
+    set_remote_client_registry(None)
+    try:
+        registry = get_remote_client_registry()
+        assert registry.get_endpoint("ollama").config.max_concurrency == 4
+        assert registry is get_remote_client_registry()
+    finally:
+        set_remote_client_registry(None)
+
+
+def test_clients_and_credential_are_created_once():
+    registry = RemoteClientRegistry()
+    factory = MagicMock(side_effect=lambda: object())
+    credential_factory = MagicMock()
+
+    first = registry.get_client(("service", "endpoint"), factory)
+    assert registry.get_client(("service", "endpoint"), factory) is first
+    factory.assert_called_once()
+
+    credential = registry.get_credential(credential_factory)
+    assert registry.get_credential(credential_factory) is credential
+    credential_factory.assert_called_once()
+    assert registry.get_endpoint("ahds") is registry.get_endpoint("ahds")
+
+
+def test_azure_client_kwargs_use_pooled_session():
+    registry = RemoteClientRegistry.from_dict({"defaults": {"timeout": 7}})
+
+    kwargs = registry.get_azure_client_kwargs("ahds")
+
+    assert kwargs["retry_total"] == 0
+    assert kwargs["transport"].session is registry.get_session("ahds")
+
+
+def test_when_stand_in_fails_transiently_then_call_succeeds(flaky_server):
+    url, requests_count = flaky_server
+    registry = RemoteClientRegistry.from_dict(
+        {"defaults": {"retry": {"max_retries": 3, "backoff_base": 0}}}
+    )
+    session = registry.get_session("stand_in")
+
+    def get():
+        response = session.get(url, timeout=5)
+        response.raise_for_status()
+        return response.json()
+
+    assert registry.get_endpoint("stand_in").call(get) == {"ok": True}
+    assert requests_count["value"] == 3
+    assert registry.get_stats()["stand_in"]["retries"] == 2
+    registry.close()
+
+
+def test_when_stand_in_keeps_failing_then_circuit_opens(flaky_server):
+    url, requests_count = flaky_server
+    registry = RemoteClientRegistry.from_dict(
+        {
+            "defaults": {
+                "retry": {"max_retries": 0},
+                "circuit_breaker": {"failure_threshold": 2, "reset_timeout": 60},
+            }
+        }
+    )
+    session = registry.get_session("stand_in")
+    endpoint = registry.get_endpoint("stand_in")
+
+    def get():
+        session.get(url, timeout=5).raise_for_status()
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            endpoint.call(get)
+    with pytest.raises(CircuitOpenError):
+        endpoint.call(get)
+
+    assert requests_count["value"] == 2
+    registry.close()
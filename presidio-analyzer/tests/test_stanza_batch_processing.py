@@ -337,3 +337,79 @@ class TestStanzaBulkProcessIntegration:
             
             # Should process all texts regardless of batch size
             assert len(result_list) == 10
+
+
+@pytest.fixture
+def mock_stanza_tokenizer():
+    """StanzaTokenizer over a mocked Stanza pipeline, usable without Stanza."""
+    from spacy.vocab import Vocab
+    from spacy.tokens import Doc
+
+    from presidio_analyzer.nlp_engine.stanza_nlp_engine import StanzaTokenizer
+
+    snlp = MagicMock()
+    snlp.processors = {}
+    snlp.bulk_process.side_effect = lambda docs: list(docs)
+    tokenizer = StanzaTokenizer(snlp, Vocab())
+    tokenizer._convert_doc = lambda snlp_doc: Doc(
+        tokenizer.vocab, words=snlp_doc.text.split()
+    )
+
+    mock_stanza = MagicMock()
+    mock_stanza.Document.side_effect = lambda sentences, text: Mock(text=text)
+    with patch(
+        "presidio_analyzer.nlp_engine.stanza_nlp_engine.stanza", mock_stanza
+    ):
+        yield tokenizer
+
+
+def test_when_tokenizer_pipe_then_one_bulk_process_call_per_batch(
+    mock_stanza_tokenizer,
+):
+    texts = [f"Text number {i}" for i in range(5)]
+
+    docs = list(mock_stanza_tokenizer.pipe(texts, batch_size=2))
+
+    assert [doc.text for doc in docs] == [f"Text number {i} " for i in range(5)]
+    assert [
+        len(call.args[0]) for call in mock_stanza_tokenizer.snlp.bulk_process.mock_calls
+    ] == [2, 2, 1]
+    mock_stanza_tokenizer.snlp.assert_not_called()
+
+
+def test_when_tokenizer_pipe_with_empty_texts_then_not_sent_to_stanza(
+    mock_stanza_tokenizer,
+):
+    docs = list(mock_stanza_tokenizer.pipe(["", "John Smith", "  "], batch_size=3))
+
+    assert len(docs) == 3
+    assert len(docs[0]) == 0
+    assert [t.text for t in docs[1]] == ["John", "Smith"]
+    assert docs[2].text == "  "
+    sent_docs = mock_stanza_tokenizer.snlp.bulk_process.call_args.args[0]
+    assert [doc.text for doc in sent_docs] == ["John Smith"]
+
+
+def test_when_process_batch_then_input_consumed_lazily(mock_stanza_tokenizer):
+    from spacy.lang.en import English
+
+    from presidio_analyzer.nlp_engine import StanzaNlpEngine
+
+    nlp = English()
+    nlp.tokenizer = mock_stanza_tokenizer
+    engine = StanzaNlpEngine(models=[{"lang_code": "en", "model_name": "en"}])
+    engine.nlp = {"en": nlp}
+    consumed = []
+
+    def texts():
+        for i in range(4):
+            consumed.append(i)
+            yield f"Text {i}"
+
+    results = engine.process_batch(texts(), language="en", batch_size=2)
+    text, nlp_artifacts = next(results)
+
+    assert text == "Text 0"
+    assert isinstance(nlp_artifacts, NlpArtifacts)
+    assert consumed == [0, 1]
+    assert [text for text, _ in results] == ["Text 1", "Text 2", "Text 3"]
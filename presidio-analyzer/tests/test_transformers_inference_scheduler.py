@@ -0,0 +1,174 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from presidio_analyzer.nlp_engine.transformers_inference_scheduler import (
+    TransformersInferenceScheduler,
+)
+
+
+class PipelineMock:
+    """Token classification pipeline returning one entity per text."""
+
+    def __init__(self, fail_on=None):
+        self.calls = []
+        self.fail_on = fail_on
+
+    def __call__(self, inputs, **kwargs):
+        self.calls.append((inputs, kwargs))
+        if isinstance(inputs, str):
+            return self.predict(inputs)
+        if self.fail_on and self.fail_on in inputs:
+            raise ValueError("batch failed")
+        return [self.predict(text) for text in inputs]
+
+    def predict(self, text):
+        if text == self.fail_on:
+            raise ValueError("text failed")
+        return [{"entity_group": "PER", "start": 0, "end": len(text), "score": 0.9}]
+
+
+def test_when_single_text_then_same_output_as_pipeline():
+    pipeline = PipelineMock()
+    scheduler = TransformersInferenceScheduler(pipeline, max_wait_ms=0)
+
+    result = scheduler("John")
+    scheduler.close()
+
+    assert result == pipeline.predict("John")
+    assert scheduler.get_stats()["batch_size"]["count"] == 1
+
+
+def test_when_list_of_texts_then_list_of_outputs_in_order():
+    pipeline = PipelineMock()
+    scheduler = TransformersInferenceScheduler(pipeline, max_wait_ms=50)
+    texts = ["a", "bb" * 40, "ccc"]
+
+    results = scheduler(texts)
+    scheduler.close()
+
+    assert results == [pipeline.predict(text) for text in texts]
+
+
+def test_when_concurrent_callers_then_texts_batched_together():
+    pipeline = PipelineMock()
+    scheduler = TransformersInferenceScheduler(
+        pipeline, max_batch_size=8, max_wait_ms=200
+    )
+    texts = [f"Person {i}" for i in range(8)]
+    results = [None] * len(texts)
+
+    def infer(i):
+        results[i] = scheduler(texts[i])
+
+    threads = [threading.Thread(target=infer, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    scheduler.close()
+
+    assert results == [pipeline.predict(text) for text in texts]
+    assert len(pipeline.calls) < len(texts)
+    batch_inputs, batch_kwargs = pipeline.calls[0]
+    assert batch_kwargs == {"batch_size": len(batch_inputs)}
+
+
+def test_when_texts_of_different_lengths_then_bucketed_separately():
+    pipeline = PipelineMock()
+    scheduler = TransformersInferenceScheduler(pipeline, max_wait_ms=200)
+    short_texts = ["a", "b"]
+    long_texts = ["x" * 300, "y" * 300]
+
+    futures = [scheduler.submit(text) for text in short_texts + long_texts]
+    results = [future.result() for future in futures]
+    scheduler.close()
+
+    assert results == [pipeline.predict(t) for t in short_texts + long_texts]
+    batches = sorted(inputs for inputs, _ in pipeline.calls)
+    assert batches == sorted([short_texts, long_texts])
+    assert scheduler.get_stats()["sequence_length"]["count"] == 4
+
+
+def test_when_batch_fails_then_only_failing_text_gets_exception():
+    pipeline = PipelineMock(fail_on="bad")
+    scheduler = TransformersInferenceScheduler(pipeline, max_wait_ms=200)
+
+    good = scheduler.submit("good")
+    bad = scheduler.submit("bad")
+    scheduler.close()
+
+    assert good.result() == pipeline.predict("good")
+    with pytest.raises(ValueError):
+        bad.result()
+
+
+def test_when_pipeline_kwargs_then_not_batched():
+    pipeline = PipelineMock()
+    scheduler = TransformersInferenceScheduler(pipeline)
+
+    scheduler("John", aggregation_strategy="first")
+    scheduler.close()
+
+    assert pipeline.calls == [("John", {"aggregation_strategy": "first"})]
+    assert scheduler.get_stats()["batch_size"]["count"] == 0
+
+
+def test_infer_async():
+    pipeline = PipelineMock()
+    scheduler = TransformersInferenceScheduler(pipeline, max_wait_ms=50)
+
+    results = asyncio.run(scheduler.infer_async(["a", "b"]))
+    scheduler.close()
+
+    assert results == [pipeline.predict("a"), pipeline.predict("b")]
+
+
+def test_default_length_function_uses_tokenizer():
+    pipeline = PipelineMock()
+    pipeline.tokenizer = lambda text, add_special_tokens: {
+        "input_ids": text.split()
+    }
+    scheduler = TransformersInferenceScheduler(pipeline)
+    scheduler.close()
+
+    assert scheduler.length_function("three word text") == 3
+
+
+def test_when_closed_then_submit_raises():
+    scheduler = TransformersInferenceScheduler(PipelineMock())
+    scheduler.close()
+    with pytest.raises(RuntimeError):
+        scheduler("John")
+
+
+@pytest.mark.parametrize(
+    "max_batch_size, max_wait_ms", [(0, 5), (8, -1)]
+)
+def test_invalid_parameters_raise(max_batch_size, max_wait_ms):
+    with pytest.raises(ValueError):
+        TransformersInferenceScheduler(
+            PipelineMock(), max_batch_size=max_batch_size, max_wait_ms=max_wait_ms
+        )
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_when_forked_after_first_text_then_child_texts_answered():
+    pipeline = PipelineMock()
+    scheduler = TransformersInferenceScheduler(pipeline, max_wait_ms=0)
+    scheduler("John")
+
+    pid = os.fork()
+    if pid == 0:
+        # Child process: a hang is reported as a failure
+        try:
+            result = scheduler.submit("Jane").result(timeout=10)
+            os._exit(0 if result == pipeline.predict("Jane") else 1)
+        except Exception:
+            os._exit(1)
+
+    _, status = os.waitpid(pid, 0)
+    scheduler.close()
+    assert os.WEXITSTATUS(status) == 0
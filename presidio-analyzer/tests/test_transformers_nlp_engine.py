@@ -1,6 +1,6 @@
 import pytest
 
-from presidio_analyzer.nlp_engine import TransformersNlpEngine
+from presidio_analyzer.nlp_engine import NerModelConfiguration, TransformersNlpEngine
 
 
 def test_default_models():
@@ -42,3 +42,50 @@ def test_validate_model_params_missing_fields(key):
 
     with pytest.raises(ValueError):
         TransformersNlpEngine._validate_model_params(model)
+
+
+@pytest.mark.parametrize(
+    "backend, expected_pipe_name",
+    [("pytorch", "hf_token_pipe"), ("onnx", "presidio_onnx_token_pipe")],
+)
+def test_load_uses_pipe_of_configured_backend(mocker, backend, expected_pipe_name):
+    mock_nlp = mocker.MagicMock()
+    mocker.patch("spacy.load", return_value=mock_nlp)
+    mocker.patch.object(TransformersNlpEngine, "_download_spacy_model_if_needed")
+    ner_model_configuration = NerModelConfiguration(
+        backend=backend, onnx_quantize=True, onnx_intra_op_num_threads=2
+    )
+
+    engine = TransformersNlpEngine(ner_model_configuration=ner_model_configuration)
+    engine.load()
+
+    pipe_name, = mock_nlp.add_pipe.call_args.args
+    pipe_config = mock_nlp.add_pipe.call_args.kwargs["config"]
+    assert pipe_name == expected_pipe_name
+    assert pipe_config["annotate_spans_key"] == engine.entity_key
+    if backend == "onnx":
+        assert pipe_config["quantize"] is True
+        assert pipe_config["intra_op_num_threads"] == 2
+    else:
+        assert "quantize" not in pipe_config
+
+
+def test_load_with_dynamic_batching_wraps_pipeline(mocker):
+    mock_nlp = mocker.MagicMock()
+    hf_token_pipe = mock_nlp.add_pipe.return_value
+    hf_pipeline = hf_token_pipe.hf_pipeline
+    mocker.patch("spacy.load", return_value=mock_nlp)
+    mocker.patch.object(TransformersNlpEngine, "_download_spacy_model_if_needed")
+    ner_model_configuration = NerModelConfiguration(
+        dynamic_batching=True, dynamic_batching_max_batch_size=4
+    )
+
+    engine = TransformersNlpEngine(ner_model_configuration=ner_model_configuration)
+    engine.load()
+
+    scheduler = engine.inference_schedulers["en"]
+    assert hf_token_pipe.hf_pipeline is scheduler
+    assert scheduler.pipeline is hf_pipeline
+    assert scheduler.max_batch_size == 4
+    assert "en" in engine.get_inference_stats()
+    scheduler.close()
@@ -1,20 +1,42 @@
 """REST API server for anonymizer."""
 
+import json
 import logging
 import os
+from itertools import islice
 from logging.config import fileConfig
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
-from flask import Flask, Response, jsonify, request
-from presidio_anonymizer import AnonymizerEngine, DeanonymizeEngine
-from presidio_anonymizer.entities import InvalidParamError
+from flask import Flask, Response, jsonify, request, stream_with_context
+from presidio_anonymizer import (
+    AnonymizationPipeline,
+    AnonymizerEngine,
+    BatchAnonymizerEngine,
+    DeanonymizeEngine,
+)
+from presidio_anonymizer.core import OperatorResolver
+from presidio_anonymizer.entities import (
+    InvalidParamError,
+    OperatorConfig,
+    OperatorResult,
+    RecognizerResult,
+)
+from presidio_anonymizer.operators import OperatorType
 from presidio_anonymizer.services.app_entities_convertor import AppEntitiesConvertor
-from werkzeug.exceptions import BadRequest, HTTPException
+from presidio_service_utils import RequestLimiter, warm_up
+from werkzeug.exceptions import BadRequest, HTTPException, RequestEntityTooLarge
 
 DEFAULT_PORT = "3000"
 
+DEFAULT_BATCH_SIZE = 32
+
+NDJSON_MIMETYPE = "application/x-ndjson"
+
 LOGGING_CONF_FILE = "logging.ini"
 
+WARMUP_TEXT = "My name is John Smith"
+
 WELCOME_MESSAGE = r"""
  _______  _______  _______  _______ _________ ______  _________ _______
 (  ____ )(  ____ )(  ____ \(  ____ \\__   __/(  __  \ \__   __/(  ___  )
@@ -38,8 +60,33 @@ class Server:
         self.logger.info("Starting anonymizer engine")
         self.anonymizer = AnonymizerEngine()
         self.deanonymize = DeanonymizeEngine()
+        self.batch_anonymizer = BatchAnonymizerEngine(anonymizer_engine=self.anonymizer)
+
+        # Optional in-process analyze and anonymize pipeline,
+        # requires presidio-analyzer and its NLP models
+        self.pipeline = None
+        if os.environ.get("ANALYZE_ANONYMIZE_ENABLED", "false").lower() == "true":
+            self.logger.info("Starting analyze and anonymize pipeline")
+            self.pipeline = AnonymizationPipeline(anonymizer_engine=self.anonymizer)
+
+        # Bounds of batch requests
+        self.max_batch_items = int(os.environ.get("BATCH_MAX_ITEMS", "1000"))
+        self.max_batch_request_bytes = int(
+            os.environ.get("BATCH_MAX_REQUEST_BYTES", str(10 * 1024 * 1024))
+        )
+
+        self.request_limiter = RequestLimiter.from_env()
+        self.request_limiter.init_app(self.app)
+        self.ready = warm_up(self._warmup, self.logger)
         self.logger.info(WELCOME_MESSAGE)
 
+        @self.app.route("/ready")
+        def ready():
+            """Return readiness probe result, not ready if the warmup failed."""
+            if not self.ready:
+                return jsonify(error="Presidio Anonymizer service is not ready"), 503
+            return "Presidio Anonymizer service is ready", 200
+
         @self.app.route("/health")
         def health() -> str:
             """Return basic health probe result."""
@@ -86,6 +133,91 @@ class Server:
                 deanonymized_response.to_json(), mimetype="application/json"
             )
 
+        @self.app.route("/anonymize/batch", methods=["POST"])
+        def anonymize_batch() -> Response:
+            """Anonymize a batch of texts.
+
+            Accepts either a JSON body with `items` (a list of
+            {"id", "text", "analyzer_results", "anonymizers"} objects) and
+            `anonymizers` shared by the items not setting their own,
+            or a streaming NDJSON body with one item per line, and the shared
+            `anonymizers` passed as a JSON query parameter.
+            """
+            return self._run_batch("anonymizers", self._anonymize_items)
+
+        @self.app.route("/deanonymize/batch", methods=["POST"])
+        def deanonymize_batch() -> Response:
+            """Deanonymize a batch of texts.
+
+            Accepts either a JSON body with `items` (a list of
+            {"id", "text", "anonymizer_results", "deanonymizers"} objects) and
+            `deanonymizers` shared by the items not setting their own,
+            or a streaming NDJSON body with one item per line, and the shared
+            `deanonymizers` passed as a JSON query parameter.
+            """
+            return self._run_batch("deanonymizers", self._deanonymize_items)
+
+        @self.app.route("/analyze-anonymize", methods=["POST"])
+        def analyze_anonymize() -> Response:
+            """Analyze and anonymize texts in a single request.
+
+            Accepts a JSON body with a `text`, or with `items` (a list of
+            {"id", "text"} objects), together with the `language`,
+            the `anonymizers` and the analysis options `entities`,
+            `score_threshold` and `allow_list`. Alternatively, accepts
+            a streaming NDJSON body with one item per line, and the options
+            passed as query parameters (with `anonymizers` as JSON).
+            """
+            if not self.pipeline:
+                return jsonify(error="Analyze and anonymize is not enabled"), 404
+
+            if request.mimetype == NDJSON_MIMETYPE:
+                options = request.args.to_dict()
+                for list_param in ("entities", "allow_list"):
+                    if list_param in options:
+                        options[list_param] = options[list_param].split(",")
+                if "score_threshold" in options:
+                    options["score_threshold"] = float(options["score_threshold"])
+            else:
+                options = request.get_json()
+                if not options:
+                    raise BadRequest("Invalid request json")
+
+            language = options.get("language")
+            if not language:
+                raise BadRequest("No language provided")
+            analyze_kwargs = {
+                key: options[key]
+                for key in ("entities", "score_threshold", "allow_list")
+                if options.get(key) is not None
+            }
+
+            if request.mimetype != NDJSON_MIMETYPE and "items" not in options:
+                engine_result = self.pipeline.run(
+                    text=_get_item_text(options),
+                    language=language,
+                    operators=_operators_config_from_json(options.get("anonymizers")),
+                    **analyze_kwargs,
+                )
+                return Response(engine_result.to_json(), mimetype="application/json")
+
+            def analyze_anonymize_items(
+                items: List[Dict], shared_anonymizers: Dict[str, OperatorConfig]
+            ) -> List[Dict]:
+                engine_results = self.pipeline.run_batch(
+                    [_get_item_text(item) for item in items],
+                    language=language,
+                    operators=shared_anonymizers,
+                    batch_size=len(items),
+                    **analyze_kwargs,
+                )
+                return [
+                    _item_result(item, engine_result.text, engine_result.items)
+                    for item, engine_result in zip(items, engine_results)
+                ]
+
+            return self._run_batch("anonymizers", analyze_anonymize_items)
+
         @self.app.route("/anonymizers", methods=["GET"])
         def anonymizers():
             """Return a list of supported anonymizers."""
@@ -112,6 +244,230 @@ class Server:
             self.logger.error(f"A fatal error occurred during execution: {e}")
             return jsonify(error="Internal server error"), 500
 
+    def _warmup(self) -> None:
+        """Run the engine once, so the first request is not slowed down."""
+        self.anonymizer.anonymize(
+            text=WARMUP_TEXT,
+            analyzer_results=[RecognizerResult("PERSON", 11, 21, 0.85)],
+        )
+        if self.pipeline:
+            for language in self.pipeline.analyzer_engine.supported_languages:
+                self.pipeline.run(text=WARMUP_TEXT, language=language)
+
+    def _run_batch(
+        self,
+        operators_key: str,
+        process_items: Callable[[List[Dict], Dict[str, OperatorConfig]], List[Dict]],
+    ) -> Response:
+        """Process a JSON or NDJSON batch request with its shared operators."""
+        if (
+            request.content_length
+            and request.content_length > self.max_batch_request_bytes
+        ):
+            raise RequestEntityTooLarge(
+                f"Batch request is larger than {self.max_batch_request_bytes} bytes"
+            )
+
+        if request.mimetype == NDJSON_MIMETYPE:
+            return self._run_batch_stream(operators_key, process_items)
+
+        content = request.get_json()
+        if not content:
+            raise BadRequest("Invalid request json")
+        items = content.get("items")
+        if not isinstance(items, list):
+            raise BadRequest("Invalid request json, items must be a list")
+        if len(items) > self.max_batch_items:
+            raise RequestEntityTooLarge(
+                f"Batch contains more than {self.max_batch_items} items"
+            )
+
+        shared_operators = _operators_config_from_json(content.get(operators_key))
+        return Response(
+            json.dumps(process_items(items, shared_operators)),
+            mimetype="application/json",
+        )
+
+    def _run_batch_stream(
+        self,
+        operators_key: str,
+        process_items: Callable[[List[Dict], Dict[str, OperatorConfig]], List[Dict]],
+    ) -> Response:
+        """Process NDJSON items, streaming NDJSON results back.
+
+        Items are read and processed in chunks of `batch_size`,
+        so neither the request nor the response are buffered in memory.
+        """
+        batch_size = int(request.args.get("batch_size", DEFAULT_BATCH_SIZE))
+        if batch_size < 1:
+            raise BadRequest("batch_size must be a positive integer")
+        operators_json = request.args.get(operators_key)
+        try:
+            operators = json.loads(operators_json) if operators_json else None
+        except json.JSONDecodeError:
+            raise BadRequest(f"Invalid {operators_key} json")
+        shared_operators = _operators_config_from_json(operators)
+        items = _read_ndjson_items(
+            request.stream, self.max_batch_items, self.max_batch_request_bytes
+        )
+
+        def generate() -> Iterator[str]:
+            while True:
+                try:
+                    chunk = list(islice(items, batch_size))
+                    if not chunk:
+                        return
+                    results = process_items(chunk, shared_operators)
+                except Exception as e:
+                    self.logger.error(f"Failed to process a streaming batch: {e}")
+                    if isinstance(e, InvalidParamError):
+                        error = e.err_msg
+                    elif isinstance(e, HTTPException):
+                        error = e.description
+                    else:
+                        error = str(e)
+                    yield json.dumps({"error": error}) + "\n"
+                    return
+
+                for result in results:
+                    yield json.dumps(result) + "\n"
+
+        return Response(stream_with_context(generate()), mimetype=NDJSON_MIMETYPE)
+
+    def _anonymize_items(
+        self, items: List[Dict], shared_anonymizers: Dict[str, OperatorConfig]
+    ) -> List[Dict]:
+        """Anonymize batch items, in one bulk call for those sharing anonymizers."""
+        results: List[Optional[Dict]] = [None] * len(items)
+        shared_rows = []
+        shared_texts = []
+        row_ids, entity_types, starts, ends, scores = [], [], [], [], []
+
+        for index, item in enumerate(items):
+            text = _get_item_text(item)
+            analyzer_results = AppEntitiesConvertor.analyzer_results_from_json(
+                item.get("analyzer_results")
+            )
+            if item.get("anonymizers") is not None:
+                engine_result = self.anonymizer.anonymize(
+                    text=text,
+                    analyzer_results=analyzer_results,
+                    operators=_operators_config_from_json(item["anonymizers"]),
+                )
+                results[index] = _item_result(
+                    item, engine_result.text, engine_result.items
+                )
+                continue
+
+            row_id = len(shared_rows)
+            shared_rows.append(index)
+            shared_texts.append(text)
+            for result in analyzer_results:
+                row_ids.append(row_id)
+                entity_types.append(result.entity_type)
+                starts.append(result.start)
+                ends.append(result.end)
+                scores.append(result.score)
+
+        if shared_rows:
+            texts, texts_items = self.batch_anonymizer.anonymize_many(
+                shared_texts,
+                row_ids,
+                entity_types,
+                starts,
+                ends,
+                scores,
+                operators=shared_anonymizers,
+                return_items=True,
+            )
+            for index, text, text_items in zip(shared_rows, texts, texts_items):
+                results[index] = _item_result(items[index], text, text_items)
+        return results
+
+    def _deanonymize_items(
+        self, items: List[Dict], shared_deanonymizers: Dict[str, OperatorConfig]
+    ) -> List[Dict]:
+        """Deanonymize batch items, validating the shared deanonymizers once."""
+        operator_resolver = OperatorResolver(
+            self.deanonymize.operators_factory,
+            OperatorType.Deanonymize,
+            self.deanonymize.operator_memo,
+        )
+        results = []
+        for item in items:
+            text = _get_item_text(item)
+            entities = AppEntitiesConvertor.deanonymize_entities_from_json(item)
+            if item.get("deanonymizers") is not None:
+                engine_result = self.deanonymize.deanonymize(
+                    text=text,
+                    entities=entities,
+                    operators=_operators_config_from_json(item["deanonymizers"]),
+                )
+            else:
+                engine_result = self.deanonymize.deanonymize(
+                    text=text,
+                    entities=entities,
+                    operators=shared_deanonymizers,
+                    operator_resolver=operator_resolver,
+                )
+            results.append(_item_result(item, engine_result.text, engine_result.items))
+        return results
+
+
+def _operators_config_from_json(data: Optional[Dict]) -> Dict[str, OperatorConfig]:
+    operators = AppEntitiesConvertor.operators_config_from_json(data)
+    if AppEntitiesConvertor.check_custom_operator(operators):
+        raise BadRequest("Custom type anonymizer is not supported")
+    return operators
+
+
+def _get_item_text(item: Any) -> str:
+    if not isinstance(item, dict):
+        raise BadRequest("Invalid request json, items must be objects")
+    text = item.get("text", "")
+    if not isinstance(text, str):
+        raise InvalidParamError("Invalid input, text must be a string")
+    return text
+
+
+def _item_result(item: Dict, text: str, items: List[OperatorResult]) -> Dict:
+    result = {"text": text, "items": [operator.to_dict() for operator in items]}
+    if "id" in item:
+        result["id"] = item["id"]
+    return result
+
+
+def _read_ndjson_items(stream, max_items: int, max_bytes: int) -> Iterator[Dict]:
+    """Read items from an NDJSON stream, either objects or texts.
+
+    The index of each item is set as its default id. At most `max_bytes` are
+    read, also bounding each line, as chunked requests have no Content-Length.
+    """
+    index = 0
+    read_bytes = 0
+    while True:
+        line = stream.readline(max_bytes - read_bytes + 1)
+        if not line:
+            return
+        read_bytes += len(line)
+        if read_bytes > max_bytes:
+            raise RequestEntityTooLarge(
+                f"Batch request is larger than {max_bytes} bytes"
+            )
+        line = line.strip()
+        if not line:
+            continue
+        if index >= max_items:
+            raise RequestEntityTooLarge(f"Batch contains more than {max_items} items")
+        item = json.loads(line)
+        if isinstance(item, str):
+            item = {"text": item}
+        if isinstance(item, dict):
+            item.setdefault("id", index)
+        index += 1
+        yield item
+
+
 def create_app(): # noqa
     server = Server()
     return server.app
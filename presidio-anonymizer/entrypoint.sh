@@ -1,2 +1,2 @@
 #!/bin/sh
-exec poetry run gunicorn -w "$WORKERS" -b "0.0.0.0:$PORT" "app:create_app()"
+exec poetry run gunicorn -c python:presidio_service_utils.gunicorn_conf
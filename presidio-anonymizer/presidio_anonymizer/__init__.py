@@ -2,6 +2,7 @@
 
 import logging
 
+from .anonymization_pipeline import AnonymizationPipeline
 from .anonymizer_engine import AnonymizerEngine
 from .batch_anonymizer_engine import BatchAnonymizerEngine
 from .deanonymize_engine import DeanonymizeEngine
@@ -23,6 +24,7 @@ logging.getLogger("presidio-anonymizer").addHandler(logging.NullHandler())
 
 __all__ = [
     "AnonymizerEngine",
+    "AnonymizationPipeline",
     "DeanonymizeEngine",
     "BatchAnonymizerEngine",
     "InvalidParamError",
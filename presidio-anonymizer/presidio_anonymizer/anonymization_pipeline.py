@@ -0,0 +1,215 @@
+"""Analyze and anonymize texts in a single process."""
+
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, Optional
+
+try:
+    from presidio_analyzer import AnalyzerEngine, BatchAnalyzerEngine
+except ImportError:
+    AnalyzerEngine = None
+    BatchAnalyzerEngine = None
+
+from presidio_anonymizer.anonymizer_engine import AnonymizerEngine
+from presidio_anonymizer.core import OperatorResolver
+from presidio_anonymizer.entities import (
+    ConflictResolutionStrategy,
+    EngineResult,
+    OperatorConfig,
+)
+from presidio_anonymizer.operators import OperatorType
+
+
+class AnonymizationPipeline:
+    """
+    Analyze and anonymize texts in a single step.
+
+    The results of the analyzer are passed to the anonymizer as objects,
+    without serializing them or sending the text again, as done when calling
+    the analyzer and anonymizer services one after the other.
+    When anonymizing many texts, the operators are validated once
+    and shared by all the texts.
+
+    Requires the `presidio-analyzer` package.
+
+    :param analyzer_engine: The analyzer engine to use,
+    a default `AnalyzerEngine` is created if not given
+    :param anonymizer_engine: The anonymizer engine to use,
+    a default `AnonymizerEngine` is created if not given
+
+    :example:
+
+    >>> from presidio_anonymizer import AnonymizationPipeline
+
+    >>> pipeline = AnonymizationPipeline()
+    >>> result = pipeline.run("My name is James Bond", language="en")
+    >>> print(result.text)
+    My name is <PERSON>
+    """
+
+    def __init__(
+        self,
+        analyzer_engine: Optional["AnalyzerEngine"] = None,
+        anonymizer_engine: Optional[AnonymizerEngine] = None,
+    ):
+        if not AnalyzerEngine:
+            raise ImportError(
+                "AnonymizationPipeline requires presidio-analyzer, "
+                "install it with: pip install presidio-anonymizer[analyzer]"
+            )
+
+        self.analyzer_engine = analyzer_engine or AnalyzerEngine()
+        self.anonymizer_engine = anonymizer_engine or AnonymizerEngine()
+        self.batch_analyzer_engine = BatchAnalyzerEngine(
+            analyzer_engine=self.analyzer_engine
+        )
+
+    def run(
+        self,
+        text: str,
+        language: str,
+        operators: Optional[Dict[str, OperatorConfig]] = None,
+        conflict_resolution: ConflictResolutionStrategy = (
+            ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED
+        ),
+        **analyze_kwargs,
+    ) -> EngineResult:
+        """
+        Analyze and anonymize a text.
+
+        :param text: The text to anonymize
+        :param language: The language of the text
+        :param operators: The operators to use for each entity type,
+        as in `AnonymizerEngine.anonymize`
+        :param conflict_resolution: The strategy for handling conflicts among entities
+        :param analyze_kwargs: Additional parameters for `AnalyzerEngine.analyze`
+        (e.g. entities, score_threshold)
+        :return: The anonymized text and the anonymized entities
+        """
+        analyzer_results = self.analyzer_engine.analyze(
+            text=text, language=language, **analyze_kwargs
+        )
+        return self.anonymizer_engine.anonymize(
+            text=text,
+            analyzer_results=analyzer_results,
+            operators=operators,
+            conflict_resolution=conflict_resolution,
+        )
+
+    def run_batch(
+        self,
+        texts: Iterable[str],
+        language: str,
+        operators: Optional[Dict[str, OperatorConfig]] = None,
+        conflict_resolution: ConflictResolutionStrategy = (
+            ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED
+        ),
+        batch_size: int = 1,
+        n_process: int = 1,
+        **analyze_kwargs,
+    ) -> List[EngineResult]:
+        """
+        Analyze and anonymize a batch of texts.
+
+        The texts are analyzed with `BatchAnalyzerEngine.analyze_iterator`,
+        and anonymized with operators shared by all the texts.
+
+        :param texts: The texts to anonymize
+        :param language: The language of the texts
+        :param operators: The operators to use for each entity type,
+        as in `AnonymizerEngine.anonymize`
+        :param conflict_resolution: The strategy for handling conflicts among entities
+        :param batch_size: Number of texts processed together by the NLP engine
+        :param n_process: Number of processes used by the NLP engine
+        :param analyze_kwargs: Additional parameters for `AnalyzerEngine.analyze`
+        :return: The anonymization result of each text, in the order of the texts
+        """
+        texts = list(texts)
+        results_list = self.batch_analyzer_engine.analyze_iterator(
+            texts=texts,
+            language=language,
+            batch_size=batch_size,
+            n_process=n_process,
+            **analyze_kwargs,
+        )
+        return list(
+            self.__anonymize_texts(
+                texts,
+                results_list,
+                self.anonymizer_engine._add_default_operator(operators),
+                conflict_resolution,
+                self.__create_operator_resolver(),
+            )
+        )
+
+    def run_iterator(
+        self,
+        texts: Iterable[str],
+        language: str,
+        operators: Optional[Dict[str, OperatorConfig]] = None,
+        conflict_resolution: ConflictResolutionStrategy = (
+            ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED
+        ),
+        batch_size: int = 32,
+        **analyze_kwargs,
+    ) -> Iterator[EngineResult]:
+        """
+        Analyze and anonymize a stream of texts.
+
+        Texts are consumed lazily and processed in batches of `batch_size`,
+        so only a single batch is kept in memory, and results are yielded
+        as each batch is processed.
+
+        :param texts: The texts to anonymize, e.g. lines read from a file
+        :param language: The language of the texts
+        :param operators: The operators to use for each entity type,
+        as in `AnonymizerEngine.anonymize`
+        :param conflict_resolution: The strategy for handling conflicts among entities
+        :param batch_size: Number of texts processed together
+        :param analyze_kwargs: Additional parameters for `AnalyzerEngine.analyze`
+        :return: An iterator of the anonymization result of each text
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        operators = self.anonymizer_engine._add_default_operator(operators)
+        operator_resolver = self.__create_operator_resolver()
+        texts = iter(texts)
+        while True:
+            batch = list(islice(texts, batch_size))
+            if not batch:
+                return
+            results_list = self.batch_analyzer_engine.analyze_iterator(
+                texts=batch,
+                language=language,
+                batch_size=batch_size,
+                **analyze_kwargs,
+            )
+            yield from self.__anonymize_texts(
+                batch, results_list, operators, conflict_resolution, operator_resolver
+            )
+
+    def __anonymize_texts(
+        self,
+        texts: List[str],
+        results_list: List[List],
+        operators: Dict[str, OperatorConfig],
+        conflict_resolution: ConflictResolutionStrategy,
+        operator_resolver: OperatorResolver,
+    ) -> Iterator[EngineResult]:
+        for text, analyzer_results in zip(texts, results_list):
+            if type(text) in (bool, int, float):
+                text = str(text)
+            yield self.anonymizer_engine.anonymize(
+                text=text,
+                analyzer_results=analyzer_results,
+                operators=operators,
+                conflict_resolution=conflict_resolution,
+                operator_resolver=operator_resolver,
+            )
+
+    def __create_operator_resolver(self) -> OperatorResolver:
+        return OperatorResolver(
+            self.anonymizer_engine.operators_factory,
+            OperatorType.Anonymize,
+            self.anonymizer_engine.operator_memo,
+        )
@@ -1,14 +1,16 @@
 """Handles the entire logic of the Presidio-anonymizer and text anonymizing."""
 
+import heapq
 import logging
 import re
-from typing import Dict, List, Optional, Type
+from typing import Callable, Dict, Iterable, List, Optional, TextIO, Type, Union
 
-from presidio_anonymizer.core import EngineBase
+from presidio_anonymizer.core import EngineBase, OperatorResolver, TextStreamBuffer
 from presidio_anonymizer.entities import (
     ConflictResolutionStrategy,
     EngineResult,
     OperatorConfig,
+    OperatorResult,
     RecognizerResult,
 )
 from presidio_anonymizer.operators import Operator, OperatorType
@@ -34,6 +36,7 @@ class AnonymizerEngine(EngineBase):
         conflict_resolution: ConflictResolutionStrategy = (
             ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED
         ),
+        operator_resolver: Optional[OperatorResolver] = None,
     ) -> EngineResult:
         """Anonymize method to anonymize the given text.
 
@@ -45,6 +48,8 @@ class AnonymizerEngine(EngineBase):
         received from the analyzer
         :param conflict_resolution: The configuration designed to handle conflicts
         among entities
+        :param operator_resolver: Resolver of the validated operators, shared
+        between calls with the same operators (e.g. when anonymizing a batch)
         :return: the anonymized text and a list of information about the
         anonymized entities.
 
@@ -87,27 +92,151 @@ class AnonymizerEngine(EngineBase):
         # modified
         analyzer_results = self._copy_recognizer_results(analyzer_results)
 
-        # Sort because downstream processors like whitespace merging expect input to
-        # be sorted by start, end to work correctly
-        analyzer_results.sort(key=lambda x: (x.start, x.end))
-
-        analyzer_results = self._remove_conflicts_and_get_text_manipulation_data(
-            analyzer_results, conflict_resolution
+        merged_results = self._prepare_analyzer_results(
+            text, analyzer_results, conflict_resolution
         )
 
-        merged_results = self._merge_entities_with_whitespace_between(
-            text, analyzer_results
-        )
+        operators = self._add_default_operator(operators)
 
-        operators = self.__check_or_add_default_operator(operators)
+        # Only passed when given, for engines overriding the previous signature
+        operate_kwargs = {}
+        if operator_resolver:
+            operate_kwargs["operator_resolver"] = operator_resolver
 
         return self._operate(
             text=text,
             pii_entities=merged_results,
             operators_metadata=operators,
             operator_type=OperatorType.Anonymize,
+            **operate_kwargs,
+        )
+
+    def anonymize_stream(
+        self,
+        reader: Union[TextIO, Iterable[str]],
+        writer: TextIO,
+        analyzer_results: Iterable[RecognizerResult],
+        operators: Optional[Dict[str, OperatorConfig]] = None,
+        conflict_resolution: ConflictResolutionStrategy = (
+            ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED
+        ),
+        item_callback: Optional[Callable[[OperatorResult], None]] = None,
+        chunk_size: int = 1024 * 1024,
+    ) -> None:
+        """Anonymize a text stream, writing the anonymized text incrementally.
+
+        Used for texts too large to keep in memory, e.g. log archives.
+        The analyzer results are given with their positions in the full text,
+        sorted by start (e.g. as returned by a streaming analyzer), and are consumed
+        lazily together with the text. Results which overlap, or are separated
+        only by spaces, are resolved together as in `anonymize`, so entities
+        spanning chunks are handled, and the output is the same as anonymizing
+        the full text. Memory is bounded by the chunk size and the span of
+        such overlapping results, not by the size of the text.
+
+        :param reader: The text to anonymize, either a file-like object
+        or an iterable of text chunks
+        :param writer: A file-like object the anonymized text is written to
+        :param analyzer_results: The results of the analyzer on the text,
+        sorted by start
+        :param operators: The configuration of the anonymizers we would like
+        to use for each entity, as in `anonymize`
+        :param conflict_resolution: The configuration designed to handle conflicts
+        among entities
+        :param item_callback: Optional function called with each anonymized item,
+        in the order of the text, with its indices in the anonymized text
+        :param chunk_size: Number of characters read at a time from a file-like reader
+        """
+        if hasattr(reader, "read"):
+            chunks = iter(lambda: reader.read(chunk_size), "")
+        else:
+            chunks = iter(reader)
+        text_buffer = TextStreamBuffer(chunks, writer)
+        operators = self._add_default_operator(operators)
+        operator_resolver = OperatorResolver(
+            self.operators_factory, OperatorType.Anonymize, self.operator_memo
+        )
+
+        def anonymize_group(group: List[RecognizerResult], group_end: int) -> None:
+            self.__anonymize_stream_group(
+                text_buffer,
+                group,
+                group_end,
+                operators,
+                conflict_resolution,
+                operator_resolver,
+                item_callback,
+            )
+
+        # Results which overlap or are separated only by whitespace are grouped,
+        # as resolving their conflicts or merging them may affect one another.
+        # Newlines are included, as the whitespace merging also merges results
+        # separated by spaces and a newline.
+        group = []
+        group_end = 0
+        for result in analyzer_results:
+            result = RecognizerResult(
+                result.entity_type, result.start, result.end, result.score
+            )
+            if group and result.start < group[-1].start:
+                raise ValueError(
+                    "Analyzer results must be sorted by start, "
+                    f"got {result.start} after {group[-1].start}"
+                )
+
+            if group and result.start > group_end:
+                if not text_buffer.has_only(
+                    group_end, result.start, " \n", flush_until=group[0].start
+                ):
+                    anonymize_group(group, group_end)
+                    group = []
+
+            if not group:
+                group_end = result.end
+            group.append(result)
+            group_end = max(group_end, result.end)
+
+        if group:
+            anonymize_group(group, group_end)
+        text_buffer.write_rest()
+
+    def __anonymize_stream_group(
+        self,
+        text_buffer: TextStreamBuffer,
+        group: List[RecognizerResult],
+        group_end: int,
+        operators: Dict[str, OperatorConfig],
+        conflict_resolution: ConflictResolutionStrategy,
+        operator_resolver: OperatorResolver,
+        item_callback: Optional[Callable[[OperatorResult], None]],
+    ) -> None:
+        group_start = group[0].start
+        text_buffer.read_until(group_end, flush_until=group_start)
+        text_buffer.write_until(group_start)
+        text = text_buffer.get_text(group_start, group_end)
+
+        for result in group:
+            result.start -= group_start
+            result.end -= group_start
+        group = self._prepare_analyzer_results(text, group, conflict_resolution)
+        output_text, items = self._replace_entities(
+            text,
+            group,
+            operators,
+            OperatorType.Anonymize,
+            operator_resolver,
+            return_items=item_callback is not None,
         )
 
+        output_start = text_buffer.output_length
+        text_buffer.write(output_text)
+        text_buffer.skip_until(group_end)
+        if item_callback:
+            for item in reversed(items):
+                item.start += output_start
+                item.end += output_start
+                item_callback(item)
+
     def add_anonymizer(self, anonymizer_cls: Type[Operator]) -> None:
         """
         Add a new anonymizer to the engine.
@@ -126,6 +255,32 @@ class AnonymizerEngine(EngineBase):
         logger.info(f"Removed anonymizer {anonymizer_cls.__name__}")
         self.operators_factory.remove_anonymize_operator(anonymizer_cls)
 
+    def _prepare_analyzer_results(
+        self,
+        text: str,
+        analyzer_results: List[RecognizerResult],
+        conflict_resolution: ConflictResolutionStrategy,
+    ) -> List[RecognizerResult]:
+        """
+        Resolve the conflicts between results, and merge adjacent results.
+
+        The given results are sorted and modified in place.
+
+        :param text: the text we are anonymizing
+        :param analyzer_results: The results of the analyzer on the text
+        :param conflict_resolution: The strategy for handling the conflicts
+        :return: The results to anonymize
+        """
+        # Sort because downstream processors like whitespace merging expect input to
+        # be sorted by start, end to work correctly
+        analyzer_results.sort(key=lambda x: (x.start, x.end))
+
+        analyzer_results = self._remove_conflicts_and_get_text_manipulation_data(
+            analyzer_results, conflict_resolution
+        )
+
+        return self._merge_entities_with_whitespace_between(text, analyzer_results)
+
     def _remove_conflicts_and_get_text_manipulation_data(
         self,
         analyzer_results: List[RecognizerResult],
@@ -137,81 +292,170 @@ class AnonymizerEngine(EngineBase):
         Only insert results which are:
         1. Indices are not contained in other result.
         2. Have the same indices as other results but with larger score.
+
+        Each step sweeps the results in the order of their indices,
+        so resolving the conflicts takes O(n log n).
+
+        :param analyzer_results: The results, sorted by start and end
+        :param conflict_resolution: The strategy for handling the conflicts
         :return: List
         """
-        tmp_analyzer_results = []
-        # This list contains all elements which we need to check a single result
-        # against. If a result is dropped, it can also be dropped from this list
-        # since it is intersecting with another result and we selected the other one.
-        other_elements = analyzer_results.copy()
-        for result in analyzer_results:
-            other_elements.remove(result)
-
-            is_merge_same_entity_type = False
-            for other_element in other_elements:
-                if other_element.entity_type != result.entity_type:
-                    continue
-                if result.intersects(other_element) == 0:
-                    continue
-
-                other_element.start = min(result.start, other_element.start)
-                other_element.end = max(result.end, other_element.end)
-                other_element.score = max(result.score, other_element.score)
-                is_merge_same_entity_type = True
-                break
-            if not is_merge_same_entity_type:
-                other_elements.append(result)
-                tmp_analyzer_results.append(result)
-            else:
+        merged_results = self.__merge_intersecting_results_of_same_type(
+            analyzer_results
+        )
+        unique_text_metadata_elements = self.__remove_conflicted_results(
+            merged_results
+        )
+
+        # This further improves the quality of handling the conflict between the
+        # various entities overlapping. This will not drop the results insted
+        # it adjust the start and end positions of overlapping results and removes
+        # All types of conflicts among entities as well as text.
+        if conflict_resolution == ConflictResolutionStrategy.REMOVE_INTERSECTIONS:
+            unique_text_metadata_elements = self.__remove_intersections(
+                unique_text_metadata_elements
+            )
+        return unique_text_metadata_elements
+
+    def __merge_intersecting_results_of_same_type(
+        self, analyzer_results: List[RecognizerResult]
+    ) -> List[RecognizerResult]:
+        """
+        Merge each group of intersecting results of the same type into one result.
+
+        The group is merged into its last result, which is extended to the
+        indices of the whole group and gets the highest score in the group.
+        Results are returned in the order of the last result of each group.
+        """
+        # [index of the last result, start, end, score] of each group
+        groups = []
+        # The group each entity type is currently merging into
+        open_groups: Dict[str, list] = {}
+        for index, result in enumerate(analyzer_results):
+            is_empty = result.start == result.end
+            group = open_groups.get(result.entity_type)
+            if not is_empty and group and result.start < group[2]:
                 self.logger.debug(
-                    f"removing element {result} from " f"results list due to merge"
+                    f"removing element {analyzer_results[group[0]]} from "
+                    f"results list due to merge"
                 )
+                group[0] = index
+                group[2] = max(group[2], result.end)
+                group[3] = max(group[3], result.score)
+                continue
 
-        unique_text_metadata_elements = []
-        # This list contains all elements which we need to check a single result
-        # against. If a result is dropped, it can also be dropped from this list
-        # since it is intersecting with another result and we selected the other one.
-        other_elements = tmp_analyzer_results.copy()
-        for result in tmp_analyzer_results:
-            other_elements.remove(result)
-            result_conflicted = self.__is_result_conflicted_with_other_elements(
-                other_elements, result
-            )
-            if not result_conflicted:
-                other_elements.append(result)
-                unique_text_metadata_elements.append(result)
+            group = [index, result.start, result.end, result.score]
+            groups.append(group)
+            # Empty results do not intersect with any other result
+            if not is_empty:
+                open_groups[result.entity_type] = group
+
+        merged_results = []
+        for index, start, end, score in sorted(groups, key=lambda group: group[0]):
+            result = analyzer_results[index]
+            result.start = start
+            result.end = end
+            result.score = score
+            merged_results.append(result)
+        return merged_results
+
+    def __remove_conflicted_results(
+        self, results: List[RecognizerResult]
+    ) -> List[RecognizerResult]:
+        """
+        Remove results which are conflicted with another result.
+
+        A result is conflicted if it is contained in another result, or has the
+        same indices as another result with a higher score. Of results with the
+        same indices and score, the last one is kept.
+        """
+        # Sweep by start, and by end in descending order, so that the results
+        # containing a result are before it
+        contained = set()
+        max_end_before_start = -1
+        current_start = None
+        max_end_from_start = -1
+        for index in sorted(
+            range(len(results)),
+            key=lambda i: (results[i].start, -results[i].end),
+        ):
+            result = results[index]
+            if result.start != current_start:
+                max_end_before_start = max(max_end_before_start, max_end_from_start)
+                current_start = result.start
+                max_end_from_start = result.end
+            if (
+                max_end_before_start >= result.end
+                or max_end_from_start > result.end
+            ):
+                contained.add(index)
+
+        best_with_same_indices = {}
+        for index, result in enumerate(results):
+            if index in contained:
+                continue
+            indices = (result.start, result.end)
+            best_index = best_with_same_indices.get(indices)
+            if best_index is None or result.score >= results[best_index].score:
+                best_with_same_indices[indices] = index
+
+        kept_indices = set(best_with_same_indices.values())
+        unique_results = []
+        for index, result in enumerate(results):
+            if index in kept_indices:
+                unique_results.append(result)
             else:
                 self.logger.debug(
                     f"removing element {result} from results list due to conflict"
                 )
+        return unique_results
 
-        # This further improves the quality of handling the conflict between the
-        # various entities overlapping. This will not drop the results insted
-        # it adjust the start and end positions of overlapping results and removes
-        # All types of conflicts among entities as well as text.
-        if conflict_resolution == ConflictResolutionStrategy.REMOVE_INTERSECTIONS:
-            unique_text_metadata_elements.sort(key=lambda element: element.start)
-            elements_length = len(unique_text_metadata_elements)
-            index = 0
-            while index < elements_length - 1:
-                current_entity = unique_text_metadata_elements[index]
-                next_entity = unique_text_metadata_elements[index + 1]
-                if current_entity.end <= next_entity.start:
-                    index += 1
-                else:
-                    if current_entity.score >= next_entity.score:
-                        next_entity.start = current_entity.end
-                    else:
-                        current_entity.end = next_entity.start
-                    unique_text_metadata_elements.sort(
-                        key=lambda element: element.start
-                    )
-            unique_text_metadata_elements = [
-                element
-                for element in unique_text_metadata_elements
-                if element.start <= element.end
-            ]
-        return unique_text_metadata_elements
+    @staticmethod
+    def __remove_intersections(
+        results: List[RecognizerResult],
+    ) -> List[RecognizerResult]:
+        """
+        Adjust the indices of intersecting results, so that they do not intersect.
+
+        Results are swept by their start. When a result intersects the next one,
+        the result with the lower score gives up the intersection: the next
+        result is moved to start at the end of the current one, or the current
+        result is cut at the start of the next one.
+        Results which are left with a negative length are removed.
+        """
+        if not results:
+            return []
+
+        # (start, order, result) of the results after the current one.
+        # A moved result is ordered before the results with the same start.
+        remaining = [
+            (result.start, order, result)
+            for order, result in enumerate(
+                sorted(results, key=lambda element: element.start)
+            )
+        ]
+        moved_count = 0
+        adjusted_results = []
+        current = heapq.heappop(remaining)[2]
+        while remaining:
+            next_result = remaining[0][2]
+            if current.end <= next_result.start:
+                adjusted_results.append(current)
+                current = heapq.heappop(remaining)[2]
+            elif current.score >= next_result.score:
+                heapq.heappop(remaining)
+                next_result.start = current.end
+                moved_count += 1
+                heapq.heappush(
+                    remaining, (next_result.start, -moved_count, next_result)
+                )
+            else:
+                current.end = next_result.start
+        adjusted_results.append(current)
+
+        return [
+            element for element in adjusted_results if element.start <= element.end
+        ]
 
     def _merge_entities_with_whitespace_between(
         self, text: str, analyzer_results: List[RecognizerResult]
@@ -235,20 +479,22 @@ class AnonymizerEngine(EngineBase):
         return names
 
     @staticmethod
-    def __is_result_conflicted_with_other_elements(other_elements, result):
-        return any(
-            [result.has_conflict(other_element) for other_element in other_elements]
-        )
-
-    @staticmethod
-    def __check_or_add_default_operator(
-        operators: Dict[str, OperatorConfig],
+    def _add_default_operator(
+        operators: Optional[Dict[str, OperatorConfig]],
     ) -> Dict[str, OperatorConfig]:
-        default_operator = OperatorConfig(DEFAULT)
-        if not operators:
-            return {"DEFAULT": default_operator}
-        if not operators.get("DEFAULT"):
-            operators["DEFAULT"] = default_operator
+        """
+        Return the operators, with the default operator if "DEFAULT" is not set.
+
+        The given operators are not modified. Callers anonymizing many texts
+        add the default operator once, so that the same configs are used for
+        all the texts and their validated operators are shared.
+
+        :param operators: The operators of each entity type
+        """
+        if operators and operators.get("DEFAULT"):
+            return operators
+        operators = dict(operators) if operators else {}
+        operators["DEFAULT"] = OperatorConfig(DEFAULT)
         return operators
 
     @staticmethod
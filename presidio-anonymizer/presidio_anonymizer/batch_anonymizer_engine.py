@@ -1,8 +1,17 @@
 import collections
-from typing import Any, Dict, Iterable, List, Optional, Union
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Deque, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 from presidio_anonymizer import AnonymizerEngine
-from presidio_anonymizer.entities import DictRecognizerResult, RecognizerResult
+from presidio_anonymizer.core import OperatorMemo, OperatorResolver
+from presidio_anonymizer.entities import (
+    ConflictResolutionStrategy,
+    DictRecognizerResult,
+    OperatorConfig,
+    OperatorResult,
+    RecognizerResult,
+)
+from presidio_anonymizer.operators import AESCipher, Encrypt, OperatorType
 
 
 class BatchAnonymizerEngine:
@@ -10,16 +19,144 @@ class BatchAnonymizerEngine:
     BatchAnonymizerEngine class.
 
     A class that provides functionality to anonymize in batches.
+    The operators of a batch are resolved and validated once,
+    and reused for all the texts in the batch. Results of deterministic
+    operators can be memoized by giving an `OperatorMemo`.
     :param anonymizer_engine: An instance of the AnonymizerEngine class.
     """
 
     def __init__(self, anonymizer_engine: Optional[AnonymizerEngine] = None):
         self.anonymizer_engine = anonymizer_engine or AnonymizerEngine()
 
+    def anonymize_many(
+        self,
+        texts: Sequence[Optional[Union[str, bool, int, float]]],
+        row_ids: Sequence[int],
+        entity_types: Sequence[str],
+        starts: Sequence[int],
+        ends: Sequence[int],
+        scores: Sequence[float],
+        operators: Optional[Dict[str, OperatorConfig]] = None,
+        conflict_resolution: ConflictResolutionStrategy = (
+            ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED
+        ),
+        return_items: bool = False,
+        n_process: int = 1,
+        chunk_size: int = 1000,
+        operator_memo: Optional[OperatorMemo] = None,
+    ) -> Union[List[Any], Tuple[List[Any], List[List[OperatorResult]]]]:
+        """
+        Anonymize many texts, given the analyzer results as parallel arrays.
+
+        The analyzer results of all the texts are given flattened, as columns
+        (e.g. of a DataFrame), where `row_ids` holds the index of the text
+        each result belongs to. The operators are set up once for all the texts,
+        and only the anonymized texts are built, without an `EngineResult` per text.
+        The `AnonymizerEngine` is used through its internal steps,
+        so overrides of `AnonymizerEngine.anonymize` are not applied.
+
+        :param texts: The texts to anonymize.
+            Items with a `type` not in `(str, bool, int, float)` are returned as is.
+        :param row_ids: The index in `texts` of each analyzer result
+        :param entity_types: The entity type of each analyzer result
+        :param starts: The start of each analyzer result
+        :param ends: The end of each analyzer result
+        :param scores: The score of each analyzer result
+        :param operators: The operators to use for each entity type,
+            as in `AnonymizerEngine.anonymize`
+        :param conflict_resolution: The strategy for handling conflicts among entities
+        :param return_items: Whether to also return the anonymized items of each text
+        Values of the `encrypt` operator are encrypted together, with
+        `AESCipher.encrypt_many`, for each chunk of texts.
+
+        :param n_process: Number of processes for anonymizing the texts.
+            Useful for CPU bound operators (e.g. hash, encrypt). The anonymizer
+            engine and the operators must be picklable, so operators using
+            lambdas (e.g. custom) are only supported with a single process.
+        :param chunk_size: Number of texts sent to a process at a time
+        :param operator_memo: Optional memo of deterministic operator results
+            for this batch. Defaults to the memo of the anonymizer engine.
+            Each process uses its own empty copy of the memo.
+        :return: The anonymized texts, and if `return_items` is set,
+            the anonymized items of each text
+        """
+        rows = self._group_results_by_row(
+            len(texts), row_ids, entity_types, starts, ends, scores
+        )
+
+        operators = self.anonymizer_engine._add_default_operator(operators)
+
+        operator_memo = operator_memo or self.anonymizer_engine.operator_memo
+        if n_process > 1:
+            chunks = [
+                (texts[i : i + chunk_size], rows[i : i + chunk_size])
+                for i in range(0, len(texts), chunk_size)
+            ]
+            outputs = []
+            with ProcessPoolExecutor(
+                max_workers=n_process,
+                initializer=_init_process_bulk_anonymizer,
+                initargs=(
+                    self.anonymizer_engine,
+                    operators,
+                    conflict_resolution,
+                    return_items,
+                    operator_memo,
+                ),
+            ) as executor:
+                for chunk_outputs in executor.map(_anonymize_chunk, chunks):
+                    outputs.extend(chunk_outputs)
+        else:
+            bulk_anonymizer = _BulkAnonymizer(
+                self.anonymizer_engine,
+                operators,
+                conflict_resolution,
+                return_items,
+                operator_memo,
+            )
+            outputs = bulk_anonymizer.anonymize_chunk(texts, rows)
+
+        anonymized_texts = [output[0] for output in outputs]
+        if return_items:
+            return anonymized_texts, [output[1] for output in outputs]
+        return anonymized_texts
+
+    @staticmethod
+    def _group_results_by_row(
+        rows_count: int,
+        row_ids: Sequence[int],
+        entity_types: Sequence[str],
+        starts: Sequence[int],
+        ends: Sequence[int],
+        scores: Sequence[float],
+    ) -> List[List[Tuple[str, int, int, float]]]:
+        results_count = len(row_ids)
+        if not (
+            len(entity_types) == len(starts) == len(ends) == len(scores)
+            == results_count
+        ):
+            raise ValueError(
+                "row_ids, entity_types, starts, ends and scores "
+                "must have the same length"
+            )
+
+        rows = [[] for _ in range(rows_count)]
+        for row_id, entity_type, start, end, score in zip(
+            row_ids, entity_types, starts, ends, scores
+        ):
+            row_id = int(row_id)
+            if not 0 <= row_id < rows_count:
+                raise ValueError(
+                    f"Invalid row id {row_id}, while there are {rows_count} texts"
+                )
+            rows[row_id].append((entity_type, int(start), int(end), score))
+        return rows
+
     def anonymize_list(
         self,
         texts: List[Optional[Union[str, bool, int, float]]],
         recognizer_results_list: List[List[RecognizerResult]],
+        operator_memo: Optional[OperatorMemo] = None,
         **kwargs,
     ) -> List[Union[str, Any]]:
         """
@@ -29,8 +166,11 @@ class BatchAnonymizerEngine:
             Items with a `type` not in `(str, bool, int, float)` will not be anonymized.
         :param recognizer_results_list: A list of lists of RecognizerResult,
         the output of the AnalyzerEngine on each text in the list.
+        :param operator_memo: Optional memo of the results of deterministic
+        operators in this batch. Defaults to the memo of the anonymizer engine.
         :param kwargs: Additional kwargs for the `AnonymizerEngine.anonymize` method
         """
+        self._add_operator_resolver(kwargs, operator_memo)
         return_list = []
         if not recognizer_results_list:
             recognizer_results_list = [[] for _ in range(len(texts))]
@@ -46,16 +186,21 @@ class BatchAnonymizerEngine:
         return return_list
 
     def anonymize_dict(
-        self, analyzer_results: Iterable[DictRecognizerResult], **kwargs
+        self,
+        analyzer_results: Iterable[DictRecognizerResult],
+        operator_memo: Optional[OperatorMemo] = None,
+        **kwargs,
     ) -> Dict[str, str]:
         """
         Anonymize values in a dictionary.
 
         :param analyzer_results: Iterator of `DictRecognizerResult`
         containing the output of the AnalyzerEngine.analyze_dict on the input text.
+        :param operator_memo: Optional memo of the results of deterministic
+        operators in this batch. Defaults to the memo of the anonymizer engine.
         :param kwargs: Additional kwargs for the `AnonymizerEngine.anonymize` method
         """
-
+        self._add_operator_resolver(kwargs, operator_memo)
         return_dict = {}
         for result in analyzer_results:
             if isinstance(result.value, dict):
@@ -82,3 +227,167 @@ class BatchAnonymizerEngine:
             else:
                 return_dict[result.key] = result.value
         return return_dict
+
+    def _add_operator_resolver(
+        self, kwargs: Dict, operator_memo: Optional[OperatorMemo]
+    ) -> None:
+        # Share the validated operators between all the texts in the batch
+        if kwargs.get("operator_resolver"):
+            return
+        kwargs["operators"] = self.anonymizer_engine._add_default_operator(
+            kwargs.get("operators")
+        )
+        kwargs["operator_resolver"] = OperatorResolver(
+            self.anonymizer_engine.operators_factory,
+            OperatorType.Anonymize,
+            operator_memo or self.anonymizer_engine.operator_memo,
+        )
+
+
+class _BulkAnonymizer:
+    """Anonymize texts with operators set up once, for `anonymize_many`."""
+
+    def __init__(
+        self,
+        anonymizer_engine: AnonymizerEngine,
+        operators: Dict[str, OperatorConfig],
+        conflict_resolution: ConflictResolutionStrategy,
+        return_items: bool,
+        operator_memo: Optional[OperatorMemo],
+    ):
+        self.anonymizer_engine = anonymizer_engine
+        self.operators = operators
+        self.conflict_resolution = conflict_resolution
+        self.return_items = return_items
+        self.operator_resolver = OperatorResolver(
+            anonymizer_engine.operators_factory,
+            OperatorType.Anonymize,
+            operator_memo,
+        )
+
+    def anonymize_chunk(
+        self,
+        texts: Sequence[Any],
+        rows: Sequence[List[Tuple[str, int, int, float]]],
+    ) -> List[Tuple[Any, Optional[List[OperatorResult]]]]:
+        prepared = [self._prepare(text, row) for text, row in zip(texts, rows)]
+        operator_resolver = self._encrypt_in_bulk(prepared)
+        return [
+            self._replace(text, analyzer_results, operator_resolver)
+            for text, analyzer_results in prepared
+        ]
+
+    def anonymize(
+        self, text: Any, row: List[Tuple[str, int, int, float]]
+    ) -> Tuple[Any, Optional[List[OperatorResult]]]:
+        return self.anonymize_chunk([text], [row])[0]
+
+    def _prepare(
+        self, text: Any, row: List[Tuple[str, int, int, float]]
+    ) -> Tuple[Any, Optional[List[RecognizerResult]]]:
+        if type(text) not in (str, bool, int, float):
+            return text, None
+        text = str(text)
+        if not row:
+            return text, None
+
+        analyzer_results = [
+            RecognizerResult(entity_type, start, end, score)
+            for entity_type, start, end, score in row
+        ]
+        analyzer_results = self.anonymizer_engine._prepare_analyzer_results(
+            text, analyzer_results, self.conflict_resolution
+        )
+        return text, analyzer_results
+
+    def _replace(
+        self,
+        text: Any,
+        analyzer_results: Optional[List[RecognizerResult]],
+        operator_resolver: Union[OperatorResolver, "_BulkEncryptResolver"],
+    ) -> Tuple[Any, Optional[List[OperatorResult]]]:
+        if not analyzer_results:
+            return text, [] if self.return_items else None
+        return self.anonymizer_engine._replace_entities(
+            text,
+            analyzer_results,
+            self.operators,
+            OperatorType.Anonymize,
+            operator_resolver,
+            return_items=self.return_items,
+        )
+
+    def _encrypt_in_bulk(
+        self, prepared: List[Tuple[Any, Optional[List[RecognizerResult]]]]
+    ) -> Union[OperatorResolver, "_BulkEncryptResolver"]:
+        """Encrypt the values of the `encrypt` operator, once per key."""
+        # Entities are visited in the order in which _replace_entities operates
+        values_to_encrypt = []
+        for text, analyzer_results in prepared:
+            for result in sorted(analyzer_results or [], reverse=True):
+                operator_config = self.operators.get(
+                    result.entity_type
+                ) or self.operators.get("DEFAULT")
+                operator = self.operator_resolver.get_operator(
+                    result.entity_type, operator_config
+                )
+                if isinstance(operator, Encrypt):
+                    key = operator_config.params.get(Encrypt.KEY)
+                    if isinstance(key, str):
+                        key = key.encode("utf8")
+                    values_to_encrypt.append((key, text[result.start : result.end]))
+        if not values_to_encrypt:
+            return self.operator_resolver
+
+        indices_by_key = collections.defaultdict(list)
+        for i, (key, _) in enumerate(values_to_encrypt):
+            indices_by_key[key].append(i)
+        encrypted_values = [None] * len(values_to_encrypt)
+        for key, indices in indices_by_key.items():
+            encrypted = AESCipher.encrypt_many(
+                key, [values_to_encrypt[i][1] for i in indices]
+            )
+            for i, encrypted_value in zip(indices, encrypted):
+                encrypted_values[i] = encrypted_value
+
+        return _BulkEncryptResolver(
+            self.operator_resolver, collections.deque(encrypted_values)
+        )
+
+
+class _BulkEncryptResolver:
+    """
+    Operator resolver returning the values encrypted by `_encrypt_in_bulk`.
+
+    The entity texts are slices of the original texts, so the values
+    are returned in the order of the `encrypt` operations.
+    """
+
+    def __init__(
+        self, operator_resolver: OperatorResolver, encrypted_values: Deque[str]
+    ):
+        self.operator_resolver = operator_resolver
+        self.encrypted_values = encrypted_values
+
+    def operate(
+        self, entity_type: str, operator_config: OperatorConfig, text: str
+    ) -> str:
+        operator = self.operator_resolver.get_operator(entity_type, operator_config)
+        if isinstance(operator, Encrypt):
+            return self.encrypted_values.popleft()
+        return self.operator_resolver.operate(entity_type, operator_config, text)
+
+
+# The bulk anonymizer of a worker process of `anonymize_many`
+_process_bulk_anonymizer: Optional[_BulkAnonymizer] = None
+
+
+def _init_process_bulk_anonymizer(*args) -> None:
+    global _process_bulk_anonymizer
+    _process_bulk_anonymizer = _BulkAnonymizer(*args)
+
+
+def _anonymize_chunk(
+    chunk: Tuple[Sequence[Any], Sequence[List[Tuple[str, int, int, float]]]],
+) -> List[Tuple[Any, Optional[List[OperatorResult]]]]:
+    return _process_bulk_anonymizer.anonymize_chunk(*chunk)
@@ -1,6 +1,15 @@
 """The core text functionality."""
 
 from .engine_base import EngineBase
+from .operator_memo import OperatorMemo
+from .operator_resolver import OperatorResolver
 from .text_replace_builder import TextReplaceBuilder
+from .text_stream_buffer import TextStreamBuffer
 
-__all__ = ["EngineBase", "TextReplaceBuilder"]
+__all__ = [
+    "EngineBase",
+    "OperatorMemo",
+    "OperatorResolver",
+    "TextReplaceBuilder",
+    "TextStreamBuffer",
+]
@@ -2,8 +2,10 @@
 
 import logging
 from abc import ABC
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
+from presidio_anonymizer.core.operator_memo import OperatorMemo
+from presidio_anonymizer.core.operator_resolver import OperatorResolver
 from presidio_anonymizer.core.text_replace_builder import TextReplaceBuilder
 from presidio_anonymizer.entities import (
     EngineResult,
@@ -15,11 +17,17 @@ from presidio_anonymizer.operators import OperatorsFactory, OperatorType
 
 
 class EngineBase(ABC):
-    """Handle the logic of operations over the text using the operators."""
+    """
+    Handle the logic of operations over the text using the operators.
 
-    def __init__(self):
+    :param operator_memo: Optional memo of the results of deterministic
+    operators, shared by all the requests of the engine
+    """
+
+    def __init__(self, operator_memo: Optional[OperatorMemo] = None):
         self.logger = logging.getLogger("presidio-anonymizer")
         self.operators_factory = OperatorsFactory()
+        self.operator_memo = operator_memo
 
     def _operate(
         self,
@@ -27,6 +35,7 @@ class EngineBase(ABC):
         pii_entities: List[PIIEntity],
         operators_metadata: Dict[str, OperatorConfig],
         operator_type: OperatorType,
+        operator_resolver: Optional[OperatorResolver] = None,
         **operator_kwargs: Dict,
     ) -> EngineResult:
         """
@@ -37,10 +46,50 @@ class EngineBase(ABC):
         :param operators_metadata: dictionary where the key is the entity_type and what
         :type operator_type: either anonymize or deanonymize
         we want to perform over this entity_type.
+        :param operator_resolver: resolver of the validated operators, to share
+        between requests with the same operators. A new one is used if not given.
         :return:
         """
-        text_replace_builder = TextReplaceBuilder(original_text=text)
+        output_text, items = self._replace_entities(
+            text, pii_entities, operators_metadata, operator_type, operator_resolver
+        )
         engine_result = EngineResult()
+        for item in items:
+            engine_result.add_item(item)
+        engine_result.set_text(output_text)
+        return engine_result
+
+    def _replace_entities(
+        self,
+        text: str,
+        pii_entities: List[PIIEntity],
+        operators_metadata: Dict[str, OperatorConfig],
+        operator_type: OperatorType,
+        operator_resolver: Optional[OperatorResolver] = None,
+        return_items: bool = True,
+    ) -> Tuple[str, Optional[List[OperatorResult]]]:
+        """
+        Replace the entities in the text with the results of their operators.
+
+        :param text: the text we need to operate on.
+        :param pii_entities: data about the text entities we want to operate over.
+        :param operators_metadata: dictionary where the key is the entity_type and
+        the value is the operator config we want to perform over this entity_type.
+        :param operator_type: either anonymize or deanonymize
+        :param operator_resolver: resolver of the validated operators, to share
+        between requests with the same operators. A new one is used if not given.
+        :param return_items: whether to return the operated items,
+        otherwise only the output text is returned.
+        :return: The output text, and the operated items (ordered from end to start,
+        with their indexes in the output text) or None
+        """
+        if operator_resolver is None:
+            operator_resolver = OperatorResolver(
+                self.operators_factory, operator_type, self.operator_memo
+            )
+
+        text_replace_builder = TextReplaceBuilder(original_text=text)
+        operated_entities = []
         sorted_pii_entities = sorted(pii_entities, reverse=True)
         for entity in sorted_pii_entities:
             text_to_operate_on = text_replace_builder.get_text_in_position(
@@ -52,50 +101,40 @@ class EngineBase(ABC):
                 entity.entity_type, operators_metadata
             )
             changed_text = self.__operate_on_text(
-                entity, text_to_operate_on, operator_metadata, operator_type
+                entity, text_to_operate_on, operator_metadata, operator_resolver
             )
-            index_from_end = text_replace_builder.replace_text_get_insertion_index(
+            text_replace_builder.replace_text_get_insertion_index(
                 changed_text, entity.start, entity.end
             )
-
-            # The following creates an intermediate list of result entities,
-            # ordered from end to start, and the indexes will be normalized
-            # from start to end once the loop ends and the text length is deterministic.
-            result_item = OperatorResult(
-                0,
-                index_from_end,
-                entity.entity_type,
-                changed_text,
-                operator_metadata.operator_name,
+            operated_entities.append(
+                (entity, changed_text, operator_metadata.operator_name)
             )
-            engine_result.add_item(result_item)
 
-        engine_result.set_text(text_replace_builder.output_text)
-        engine_result.normalize_item_indexes()
-        return engine_result
+        if not return_items:
+            return text_replace_builder.output_text, None
+
+        items = [
+            OperatorResult(start, end, entity.entity_type, changed_text, operator_name)
+            for (entity, changed_text, operator_name), (start, end) in zip(
+                operated_entities, text_replace_builder.get_replacement_indices()
+            )
+        ]
+        return text_replace_builder.output_text, items
 
     def __operate_on_text(
         self,
         text_metadata: PIIEntity,
         text_to_operate_on: str,
         operator_metadata: OperatorConfig,
-        operator_type: OperatorType,
+        operator_resolver: OperatorResolver,
     ) -> str:
         entity_type = text_metadata.entity_type
-        self.logger.debug(f"getting operator for {entity_type}")
-        operator = self.operators_factory.create_operator_class(
-            operator_metadata.operator_name, operator_type
+        self.logger.debug(
+            f"operating on {entity_type} with {operator_metadata.operator_name}"
+        )
+        return operator_resolver.operate(
+            entity_type, operator_metadata, text_to_operate_on
         )
-        self.logger.debug(f"validating operator {operator} for {entity_type}")
-        params = operator_metadata.params
-        params["entity_type"] = entity_type
-
-        operator.validate(params=params)
-
-        self.logger.debug(f"operating on {entity_type} with {operator}")
-        operated_on_text = operator.operate(params=params, text=text_to_operate_on)
-
-        return operated_on_text
 
     @staticmethod
     def __get_entity_operator_metadata(
@@ -0,0 +1,107 @@
+"""Memoizes the results of deterministic operators."""
+
+import threading
+from typing import Dict, Hashable, Optional, Tuple, Union
+
+from presidio_anonymizer.operators import Operator
+
+
+class OperatorMemo:
+    """
+    Bounded memo of the results of deterministic operators.
+
+    Deterministic operators (see `Operator.is_deterministic`) always return
+    the same text for the same text and params, so repeated values
+    (e.g. the same email in many records) only need to be operated on once.
+    Results are stored by operator, params and text, so operators with
+    different params (e.g. different hash keys) never share results.
+    When `max_size` results are stored, the oldest one is evicted.
+
+    A memo can be given to an engine, to be shared by all its requests,
+    or to a single batch of the `BatchAnonymizerEngine`.
+
+    :param max_size: Maximum number of stored results
+    """
+
+    def __init__(self, max_size: int = 100000):
+        if max_size < 1:
+            raise ValueError("max_size must be a positive integer")
+
+        self.max_size = max_size
+        self._results: Dict[Tuple[Hashable, str], str] = {}
+        self._stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def get_params_key(operator: Operator, params: Dict) -> Optional[Hashable]:
+        """
+        Return the key of the results of an operator with the given params.
+
+        :param operator: The operator
+        :param params: The params the operator operates with
+        :return: The key, or None if the results should not be memoized,
+        as the operator is not deterministic or its params are not hashable
+        """
+        if not operator.is_deterministic():
+            return None
+
+        key = (
+            operator.operator_type(),
+            operator.operator_name(),
+            tuple(sorted(params.items())),
+        )
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def operate(
+        self, params_key: Hashable, operator: Operator, params: Dict, text: str
+    ) -> str:
+        """
+        Return the memoized result of an operator, operating on a miss.
+
+        :param params_key: The key of the operator and its params,
+        see `get_params_key`
+        :param operator: The operator
+        :param params: The params the operator operates with
+        :param text: The text to operate on
+        """
+        key = (params_key, text)
+        with self._lock:
+            result = self._results.get(key)
+            if result is not None:
+                self._stats["hits"] += 1
+                return result
+
+        result = operator.operate(params=params, text=text)
+        with self._lock:
+            self._stats["misses"] += 1
+            if len(self._results) >= self.max_size:
+                # Evict the oldest entry (dicts keep insertion order)
+                self._results.pop(next(iter(self._results)), None)
+                self._stats["evictions"] += 1
+            self._results[key] = result
+        return result
+
+    def __getstate__(self) -> Dict:
+        """Pickle as an empty memo, e.g. when copied to a worker process."""
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state: Dict) -> None:
+        """Unpickle as an empty memo."""
+        self.__init__(max_size=state["max_size"])
+
+    def get_stats(self) -> Dict[str, Union[int, float]]:
+        """Return the hits, misses, evictions, hit rate and size of the memo."""
+        with self._lock:
+            stats = {**self._stats, "size": len(self._results)}
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = stats["hits"] / lookups if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Remove all stored results."""
+        with self._lock:
+            self._results.clear()
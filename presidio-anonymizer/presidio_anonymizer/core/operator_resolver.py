@@ -0,0 +1,98 @@
+"""Resolves and validates the operators of a request."""
+
+import logging
+from typing import Dict, Hashable, Optional, Tuple
+
+from presidio_anonymizer.core.operator_memo import OperatorMemo
+from presidio_anonymizer.entities import OperatorConfig
+from presidio_anonymizer.operators import Operator, OperatorsFactory, OperatorType
+
+
+class OperatorResolver:
+    """
+    Resolve and validate the operator of each entity type once.
+
+    The operator of an entity type is created by the operators factory and
+    validated the first time it is used with an operator config.
+    Following entities of the same type and config reuse the validated operator.
+
+    A resolver is created for each request, and can be shared between
+    requests using the same operator configs, e.g. in batch anonymization.
+
+    :param operators_factory: The factory creating the operators
+    :param operator_type: Either anonymize or deanonymize
+    :param operator_memo: Optional memo of the results of deterministic operators
+    """
+
+    def __init__(
+        self,
+        operators_factory: OperatorsFactory,
+        operator_type: OperatorType,
+        operator_memo: Optional[OperatorMemo] = None,
+    ):
+        self.logger = logging.getLogger("presidio-anonymizer")
+        self.operators_factory = operators_factory
+        self.operator_type = operator_type
+        self.operator_memo = operator_memo
+        # (entity type, config id) -> (config, operator, memo key of the params).
+        # The config is kept referenced so that its id is not reused
+        # while the resolver exists.
+        self._operators: Dict[
+            Tuple[str, int], Tuple[OperatorConfig, Operator, Optional[Hashable]]
+        ] = {}
+
+    def get_operator(
+        self, entity_type: str, operator_config: OperatorConfig
+    ) -> Operator:
+        """
+        Return the validated operator of an entity type.
+
+        :param entity_type: The type of the entity to operate on
+        :param operator_config: The operator config of the entity type
+        :return: The operator, validated with the params of the config
+        """
+        return self.__resolve(entity_type, operator_config)[1]
+
+    def operate(
+        self, entity_type: str, operator_config: OperatorConfig, text: str
+    ) -> str:
+        """
+        Operate on the text of an entity, using the memo if possible.
+
+        :param entity_type: The type of the entity to operate on
+        :param operator_config: The operator config of the entity type
+        :param text: The text of the entity
+        :return: The operated text
+        """
+        _, operator, params_key = self.__resolve(entity_type, operator_config)
+        params = operator_config.params
+        params["entity_type"] = entity_type
+
+        if params_key is None:
+            return operator.operate(params=params, text=text)
+        return self.operator_memo.operate(params_key, operator, params, text)
+
+    def __resolve(
+        self, entity_type: str, operator_config: OperatorConfig
+    ) -> Tuple[OperatorConfig, Operator, Optional[Hashable]]:
+        key = (entity_type, id(operator_config))
+        resolved = self._operators.get(key)
+        if resolved:
+            return resolved
+
+        self.logger.debug(f"getting operator for {entity_type}")
+        operator = self.operators_factory.create_operator_class(
+            operator_config.operator_name, self.operator_type
+        )
+        self.logger.debug(f"validating operator {operator} for {entity_type}")
+        params = operator_config.params
+        params["entity_type"] = entity_type
+        operator.validate(params=params)
+
+        params_key = None
+        if self.operator_memo:
+            params_key = OperatorMemo.get_params_key(operator, params)
+
+        resolved = (operator_config, operator, params_key)
+        self._operators[key] = resolved
+        return resolved
@@ -1,20 +1,40 @@
 """Handles the original text and creates a new one according to changes requests."""
 
 import logging
+from typing import List, Optional, Tuple
 
 from presidio_anonymizer.entities import InvalidParamError
 
 
 class TextReplaceBuilder:
-    """Creates new text according to users request."""
+    """
+    Creates new text according to users request.
+
+    Replacements are made from the end of the text to its start.
+    They are collected as segments, and the output text is assembled
+    with a single join when it is read, so building a text with many
+    replacements takes linear time.
+    """
 
     def __init__(self, original_text: str):
         self.logger = logging.getLogger("presidio-anonymizer")
-        self.output_text = original_text
         self.original_text = original_text
         self.text_len = len(original_text)
         self.last_replacement_index = self.text_len
 
+        # (start, end, replacement text) in the original text, from end to start
+        self._replacements: List[Tuple[int, int, str]] = []
+        # Length of the output text from the last replacement to the end
+        self._output_tail_len = 0
+        self._output_text: Optional[str] = original_text
+
+    @property
+    def output_text(self) -> str:
+        """Return the text with all the replacements made so far."""
+        if self._output_text is None:
+            self._output_text = "".join(self.__get_output_parts())
+        return self._output_text
+
     def get_text_in_position(self, start: int, end: int) -> str:
         """
         Get part of the text inside the original text.
@@ -32,21 +52,55 @@ class TextReplaceBuilder:
         """
         Replace text in a specific position with the text.
 
+        Text is replaced from end to start, so each replacement should start
+        at or before the start of the previous one. If the replaced text overlaps
+        the previous replacement, the overlapping part is kept in the previous one.
+
         :param replacement_text: new text to replace the old text according to indices
         :param start: the startpoint to replace the text
         :param end: the endpoint to replace the text
-        :return: The index of inserted text
+        :return: The index of inserted text, from the end of the output text
         """
         end_of_text_index = min(end, self.last_replacement_index)
+        after_text_len = (
+            self.last_replacement_index - end_of_text_index + self._output_tail_len
+        )
         self.last_replacement_index = start
 
-        before_text = self.output_text[:start]
-        after_text = self.output_text[end_of_text_index:]
-        self.output_text = before_text + replacement_text + after_text
+        self._replacements.append((start, end_of_text_index, replacement_text))
+        self._output_tail_len = after_text_len + len(replacement_text)
+        self._output_text = None
 
         # The replace algorithm is replacing the text from end to start.
         # calculate and return the start point from the end.
-        return len(after_text) + len(replacement_text)
+        return self._output_tail_len
+
+    def get_replacement_indices(self) -> List[Tuple[int, int]]:
+        """
+        Get the start and end index of each replacement in the output text.
+
+        :return: The indices of the replacements, in the order they were made
+        """
+        indices = []
+        output_index = 0
+        original_index = 0
+        for start, end, replacement_text in reversed(self._replacements):
+            output_index += start - original_index
+            indices.append((output_index, output_index + len(replacement_text)))
+            output_index += len(replacement_text)
+            original_index = end
+        indices.reverse()
+        return indices
+
+    def __get_output_parts(self) -> List[str]:
+        parts = []
+        original_index = 0
+        for start, end, replacement_text in reversed(self._replacements):
+            parts.append(self.original_text[original_index:start])
+            parts.append(replacement_text)
+            original_index = end
+        parts.append(self.original_text[original_index:])
+        return parts
 
     def __validate_position_in_text(self, start: int, end: int):
         """Validate the start and end position match the text length."""
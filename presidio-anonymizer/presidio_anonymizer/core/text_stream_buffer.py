@@ -0,0 +1,134 @@
+"""Buffers a stream of text chunks, writing it incrementally."""
+
+from typing import Iterator, TextIO
+
+
+class TextStreamBuffer:
+    """
+    Keep the part of a text stream which was read but not yet written.
+
+    Positions are given in the full text of the stream.
+    Text is read from the chunks only when needed, and can be written
+    (or skipped, when replaced) only in order, so the buffer holds the text
+    from the last written position to the last read position.
+
+    :param chunks: The chunks of the text
+    :param writer: The output stream the text is written to
+    """
+
+    def __init__(self, chunks: Iterator[str], writer: TextIO):
+        self.chunks = chunks
+        self.writer = writer
+        self.exhausted = False
+        # Length of the text written to the writer
+        self.output_length = 0
+
+        self._text = ""
+        # Position of the start of `_text` in the full text
+        self._text_start = 0
+        # Position of the start of the text not yet written or skipped
+        self._start = 0
+
+    @property
+    def end(self) -> int:
+        """Return the position of the end of the text read so far."""
+        return self._text_start + len(self._text)
+
+    def read_until(self, end: int, flush_until: int) -> None:
+        """
+        Read chunks until the text up to the given position is buffered.
+
+        To bound the buffer size, text before `flush_until` is written
+        while reading. Stops early if the stream ends.
+
+        :param end: The position to read the text up to
+        :param flush_until: The position up to which the text can be written
+        """
+        while self.end < end and not self.exhausted:
+            self.write_until(min(flush_until, self.end))
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                self.exhausted = True
+            else:
+                self._compact()
+                self._text += chunk
+
+    def get_text(self, start: int, end: int) -> str:
+        """
+        Return the buffered text between the given positions.
+
+        :param start: The start position, not before the written text
+        :param end: The end position
+        """
+        return self._text[start - self._text_start : end - self._text_start]
+
+    def has_only(
+        self, start: int, end: int, characters: str, flush_until: int
+    ) -> bool:
+        """
+        Return whether the text between the given positions only has the characters.
+
+        Reads only as much text as needed to find a different character.
+
+        :param start: The start position
+        :param end: The end position
+        :param characters: The allowed characters
+        :param flush_until: The position up to which the text can be written
+        :return: True if the text is not empty and only has the given characters
+        """
+        if start >= end:
+            return False
+        position = start
+        while position < end:
+            self.read_until(position + 1, flush_until)
+            if self.end <= position:
+                return False
+            next_position = min(end, self.end)
+            if self.get_text(position, next_position).strip(characters):
+                return False
+            position = next_position
+        return True
+
+    def write_until(self, position: int) -> None:
+        """
+        Write the buffered text up to the given position.
+
+        :param position: The position to write the text up to
+        """
+        if position <= self._start:
+            return
+        self.write(self.get_text(self._start, position))
+        self.skip_until(position)
+
+    def skip_until(self, position: int) -> None:
+        """
+        Drop the buffered text up to the given position, without writing it.
+
+        :param position: The position to drop the text up to
+        """
+        self._start = position
+        # Dropping the text is deferred, so that skipping many short parts
+        # of the buffer does not copy the rest of the buffer each time
+        if self._start - self._text_start > len(self._text) // 2:
+            self._compact()
+
+    def write(self, text: str) -> None:
+        """
+        Write text to the output stream.
+
+        :param text: The text to write
+        """
+        if text:
+            self.writer.write(text)
+            self.output_length += len(text)
+
+    def _compact(self) -> None:
+        self._text = self._text[self._start - self._text_start :]
+        self._text_start = self._start
+
+    def write_rest(self) -> None:
+        """Write the rest of the buffered text and of the stream."""
+        self.write_until(self.end)
+        for chunk in self.chunks:
+            self.write(chunk)
+        self.exhausted = True
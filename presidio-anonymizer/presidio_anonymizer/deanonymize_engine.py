@@ -1,9 +1,10 @@
 """Deanonymize anonymized text by using deanonymize operators."""
 
 import logging
-from typing import Dict, List, Type
+from typing import Dict, List, Optional, Type
 
 from presidio_anonymizer.core.engine_base import EngineBase
+from presidio_anonymizer.core.operator_resolver import OperatorResolver
 from presidio_anonymizer.entities import EngineResult, OperatorConfig, OperatorResult
 from presidio_anonymizer.operators import Operator, OperatorType
 
@@ -18,6 +19,7 @@ class DeanonymizeEngine(EngineBase):
         text: str,
         entities: List[OperatorResult],
         operators: Dict[str, OperatorConfig],
+        operator_resolver: Optional[OperatorResolver] = None,
     ) -> EngineResult:
         """
         Receive the text, entities and operators to perform deanonymization over.
@@ -25,9 +27,18 @@ class DeanonymizeEngine(EngineBase):
         :param operators: the operators to apply on the anonymizer result entities
         :param text: the full text with the encrypted entities
         :param entities: list of encrypted entities
+        :param operator_resolver: Resolver of the validated operators, shared
+        between calls with the same operators (e.g. when deanonymizing a batch)
         :return: EngineResult - the new text and data about the deanonymized entities.
         """
-        return self._operate(text, entities, operators, OperatorType.Deanonymize)
+        # Only passed when given, for engines overriding the previous signature
+        operate_kwargs = {}
+        if operator_resolver:
+            operate_kwargs["operator_resolver"] = operator_resolver
+
+        return self._operate(
+            text, entities, operators, OperatorType.Deanonymize, **operate_kwargs
+        )
 
     def get_deanonymizers(self) -> List[str]:
         """Return a list of supported deanonymizers."""
@@ -2,16 +2,22 @@
 
 from .operator import OperatorType, Operator  # isort:skip
 from .aes_cipher import AESCipher
+from .aes_siv_cipher import AESSIVCipher
 from .custom import Custom
 from .deanonymize_keep import DeanonymizeKeep
+from .deterministic_encrypt import DeterministicEncrypt
 from .encrypt import Encrypt
 
 from .decrypt import Decrypt  # isort:skip
+from .deterministic_decrypt import DeterministicDecrypt  # isort:skip
 from .hash import Hash
 from .keep import Keep
 from .mask import Mask
 from .redact import Redact
 from .replace import Replace
+from .tokenize import Tokenize
+
+from .detokenize import Detokenize  # isort:skip
 
 try:
     from .ahds_surrogate import AHDSSurrogate
@@ -35,6 +41,11 @@ __all__ = [
     "Encrypt",
     "Decrypt",
     "AESCipher",
+    "DeterministicEncrypt",
+    "DeterministicDecrypt",
+    "AESSIVCipher",
+    "Tokenize",
+    "Detokenize",
     "OperatorsFactory",
     "AHDS_AVAILABLE",
 ]
@@ -1,9 +1,12 @@
 import base64
 import os
+from typing import Iterable, List
 
 from cryptography.hazmat.primitives import padding
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
+BLOCK_SIZE = algorithms.AES.block_size // 8
+
 
 class AESCipher:
     """Advanced Encryption Standard (aka Rijndael) en/decryption in CBC mode."""
@@ -46,6 +49,113 @@ class AESCipher:
         unpadder = padding.PKCS7(128).unpadder()
         decrypted_text = decryptor.update(ct) + decryptor.finalize()
         return (unpadder.update(decrypted_text) + unpadder.finalize()).decode("utf-8")
+
+    @staticmethod
+    def encrypt_many(
+        key: bytes, texts: Iterable[str], batch_size: int = 1024
+    ) -> List[str]:
+        """
+        Encrypts many texts using AES cypher in CBC mode.
+
+        Used by `BatchAnonymizerEngine.anonymize_many` for the values of the
+        `encrypt` operator, and for encrypting many values, e.g. a table column.
+
+        Each batch of texts is encrypted as a single CBC stream, so the key
+        is set up once per batch rather than once per text. A random block
+        is encrypted before each text, and its ciphertext is used as the
+        text's IV, so the results are random and have the same format as
+        `encrypt`: each of them can be decrypted separately with `decrypt`.
+        :param key: AES encryption key in bytes.
+        :param texts: The texts for encryption.
+        :param batch_size: Number of texts encrypted as a single stream.
+        :returns: The encrypted texts, in the order of the texts.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        encrypted_texts = []
+        texts = list(texts)
+        for batch_start in range(0, len(texts), batch_size):
+            batch = texts[batch_start : batch_start + batch_size]
+            random_blocks = os.urandom(BLOCK_SIZE * len(batch))
+            plain_parts = []
+            lengths = []
+            for i, text in enumerate(batch):
+                encoded_text = text.encode("utf-8")
+                padding_length = BLOCK_SIZE - len(encoded_text) % BLOCK_SIZE
+                plain_parts.append(random_blocks[i * BLOCK_SIZE : (i + 1) * BLOCK_SIZE])
+                plain_parts.append(encoded_text)
+                plain_parts.append(bytes([padding_length]) * padding_length)
+                lengths.append(BLOCK_SIZE + len(encoded_text) + padding_length)
+
+            cipher = Cipher(algorithms.AES(key), modes.CBC(os.urandom(BLOCK_SIZE)))
+            encryptor = cipher.encryptor()
+            encrypted = encryptor.update(b"".join(plain_parts)) + encryptor.finalize()
+
+            position = 0
+            for length in lengths:
+                encrypted_texts.append(
+                    base64.urlsafe_b64encode(
+                        encrypted[position : position + length]
+                    ).decode()
+                )
+                position += length
+        return encrypted_texts
+
+    @staticmethod
+    def decrypt_many(
+        key: bytes, texts: Iterable[str], batch_size: int = 1024
+    ) -> List[str]:
+        """
+        Decrypts many previously AES-CBC encrypted texts.
+
+        The counterpart of `encrypt_many`.
+        Each batch of texts is decrypted as a single CBC stream, in which
+        the IV of each text is the block preceding its ciphertext.
+        :param key: AES encryption key in bytes.
+        :param texts: The texts for decryption, encrypted by `encrypt`
+        or `encrypt_many`.
+        :param batch_size: Number of texts decrypted as a single stream.
+        :returns: The decrypted texts, in the order of the texts.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be a positive integer")
+
+        decrypted_texts = []
+        texts = list(texts)
+        for batch_start in range(0, len(texts), batch_size):
+            decoded_texts = [
+                base64.urlsafe_b64decode(text)
+                for text in texts[batch_start : batch_start + batch_size]
+            ]
+            for decoded_text in decoded_texts:
+                if len(decoded_text) < 2 * BLOCK_SIZE or len(decoded_text) % BLOCK_SIZE:
+                    raise ValueError(
+                        "The length of an encrypted text is not a multiple "
+                        "of the block length."
+                    )
+
+            # The IV of the stream only affects the first decrypted block,
+            # which is the IV of the first text and is dropped
+            cipher = Cipher(algorithms.AES(key), modes.CBC(bytes(BLOCK_SIZE)))
+            decryptor = cipher.decryptor()
+            decrypted = decryptor.update(b"".join(decoded_texts)) + decryptor.finalize()
+
+            position = 0
+            for decoded_text in decoded_texts:
+                end = position + len(decoded_text)
+                padding_length = decrypted[end - 1]
+                padding_bytes = decrypted[end - padding_length : end]
+                expected_padding = bytes([padding_length]) * padding_length
+                if not 0 < padding_length <= BLOCK_SIZE or (
+                    padding_bytes != expected_padding
+                ):
+                    raise ValueError("Invalid padding bytes.")
+                text = decrypted[position + BLOCK_SIZE : end - padding_length]
+                decrypted_texts.append(text.decode("utf-8"))
+                position = end
+        return decrypted_texts
+
     @staticmethod
     def is_valid_key_size(key: bytes) -> bool:
         """
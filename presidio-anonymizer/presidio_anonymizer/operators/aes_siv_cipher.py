@@ -0,0 +1,95 @@
+import base64
+from typing import Iterable, List
+
+from cryptography.hazmat.primitives.ciphers.aead import AESSIV
+
+
+class AESSIVCipher:
+    """
+    Deterministic authenticated en/decryption using AES in SIV mode (RFC 5297).
+
+    Unlike `AESCipher`, the same text is always encrypted to the same value
+    with the same key, so encrypted values can be compared, joined on
+    and memoized. This reveals which encrypted values are equal,
+    but nothing else about the texts.
+    """
+
+    KEY_SIZES = frozenset([256, 384, 512])
+
+    @staticmethod
+    def encrypt(key: bytes, text: str) -> str:
+        """
+        Encrypts a text using AES-SIV.
+
+        An empty text is encrypted to an empty value.
+        :param key: AES-SIV encryption key in bytes.
+        :param text: The text for encryption.
+        :returns: The encrypted text.
+        """
+        if not text:
+            return ""
+        encrypted_text = AESSIV(key).encrypt(text.encode("utf-8"), None)
+        return base64.urlsafe_b64encode(encrypted_text).decode()
+
+    @staticmethod
+    def decrypt(key: bytes, text: str) -> str:
+        """
+        Decrypts a previously AES-SIV encrypted text.
+
+        :param key: AES-SIV encryption key in bytes.
+        :param text: The text for decryption.
+        :returns: The decrypted text.
+        :raises InvalidTag: If the text was not encrypted with the key.
+        """
+        if not text:
+            return ""
+        decoded_text = base64.urlsafe_b64decode(text)
+        return AESSIV(key).decrypt(decoded_text, None).decode("utf-8")
+
+    @staticmethod
+    def encrypt_many(key: bytes, texts: Iterable[str]) -> List[str]:
+        """
+        Encrypts many texts using AES-SIV, with a single cipher.
+
+        :param key: AES-SIV encryption key in bytes.
+        :param texts: The texts for encryption.
+        :returns: The encrypted texts, in the order of the texts.
+        """
+        aes_siv = AESSIV(key)
+        return [
+            base64.urlsafe_b64encode(
+                aes_siv.encrypt(text.encode("utf-8"), None)
+            ).decode()
+            if text
+            else ""
+            for text in texts
+        ]
+
+    @staticmethod
+    def decrypt_many(key: bytes, texts: Iterable[str]) -> List[str]:
+        """
+        Decrypts many previously AES-SIV encrypted texts, with a single cipher.
+
+        :param key: AES-SIV encryption key in bytes.
+        :param texts: The texts for decryption.
+        :returns: The decrypted texts, in the order of the texts.
+        """
+        aes_siv = AESSIV(key)
+        return [
+            aes_siv.decrypt(base64.urlsafe_b64decode(text), None).decode("utf-8")
+            if text
+            else ""
+            for text in texts
+        ]
+
+    @staticmethod
+    def is_valid_key_size(key: bytes) -> bool:
+        """
+        Validate key size for AES-SIV.
+
+        SIV uses two keys of the same size, so its key is twice as long
+        as an AES key.
+        :param key: AES-SIV encryption key in bytes.
+        :returns: True if the key is of valid size, False otherwise.
+        """
+        return len(key) * 8 in AESSIVCipher.KEY_SIZES
@@ -34,11 +34,20 @@ try:
 except ImportError:
     get_azure_credential = None
 
+try:
+    from presidio_analyzer.llm_utils.remote_client_registry import (
+        get_remote_client_registry,
+    )
+except ImportError:
+    get_remote_client_registry = None
+
 from presidio_anonymizer.entities import InvalidParamError
 from presidio_anonymizer.operators import Operator, OperatorType
 
 logger = logging.getLogger("presidio-anonymizer")
 
+AHDS_API_VERSION = "2025-07-15-preview"
+
 
 class AHDSSurrogate(Operator):
     """AHDS Surrogate operator using AHDS de-identification service surrogation."""
@@ -247,11 +256,7 @@ class AHDSSurrogate(Operator):
         tagged_entities = self._convert_to_tagged_entities(entities)
 
         try:
-            # Use environment-aware credential (DefaultAzureCredential for dev,
-            # ChainedTokenCredential for production)
-            credential = get_azure_credential()
-            client = DeidentificationClient(endpoint, credential,
-                                            api_version="2025-07-15-preview")
+            client = self._get_client(endpoint)
 
             # Create tagged entity collection
             tagged_entity_collection = TaggedPhiEntities(
@@ -274,7 +279,12 @@ class AHDSSurrogate(Operator):
                 customizations=customizations
             )
 
-            result = client.deidentify_text(content)
+            if get_remote_client_registry:
+                result = get_remote_client_registry().get_endpoint("ahds").call(
+                    client.deidentify_text, content
+                )
+            else:
+                result = client.deidentify_text(content)
             if not result.output_text:
                 raise InvalidParamError("Operation returned empty output text.")
             if result.output_text == text:
@@ -283,6 +293,32 @@ class AHDSSurrogate(Operator):
         except Exception as e:
             raise InvalidParamError(f"AHDS Surrogate operation failed: {e}")
 
+    @staticmethod
+    def _get_client(endpoint: str) -> "DeidentificationClient":
+        """Return the de-identification client of an endpoint.
+
+        Clients are cached per endpoint in the remote client registry and
+        share its credential, so access tokens and connections are reused
+        across calls.
+        """
+        # Use environment-aware credential (DefaultAzureCredential for dev,
+        # ChainedTokenCredential for production)
+        if not get_remote_client_registry:
+            return DeidentificationClient(
+                endpoint, get_azure_credential(), api_version=AHDS_API_VERSION
+            )
+
+        registry = get_remote_client_registry()
+        return registry.get_client(
+            ("ahds_surrogate", endpoint),
+            lambda: DeidentificationClient(
+                endpoint,
+                registry.get_credential(get_azure_credential),
+                api_version=AHDS_API_VERSION,
+                **registry.get_azure_client_kwargs("ahds"),
+            ),
+        )
+
     def _convert_to_tagged_entities(self, entities: List) -> List:
         """Convert analyzer results to AHDS SimplePhiEntity format."""
         tagged_entities = []
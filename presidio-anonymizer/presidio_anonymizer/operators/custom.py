@@ -14,6 +14,7 @@ class Custom(Operator):
     """
 
     LAMBDA = "lambda"
+    STATELESS = True
 
     def operate(self, text: str = None, params: Dict = None) -> str:
         """:return: result of function executed on the text."""
@@ -9,6 +9,8 @@ class Decrypt(Operator):
 
     NAME = "decrypt"
     KEY = "key"
+    STATELESS = True
+    DETERMINISTIC = True
 
     def operate(self, text: str = None, params: Dict = None) -> str:
         """
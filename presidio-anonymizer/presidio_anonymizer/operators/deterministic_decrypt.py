@@ -0,0 +1,46 @@
+from typing import Dict
+
+from presidio_anonymizer.operators import DeterministicEncrypt, Operator, OperatorType
+from presidio_anonymizer.operators.aes_siv_cipher import AESSIVCipher
+
+
+class DeterministicDecrypt(Operator):
+    """Decrypt text from its deterministic encrypted form."""
+
+    NAME = "deterministic_decrypt"
+    KEY = "key"
+    STATELESS = True
+    DETERMINISTIC = True
+
+    def operate(self, text: str = None, params: Dict = None) -> str:
+        """
+        Decrypt the text.
+
+        :param text: The text for decryption.
+        :param params:
+            **key* The key supplied by the user for the encryption (bytes or str).
+        :return: The decrypted text
+        """
+        key = params.get(self.KEY)
+        if isinstance(key, str):
+            key = key.encode("utf8")
+        return AESSIVCipher.decrypt(key=key, text=text)
+
+    def validate(self, params: Dict = None) -> None:
+        """
+        Validate DeterministicDecrypt parameters.
+
+        :param params:
+            * *key* The key supplied by the user for the encryption.
+                    Should be a string of 256, 384 or 512 bits length.
+        :raises InvalidParamException: in case on an invalid parameter.
+        """
+        DeterministicEncrypt().validate(params)
+
+    def operator_name(self) -> str:
+        """Return operator name."""
+        return self.NAME
+
+    def operator_type(self) -> OperatorType:
+        """Return operator type."""
+        return OperatorType.Deanonymize
@@ -0,0 +1,61 @@
+from typing import Dict
+
+from presidio_anonymizer.entities import InvalidParamError
+from presidio_anonymizer.operators import Operator, OperatorType
+from presidio_anonymizer.operators.aes_siv_cipher import AESSIVCipher
+from presidio_anonymizer.services.validators import validate_parameter
+
+
+class DeterministicEncrypt(Operator):
+    """
+    Anonymizes text to a deterministic encrypted form, using AES-SIV.
+
+    Equal texts are encrypted to equal values with the same key,
+    so they can be joined on, and can be restored using deterministic_decrypt.
+    """
+
+    KEY = "key"
+    STATELESS = True
+    DETERMINISTIC = True
+
+    def operate(self, text: str = None, params: Dict = None) -> str:
+        """
+        Anonymize the text with a deterministic encrypted text.
+
+        :param text: The text for encryption.
+        :param params:
+            * *key* The key supplied by the user for the encryption (bytes or str).
+        :return: The encrypted text
+        """
+        key = params.get(self.KEY)
+        if isinstance(key, str):
+            key = key.encode("utf8")
+        return AESSIVCipher.encrypt(key, text)
+
+    def validate(self, params: Dict = None) -> None:
+        """
+        Validate DeterministicEncrypt parameters.
+
+        :param params:
+            * *key* The key supplied by the user for the encryption.
+                    Should be a string of 256, 384 or 512 bits length.
+        :raises InvalidParamException: in case on an invalid parameter.
+        """
+        key = params.get(self.KEY)
+        if isinstance(key, str):
+            validate_parameter(key, self.KEY, str)
+            key = key.encode("utf8")
+        else:
+            validate_parameter(key, self.KEY, bytes)
+        if not AESSIVCipher.is_valid_key_size(key):
+            raise InvalidParamError(
+                f"Invalid input, {self.KEY} must be of length 256, 384 or 512 bits"
+            )
+
+    def operator_name(self) -> str:
+        """Return operator name."""
+        return "deterministic_encrypt"
+
+    def operator_type(self) -> OperatorType:
+        """Return operator type."""
+        return OperatorType.Anonymize
@@ -0,0 +1,45 @@
+from typing import Dict
+
+from presidio_anonymizer.entities import InvalidParamError
+from presidio_anonymizer.operators import Operator, OperatorType, Tokenize
+
+
+class Detokenize(Operator):
+    """Restore a token issued by the tokenize operator to its original text."""
+
+    NAME = "detokenize"
+    VAULT = "vault"
+    # Tokens are kept in the vault given in the params
+    STATELESS = True
+
+    def operate(self, text: str = None, params: Dict = None) -> str:
+        """
+        Restore the original text of a token.
+
+        :param text: The token.
+        :param params:
+            * *vault* The token vault which issued the token.
+        :return: The original text
+        """
+        original = params[self.VAULT].get_original(text)
+        if original is None:
+            raise InvalidParamError(f"Token {text} was not found in the vault")
+        return original
+
+    def validate(self, params: Dict = None) -> None:
+        """
+        Validate Detokenize parameters.
+
+        :param params:
+            * *vault* The token vault which issued the tokens.
+        :raises InvalidParamException: in case on an invalid parameter.
+        """
+        Tokenize().validate(params)
+
+    def operator_name(self) -> str:
+        """Return operator name."""
+        return self.NAME
+
+    def operator_type(self) -> OperatorType:
+        """Return operator type."""
+        return OperatorType.Deanonymize
@@ -10,6 +10,7 @@ class Encrypt(Operator):
     """Anonymizes text to an encrypted form, or it to be restored using decrypted."""
 
     KEY = "key"
+    STATELESS = True
 
     def operate(self, text: str = None, params: Dict = None) -> str:
         """
@@ -1,26 +1,46 @@
 """Hashes the PII text entity."""
 
+import hmac
 from hashlib import sha256, sha512
 from typing import Dict
 
+from presidio_anonymizer.entities import InvalidParamError
 from presidio_anonymizer.operators import Operator, OperatorType
 from presidio_anonymizer.services.validators import validate_parameter_in_range
 
 
 class Hash(Operator):
-    """Hash given text with sha256/sha512 algorithm."""
+    """
+    Hash given text with sha256/sha512 algorithm.
+
+    When a key is given, the text is hashed with HMAC, so hashes
+    computed with different keys (e.g. of different tenants) differ.
+    """
 
     HASH_TYPE = "hash_type"
+    KEY = "key"
     SHA256 = "sha256"
     SHA512 = "sha512"
+    STATELESS = True
+    DETERMINISTIC = True
 
     def operate(self, text: str = None, params: Dict = None) -> str:
         """
         Hash given value using sha256.
 
+        :param text: The text to hash.
+        :param params:
+            * *hash_type* sha256 (default) or sha512.
+            * *key* Optional key for keyed hashing with HMAC (bytes or str).
         :return: hashed original text
         """
         hash_type = self._get_hash_type_or_default(params)
+        key = params.get(self.KEY)
+        if key is not None:
+            if isinstance(key, str):
+                key = key.encode("utf8")
+            return hmac.new(key, text.encode(), hash_type).hexdigest()
+
         hash_switcher = {
             self.SHA256: lambda s: sha256(s),
             self.SHA512: lambda s: sha512(s),
@@ -35,7 +55,11 @@ class Hash(Operator):
             self.HASH_TYPE,
             str,
         )
-        pass
+        key = params.get(self.KEY)
+        if key is not None and (not isinstance(key, (str, bytes)) or not key):
+            raise InvalidParamError(
+                f"Invalid input, {self.KEY} must be a non empty string or bytes"
+            )
 
     def operator_name(self) -> str:
         """Return operator name."""
@@ -13,6 +13,9 @@ class BaseKeep(Operator, ABC):
     type to be implemented by concrete classes
     """
 
+    STATELESS = True
+    DETERMINISTIC = True
+
     def operate(self, text: str = None, params: Dict = None) -> str:
         """:return: original text."""
         return text
@@ -13,6 +13,8 @@ class Mask(Operator):
     CHARS_TO_MASK = "chars_to_mask"
     FROM_END = "from_end"
     MASKING_CHAR = "masking_char"
+    STATELESS = True
+    DETERMINISTIC = True
 
     def operate(self, text: str = None, params: Dict = None) -> str:
         """
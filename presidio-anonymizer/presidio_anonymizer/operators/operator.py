@@ -18,6 +18,16 @@ types = [OperatorType.Anonymize, OperatorType.Deanonymize]
 class Operator(ABC):
     """Operator abstract class to be implemented by each operator."""
 
+    # Whether the operator keeps no state between operations. A single instance
+    # of a stateless operator is reused for all requests, so it should only
+    # depend on the text and params it operates on.
+    STATELESS = False
+
+    # Whether the operator always returns the same text for the same input.
+    # Results of deterministic operators can be memoized by text and params
+    # (see `OperatorMemo`), so randomized operators should keep it False.
+    DETERMINISTIC = False
+
     @abstractmethod
     def operate(self, text: str, params: Dict = None) -> str:
         """Operate method to be implemented in each operator."""
@@ -37,3 +47,11 @@ class Operator(ABC):
     def operator_type(self) -> OperatorType:
         """Return operator type."""
         pass
+
+    def is_stateless(self) -> bool:
+        """Return whether the operator keeps no state between operations."""
+        return self.STATELESS
+
+    def is_deterministic(self) -> bool:
+        """Return whether the operator returns the same text for the same input."""
+        return self.DETERMINISTIC
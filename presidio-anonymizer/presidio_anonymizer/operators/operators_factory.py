@@ -8,6 +8,9 @@ from presidio_anonymizer.operators import (
     Custom,
     DeanonymizeKeep,
     Decrypt,
+    DeterministicDecrypt,
+    DeterministicEncrypt,
+    Detokenize,
     Encrypt,
     Hash,
     Keep,
@@ -16,16 +19,27 @@ from presidio_anonymizer.operators import (
     OperatorType,
     Redact,
     Replace,
+    Tokenize,
 )
 
 logger = logging.getLogger("presidio-anonymizer")
 
 # Predefined operators
-ANONYMIZERS = [Custom, Encrypt, Hash, Keep, Mask, Redact, Replace]
+ANONYMIZERS = [
+    Custom,
+    DeterministicEncrypt,
+    Encrypt,
+    Hash,
+    Keep,
+    Mask,
+    Redact,
+    Replace,
+    Tokenize,
+]
 if AHDS_AVAILABLE and AHDSSurrogate:
     ANONYMIZERS.append(AHDSSurrogate)
 
-DEANONYMIZERS = [Decrypt, DeanonymizeKeep]
+DEANONYMIZERS = [Decrypt, DeterministicDecrypt, DeanonymizeKeep, Detokenize]
 
 
 class OperatorsFactory:
@@ -36,6 +50,8 @@ class OperatorsFactory:
     ):
         self._anonymizers = self.__load_predefined(OperatorType.Anonymize)
         self._deanonymizers = self.__load_predefined(OperatorType.Deanonymize)
+        # Instances of stateless operators, reused for all requests
+        self._stateless_operators: Dict[Type[Operator], Operator] = {}
 
     @staticmethod
     def __load_predefined(operator_type: OperatorType) -> Dict[str, Type[Operator]]:
@@ -98,6 +114,7 @@ class OperatorsFactory:
                 f"Operator {operator().operator_name()} not found in anonymizers list"
             )
         self._anonymizers.pop(operator().operator_name(), None)
+        self._stateless_operators.pop(operator, None)
 
     def remove_deanonymize_operator(self, operator: Type[Operator]):
         """Remove a deanonymizer from the factory.
@@ -112,6 +129,7 @@ class OperatorsFactory:
                 f"Operator {operator().operator_name()} not found in deanonymizers list"
             )
         self._deanonymizers.pop(operator().operator_name(), None)
+        self._stateless_operators.pop(operator, None)
 
     def create_operator_class(
         self, operator_name: str, operator_type: OperatorType
@@ -119,6 +137,9 @@ class OperatorsFactory:
         """
         Extract the operator class from the operators list.
 
+        A new operator instance is created for each call,
+        unless the operator is stateless.
+
         :param operator_type: Either Anonymize or Decrypt to defer between operators.
         :type operator_name: operator name.
         :return: operator class entity.
@@ -134,7 +155,14 @@ class OperatorsFactory:
             logger.error(f"No such operator {operator_name}")
             raise InvalidParamError(f"Invalid operator class '{operator_name}'.")
 
-        return operator()
+        operator_instance = self._stateless_operators.get(operator)
+        if operator_instance:
+            return operator_instance
+
+        operator_instance = operator()
+        if operator_instance.is_stateless():
+            self._stateless_operators[operator] = operator_instance
+        return operator_instance
 
     def __get_operators_classes(self) -> Dict[OperatorType, Dict[str, Type[Operator]]]:
         operator_classes = {
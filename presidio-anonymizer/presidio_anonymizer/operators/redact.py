@@ -8,6 +8,9 @@ from presidio_anonymizer.operators import Operator, OperatorType
 class Redact(Operator):
     """Redact the string - empty value."""
 
+    STATELESS = True
+    DETERMINISTIC = True
+
     def operate(self, text: str = None, params: Dict = None) -> str:
         """:return: an empty value."""
         return ""
@@ -10,6 +10,8 @@ class Replace(Operator):
     """Receives new text to replace old PII text entity with."""
 
     NEW_VALUE = "new_value"
+    STATELESS = True
+    DETERMINISTIC = True
 
     def operate(self, text: str = None, params: Dict = None) -> str:
         """:return: new_value."""
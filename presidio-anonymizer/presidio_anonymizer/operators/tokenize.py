@@ -0,0 +1,49 @@
+from typing import Dict
+
+from presidio_anonymizer.operators import Operator, OperatorType
+from presidio_anonymizer.services.validators import validate_parameter
+from presidio_anonymizer.token_vault import TokenVault
+
+
+class Tokenize(Operator):
+    """
+    Replace the PII text with a surrogate token, kept in a token vault.
+
+    The same value of the same entity type is always replaced by the same
+    token, and can be restored with the vault (see `TokenVault.deanonymize`)
+    or the detokenize operator.
+    """
+
+    VAULT = "vault"
+    # Tokens are kept in the vault given in the params
+    STATELESS = True
+
+    def operate(self, text: str = None, params: Dict = None) -> str:
+        """
+        Anonymize the text with a token.
+
+        :param text: The text to replace.
+        :param params:
+            * *vault* The token vault issuing and keeping the tokens.
+            * *entity_type* The entity type of the text.
+        :return: The token of the text
+        """
+        return params[self.VAULT].get_or_create_token(text, params["entity_type"])
+
+    def validate(self, params: Dict = None) -> None:
+        """
+        Validate Tokenize parameters.
+
+        :param params:
+            * *vault* The token vault issuing and keeping the tokens.
+        :raises InvalidParamException: in case on an invalid parameter.
+        """
+        validate_parameter(params.get(self.VAULT), self.VAULT, TokenVault)
+
+    def operator_name(self) -> str:
+        """Return operator name."""
+        return "tokenize"
+
+    def operator_type(self) -> OperatorType:
+        """Return operator type."""
+        return OperatorType.Anonymize
@@ -0,0 +1,13 @@
+"""Token vaults, for restoring surrogate tokens in free text."""
+
+from .in_memory_token_vault import InMemoryTokenVault
+from .sqlite_token_vault import SQLiteTokenVault
+from .token_scanner import TokenScanner
+from .token_vault import TokenVault
+
+__all__ = [
+    "TokenScanner",
+    "TokenVault",
+    "InMemoryTokenVault",
+    "SQLiteTokenVault",
+]
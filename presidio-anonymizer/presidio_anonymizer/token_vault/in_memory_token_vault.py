@@ -0,0 +1,47 @@
+"""Token vault kept in memory."""
+
+from typing import Dict, Iterable, Optional, Tuple
+
+from presidio_anonymizer.token_vault.token_vault import TokenVault
+
+
+class InMemoryTokenVault(TokenVault):
+    """
+    Token vault keeping the tokens in memory, e.g. for a single conversation.
+
+    :param token_format: Format of the issued tokens,
+    with `entity_type` and `index` fields
+    """
+
+    def __init__(self, token_format: str = TokenVault.DEFAULT_TOKEN_FORMAT):
+        super().__init__(token_format=token_format)
+        # token -> (value, entity type)
+        self._originals: Dict[str, Tuple[str, str]] = {}
+        # (value, entity type) -> first token
+        self._tokens: Dict[Tuple[str, str], str] = {}
+        self._counts: Dict[str, int] = {}
+
+    def _get_token(self, text: str, entity_type: str) -> Optional[str]:
+        return self._tokens.get((text, entity_type))
+
+    def _get_originals(self, tokens: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        return {
+            token: self._originals[token]
+            for token in tokens
+            if token in self._originals
+        }
+
+    def _insert(self, token: str, text: str, entity_type: str) -> bool:
+        if token in self._originals:
+            return False
+        self._originals[token] = (text, entity_type)
+        self._tokens.setdefault((text, entity_type), token)
+        self._counts[entity_type] = self._counts.get(entity_type, 0) + 1
+        return True
+
+    def _count_tokens(self, entity_type: str) -> int:
+        return self._counts.get(entity_type, 0)
+
+    def __len__(self) -> int:
+        """Return the number of stored tokens."""
+        return len(self._originals)
@@ -0,0 +1,136 @@
+"""Token vault persisted in SQLite."""
+
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from presidio_anonymizer.token_vault.token_vault import TokenVault
+
+
+class SQLiteTokenVault(TokenVault):
+    """
+    Token vault persisted in a SQLite database.
+
+    The tokens are kept across restarts, and the database file can be shared
+    between processes: tokens are issued in transactions, and tokens issued
+    by other processes are loaded before deanonymizing.
+
+    :param path: Path of the SQLite database file, created if missing,
+    or ":memory:"
+    :param token_format: Format of the issued tokens,
+    with `entity_type` and `index` fields
+    """
+
+    # Maximum number of tokens read in a single query
+    QUERY_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        token_format: str = TokenVault.DEFAULT_TOKEN_FORMAT,
+    ):
+        super().__init__(token_format=token_format)
+        if str(path) != ":memory:":
+            path = Path(path).expanduser()
+            path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+
+        self._connection = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS tokens ("
+            "token TEXT PRIMARY KEY, "
+            "original TEXT NOT NULL, "
+            "entity_type TEXT NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS tokens_original "
+            "ON tokens (entity_type, original)"
+        )
+        # Number of tokens per entity type, updated with each inserted token
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS token_counts ("
+            "entity_type TEXT PRIMARY KEY, "
+            "count INTEGER NOT NULL)"
+        )
+        # Row id of the last token loaded into the scanner
+        self._last_rowid = 0
+        with self._lock:
+            self._scanner.add(self._load_new_tokens())
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        # Other processes cannot issue tokens between reading and inserting
+        self._connection.execute("BEGIN IMMEDIATE")
+        try:
+            yield
+        except BaseException:
+            self._connection.execute("ROLLBACK")
+            raise
+        self._connection.execute("COMMIT")
+
+    def _load_new_tokens(self) -> List[str]:
+        rows = self._connection.execute(
+            "SELECT rowid, token FROM tokens WHERE rowid > ? ORDER BY rowid",
+            (self._last_rowid,),
+        ).fetchall()
+        if rows:
+            self._last_rowid = rows[-1][0]
+        return [token for _, token in rows]
+
+    def _get_token(self, text: str, entity_type: str) -> Optional[str]:
+        row = self._connection.execute(
+            "SELECT token FROM tokens WHERE entity_type = ? AND original = ? "
+            "ORDER BY rowid LIMIT 1",
+            (entity_type, text),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _get_originals(self, tokens: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        tokens = list(tokens)
+        originals = {}
+        for start in range(0, len(tokens), self.QUERY_BATCH_SIZE):
+            batch = tokens[start : start + self.QUERY_BATCH_SIZE]
+            placeholders = ", ".join("?" * len(batch))
+            for token, original, entity_type in self._connection.execute(
+                "SELECT token, original, entity_type FROM tokens "
+                f"WHERE token IN ({placeholders})",
+                batch,
+            ):
+                originals[token] = (original, entity_type)
+        return originals
+
+    def _insert(self, token: str, text: str, entity_type: str) -> bool:
+        cursor = self._connection.execute(
+            "INSERT OR IGNORE INTO tokens (token, original, entity_type) "
+            "VALUES (?, ?, ?)",
+            (token, text, entity_type),
+        )
+        if cursor.rowcount != 1:
+            return False
+        self._connection.execute(
+            "INSERT INTO token_counts (entity_type, count) VALUES (?, 1) "
+            "ON CONFLICT (entity_type) DO UPDATE SET count = count + 1",
+            (entity_type,),
+        )
+        return True
+
+    def _count_tokens(self, entity_type: str) -> int:
+        row = self._connection.execute(
+            "SELECT count FROM token_counts WHERE entity_type = ?", (entity_type,)
+        ).fetchone()
+        return row[0] if row else 0
+
+    def __len__(self) -> int:
+        """Return the number of stored tokens."""
+        with self._lock:
+            row = self._connection.execute("SELECT COUNT(*) FROM tokens").fetchone()
+        return row[0]
@@ -0,0 +1,133 @@
+"""Finds the occurrences of many tokens in texts in a single pass."""
+
+from typing import Dict, Iterable, List, Set, Tuple
+
+
+class _Automaton:
+    """Aho-Corasick automaton of a fixed list of tokens."""
+
+    def __init__(self, tokens: List[str]):
+        self.tokens = tokens
+        # Transitions of each state, by character
+        self.goto: List[Dict[str, int]] = [{}]
+        # Lengths of the tokens ending at each state
+        self.outputs: List[Tuple[int, ...]] = [()]
+        for token in tokens:
+            state = 0
+            for char in token:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto.append({})
+                    self.outputs.append(())
+                    self.goto[state][char] = next_state
+                state = next_state
+            self.outputs[state] = (len(token),)
+
+        # Failure links, computed in breadth first order, with the outputs
+        # of each state extended by those of its failure state
+        self.fail: List[int] = [0] * len(self.goto)
+        queue = list(self.goto[0].values())
+        for state in queue:
+            for char, next_state in self.goto[state].items():
+                fail_state = self.fail[state]
+                while fail_state and char not in self.goto[fail_state]:
+                    fail_state = self.fail[fail_state]
+                fail_state = self.goto[fail_state].get(char, 0)
+                self.fail[next_state] = fail_state
+                self.outputs[next_state] += self.outputs[fail_state]
+                queue.append(next_state)
+
+    def find_longest(self, text: str, longest: Dict[int, int]) -> None:
+        """
+        Update the end of the longest token starting at each position of the text.
+
+        :param text: The text to scan
+        :param longest: Ends of the longest tokens found so far, by start
+        """
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        state = 0
+        for end, char in enumerate(text, 1):
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+            for length in outputs[state]:
+                start = end - length
+                if longest.get(start, 0) < end:
+                    longest[start] = end
+
+
+class TokenScanner:
+    """
+    Find all the occurrences of a set of tokens in texts, in a single pass.
+
+    Tokens are compiled into Aho-Corasick automata, so scanning a text takes
+    time linear in its length, regardless of the number of tokens.
+    When tokens overlap, the leftmost one is found, and the longest one
+    among those starting at the same position.
+
+    Tokens can be added at any time: new tokens are compiled into a new
+    automaton, and automata of similar sizes are merged, as in a binary counter.
+    Each token is therefore recompiled a logarithmic number of times,
+    and a logarithmic number of automata is scanned.
+
+    :param tokens: The initial tokens
+    """
+
+    def __init__(self, tokens: Iterable[str] = ()):
+        self._tokens: Set[str] = set()
+        self._automata: List[_Automaton] = []
+        self.add(tokens)
+
+    def add(self, tokens: Iterable[str]) -> None:
+        """
+        Add tokens to find. Empty and already known tokens are ignored.
+
+        :param tokens: The tokens to add
+        """
+        new_tokens = [
+            token
+            for token in dict.fromkeys(tokens)
+            if token and token not in self._tokens
+        ]
+        if not new_tokens:
+            return
+
+        # Scanning threads keep using the previous list of automata
+        automata = list(self._automata)
+        while automata and len(automata[-1].tokens) <= len(new_tokens):
+            new_tokens = automata.pop().tokens + new_tokens
+        automata.append(_Automaton(new_tokens))
+        self._tokens.update(new_tokens)
+        self._automata = automata
+
+    def find(self, text: str) -> List[Tuple[int, int]]:
+        """
+        Return the start and end of each occurrence of the tokens in the text.
+
+        :param text: The text to scan
+        :return: The non-overlapping occurrences, sorted by start
+        """
+        longest = {}
+        for automaton in self._automata:
+            automaton.find_longest(text, longest)
+
+        occurrences = []
+        position = 0
+        for start in sorted(longest):
+            if start >= position:
+                position = longest[start]
+                occurrences.append((start, position))
+        return occurrences
+
+    def __len__(self) -> int:
+        """Return the number of tokens."""
+        return len(self._tokens)
+
+    def __contains__(self, token: str) -> bool:
+        """Return whether the token is found by the scanner."""
+        return token in self._tokens
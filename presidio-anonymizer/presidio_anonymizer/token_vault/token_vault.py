@@ -0,0 +1,195 @@
+"""Maps surrogate tokens to the original values they replace."""
+
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from presidio_anonymizer.entities import EngineResult, OperatorResult
+from presidio_anonymizer.token_vault.token_scanner import TokenScanner
+
+
+class TokenVault(ABC):
+    """
+    Store of surrogate tokens and the original values they replace.
+
+    Tokens are issued for the anonymized values by the `tokenize` operator,
+    one token per value and entity type (e.g. `<PERSON_0>`), or added with
+    `add_token`. All the known tokens are kept in a `TokenScanner`,
+    so `deanonymize` restores the original values in any text containing
+    the tokens, such as the response of an LLM to an anonymized prompt,
+    in a single pass and without the positions of the tokens.
+
+    :param token_format: Format of the issued tokens,
+    with `entity_type` and `index` fields
+    """
+
+    DEFAULT_TOKEN_FORMAT = "<{entity_type}_{index}>"
+    OPERATOR_NAME = "detokenize"
+
+    def __init__(self, token_format: str = DEFAULT_TOKEN_FORMAT):
+        self.token_format = token_format
+        self._lock = threading.RLock()
+        self._scanner = TokenScanner()
+
+    def get_or_create_token(self, text: str, entity_type: str) -> str:
+        """
+        Return the token of a value, issuing a new token for a new value.
+
+        :param text: The original value
+        :param entity_type: The entity type of the value
+        :return: The token replacing the value
+        """
+        with self._lock:
+            token = self._get_token(text, entity_type)
+            if token is not None:
+                return token
+
+            # Only new values take the write transaction
+            with self._transaction():
+                # The value may have been tokenized by another process meanwhile
+                token = self._get_token(text, entity_type)
+                if token is not None:
+                    return token
+
+                # Tokens added with `add_token` may already use the next index
+                index = self._count_tokens(entity_type)
+                token = self.token_format.format(entity_type=entity_type, index=index)
+                while not self._insert(token, text, entity_type):
+                    index += 1
+                    token = self.token_format.format(
+                        entity_type=entity_type, index=index
+                    )
+                self._scanner.add([token])
+        return token
+
+    def add_token(self, token: str, text: str, entity_type: str) -> None:
+        """
+        Add a token issued elsewhere, e.g. by another operator.
+
+        :param token: The token replacing the value
+        :param text: The original value
+        :param entity_type: The entity type of the value
+        :raises ValueError: If the token replaces another value
+        """
+        if not token:
+            raise ValueError("token must not be empty")
+
+        with self._lock, self._transaction():
+            original = self._get_originals([token]).get(token)
+            if original is None:
+                self._insert(token, text, entity_type)
+            elif original != (text, entity_type):
+                raise ValueError(f"Token {token} already replaces another value")
+            self._scanner.add([token])
+
+    def get_original(self, token: str) -> Optional[str]:
+        """
+        Return the original value of a token.
+
+        :param token: The token
+        :return: The value the token replaces, or None for an unknown token
+        """
+        with self._lock:
+            original = self._get_originals([token]).get(token)
+        return original[0] if original else None
+
+    def deanonymize(self, text: str) -> EngineResult:
+        """
+        Replace all the known tokens in a text with their original values.
+
+        :param text: The text containing tokens
+        :return: The restored text, and the restored items with their positions
+        in the restored text
+        """
+        return self.deanonymize_many([text])[0]
+
+    def deanonymize_many(self, texts: Iterable[str]) -> List[EngineResult]:
+        """
+        Replace all the known tokens in texts with their original values.
+
+        The original values of the tokens found in all the texts are read
+        from the vault together.
+
+        :param texts: The texts containing tokens
+        :return: The restored text and items of each text, in the order of the texts
+        """
+        texts = list(texts)
+        with self._lock:
+            self._scanner.add(self._load_new_tokens())
+
+        occurrences_list = [self._scanner.find(text) for text in texts]
+        tokens = {
+            text[start:end]
+            for text, occurrences in zip(texts, occurrences_list)
+            for start, end in occurrences
+        }
+        with self._lock:
+            originals = self._get_originals(tokens)
+
+        return [
+            self.__replace_tokens(text, occurrences, originals)
+            for text, occurrences in zip(texts, occurrences_list)
+        ]
+
+    def __replace_tokens(
+        self,
+        text: str,
+        occurrences: List[Tuple[int, int]],
+        originals: Dict[str, Tuple[str, str]],
+    ) -> EngineResult:
+        parts = []
+        items = []
+        position = 0
+        output_length = 0
+        for start, end in occurrences:
+            original_text, entity_type = originals[text[start:end]]
+            parts.append(text[position:start])
+            output_length += start - position
+            parts.append(original_text)
+            items.append(
+                OperatorResult(
+                    start=output_length,
+                    end=output_length + len(original_text),
+                    entity_type=entity_type,
+                    text=original_text,
+                    operator=self.OPERATOR_NAME,
+                )
+            )
+            output_length += len(original_text)
+            position = end
+        parts.append(text[position:])
+        return EngineResult(text="".join(parts), items=items)
+
+    @contextmanager
+    def _transaction(self) -> Iterator[None]:
+        """Make the storage operations in the context atomic, if supported."""
+        yield
+
+    def _load_new_tokens(self) -> Iterable[str]:
+        """Return the tokens added to the storage by others, e.g. other processes."""
+        return ()
+
+    @abstractmethod
+    def _get_token(self, text: str, entity_type: str) -> Optional[str]:
+        """Return the stored token of a value, or None."""
+
+    @abstractmethod
+    def _get_originals(self, tokens: Iterable[str]) -> Dict[str, Tuple[str, str]]:
+        """Return the stored value and entity type of each known token."""
+
+    @abstractmethod
+    def _insert(self, token: str, text: str, entity_type: str) -> bool:
+        """Store a token, returning False if the token is already stored."""
+
+    @abstractmethod
+    def _count_tokens(self, entity_type: str) -> int:
+        """Return the number of stored tokens of an entity type.
+
+        Called for every new token, so it should be kept as a counter
+        rather than counted.
+        """
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored tokens."""
@@ -1,6 +1,9 @@
+from unittest.mock import patch
+
 import pytest
 
 from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.core import OperatorResolver
 from presidio_anonymizer.deanonymize_engine import DeanonymizeEngine
 from presidio_anonymizer.entities import (
     InvalidParamError,
@@ -92,7 +95,12 @@ def test_given_anonymize_with_encrypt_then_text_returned_with_encrypted_content(
 
 def test_given_request_deanonymizers_return_list():
     engine = DeanonymizeEngine()
-    expected_list = ["deanonymize_keep", "decrypt"]
+    expected_list = [
+        "deanonymize_keep",
+        "decrypt",
+        "deterministic_decrypt",
+        "detokenize",
+    ]
     anon_list = engine.get_deanonymizers()
 
     assert len(anon_list) == len(expected_list)
@@ -136,3 +144,51 @@ def test_remove_deanonymizer_removes_anonymizer():
     engine.remove_deanonymizer(DeanonymizeKeep)
     deanonymizers = engine.get_deanonymizers()
     assert len(deanonymizers) == num_of_deanonymizers - 1
+
+
+def test_given_shared_operator_resolver_then_decrypt_validated_once():
+    text = "My name is S184CMt9Drj7QaKQ21JTrpYzghnboTF9pn/neN8JME0="
+    encryption_results = [OperatorResult(start=11, end=55, entity_type="PERSON")]
+    operators = {"DEFAULT": OperatorConfig(Decrypt.NAME, {"key": "WmZq4t7w!z%C&F)J"})}
+    engine = DeanonymizeEngine()
+    operator_resolver = OperatorResolver(
+        engine.operators_factory, OperatorType.Deanonymize
+    )
+
+    with patch.object(Decrypt, "validate", autospec=True) as validate:
+        texts = [
+            engine.deanonymize(
+                text,
+                encryption_results,
+                operators,
+                operator_resolver=operator_resolver,
+            ).text
+            for _ in range(3)
+        ]
+
+    assert texts == ["My name is Chloë"] * 3
+    assert validate.call_count == 1
+
+
+def test_given_anonymize_with_deterministic_encrypt_then_equal_values_decrypted():
+    text = "Chloë met Chloë"
+    key = "WmZq4t7w!z%C&F)JWmZq4t7w!z%C&F)J"
+    analyzer_results = [
+        RecognizerResult("PERSON", 0, 5, 0.8),
+        RecognizerResult("PERSON", 10, 15, 0.8),
+    ]
+
+    anonymize_result = AnonymizerEngine().anonymize(
+        text,
+        analyzer_results,
+        {"PERSON": OperatorConfig("deterministic_encrypt", {"key": key})},
+    )
+    first, second = sorted(anonymize_result.items, key=lambda item: item.start)
+    assert first.text == second.text
+
+    decryption = DeanonymizeEngine().deanonymize(
+        anonymize_result.text,
+        anonymize_result.items,
+        {"PERSON": OperatorConfig("deterministic_decrypt", {"key": key})},
+    )
+    assert decryption.text == text
@@ -0,0 +1,49 @@
+import pytest
+
+from presidio_anonymizer.entities import InvalidParamError
+from presidio_anonymizer.operators import (
+    AESSIVCipher,
+    DeterministicDecrypt,
+    DeterministicEncrypt,
+)
+
+KEY = "256bitslengthkey256bitslengthkey"
+
+
+def test_given_anonymize_then_same_text_returns_same_encrypted_text():
+    encrypted_text = DeterministicEncrypt().operate(text="text", params={"key": KEY})
+
+    assert encrypted_text == AESSIVCipher.encrypt(KEY.encode("utf8"), "text")
+    assert encrypted_text == DeterministicEncrypt().operate(
+        text="text", params={"key": KEY.encode("utf8")}
+    )
+
+
+def test_given_encrypted_text_then_deterministic_decrypt_returns_text():
+    encrypted_text = DeterministicEncrypt().operate(text="text", params={"key": KEY})
+
+    decrypted_text = DeterministicDecrypt().operate(
+        text=encrypted_text, params={"key": KEY}
+    )
+
+    assert decrypted_text == "text"
+
+
+@pytest.mark.parametrize("key", [KEY, KEY.encode("utf8"), "1" * 64])
+def test_given_verifying_an_valid_length_key_no_exceptions_raised(key):
+    DeterministicEncrypt().validate(params={"key": key})
+    DeterministicDecrypt().validate(params={"key": key})
+
+
+@pytest.mark.parametrize("key", ["128bitslengthkey", b"key"])
+def test_given_verifying_an_invalid_length_key_then_ipe_raised(key):
+    with pytest.raises(
+        InvalidParamError,
+        match="Invalid input, key must be of length 256, 384 or 512 bits",
+    ):
+        DeterministicEncrypt().validate(params={"key": key})
+
+
+def test_given_deterministic_operators_then_memoizable():
+    assert DeterministicEncrypt().is_deterministic()
+    assert DeterministicDecrypt().is_deterministic()
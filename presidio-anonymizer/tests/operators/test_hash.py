@@ -115,6 +115,52 @@ def test_when_hash_type_is_empty_string_then_ipe_raised():
         Hash().validate(params)
 
 
+@pytest.mark.parametrize(
+    "key, hash_type, anonymized_text",
+    [
+        # fmt: off
+        (
+            "tenant-key",
+            "sha256",
+            "9f95209e7da0138beb4c3ad44bf118af88fcbc0c97f3df8b9b94e82581ccf639",
+        ),
+        (
+            b"tenant-key",
+            "sha256",
+            "9f95209e7da0138beb4c3ad44bf118af88fcbc0c97f3df8b9b94e82581ccf639",
+        ),
+        (
+            "tenant-key",
+            "sha512",
+            "f1ec6983c8b539573d2b76682f578c5de721fc2dd67407679900aaed66b0d6be"
+            "e8757a67573bd42e98a3ade76ac0b2b3fab937ebb19c08c5e6e4e83e77616a61",
+        ),
+        # fmt: on
+    ],
+)
+def test_when_given_key_then_expected_hmac_string_returned(
+    key, hash_type, anonymized_text
+):
+    params = {"key": key, "hash_type": hash_type}
+    Hash().validate(params)
+
+    assert Hash().operate(text="123456", params=params) == anonymized_text
+
+
+def test_when_given_different_keys_then_hashes_differ():
+    first = Hash().operate(text="123456", params={"key": "tenant-1"})
+    second = Hash().operate(text="123456", params={"key": "tenant-2"})
+
+    assert first != second
+    assert first != Hash().operate(text="123456", params={})
+
+
+@pytest.mark.parametrize("key", ["", b"", 1234])
+def test_when_key_is_invalid_then_ipe_raised(key):
+    with pytest.raises(InvalidParamError, match="Invalid input, key must be"):
+        Hash().validate({"key": key})
+
+
 def test_when_validate_anonymizer_then_correct_name():
     assert Hash().operator_name() == "hash"
 
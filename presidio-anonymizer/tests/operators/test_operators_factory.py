@@ -6,7 +6,7 @@ from presidio_anonymizer.operators import OperatorsFactory, OperatorType, AHDS_A
 
 def test_given_anonymizers_list_then_all_classes_are_there():
     anonymizers = OperatorsFactory().get_anonymizers()
-    expected_length = 8 if AHDS_AVAILABLE else 7
+    expected_length = 10 if AHDS_AVAILABLE else 9
     assert len(anonymizers) == expected_length
     expected_classes = [
         "hash",
@@ -14,8 +14,10 @@ def test_given_anonymizers_list_then_all_classes_are_there():
         "redact",
         "replace",
         "encrypt",
+        "deterministic_encrypt",
         "custom",
         "keep",
+        "tokenize",
     ]
     if AHDS_AVAILABLE:
         expected_classes.append("surrogate_ahds")
@@ -26,8 +28,8 @@ def test_given_anonymizers_list_then_all_classes_are_there():
 
 def test_given_decryptors_list_then_all_classes_are_there():
     decryptors = OperatorsFactory().get_deanonymizers()
-    assert len(decryptors) == 2
-    for class_name in ["decrypt"]:
+    assert len(decryptors) == 4
+    for class_name in ["decrypt", "deterministic_decrypt", "detokenize"]:
         assert decryptors.get(class_name)
 
 
@@ -128,3 +130,32 @@ def test_remove_missing_deanonymizer_raises_exception(mock_deanonymizer_cls):
         match="Operator MockDeanonymizer not found in deanonymizers list",
     ):
         factory.remove_deanonymize_operator(mock_deanonymizer_cls)
+
+
+def test_given_stateless_operator_then_same_instance_is_returned():
+    factory = OperatorsFactory()
+    first = factory.create_operator_class("replace", OperatorType.Anonymize)
+    second = factory.create_operator_class("replace", OperatorType.Anonymize)
+    assert first.is_stateless()
+    assert first is second
+
+
+def test_given_stateful_operator_then_new_instance_is_returned(mock_anonymizer_cls):
+    factory = OperatorsFactory()
+    factory.add_anonymize_operator(mock_anonymizer_cls)
+    first = factory.create_operator_class("MockAnonymizer", OperatorType.Anonymize)
+    second = factory.create_operator_class("MockAnonymizer", OperatorType.Anonymize)
+    assert not first.is_stateless()
+    assert first is not second
+
+
+def test_given_operator_declared_stateless_then_same_instance_is_returned(
+    mock_anonymizer_cls,
+):
+    mock_anonymizer_cls.STATELESS = True
+    factory = OperatorsFactory()
+    factory.add_anonymize_operator(mock_anonymizer_cls)
+    first = factory.create_operator_class("MockAnonymizer", OperatorType.Anonymize)
+    second = factory.create_operator_class("MockAnonymizer", OperatorType.Anonymize)
+    assert first.is_stateless()
+    assert first is second
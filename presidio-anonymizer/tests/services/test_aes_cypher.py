@@ -29,6 +29,41 @@ def test_given_valid_key_and_text_then_text_encryption_and_decryption_returns_sa
     assert text == decrypted_text
 
 
+@pytest.mark.parametrize("batch_size", [1, 2, 1024])
+def test_given_texts_then_encrypt_many_and_decrypt_many_return_same_texts(batch_size):
+    key = b"1111111111111111"
+    texts = ["text_for_encryption", "", "PII with a Résumé", "😈" * 20, "a" * 16]
+
+    encrypted_texts = AESCipher.encrypt_many(key, texts, batch_size=batch_size)
+
+    assert AESCipher.decrypt_many(key, encrypted_texts, batch_size=batch_size) == texts
+    assert [AESCipher.decrypt(key, text) for text in encrypted_texts] == texts
+
+
+def test_given_encrypted_texts_then_decrypt_many_returns_decrypted_texts():
+    key = os.urandom(32)
+    texts = ["text_for_encryption", "面汤", "הצפן אותי"]
+
+    encrypted_texts = [AESCipher.encrypt(key, text) for text in texts]
+
+    assert AESCipher.decrypt_many(key, encrypted_texts) == texts
+
+
+def test_given_same_texts_then_encrypt_many_returns_different_texts():
+    key = b"1111111111111111"
+
+    encrypted_texts = AESCipher.encrypt_many(key, ["text"] * 2)
+
+    assert encrypted_texts[0] != encrypted_texts[1]
+
+
+def test_given_invalid_encrypted_text_length_then_decrypt_many_raises():
+    encrypted_text = AESCipher.encrypt(b"1111111111111111", "text")[:-4]
+
+    with pytest.raises(ValueError, match="multiple of the block length"):
+        AESCipher.decrypt_many(b"1111111111111111", [encrypted_text])
+
+
 def test_given_invalid_key_length_then_value_error_raised():
     invalid_length_key = b"1111"
     with pytest.raises(ValueError, match="Invalid key size \(32\) for AES"):
@@ -0,0 +1,75 @@
+import os
+
+import pytest
+from cryptography.exceptions import InvalidTag
+
+from presidio_anonymizer.operators import AESSIVCipher
+
+
+@pytest.mark.parametrize(
+    # fmt: off
+    "key,text",
+    [
+        (b'1' * 32, "text_for_encryption"),  # 256 bits key
+        (b'1' * 48, "text_for_encryption"),  # 384 bits key
+        (b'1' * 64, "text_for_encryption"),  # 512 bits key
+        (b'1' * 32, "PII with a Résumé"),  # Text with e-acute
+        (b'1' * 32, "面汤"),  # Chinese text
+        (b'1' * 32, "😈😈😈😈"),  # Text with EmojiSources character
+        (b'1' * 32, ""),  # Empty text
+        (os.urandom(32), "text_for_encryption"),  # random 256 bits key
+    ],
+    # fmt: on
+)
+def test_given_valid_key_and_text_then_text_encryption_and_decryption_returns_same_text(
+    key, text
+):
+    encrypted_text = AESSIVCipher.encrypt(key, text)
+
+    assert AESSIVCipher.decrypt(key, encrypted_text) == text
+
+
+def test_given_same_text_then_same_encrypted_text_returned():
+    key = os.urandom(32)
+
+    assert AESSIVCipher.encrypt(key, "text") == AESSIVCipher.encrypt(key, "text")
+    assert AESSIVCipher.encrypt(key, "text") != AESSIVCipher.encrypt(key, "text2")
+    assert AESSIVCipher.encrypt(key, "text") != AESSIVCipher.encrypt(
+        os.urandom(32), "text"
+    )
+
+
+def test_given_texts_then_encrypt_many_equals_encrypt():
+    key = b"1" * 32
+    texts = ["text_for_encryption", "", "面汤", "text_for_encryption"]
+
+    encrypted_texts = AESSIVCipher.encrypt_many(key, texts)
+
+    assert encrypted_texts == [AESSIVCipher.encrypt(key, text) for text in texts]
+    assert AESSIVCipher.decrypt_many(key, encrypted_texts) == texts
+
+
+def test_given_other_key_then_decrypt_raises_invalid_tag():
+    encrypted_text = AESSIVCipher.encrypt(b"1" * 32, "text")
+
+    with pytest.raises(InvalidTag):
+        AESSIVCipher.decrypt(b"2" * 32, encrypted_text)
+
+
+@pytest.mark.parametrize(
+    # fmt: off
+    "key,is_valid",
+    [
+        (b'', False),  # Empty bit-string key
+        (b'1' * 16, False),  # AES-128 key
+        (b'1' * 32, True),  # 256 bits key
+        (b'1' * 33, False),  # 264 bits key
+        (b'1' * 48, True),  # 384 bits key
+        (b'1' * 64, True),  # 512 bits key
+    ],
+    # fmt: on
+)
+def test_given_is_valid_key_size_called_then_aes_siv_valid_key_sizes_returned(
+    key, is_valid
+):
+    assert AESSIVCipher.is_valid_key_size(key) == is_valid
@@ -4,10 +4,21 @@ import os
 from unittest.mock import Mock, patch, MagicMock
 import pytest
 
+from presidio_analyzer.llm_utils.remote_client_registry import (
+    set_remote_client_registry,
+)
 from presidio_anonymizer.operators import AHDSSurrogate
 from presidio_anonymizer.entities import InvalidParamError
 
 
+@pytest.fixture(autouse=True)
+def fresh_remote_client_registry():
+    """Start every test without cached clients and credentials."""
+    set_remote_client_registry(None)
+    yield
+    set_remote_client_registry(None)
+
+
 @pytest.fixture
 def mock_azure_modules():
     """Mock Azure modules to avoid import dependencies."""
@@ -76,7 +87,7 @@ class TestAHDSCredentialSelection:
                 # Verify DeidentificationClient was initialized with credential from helper
                 mock_azure_modules['DeidentificationClient'].assert_called_once()
                 call_args = mock_azure_modules['DeidentificationClient'].call_args
-                assert call_args[0][1] == mock_credential
+                assert call_args[0][1].credential == mock_credential
 
     def test_uses_chained_credential_in_production_environment(self, mock_azure_modules):
         """Test that get_azure_credential is called (which uses ChainedTokenCredential for ENV=production)."""
@@ -99,7 +110,7 @@ class TestAHDSCredentialSelection:
                 
                 # Verify DeidentificationClient was initialized with credential from helper
                 call_args = mock_azure_modules['DeidentificationClient'].call_args
-                assert call_args[0][1] == mock_credential
+                assert call_args[0][1].credential == mock_credential
 
     def test_uses_chained_credential_when_env_var_not_set(self, mock_azure_modules):
         """Test that get_azure_credential is called when ENV is not set (defaults to production mode)."""
@@ -141,11 +152,36 @@ class TestAHDSCredentialSelection:
                     mock_credential = MagicMock()
                     mock_azure_modules['get_azure_credential'].return_value = mock_credential
                     
-                    # Reset mocks
+                    # Reset mocks and cached clients
+                    set_remote_client_registry(None)
                     mock_azure_modules['get_azure_credential'].reset_mock()
                     mock_azure_modules['DeidentificationClient'].reset_mock()
                     
                     result = operator.operate("test text", {"entities": []})
                     
                     # Verify get_azure_credential was called
-                    mock_azure_modules['get_azure_credential'].assert_called_once(), f"Failed for environment: {env_value}"
\ No newline at end of file
+                    mock_azure_modules['get_azure_credential'].assert_called_once(), f"Failed for environment: {env_value}"
+
+    def test_client_and_credential_reused_across_calls(self, mock_azure_modules):
+        """Test that the client and credential are created once per endpoint."""
+        operator = AHDSSurrogate()
+        mock_result = MagicMock()
+        mock_result.output_text = "anonymized text"
+        mock_client_instance = MagicMock()
+        mock_client_instance.deidentify_text.return_value = mock_result
+        mock_azure_modules['DeidentificationClient'].return_value = mock_client_instance
+
+        with patch.object(operator, '_convert_to_tagged_entities', return_value=[]):
+            for _ in range(3):
+                operator.operate(
+                    "test text",
+                    {"entities": [], "endpoint": "https://test.endpoint.com"},
+                )
+            operator.operate(
+                "test text",
+                {"entities": [], "endpoint": "https://other.endpoint.com"},
+            )
+
+        mock_azure_modules['get_azure_credential'].assert_called_once()
+        assert mock_azure_modules['DeidentificationClient'].call_count == 2
+        assert mock_client_instance.deidentify_text.call_count == 4
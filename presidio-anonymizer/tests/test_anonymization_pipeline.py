@@ -0,0 +1,127 @@
+from typing import Iterable
+from unittest.mock import patch
+
+import pytest
+
+from presidio_anonymizer import AnonymizationPipeline, AnonymizerEngine
+from presidio_anonymizer.entities import OperatorConfig
+from presidio_anonymizer.operators import Mask
+
+presidio_analyzer = pytest.importorskip("presidio_analyzer")
+nlp_engine = pytest.importorskip("presidio_analyzer.nlp_engine")
+
+TEXTS = [
+    "Call me at 212-555-1234 or write to john@example.com",
+    "nothing to anonymize here",
+    "My email is jane@example.org",
+]
+
+
+class TokenNlpEngine(nlp_engine.NlpEngine):
+    """NLP engine returning empty artifacts, for pattern recognizers only."""
+
+    def load(self):
+        pass
+
+    def is_loaded(self):
+        return True
+
+    def process_text(self, text, language):
+        return nlp_engine.NlpArtifacts([], [], [], [], None, language)
+
+    def process_batch(self, texts: Iterable[str], language: str, **kwargs):
+        for text in texts:
+            yield text, self.process_text(text, language)
+
+    def is_stopword(self, word, language):
+        return False
+
+    def is_punct(self, word, language):
+        return False
+
+    def get_supported_entities(self):
+        return []
+
+    def get_supported_languages(self):
+        return ["en"]
+
+
+@pytest.fixture(scope="module")
+def pipeline():
+    registry = presidio_analyzer.RecognizerRegistry()
+    registry.load_predefined_recognizers(languages=["en"])
+    analyzer_engine = presidio_analyzer.AnalyzerEngine(
+        registry=registry, nlp_engine=TokenNlpEngine(), supported_languages=["en"]
+    )
+    return AnonymizationPipeline(
+        analyzer_engine=analyzer_engine, anonymizer_engine=AnonymizerEngine()
+    )
+
+
+def analyze_then_anonymize(pipeline, text, operators=None):
+    analyzer_results = pipeline.analyzer_engine.analyze(text, language="en")
+    return pipeline.anonymizer_engine.anonymize(text, analyzer_results, operators)
+
+
+def test_given_text_then_run_equals_analyze_then_anonymize(pipeline):
+    result = pipeline.run(TEXTS[0], language="en")
+
+    assert result == analyze_then_anonymize(pipeline, TEXTS[0])
+    assert "<EMAIL_ADDRESS>" in result.text
+
+
+def test_given_analyze_kwargs_then_passed_to_analyzer(pipeline):
+    result = pipeline.run(TEXTS[0], language="en", entities=["EMAIL_ADDRESS"])
+
+    assert result.text == "Call me at 212-555-1234 or write to <EMAIL_ADDRESS>"
+
+
+@pytest.mark.parametrize("batch_size", [1, 2, 32])
+def test_given_texts_then_batch_and_iterator_equal_single_runs(pipeline, batch_size):
+    operators = {"EMAIL_ADDRESS": OperatorConfig("hash")}
+    expected = [analyze_then_anonymize(pipeline, text, operators) for text in TEXTS]
+
+    assert (
+        pipeline.run_batch(TEXTS, language="en", operators=operators, batch_size=2)
+        == expected
+    )
+    assert (
+        list(
+            pipeline.run_iterator(
+                iter(TEXTS), language="en", operators=operators, batch_size=batch_size
+            )
+        )
+        == expected
+    )
+
+
+def test_given_iterator_then_texts_consumed_lazily(pipeline):
+    consumed = []
+
+    def texts():
+        for text in TEXTS:
+            consumed.append(text)
+            yield text
+
+    results = pipeline.run_iterator(texts(), language="en", batch_size=1)
+    next(results)
+
+    assert consumed == TEXTS[:1]
+
+
+def test_given_batch_then_operator_validated_once(pipeline):
+    operators = {
+        "DEFAULT": OperatorConfig(
+            "mask", {"masking_char": "*", "chars_to_mask": 4, "from_end": True}
+        )
+    }
+
+    with patch.object(Mask, "validate", autospec=True) as validate:
+        pipeline.run_batch(TEXTS * 5, language="en", operators=operators)
+
+    assert validate.call_count == 2
+
+
+def test_given_invalid_batch_size_then_iterator_raises(pipeline):
+    with pytest.raises(ValueError):
+        list(pipeline.run_iterator(TEXTS, language="en", batch_size=0))
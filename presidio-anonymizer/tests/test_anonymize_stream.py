@@ -0,0 +1,145 @@
+import io
+import random
+
+import pytest
+
+from presidio_anonymizer import AnonymizerEngine
+from presidio_anonymizer.core import TextStreamBuffer
+from presidio_anonymizer.entities import (
+    ConflictResolutionStrategy,
+    InvalidParamError,
+    OperatorConfig,
+    RecognizerResult,
+)
+
+TEXT = "Call John Smith at 212-555-1234.\nJohn  Smith lives in Paris.\n"
+RESULTS = [
+    RecognizerResult("PERSON", 5, 9, 0.8),
+    RecognizerResult("PERSON", 5, 15, 0.85),
+    RecognizerResult("PHONE_NUMBER", 19, 31, 0.9),
+    RecognizerResult("PERSON", 33, 37, 0.8),
+    RecognizerResult("PERSON", 39, 44, 0.8),
+    RecognizerResult("LOCATION", 54, 59, 0.7),
+]
+
+
+def anonymize_stream(engine, reader, analyzer_results, **kwargs):
+    writer = io.StringIO()
+    items = []
+    engine.anonymize_stream(
+        reader, writer, iter(analyzer_results), item_callback=items.append, **kwargs
+    )
+    return writer.getvalue(), items
+
+
+def random_case(seed):
+    rnd = random.Random(seed)
+    text = "".join(rnd.choice("ab  c\n") for _ in range(rnd.randint(0, 60)))
+    results = []
+    for _ in range(rnd.randint(0, 12)):
+        start = rnd.randint(0, len(text))
+        end = rnd.randint(start, min(len(text), start + 10))
+        results.append(
+            RecognizerResult(rnd.choice("AB"), start, end, rnd.choice([0.5, 0.8]))
+        )
+    results.sort(key=lambda result: result.start)
+    return text, results
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1000])
+def test_given_chunks_then_stream_equals_anonymize(chunk_size):
+    engine = AnonymizerEngine()
+    operators = {
+        "PHONE_NUMBER": OperatorConfig(
+            "mask", {"masking_char": "*", "chars_to_mask": 4, "from_end": True}
+        )
+    }
+    expected = engine.anonymize(TEXT, RESULTS, operators)
+
+    text, items = anonymize_stream(
+        engine, io.StringIO(TEXT), RESULTS, operators=operators, chunk_size=chunk_size
+    )
+
+    assert text == expected.text
+    assert items == sorted(expected.items)
+
+
+@pytest.mark.parametrize("seed", range(30))
+@pytest.mark.parametrize("conflict_resolution", list(ConflictResolutionStrategy))
+def test_given_random_results_then_stream_equals_anonymize(seed, conflict_resolution):
+    engine = AnonymizerEngine()
+    text, results = random_case(seed)
+    expected = engine.anonymize(text, results, conflict_resolution=conflict_resolution)
+
+    chunks = [text[i : i + 3] for i in range(0, len(text), 3)]
+    actual_text, items = anonymize_stream(
+        engine, chunks, results, conflict_resolution=conflict_resolution
+    )
+
+    assert actual_text == expected.text
+    assert items == sorted(expected.items)
+
+
+def test_given_long_stream_then_output_written_incrementally():
+    engine = AnonymizerEngine()
+    line = "user john@example.com logged in\n"
+    consumed = []
+
+    def chunks():
+        for i in range(100):
+            consumed.append(i)
+            yield line
+
+    def results():
+        for i in range(100):
+            start = i * len(line) + 5
+            yield RecognizerResult("EMAIL_ADDRESS", start, start + 16, 1)
+
+    class Writer:
+        consumed_on_first_write = None
+
+        def write(self, text):
+            if self.consumed_on_first_write is None:
+                self.consumed_on_first_write = len(consumed)
+
+    writer = Writer()
+    engine.anonymize_stream(chunks(), writer, results())
+
+    assert writer.consumed_on_first_write <= 2
+    assert len(consumed) == 100
+
+
+def test_given_unsorted_results_then_raises():
+    results = [RESULTS[2], RESULTS[0]]
+
+    with pytest.raises(ValueError, match="sorted by start"):
+        anonymize_stream(AnonymizerEngine(), io.StringIO(TEXT), results)
+
+
+def test_given_result_after_end_of_stream_then_raises():
+    results = [RecognizerResult("PERSON", 5, len(TEXT) + 5, 0.8)]
+
+    with pytest.raises(InvalidParamError):
+        anonymize_stream(AnonymizerEngine(), io.StringIO(TEXT), results)
+
+
+def test_given_no_results_then_text_copied():
+    assert anonymize_stream(AnonymizerEngine(), io.StringIO(TEXT), []) == (TEXT, [])
+
+
+def test_given_skipped_text_then_buffer_writes_rest():
+    writer = io.StringIO()
+    text_buffer = TextStreamBuffer(iter(["abc", "def", "ghi"]), writer)
+
+    text_buffer.read_until(5, flush_until=2)
+    assert writer.getvalue() == "ab"
+    assert text_buffer.get_text(2, 5) == "cde"
+    assert text_buffer.has_only(2, 3, "c", flush_until=2)
+    assert not text_buffer.has_only(2, 4, "c", flush_until=2)
+
+    text_buffer.write("X")
+    text_buffer.skip_until(5)
+    text_buffer.write_rest()
+
+    assert writer.getvalue() == "abXfghi"
+    assert text_buffer.output_length == 7
@@ -17,7 +17,17 @@ from presidio_anonymizer.operators import OperatorType, AHDS_AVAILABLE
 
 def test_given_request_anonymizers_return_list():
     engine = AnonymizerEngine()
-    expected_list = {"hash", "mask", "redact", "replace", "custom", "keep", "encrypt"}
+    expected_list = {
+        "hash",
+        "mask",
+        "redact",
+        "replace",
+        "custom",
+        "keep",
+        "encrypt",
+        "deterministic_encrypt",
+        "tokenize",
+    }
     if AHDS_AVAILABLE:
         expected_list.add("surrogate_ahds")
     anon_list = set(engine.get_anonymizers())
@@ -58,6 +68,34 @@ def test_given_custom_anonymizer_then_we_manage_to_anonymize_successfully():
     assert result == resp
 
 
+def test_given_several_entities_then_operator_validated_once_per_entity_type():
+    engine = AnonymizerEngine()
+    text = "John met Jane and Jill, call 555-1234 or 555-9876"
+    analyzer_results = [
+        RecognizerResult("PERSON", 0, 4, 0.8),
+        RecognizerResult("PERSON", 9, 13, 0.8),
+        RecognizerResult("PERSON", 18, 22, 0.8),
+        RecognizerResult("PHONE_NUMBER", 29, 37, 0.8),
+        RecognizerResult("PHONE_NUMBER", 41, 49, 0.8),
+    ]
+    calls = []
+
+    def upper(value):
+        calls.append(value)
+        return value.upper()
+
+    result = engine.anonymize(
+        text,
+        analyzer_results,
+        {"DEFAULT": OperatorConfig("custom", {"lambda": upper})},
+    )
+
+    assert result.text == "JOHN met JANE and JILL, call 555-1234 or 555-9876"
+    # The validation calls the function once with "PII", for each entity type
+    assert calls.count("PII") == 2
+    assert len(calls) == 7
+
+
 def test_given_none_as_anonymziers_list_then_we_fall_to_default():
     engine = AnonymizerEngine()
     text = "please REPLACE ME."
@@ -257,6 +295,23 @@ def test_given_analyzer_result_input_then_it_is_not_mutated():
     ):
         assert original_result == copy_result
 
+
+def test_given_operators_without_default_then_they_are_not_mutated():
+    engine = AnonymizerEngine()
+    operators = {"PERSON": OperatorConfig("redact")}
+
+    result = engine.anonymize(
+        "Jane lives in Paris",
+        [
+            RecognizerResult(start=0, end=4, entity_type="PERSON", score=1.0),
+            RecognizerResult(start=14, end=19, entity_type="LOCATION", score=1.0),
+        ],
+        operators,
+    )
+
+    assert result.text == " lives in <LOCATION>"
+    assert list(operators) == ["PERSON"]
+
 def test_given_unsorted_input_then_merged_correctly():
     engine = AnonymizerEngine()
     text = "Jane Doe is a person"
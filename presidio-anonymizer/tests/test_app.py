@@ -0,0 +1,83 @@
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("flask")
+
+from app import Server  # noqa: E402
+
+
+@pytest.fixture
+def limited_server(monkeypatch):
+    monkeypatch.setenv("MAX_CONCURRENT_REQUESTS", "1")
+    monkeypatch.setenv("MAX_QUEUED_REQUESTS", "0")
+    return Server()
+
+
+def test_given_busy_worker_then_requests_are_rejected_with_429(limited_server):
+    client = limited_server.app.test_client()
+    assert limited_server.request_limiter.acquire()
+    try:
+        response = client.get("/anonymizers")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert response.json == {"error": "Too many requests"}
+
+        # Probes are not limited
+        assert client.get("/health").status_code == 200
+        assert client.get("/ready").status_code == 200
+    finally:
+        limited_server.request_limiter.release()
+
+    # Slots of completed requests are released
+    assert client.get("/anonymizers").status_code == 200
+    assert client.get("/anonymizers").status_code == 200
+
+
+def test_given_successful_warmup_then_ready():
+    response = Server().app.test_client().get("/ready")
+    assert response.status_code == 200
+
+
+def test_given_failed_warmup_then_not_ready():
+    with patch.object(Server, "_warmup", side_effect=RuntimeError("failed")):
+        server = Server()
+    response = server.app.test_client().get("/ready")
+    assert response.status_code == 503
+    assert response.json == {"error": "Presidio Anonymizer service is not ready"}
+    assert server.app.test_client().get("/health").status_code == 200
+
+
+def test_given_malformed_operators_query_param_then_bad_request():
+    response = Server().app.test_client().post(
+        "/anonymize/batch?anonymizers={not json",
+        data='"John Smith"\n',
+        content_type="application/x-ndjson",
+    )
+    assert response.status_code == 400
+    assert response.json == {"error": "Invalid anonymizers json"}
+
+
+def test_given_ndjson_larger_than_max_bytes_then_error_record_streamed(monkeypatch):
+    monkeypatch.setenv("BATCH_MAX_REQUEST_BYTES", "64")
+    client = Server().app.test_client()
+    item = {"id": "a", "text": "John", "analyzer_results": []}
+    body = json.dumps(item) + "\n" + json.dumps("x" * 100) + "\n"
+
+    # A chunked request has no Content-Length to reject upfront
+    response = client.post(
+        "/anonymize/batch?batch_size=1",
+        input_stream=io.BytesIO(body.encode()),
+        content_type="application/x-ndjson",
+        headers={"Transfer-Encoding": "chunked"},
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.data.decode().splitlines()]
+    assert lines == [
+        {"id": "a", "text": "John", "items": []},
+        {"error": "Batch request is larger than 64 bytes"},
+    ]
@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from presidio_anonymizer import BatchAnonymizerEngine
@@ -6,6 +8,7 @@ from presidio_anonymizer.entities import (
     DictRecognizerResult,
     OperatorConfig,
 )
+from presidio_anonymizer.operators import AESCipher
 
 
 @pytest.fixture(scope="module")
@@ -134,3 +137,173 @@ def test_given_custom_anonymizer_we_anonymize_dict_correctly(engine, analyzer_re
     assert anonymize_results == {
         "name": ["<ENTITY: John>", "<ENTITY: Jill>", "<ENTITY: Jack>"]
     }
+
+
+def test_given_batch_then_operator_validated_once(engine, texts, recognizer_results_list):
+    calls = []
+
+    def upper(value):
+        calls.append(value)
+        return value.upper()
+
+    anonymize_results = engine.anonymize_list(
+        texts,
+        recognizer_results_list,
+        operators={"PERSON": OperatorConfig("custom", {"lambda": upper})},
+    )
+
+    assert anonymize_results == ["JOHN", "JILL", "JACK"]
+    assert calls == ["PII", "John", "Jill", "Jack"]
+
+
+@pytest.fixture(scope="module")
+def many_texts():
+    return [
+        "John Smith lives in Paris",
+        "nothing to anonymize",
+        "Call 212-555-1234 or 212-555-9876",
+        "Jane",
+    ]
+
+
+@pytest.fixture(scope="module")
+def many_results():
+    return [
+        [
+            RecognizerResult("PERSON", 0, 10, 0.85),
+            RecognizerResult("PERSON", 0, 4, 0.6),
+            RecognizerResult("LOCATION", 20, 25, 0.7),
+        ],
+        [],
+        [
+            RecognizerResult("PHONE_NUMBER", 5, 17, 0.9),
+            RecognizerResult("PHONE_NUMBER", 21, 33, 0.9),
+        ],
+        [RecognizerResult("PERSON", 0, 4, 0.85)],
+    ]
+
+
+def flatten_results(results_list):
+    columns = ([], [], [], [], [])
+    for row_id, results in enumerate(results_list):
+        for result in results:
+            for column, value in zip(
+                columns,
+                (row_id, result.entity_type, result.start, result.end, result.score),
+            ):
+                column.append(value)
+    return columns
+
+
+@pytest.mark.parametrize(
+    "operators",
+    [
+        None,
+        {
+            "PERSON": OperatorConfig(
+                "mask", {"masking_char": "*", "chars_to_mask": 3, "from_end": False}
+            )
+        },
+        {"DEFAULT": OperatorConfig("hash")},
+    ],
+)
+def test_given_parallel_arrays_then_anonymize_many_equals_anonymize(
+    engine, many_texts, many_results, operators
+):
+    anonymized_texts, items = engine.anonymize_many(
+        many_texts,
+        *flatten_results(many_results),
+        operators=operators,
+        return_items=True,
+    )
+
+    for text, results, anonymized_text, text_items in zip(
+        many_texts, many_results, anonymized_texts, items
+    ):
+        expected = engine.anonymizer_engine.anonymize(text, results, operators)
+        assert anonymized_text == expected.text
+        assert text_items == expected.items
+
+    assert engine.anonymize_many(
+        many_texts, *flatten_results(many_results), operators=operators
+    ) == anonymized_texts
+
+
+def test_given_non_str_texts_then_anonymize_many_matches_anonymize_list(engine):
+    texts = ["John", 1234, None, {"a": 1}]
+    results_list = [[RecognizerResult("PERSON", 0, 4, 0.85)]] + [[]] * 3
+
+    assert engine.anonymize_many(
+        texts, *flatten_results(results_list)
+    ) == engine.anonymize_list(texts, results_list)
+
+
+@pytest.mark.parametrize(
+    "columns, error",
+    [
+        (([0], ["PERSON"], [0], [4], []), "same length"),
+        (([1], ["PERSON"], [0], [4], [0.85]), "Invalid row id 1"),
+        (([-1], ["PERSON"], [0], [4], [0.85]), "Invalid row id -1"),
+    ],
+)
+def test_given_invalid_arrays_then_anonymize_many_raises(engine, columns, error):
+    with pytest.raises(ValueError, match=error):
+        engine.anonymize_many(["John"], *columns)
+
+
+def test_given_process_pool_then_anonymize_many_output_unchanged(
+    engine, many_texts, many_results
+):
+    texts = many_texts * 5
+    results_list = many_results * 5
+    operators = {"DEFAULT": OperatorConfig("hash", {"hash_type": "sha512"})}
+
+    expected = engine.anonymize_many(
+        texts, *flatten_results(results_list), operators=operators, return_items=True
+    )
+    actual = engine.anonymize_many(
+        texts,
+        *flatten_results(results_list),
+        operators=operators,
+        return_items=True,
+        n_process=2,
+        chunk_size=3,
+    )
+
+    assert actual == expected
+
+
+def test_given_encrypt_operator_then_values_encrypted_once_per_key(
+    engine, many_texts, many_results
+):
+    person_key = "WmZq4t7w!z%C&F)J"
+    default_key = b"1111111111111111"
+    operators = {
+        "PERSON": OperatorConfig("encrypt", {"key": person_key}),
+        "DEFAULT": OperatorConfig("encrypt", {"key": default_key}),
+    }
+
+    with patch.object(
+        AESCipher, "encrypt_many", wraps=AESCipher.encrypt_many
+    ) as encrypt_many:
+        anonymized_texts, items = engine.anonymize_many(
+            many_texts,
+            *flatten_results(many_results),
+            operators=operators,
+            return_items=True,
+        )
+
+    assert sorted(len(call.args[1]) for call in encrypt_many.call_args_list) == [2, 3]
+    expected = [
+        engine.anonymizer_engine.anonymize(text, results, operators)
+        for text, results in zip(many_texts, many_results)
+    ]
+    for text_items, expected_result in zip(items, expected):
+        assert [(item.start, item.entity_type) for item in text_items] == [
+            (item.start, item.entity_type) for item in expected_result.items
+        ]
+        for item, expected_item in zip(text_items, expected_result.items):
+            key = person_key.encode() if item.entity_type == "PERSON" else default_key
+            assert AESCipher.decrypt(key, item.text) == AESCipher.decrypt(
+                key, expected_item.text
+            )
@@ -1,4 +1,5 @@
 import pytest
+from hypothesis import given, settings, strategies as st
 
 from presidio_anonymizer import AnonymizerEngine
 from presidio_anonymizer.entities import (
@@ -163,3 +164,104 @@ def test_when_remove_intersections_conflict_selected_then_all_conflicts_handled(
 
     assert result.text == expected_result.text
     assert sorted(result.items) == sorted(expected_result.items)
+
+
+def remove_conflicts_by_pairwise_comparison(analyzer_results, conflict_resolution):
+    """Reference implementation, comparing each result with all other results."""
+    tmp_analyzer_results = []
+    other_elements = analyzer_results.copy()
+    for result in analyzer_results:
+        other_elements.remove(result)
+
+        is_merge_same_entity_type = False
+        for other_element in other_elements:
+            if other_element.entity_type != result.entity_type:
+                continue
+            if result.intersects(other_element) == 0:
+                continue
+
+            other_element.start = min(result.start, other_element.start)
+            other_element.end = max(result.end, other_element.end)
+            other_element.score = max(result.score, other_element.score)
+            is_merge_same_entity_type = True
+            break
+        if not is_merge_same_entity_type:
+            other_elements.append(result)
+            tmp_analyzer_results.append(result)
+
+    unique_elements = []
+    other_elements = tmp_analyzer_results.copy()
+    for result in tmp_analyzer_results:
+        other_elements.remove(result)
+        if not any(result.has_conflict(other) for other in other_elements):
+            other_elements.append(result)
+            unique_elements.append(result)
+
+    if conflict_resolution == ConflictResolutionStrategy.REMOVE_INTERSECTIONS:
+        unique_elements.sort(key=lambda element: element.start)
+        index = 0
+        while index < len(unique_elements) - 1:
+            current_entity = unique_elements[index]
+            next_entity = unique_elements[index + 1]
+            if current_entity.end <= next_entity.start:
+                index += 1
+            else:
+                if current_entity.score >= next_entity.score:
+                    next_entity.start = current_entity.end
+                else:
+                    current_entity.end = next_entity.start
+                unique_elements.sort(key=lambda element: element.start)
+        unique_elements = [
+            element for element in unique_elements if element.start <= element.end
+        ]
+    return unique_elements
+
+
+@st.composite
+def dense_analyzer_results(draw):
+    results = []
+    for _ in range(draw(st.integers(min_value=0, max_value=25))):
+        start = draw(st.integers(min_value=0, max_value=40))
+        results.append(
+            RecognizerResult(
+                entity_type=draw(st.sampled_from(["PERSON", "URL", "PHONE_NUMBER"])),
+                start=start,
+                end=start + draw(st.integers(min_value=0, max_value=12)),
+                score=draw(st.sampled_from([0.3, 0.5, 0.85, 1.0])),
+            )
+        )
+    results.sort(key=lambda x: (x.start, x.end))
+    return results
+
+
+def as_tuples(results):
+    return [
+        (result.entity_type, result.start, result.end, result.score)
+        for result in results
+    ]
+
+
+@settings(max_examples=500, deadline=None)
+@given(
+    analyzer_results=dense_analyzer_results(),
+    conflict_strategy=st.sampled_from(
+        [
+            ConflictResolutionStrategy.MERGE_SIMILAR_OR_CONTAINED,
+            ConflictResolutionStrategy.REMOVE_INTERSECTIONS,
+        ]
+    ),
+)
+def test_given_dense_results_then_conflicts_resolved_as_pairwise_comparison(
+    analyzer_results, conflict_strategy
+):
+    engine = AnonymizerEngine()
+    expected = remove_conflicts_by_pairwise_comparison(
+        engine._copy_recognizer_results(analyzer_results), conflict_strategy
+    )
+
+    actual = engine._remove_conflicts_and_get_text_manipulation_data(
+        engine._copy_recognizer_results(analyzer_results), conflict_strategy
+    )
+
+    assert as_tuples(actual) == as_tuples(expected)
+
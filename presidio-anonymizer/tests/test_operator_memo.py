@@ -0,0 +1,155 @@
+import sys
+import threading
+
+import pytest
+
+from presidio_anonymizer import AnonymizerEngine, BatchAnonymizerEngine
+from presidio_anonymizer.core import OperatorMemo
+from presidio_anonymizer.entities import OperatorConfig, RecognizerResult
+from presidio_anonymizer.operators import Encrypt, Hash, Replace
+
+TEXT = "a@b.com wrote to c@d.com and a@b.com"
+ANALYZER_RESULTS = [
+    RecognizerResult("EMAIL_ADDRESS", 0, 7, 0.9),
+    RecognizerResult("EMAIL_ADDRESS", 17, 24, 0.9),
+    RecognizerResult("EMAIL_ADDRESS", 29, 36, 0.9),
+]
+
+
+def test_given_same_text_and_params_then_operated_once(mocker):
+    operator_memo = OperatorMemo()
+    operator = Hash()
+    params = {"hash_type": "sha256"}
+    params_key = operator_memo.get_params_key(operator, params)
+    operate = mocker.spy(operator, "operate")
+
+    results = [
+        operator_memo.operate(params_key, operator, params, text)
+        for text in ["a", "b", "a", "a"]
+    ]
+
+    assert operate.call_count == 2
+    assert results == [Hash().operate(text, params) for text in ["a", "b", "a", "a"]]
+    stats = operator_memo.get_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 2
+    assert stats["size"] == 2
+    assert stats["hit_rate"] == 0.5
+
+
+def test_given_different_params_then_results_not_shared():
+    operator_memo = OperatorMemo()
+    operator = Hash()
+    first_key = operator_memo.get_params_key(operator, {"key": "tenant-1"})
+    second_key = operator_memo.get_params_key(operator, {"key": "tenant-2"})
+
+    first = operator_memo.operate(first_key, operator, {"key": "tenant-1"}, "a")
+    second = operator_memo.operate(second_key, operator, {"key": "tenant-2"}, "a")
+
+    assert first != second
+    assert operator_memo.get_stats()["misses"] == 2
+
+
+def test_given_randomized_operator_then_no_params_key():
+    params = {"key": "WmZq4t7w!z%C&F)J"}
+    assert OperatorMemo.get_params_key(Encrypt(), params) is None
+
+
+def test_given_operator_declared_deterministic_then_params_key(mock_anonymizer_cls):
+    params = {"new_value": "<EMAIL>"}
+    assert OperatorMemo.get_params_key(mock_anonymizer_cls(), params) is None
+    mock_anonymizer_cls.DETERMINISTIC = True
+    assert OperatorMemo.get_params_key(mock_anonymizer_cls(), params) is not None
+
+
+def test_given_unhashable_params_then_no_params_key():
+    params = {"new_value": "<EMAIL>", "metadata": {"tenant": "a"}}
+    assert OperatorMemo.get_params_key(Replace(), params) is None
+
+
+def test_given_full_memo_then_oldest_result_evicted():
+    operator_memo = OperatorMemo(max_size=2)
+    operator = Hash()
+    params_key = operator_memo.get_params_key(operator, {})
+    for text in ["a", "b", "c"]:
+        operator_memo.operate(params_key, operator, {}, text)
+
+    stats = operator_memo.get_stats()
+    assert stats["size"] == 2
+    assert stats["evictions"] == 1
+
+
+def test_given_concurrent_calls_then_every_lookup_counted():
+    operator_memo = OperatorMemo(max_size=8)
+    operator = Hash()
+    params_key = operator_memo.get_params_key(operator, {})
+    texts = [str(i % 16) for i in range(500)]
+
+    def operate():
+        for text in texts:
+            operator_memo.operate(params_key, operator, {}, text)
+
+    # Switch threads often, to interleave memo updates
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        threads = [threading.Thread(target=operate) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    stats = operator_memo.get_stats()
+    assert stats["hits"] + stats["misses"] == 8 * len(texts)
+    assert stats["size"] <= 8
+
+
+def test_given_invalid_max_size_then_raises():
+    with pytest.raises(ValueError):
+        OperatorMemo(max_size=0)
+
+
+def test_given_engine_memo_then_shared_between_requests():
+    operator_memo = OperatorMemo()
+    engine = AnonymizerEngine(operator_memo=operator_memo)
+    operators = {"DEFAULT": OperatorConfig("hash")}
+
+    first = engine.anonymize(TEXT, ANALYZER_RESULTS, operators)
+    second = engine.anonymize(TEXT, ANALYZER_RESULTS, operators)
+
+    assert first.text == second.text
+    assert first.text == AnonymizerEngine().anonymize(
+        TEXT, ANALYZER_RESULTS, operators
+    ).text
+    stats = operator_memo.get_stats()
+    assert stats["misses"] == 2
+    assert stats["hits"] == 4
+
+
+def test_given_randomized_operator_then_engine_memo_not_used():
+    operator_memo = OperatorMemo()
+    engine = AnonymizerEngine(operator_memo=operator_memo)
+    operators = {"DEFAULT": OperatorConfig("encrypt", {"key": "WmZq4t7w!z%C&F)J"})}
+
+    result = engine.anonymize(TEXT, ANALYZER_RESULTS, operators)
+
+    assert result.items[0].text != result.items[2].text
+    assert operator_memo.get_stats()["hits"] + operator_memo.get_stats()["misses"] == 0
+
+
+def test_given_batch_memo_then_repeated_values_operated_once():
+    operator_memo = OperatorMemo()
+    texts = ["a@b.com", "c@d.com", "a@b.com", "a@b.com"]
+    recognizer_results_list = [
+        [RecognizerResult("EMAIL_ADDRESS", 0, 7, 0.9)] for _ in texts
+    ]
+
+    anonymized = BatchAnonymizerEngine().anonymize_list(
+        texts, recognizer_results_list, operator_memo=operator_memo
+    )
+
+    assert anonymized == ["<EMAIL_ADDRESS>"] * 4
+    assert operator_memo.get_stats()["hits"] == 2
+    assert operator_memo.get_stats()["misses"] == 2
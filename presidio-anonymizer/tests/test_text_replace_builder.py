@@ -1,3 +1,5 @@
+import random
+
 import pytest
 from presidio_anonymizer.entities import InvalidParamError
 from presidio_anonymizer.core import TextReplaceBuilder
@@ -62,3 +64,59 @@ def test_given_text_and_bad_indices_then_we_get_fail(original_text, start, end):
     )
     with pytest.raises(InvalidParamError, match=err_msg):
         text_replace_builder.get_text_in_position(start, end)
+
+
+def replace_text_by_concatenation(original_text, replacements):
+    """Reference implementation, rebuilding the text on every replacement."""
+    output_text = original_text
+    last_replacement_index = len(original_text)
+    indexes_from_end = []
+    for replacement_text, start, end in replacements:
+        after_text = output_text[min(end, last_replacement_index):]
+        output_text = output_text[:start] + replacement_text + after_text
+        last_replacement_index = start
+        indexes_from_end.append(len(after_text) + len(replacement_text))
+    indices = [
+        (len(output_text) - index, len(output_text) - index + len(replacement[0]))
+        for index, replacement in zip(indexes_from_end, replacements)
+    ]
+    return output_text, indexes_from_end, indices
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_given_many_replacements_then_output_equals_concatenation(seed):
+    rng = random.Random(seed)
+    original_text = "".join(rng.choice("ab cd\n") for _ in range(rng.randint(0, 60)))
+    replacements = []
+    for _ in range(rng.randint(0, 10)):
+        start = rng.randint(0, len(original_text))
+        end = rng.randint(start, len(original_text))
+        replacements.append(("<" + "x" * rng.randint(0, 4) + ">", start, end))
+    # Replacements are made from end to start, possibly overlapping
+    replacements.sort(key=lambda replacement: replacement[1], reverse=True)
+
+    text_replace_builder = TextReplaceBuilder(original_text)
+    indexes_from_end = [
+        text_replace_builder.replace_text_get_insertion_index(*replacement)
+        for replacement in replacements
+    ]
+
+    expected_text, expected_indexes_from_end, expected_indices = (
+        replace_text_by_concatenation(original_text, replacements)
+    )
+    assert text_replace_builder.output_text == expected_text
+    assert indexes_from_end == expected_indexes_from_end
+    assert text_replace_builder.get_replacement_indices() == expected_indices
+
+
+def test_given_replacements_then_indices_point_to_replacements_in_output():
+    text_replace_builder = TextReplaceBuilder("My name is Jane and I live in Paris")
+    text_replace_builder.replace_text_get_insertion_index("<LOCATION>", 30, 35)
+    text_replace_builder.replace_text_get_insertion_index("<PERSON>", 11, 15)
+
+    output_text = text_replace_builder.output_text
+    assert output_text == "My name is <PERSON> and I live in <LOCATION>"
+    assert [
+        output_text[start:end]
+        for start, end in text_replace_builder.get_replacement_indices()
+    ] == ["<LOCATION>", "<PERSON>"]
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from presidio_anonymizer.token_vault import TokenScanner
+
+
+def find_by_brute_force(tokens, text):
+    occurrences = []
+    position = 0
+    while position < len(text):
+        lengths = [
+            len(token) for token in tokens if token and text.startswith(token, position)
+        ]
+        length = max(lengths, default=0)
+        if length:
+            occurrences.append((position, position + length))
+            position += length
+        else:
+            position += 1
+    return occurrences
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_given_random_tokens_then_find_equals_brute_force(seed):
+    rnd = random.Random(seed)
+    tokens = [
+        "".join(rnd.choice("abc") for _ in range(rnd.randint(0, 4)))
+        for _ in range(rnd.randint(0, 10))
+    ]
+    text = "".join(rnd.choice("abcd") for _ in range(rnd.randint(0, 40)))
+
+    scanner = TokenScanner()
+    for i in range(0, len(tokens), 3):
+        scanner.add(tokens[i : i + 3])
+
+    assert scanner.find(text) == find_by_brute_force(tokens, text)
+
+
+def test_given_token_prefix_of_another_then_longest_found():
+    scanner = TokenScanner(["<PERSON_1>", "<PERSON_12>"])
+
+    text = "<PERSON_12> and <PERSON_1>"
+
+    assert scanner.find(text) == [(0, 11), (16, 26)]
+
+
+def test_given_many_added_tokens_then_automata_merged():
+    scanner = TokenScanner()
+    for i in range(1000):
+        scanner.add([f"<ID_{i}>"])
+
+    assert len(scanner) == 1000
+    assert "<ID_999>" in scanner
+    assert len(scanner._automata) <= 10
+    assert scanner.find("<ID_0><ID_999>") == [(0, 6), (6, 14)]
+
+
+def test_given_empty_and_repeated_tokens_then_ignored():
+    scanner = TokenScanner(["", "a", "a"])
+
+    assert len(scanner) == 1
+    assert scanner.find("") == []
@@ -0,0 +1,146 @@
+import sqlite3
+
+import pytest
+
+from presidio_anonymizer import AnonymizerEngine, DeanonymizeEngine
+from presidio_anonymizer.entities import (
+    InvalidParamError,
+    OperatorConfig,
+    OperatorResult,
+    RecognizerResult,
+)
+from presidio_anonymizer.token_vault import InMemoryTokenVault, SQLiteTokenVault
+
+TEXT = "Peter gave his book to Heidi which later gave it to Peter."
+RESULTS = [
+    RecognizerResult("PERSON", 0, 5, 0.8),
+    RecognizerResult("PERSON", 23, 28, 0.8),
+    RecognizerResult("PERSON", 52, 57, 0.8),
+]
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def vault(request, tmp_path):
+    if request.param == "memory":
+        yield InMemoryTokenVault()
+    else:
+        vault = SQLiteTokenVault(tmp_path / "vault.sqlite")
+        yield vault
+        vault.close()
+
+
+def test_given_same_value_then_same_token_returned(vault):
+    token = vault.get_or_create_token("Peter", "PERSON")
+
+    assert token == "<PERSON_0>"
+    assert vault.get_or_create_token("Peter", "PERSON") == token
+    assert vault.get_or_create_token("Heidi", "PERSON") == "<PERSON_1>"
+    assert vault.get_or_create_token("Peter", "NAME") == "<NAME_0>"
+    assert vault.get_original(token) == "Peter"
+    assert vault.get_original("<PERSON_7>") is None
+    assert len(vault) == 3
+
+
+def test_given_text_with_tokens_then_deanonymize_restores_values(vault):
+    vault.get_or_create_token("Peter", "PERSON")
+    vault.get_or_create_token("Heidi", "PERSON")
+
+    result = vault.deanonymize("<PERSON_1> got it from <PERSON_0>, <PERSON_2>.")
+
+    assert result.text == "Heidi got it from Peter, <PERSON_2>."
+    assert result.items == [
+        OperatorResult(0, 5, "PERSON", "Heidi", "detokenize"),
+        OperatorResult(18, 23, "PERSON", "Peter", "detokenize"),
+    ]
+
+
+def test_given_texts_then_deanonymize_many_restores_each_text(vault):
+    vault.add_token("tok-1", "john@example.com", "EMAIL_ADDRESS")
+
+    results = vault.deanonymize_many(["write to tok-1", "no tokens", ""])
+
+    assert [result.text for result in results] == [
+        "write to john@example.com",
+        "no tokens",
+        "",
+    ]
+
+
+def test_given_added_token_then_issued_tokens_skip_it(vault):
+    vault.add_token("<PERSON_0>", "Alice", "NAME")
+
+    assert vault.get_or_create_token("Peter", "PERSON") == "<PERSON_1>"
+    vault.add_token("<PERSON_0>", "Alice", "NAME")
+    with pytest.raises(ValueError, match="already replaces another value"):
+        vault.add_token("<PERSON_0>", "Bob", "NAME")
+
+
+def test_given_tokenize_operator_then_anonymize_and_deanonymize(vault):
+    result = AnonymizerEngine().anonymize(
+        TEXT, RESULTS, {"PERSON": OperatorConfig("tokenize", {"vault": vault})}
+    )
+
+    assert result.text == (
+        "<PERSON_0> gave his book to <PERSON_1> which later gave it to <PERSON_0>."
+    )
+    assert vault.deanonymize(result.text).text == TEXT
+    deanonymized = DeanonymizeEngine().deanonymize(
+        result.text,
+        result.items,
+        {"DEFAULT": OperatorConfig("detokenize", {"vault": vault})},
+    )
+    assert deanonymized.text == TEXT
+
+
+def test_given_unknown_token_then_detokenize_raises(vault):
+    with pytest.raises(InvalidParamError, match="not found in the vault"):
+        DeanonymizeEngine().deanonymize(
+            "<PERSON_0>",
+            [OperatorResult(0, 10, "PERSON")],
+            {"DEFAULT": OperatorConfig("detokenize", {"vault": vault})},
+        )
+
+
+def test_given_invalid_vault_then_tokenize_raises():
+    with pytest.raises(InvalidParamError):
+        AnonymizerEngine().anonymize(
+            TEXT, RESULTS, {"PERSON": OperatorConfig("tokenize", {"vault": "vault"})}
+        )
+
+
+def test_given_reopened_sqlite_vault_then_tokens_kept(tmp_path):
+    vault = SQLiteTokenVault(tmp_path / "vault.sqlite")
+    vault.get_or_create_token("Peter", "PERSON")
+    vault.close()
+
+    vault = SQLiteTokenVault(tmp_path / "vault.sqlite")
+
+    assert vault.deanonymize("Hi <PERSON_0>").text == "Hi Peter"
+    assert vault.get_or_create_token("Heidi", "PERSON") == "<PERSON_1>"
+    vault.close()
+
+
+def test_given_shared_sqlite_vault_then_tokens_of_other_vault_restored(tmp_path):
+    first = SQLiteTokenVault(tmp_path / "vault.sqlite")
+    second = SQLiteTokenVault(tmp_path / "vault.sqlite")
+
+    first.get_or_create_token("Peter", "PERSON")
+
+    assert second.get_or_create_token("Heidi", "PERSON") == "<PERSON_1>"
+    assert second.deanonymize("<PERSON_0>, <PERSON_1>").text == "Peter, Heidi"
+    assert first.deanonymize("<PERSON_1>").text == "Heidi"
+    first.close()
+    second.close()
+
+
+def test_given_known_value_then_token_returned_while_vault_write_locked(tmp_path):
+    vault = SQLiteTokenVault(tmp_path / "vault.sqlite")
+    vault.get_or_create_token("Peter", "PERSON")
+    writer = sqlite3.connect(str(tmp_path / "vault.sqlite"), timeout=0)
+    writer.execute("BEGIN IMMEDIATE")
+    try:
+        assert vault.get_or_create_token("Peter", "PERSON") == "<PERSON_0>"
+    finally:
+        writer.execute("ROLLBACK")
+        writer.close()
+        vault.close()
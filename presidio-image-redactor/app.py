@@ -14,9 +14,12 @@ from presidio_image_redactor.entities.api_request_convertor import (
     get_json_data,
     image_to_byte_array,
 )
+from presidio_service_utils import RequestLimiter, warm_up
 
 DEFAULT_PORT = "3000"
 
+WARMUP_TEXT = "My name is John Smith and my phone number is 212-555-5555"
+
 WELCOME_MESSAGE = r"""
  _______  _______  _______  _______ _________ ______  _________ _______
 (  ____ )(  ____ )(  ____ \(  ____ \\__   __/(  __  \ \__   __/(  ___  )
@@ -37,8 +40,20 @@ class Server:
         self.app = Flask(__name__)
         self.logger.info("Starting image redactor engine")
         self.engine = ImageRedactorEngine()
+
+        self.request_limiter = RequestLimiter.from_env()
+        self.request_limiter.init_app(self.app)
+        self.ready = warm_up(self._warmup, self.logger)
         self.logger.info(WELCOME_MESSAGE)
 
+        @self.app.route("/ready")
+        def ready():
+            """Return readiness probe result, not ready if the warmup failed."""
+            if not self.ready:
+                error = "Presidio Image Redactor service is not ready"
+                return jsonify(error=error), 503
+            return "Presidio Image Redactor service is ready", 200
+
         @self.app.route("/health")
         def health() -> str:
             """Return basic health probe result."""
@@ -80,6 +95,11 @@ class Server:
             self.logger.error(f"A fatal error occurred during execution: {e}")
             return jsonify(error="Internal server error"), 500
 
+    def _warmup(self) -> None:
+        """Run the text analyzer once, so the first request is not slowed down."""
+        analyzer_engine = self.engine.image_analyzer_engine.analyzer_engine
+        analyzer_engine.analyze(text=WARMUP_TEXT, language="en")
+
 def create_app(): # noqa
     server = Server()
     return server.app
@@ -0,0 +1,58 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("flask")
+
+from app import Server  # noqa: E402
+
+
+def create_server(engine: MagicMock) -> Server:
+    with patch("app.ImageRedactorEngine", return_value=engine):
+        return Server()
+
+
+@pytest.fixture
+def engine():
+    engine = MagicMock()
+    engine.image_analyzer_engine.analyzer_engine.analyze.return_value = []
+    return engine
+
+
+def test_given_busy_worker_then_requests_are_rejected_with_429(monkeypatch, engine):
+    monkeypatch.setenv("MAX_CONCURRENT_REQUESTS", "1")
+    monkeypatch.setenv("MAX_QUEUED_REQUESTS", "0")
+    server = create_server(engine)
+    client = server.app.test_client()
+    assert server.request_limiter.acquire()
+    try:
+        response = client.post("/redact", json={})
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+
+        # Probes are not limited
+        assert client.get("/health").status_code == 200
+        assert client.get("/ready").status_code == 200
+    finally:
+        server.request_limiter.release()
+
+    # Slots of completed (here, rejected as invalid) requests are released
+    assert client.post("/redact", json={}).status_code == 422
+    assert client.post("/redact", json={}).status_code == 422
+
+
+def test_given_successful_warmup_then_ready(engine):
+    server = create_server(engine)
+    engine.image_analyzer_engine.analyzer_engine.analyze.assert_called_once()
+    assert server.app.test_client().get("/ready").status_code == 200
+
+
+def test_given_failed_warmup_then_not_ready(engine):
+    analyzer_engine = engine.image_analyzer_engine.analyzer_engine
+    analyzer_engine.analyze.side_effect = RuntimeError("model failed")
+    server = create_server(engine)
+    client = server.app.test_client()
+    response = client.get("/ready")
+    assert response.status_code == 503
+    assert response.json == {"error": "Presidio Image Redactor service is not ready"}
+    assert client.get("/health").status_code == 200
@@ -0,0 +1,6 @@
+"""Shared server utilities of the Presidio services."""
+
+from .request_limiter import UNLIMITED_PATHS, RequestLimiter
+from .warmup import warm_up
+
+__all__ = ["RequestLimiter", "UNLIMITED_PATHS", "warm_up"]
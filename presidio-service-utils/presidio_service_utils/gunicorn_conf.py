@@ -0,0 +1,27 @@
+"""Gunicorn configuration of the Presidio services.
+
+Used from the folder of a service with
+`gunicorn -c python:presidio_service_utils.gunicorn_conf`.
+
+The app, including its engine and models, is loaded once in the master process
+(preload_app), and workers are forked after loading,
+so that model memory is shared between workers using copy-on-write.
+"""
+
+import gc
+import os
+
+wsgi_app = "app:create_app()"
+bind = f"0.0.0.0:{os.environ.get('PORT', '3000')}"
+workers = int(os.environ.get("WORKERS", "1"))
+threads = int(os.environ.get("THREADS", "1"))
+preload_app = os.environ.get("PRELOAD_APP", "true").lower() == "true"
+
+# Time given to in-flight requests to complete when workers are asked to stop
+graceful_timeout = int(os.environ.get("GRACEFUL_TIMEOUT", "30"))
+
+
+def pre_fork(server, worker):  # noqa: D103
+    # Move objects created during loading to a permanent generation, so the
+    # garbage collector does not write to (and copy) their pages in the workers
+    gc.freeze()
@@ -0,0 +1,87 @@
+import os
+import threading
+
+from flask import Flask, g, jsonify, request
+
+# Probes are never rejected by the request limiter
+UNLIMITED_PATHS = ("/health", "/ready")
+
+
+class RequestLimiter:
+    """
+    Bound the number of requests processed and queued in a worker.
+
+    Requests beyond `max_concurrent` wait for a free slot. If `max_queued`
+    requests are already waiting, or no slot was freed within `queue_timeout`
+    seconds, the request is rejected, allowing clients to back off.
+
+    :param max_concurrent: Maximum number of requests processed at once
+    (0 for no limit)
+    :param max_queued: Maximum number of requests waiting for a free slot
+    :param queue_timeout: Maximum time in seconds a request waits for a free slot
+    """
+
+    def __init__(self, max_concurrent: int, max_queued: int, queue_timeout: float):
+        self.max_queued = max_queued
+        self.queue_timeout = queue_timeout
+        self._semaphore = (
+            threading.BoundedSemaphore(max_concurrent) if max_concurrent else None
+        )
+        self._queued = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "RequestLimiter":
+        """
+        Create a limiter from the environment variables of the services.
+
+        `MAX_CONCURRENT_REQUESTS` (default 0, no limit), `MAX_QUEUED_REQUESTS`
+        (default 0) and `QUEUE_TIMEOUT_SECONDS` (default 30).
+        """
+        return cls(
+            max_concurrent=int(os.environ.get("MAX_CONCURRENT_REQUESTS", "0")),
+            max_queued=int(os.environ.get("MAX_QUEUED_REQUESTS", "0")),
+            queue_timeout=float(os.environ.get("QUEUE_TIMEOUT_SECONDS", "30")),
+        )
+
+    def acquire(self) -> bool:
+        """Acquire a processing slot, return False if the request is rejected."""
+        if not self._semaphore or self._semaphore.acquire(blocking=False):
+            return True
+
+        with self._lock:
+            if self._queued >= self.max_queued:
+                return False
+            self._queued += 1
+        try:
+            return self._semaphore.acquire(timeout=self.queue_timeout)
+        finally:
+            with self._lock:
+                self._queued -= 1
+
+    def release(self) -> None:
+        """Release a slot acquired by `acquire`."""
+        if self._semaphore:
+            self._semaphore.release()
+
+    def init_app(self, app: Flask) -> None:
+        """
+        Limit the requests of a Flask app, except for the probes.
+
+        Rejected requests get status 429 with a `Retry-After` header.
+
+        :param app: The Flask app
+        """
+
+        @app.before_request
+        def acquire_request_slot():
+            if request.path in UNLIMITED_PATHS:
+                return None
+            if not self.acquire():
+                return jsonify(error="Too many requests"), 429, {"Retry-After": "1"}
+            g.request_slot_acquired = True
+
+        @app.teardown_request
+        def release_request_slot(exc):
+            if g.pop("request_slot_acquired", False):
+                self.release()
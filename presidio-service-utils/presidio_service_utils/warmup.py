@@ -0,0 +1,22 @@
+import logging
+from typing import Callable
+
+
+def warm_up(warmup_func: Callable[[], None], logger: logging.Logger) -> bool:
+    """
+    Run the engine of a service once, so the first request is not slowed down.
+
+    Warmup runs before serving, and with preload_app before workers are
+    forked, so they share the warmed up engine. The result is reported by
+    the /ready probe of the service.
+
+    :param warmup_func: Function running the engine on a sample input
+    :param logger: Logger of the service, the warmup error is logged to it
+    :return: Whether the warmup succeeded
+    """
+    try:
+        warmup_func()
+    except Exception as e:
+        logger.error(f"Failed to warm up the engine: {e}")
+        return False
+    return True
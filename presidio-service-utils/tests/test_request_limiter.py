@@ -0,0 +1,81 @@
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from presidio_service_utils import RequestLimiter
+
+
+def test_given_no_limit_then_requests_are_always_accepted():
+    limiter = RequestLimiter(max_concurrent=0, max_queued=0, queue_timeout=0)
+    assert all(limiter.acquire() for _ in range(100))
+    limiter.release()
+
+
+def test_given_full_limiter_then_request_is_rejected():
+    limiter = RequestLimiter(max_concurrent=1, max_queued=0, queue_timeout=1)
+    assert limiter.acquire()
+    assert not limiter.acquire()
+    limiter.release()
+    assert limiter.acquire()
+
+
+def test_given_queued_request_then_it_gets_released_slot():
+    limiter = RequestLimiter(max_concurrent=1, max_queued=1, queue_timeout=5)
+    assert limiter.acquire()
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(limiter.acquire()))
+    waiter.start()
+    while limiter._queued == 0:
+        time.sleep(0.001)
+
+    # The queue is full, additional requests are rejected
+    assert not limiter.acquire()
+    limiter.release()
+    waiter.join(timeout=5)
+    assert results == [True]
+
+
+def test_given_queued_request_when_timeout_expires_then_it_is_rejected():
+    limiter = RequestLimiter(max_concurrent=1, max_queued=1, queue_timeout=0.01)
+    assert limiter.acquire()
+    assert not limiter.acquire()
+    assert limiter._queued == 0
+
+
+def test_given_environment_then_limiter_configured(monkeypatch):
+    monkeypatch.setenv("MAX_CONCURRENT_REQUESTS", "2")
+    monkeypatch.setenv("MAX_QUEUED_REQUESTS", "3")
+    monkeypatch.setenv("QUEUE_TIMEOUT_SECONDS", "0.5")
+
+    limiter = RequestLimiter.from_env()
+
+    assert limiter.max_queued == 3
+    assert limiter.queue_timeout == pytest.approx(0.5)
+    assert limiter.acquire() and limiter.acquire()
+
+
+def test_given_busy_app_then_requests_are_rejected_with_429():
+    app = Flask(__name__)
+    app.add_url_rule("/health", "health", lambda: "up")
+    app.add_url_rule("/work", "work", lambda: "done")
+    limiter = RequestLimiter(max_concurrent=1, max_queued=0, queue_timeout=0)
+    limiter.init_app(app)
+    client = app.test_client()
+
+    assert limiter.acquire()
+    try:
+        response = client.get("/work")
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "1"
+        assert response.json == {"error": "Too many requests"}
+
+        # Probes are not limited
+        assert client.get("/health").status_code == 200
+    finally:
+        limiter.release()
+
+    # Slots of completed requests are released
+    assert client.get("/work").status_code == 200
+    assert client.get("/work").status_code == 200
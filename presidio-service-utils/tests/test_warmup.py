@@ -0,0 +1,18 @@
+import logging
+from unittest.mock import MagicMock
+
+from presidio_service_utils import warm_up
+
+
+def test_given_successful_warmup_then_true():
+    warmup_func = MagicMock()
+    assert warm_up(warmup_func, logging.getLogger("test"))
+    warmup_func.assert_called_once_with()
+
+
+def test_given_failed_warmup_then_error_logged(caplog):
+    def warmup_func():
+        raise RuntimeError("model failed")
+
+    assert not warm_up(warmup_func, logging.getLogger("test"))
+    assert "model failed" in caplog.text
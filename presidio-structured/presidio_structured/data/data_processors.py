@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Union
 
 from pandas import DataFrame
 from presidio_anonymizer.entities import OperatorConfig
@@ -8,13 +8,22 @@ from presidio_anonymizer.operators import OperatorsFactory, OperatorType
 
 from presidio_structured.config import StructuredAnalysis
 
+if TYPE_CHECKING:
+    from presidio_anonymizer.core import OperatorMemo
+
 
 class DataProcessorBase(ABC):
     """Abstract class to handle logic of operations over text using the operators."""
 
-    def __init__(self) -> None:
-        """Initialize DataProcessorBase object."""
+    def __init__(self, operator_memo: Optional["OperatorMemo"] = None) -> None:
+        """
+        Initialize DataProcessorBase object.
+
+        :param operator_memo: Optional memo of the results of deterministic
+        operators, so that repeated values are operated on once.
+        """
         self.logger = logging.getLogger("presidio-structured")
+        self.operator_memo = operator_memo
 
     def operate(
         self,
@@ -50,10 +59,21 @@ class DataProcessorBase(ABC):
         """
         pass
 
-    @staticmethod
-    def _create_operator_callable(operator, params):
-        def operator_callable(text):
-            return operator.operate(params=params, text=text)
+    def _create_operator_callable(self, operator, params):
+        params_key = None
+        if self.operator_memo:
+            params_key = self.operator_memo.get_params_key(operator, params)
+
+        if params_key is None:
+
+            def operator_callable(text):
+                return operator.operate(params=params, text=text)
+
+        else:
+            operator_memo = self.operator_memo
+
+            def operator_callable(text):
+                return operator_memo.operate(params_key, operator, params, text)
 
         return operator_callable
 
@@ -1,5 +1,7 @@
 import pytest
 from pandas import DataFrame
+from presidio_anonymizer.core import OperatorMemo
+from presidio_anonymizer.entities import OperatorConfig
 from presidio_structured.data.data_processors import (
     DataProcessorBase,
     PandasDataProcessor,
@@ -35,6 +37,27 @@ class TestPandasDataProcessor:
             processor.operate(sample_json, tabular_analysis, operators)
 
 
+    def test_process_with_operator_memo(self, tabular_analysis):
+        data = DataFrame(
+            {
+                "name": ["John Doe", "Jane Doe", "John Doe", "John Doe"],
+                "email": ["a@example.com"] * 4,
+                "phone": ["(212) 456-7890"] * 4,
+            }
+        )
+        operators = {"DEFAULT": OperatorConfig("hash", {"key": "tenant-key"})}
+        operator_memo = OperatorMemo()
+        processor = PandasDataProcessor(operator_memo=operator_memo)
+
+        result = processor.operate(data.copy(), tabular_analysis, operators)
+
+        expected = PandasDataProcessor().operate(data.copy(), tabular_analysis, operators)
+        assert result.equals(expected)
+        stats = operator_memo.get_stats()
+        assert stats["misses"] == 4
+        assert stats["hits"] == 8
+
+
 class TestJsonDataProcessor:
     def test_process(self, sample_json, operators, json_analysis):
         processor = JsonDataProcessor()